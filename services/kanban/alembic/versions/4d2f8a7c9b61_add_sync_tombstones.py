@@ -0,0 +1,42 @@
+"""Add sync_tombstones and updated_at indexes for project change sync
+
+Revision ID: 4d2f8a7c9b61
+Revises: 6bec91a0e333
+Create Date: 2026-10-18 20:05:13.842671
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d2f8a7c9b61'
+down_revision: Union[str, None] = '6bec91a0e333'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('sync_tombstones',
+    sa.Column('id', sa.UUID(), nullable=False, comment='삭제된 Ticket/Task의 id'),
+    sa.Column('target_type', postgresql.ENUM('PROJECT', 'TICKET', 'TASK', name='targettype', create_type=False), nullable=False, comment='TICKET 또는 TASK'),
+    sa.Column('project_id', sa.UUID(), nullable=False, comment='References projects.id (no FK for sharding)'),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('deleted_by', sa.UUID(), nullable=True, comment='References users.id from Member service (no FK for microservice)'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_sync_tombstones_deleted_at', 'sync_tombstones', ['deleted_at'], unique=False)
+    op.create_index('ix_sync_tombstones_project_id_deleted_at_id', 'sync_tombstones', ['project_id', 'deleted_at', 'id'], unique=False)
+    op.create_index('ix_tickets_project_id_updated_at_id', 'tickets', ['project_id', 'updated_at', 'id'], unique=False)
+    op.create_index('ix_tasks_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_updated_at_id', table_name='tasks')
+    op.drop_index('ix_tickets_project_id_updated_at_id', table_name='tickets')
+    op.drop_index('ix_sync_tombstones_project_id_deleted_at_id', table_name='sync_tombstones')
+    op.drop_index('ix_sync_tombstones_deleted_at', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
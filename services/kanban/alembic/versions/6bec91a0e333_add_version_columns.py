@@ -0,0 +1,34 @@
+"""Add version columns to projects, tickets and tasks for ETags
+
+Revision ID: 6bec91a0e333
+Revises: d6e15bffd956
+Create Date: 2026-10-18 19:12:40.517302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6bec91a0e333'
+down_revision: Union[str, None] = 'd6e15bffd956'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('projects', 'tickets', 'tasks')
+
+
+def upgrade() -> None:
+    # 상수 기본값 컬럼 추가는 PostgreSQL 11+에서 테이블을 다시 쓰지 않음 (기존 행은 모두 version 1)
+    for table in TABLES:
+        op.add_column(table, sa.Column(
+            'version', sa.Integer(), server_default='1', nullable=False,
+            comment='수정 시마다 증가하는 버전 (ETag)'
+        ))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, 'version')
@@ -0,0 +1,50 @@
+"""Add per-status task count rollups to tickets
+
+Revision ID: 8f1cc103780d
+Revises: a3c9e1f04b27
+Create Date: 2026-10-18 15:02:17.284113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f1cc103780d'
+down_revision: Union[str, None] = 'a3c9e1f04b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TASK_COUNT_COLUMNS = {
+    'task_count_todo': 'TODO',
+    'task_count_in_progress': 'IN_PROGRESS',
+    'task_count_review': 'REVIEW',
+    'task_count_done': 'DONE',
+}
+
+
+def upgrade() -> None:
+    for column, task_status in TASK_COUNT_COLUMNS.items():
+        op.add_column('tickets', sa.Column(
+            column, sa.Integer(), server_default='0', nullable=False,
+            comment=f'{task_status} 상태 Task 수'
+        ))
+
+    # 기존 데이터 집계 (이후에는 API가 갱신, scripts/reconcile_task_rollups.py로 보정)
+    counts = ', '.join(
+        f"count(*) FILTER (WHERE status = '{task_status}') AS {column}"
+        for column, task_status in TASK_COUNT_COLUMNS.items()
+    )
+    assignments = ', '.join(f'{column} = c.{column}' for column in TASK_COUNT_COLUMNS)
+    op.execute(f"""
+        UPDATE tickets SET {assignments}
+        FROM (SELECT ticket_id, {counts} FROM tasks WHERE NOT is_deleted GROUP BY ticket_id) AS c
+        WHERE tickets.id = c.ticket_id
+    """)
+
+
+def downgrade() -> None:
+    for column in reversed(list(TASK_COUNT_COLUMNS)):
+        op.drop_column('tickets', column)
@@ -0,0 +1,34 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: a3c9e1f04b27
+Revises: 15615a7959d1
+Create Date: 2026-10-18 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e1f04b27'
+down_revision: Union[str, None] = '15615a7959d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_workspaces_created_at_id', 'workspaces', ['created_at', 'id'], unique=False)
+    op.create_index('ix_projects_workspace_id_created_at_id', 'projects', ['workspace_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tickets_project_id_created_at_id', 'tickets', ['project_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_ticket_id_created_at_id', 'tasks', ['ticket_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_notifications_user_id_created_at_id', 'notifications', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_id_created_at_id', table_name='notifications')
+    op.drop_index('ix_tasks_ticket_id_created_at_id', table_name='tasks')
+    op.drop_index('ix_tickets_project_id_created_at_id', table_name='tickets')
+    op.drop_index('ix_projects_workspace_id_created_at_id', table_name='projects')
+    op.drop_index('ix_workspaces_created_at_id', table_name='workspaces')
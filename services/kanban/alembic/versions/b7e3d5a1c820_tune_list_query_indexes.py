@@ -0,0 +1,71 @@
+"""Tune indexes to list query shapes: add composite/partial, drop redundant single-column
+
+Revision ID: b7e3d5a1c820
+Revises: 4d2f8a7c9b61
+Create Date: 2026-10-18 21:03:27.194856
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d5a1c820'
+down_revision: Union[str, None] = '4d2f8a7c9b61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기본 키 인덱스(<table>_pkey)와 같은 컬럼의 중복 인덱스
+PRIMARY_KEY_DUPLICATES = (
+    'attachments', 'comments', 'notifications', 'project_members', 'project_roles', 'projects',
+    'task_members', 'tasks', 'ticket_members', 'ticket_types', 'tickets', 'workspaces',
+)
+
+# 단독 조건으로 쓰이지 않는 선택도 낮은 boolean / enum 컬럼과,
+# 같은 컬럼으로 시작하는 복합 인덱스가 대신하는 단일 컬럼 인덱스 (table, column)
+REDUNDANT_COLUMNS = (
+    ('attachments', 'is_deleted'), ('attachments', 'target_type'),
+    ('comments', 'is_deleted'), ('comments', 'target_type'),
+    ('notifications', 'is_read'), ('notifications', 'notification_type'), ('notifications', 'user_id'),
+    ('project_members', 'is_deleted'),
+    ('project_roles', 'is_deleted'),
+    ('projects', 'is_deleted'), ('projects', 'status'), ('projects', 'priority'), ('projects', 'workspace_id'),
+    ('task_members', 'is_deleted'), ('task_members', 'participation_type'),
+    ('tasks', 'is_deleted'), ('tasks', 'status'), ('tasks', 'ticket_id'),
+    ('ticket_members', 'is_deleted'), ('ticket_members', 'participation_type'),
+    ('ticket_types', 'is_deleted'),
+    ('tickets', 'is_deleted'), ('tickets', 'status'), ('tickets', 'priority'), ('tickets', 'project_id'),
+)
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_tickets_project_id_status_created_at_id', 'tickets',
+        ['project_id', 'status', 'created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_notifications_user_id_created_at_id_unread', 'notifications',
+        ['user_id', 'created_at', 'id'], unique=False, postgresql_where=sa.text('is_read = false')
+    )
+    op.create_index(
+        'ix_projects_created_at_id_live', 'projects',
+        ['created_at', 'id'], unique=False, postgresql_where=sa.text('is_deleted = false')
+    )
+
+    for table in PRIMARY_KEY_DUPLICATES:
+        op.drop_index(f'ix_{table}_id', table_name=table)
+    for table, column in REDUNDANT_COLUMNS:
+        op.drop_index(f'ix_{table}_{column}', table_name=table)
+
+
+def downgrade() -> None:
+    for table, column in REDUNDANT_COLUMNS:
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False)
+    for table in PRIMARY_KEY_DUPLICATES:
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=False)
+
+    op.drop_index('ix_projects_created_at_id_live', table_name='projects')
+    op.drop_index('ix_notifications_user_id_created_at_id_unread', table_name='notifications')
+    op.drop_index('ix_tickets_project_id_status_created_at_id', table_name='tickets')
@@ -0,0 +1,52 @@
+"""Add project_ticket_stats summary table for dashboards
+
+Revision ID: d6e15bffd956
+Revises: 8f1cc103780d
+Create Date: 2026-10-18 16:40:52.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6e15bffd956'
+down_revision: Union[str, None] = '8f1cc103780d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('project_ticket_stats',
+    sa.Column('project_id', sa.UUID(), nullable=False, comment='References projects.id (no FK for sharding)'),
+    sa.Column('dimension', sa.String(length=20), nullable=False, comment='집계 기준 (status, priority, ticket_type, assignee, open_due)'),
+    sa.Column('key', sa.String(length=64), nullable=False, comment='기준 값 (enum 값, UUID, ISO 날짜 또는 none)'),
+    sa.Column('count', sa.Integer(), nullable=False, comment='Ticket 수'),
+    sa.PrimaryKeyConstraint('project_id', 'dimension', 'key')
+    )
+
+    # 기존 Ticket 집계 (이후에는 API가 갱신, scripts/rebuild_project_stats.py로 보정)
+    op.execute("""
+        INSERT INTO project_ticket_stats (project_id, dimension, key, count)
+        SELECT project_id, 'status', status::text, count(*) FROM tickets
+        WHERE NOT is_deleted GROUP BY project_id, status
+        UNION ALL
+        SELECT project_id, 'priority', priority::text, count(*) FROM tickets
+        WHERE NOT is_deleted GROUP BY project_id, priority
+        UNION ALL
+        SELECT project_id, 'ticket_type', coalesce(ticket_type_id::text, 'none'), count(*) FROM tickets
+        WHERE NOT is_deleted GROUP BY project_id, ticket_type_id
+        UNION ALL
+        SELECT project_id, 'assignee', coalesce(assignee_id::text, 'none'), count(*) FROM tickets
+        WHERE NOT is_deleted GROUP BY project_id, assignee_id
+        UNION ALL
+        SELECT project_id, 'open_due', due_date::text, count(*) FROM tickets
+        WHERE NOT is_deleted AND due_date IS NOT NULL AND status NOT IN ('DONE', 'CLOSED')
+        GROUP BY project_id, due_date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('project_ticket_stats')
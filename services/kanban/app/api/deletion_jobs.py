@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+import redis.asyncio as aioredis
+from uuid import UUID
+from app.redis_client import get_redis
+from app.auth import get_current_user_id
+from app.services.deletion_jobs import get_deletion_job
+from app.schemas.deletion_job import DeletionJobResponse
+
+router = APIRouter()
+
+@router.get("/{job_id}", response_model=DeletionJobResponse)
+async def get_deletion_job_status(
+    job_id: UUID,
+    redis: aioredis.Redis = Depends(get_redis),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    백그라운드 삭제 작업 상태 조회
+
+    DELETE /api/workspaces/{id}, DELETE /api/projects/{id}가 202로 반환한 작업의
+    상태와 진행률을 조회합니다. 완료/실패한 작업은 DELETION_JOB_RESULT_TTL 이후 만료됩니다.
+    """
+    job = await get_deletion_job(redis, str(job_id))
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Deletion job {job_id} not found"
+        )
+    return job
@@ -1,9 +1,7 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from app.database import get_db
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
 from app.config import settings
-import redis
+from app.services.readiness import readiness_monitor
 
 router = APIRouter()
 
@@ -30,41 +28,15 @@ async def liveness_probe():
     }
 
 @router.get("/health/ready")
-async def readiness_probe(db: Session = Depends(get_db)):
+async def readiness_probe():
     """
     Kubernetes Readiness Probe
     - 애플리케이션이 트래픽을 받을 준비가 되었는지 확인
-    - DB, Redis 등 의존성 체크
+    - DB, Redis 등 의존성 체크 (백그라운드 태스크가 주기적으로 확인한 결과를 즉시 반환)
     - 실패 시 트래픽 라우팅 중지 (재시작 안함)
     """
-    health_status = {
-        "status": "ready",
-        "service": settings.PROJECT_NAME,
-        "checks": {}
-    }
-
-    all_healthy = True
-
-    # 1. Database 연결 확인
-    try:
-        db.execute(text("SELECT 1"))
-        health_status["checks"]["database"] = "healthy"
-    except Exception as e:
-        health_status["checks"]["database"] = f"unhealthy: {str(e)}"
-        all_healthy = False
-
-    # 2. Redis 연결 확인
-    try:
-        redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-        redis_client.ping()
-        health_status["checks"]["redis"] = "healthy"
-        redis_client.close()
-    except Exception as e:
-        health_status["checks"]["redis"] = f"unhealthy: {str(e)}"
-        all_healthy = False
-
-    if not all_healthy:
-        health_status["status"] = "not_ready"
-        return health_status, status.HTTP_503_SERVICE_UNAVAILABLE
+    ready, health_status = readiness_monitor.snapshot()
+    if not ready:
+        return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=health_status)
 
     return health_status
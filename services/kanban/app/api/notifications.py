@@ -1,13 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+import redis.asyncio as aioredis
 from typing import Optional
 from uuid import UUID
 from datetime import datetime
 from app.database import get_db
+from app.redis_client import get_redis
 from app.auth import get_current_user_id
 from app.models.notification import Notification
 from app.models.enums import NotificationType
+from app.utils.pagination import paginate, count_total
+from app.utils.sql import update_if
+from app.services.notification_counter import (
+    get_unread_count as get_cached_unread_count,
+    adjust_unread_count,
+    invalidate_unread_count,
+)
+from app.services.notification_stream import (
+    notification_broker,
+    notification_event_stream,
+    publish_notification_event,
+)
 from app.schemas.notification import (
     NotificationCreate,
     NotificationResponse,
@@ -21,7 +36,8 @@ router = APIRouter()
 @router.post("/", response_model=NotificationResponse, status_code=status.HTTP_201_CREATED)
 async def create_notification(
     notification_in: NotificationCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -35,8 +51,14 @@ async def create_notification(
         created_by=current_user_id
     )
     db.add(db_notification)
-    db.commit()
-    db.refresh(db_notification)
+    await db.commit()
+
+    await adjust_unread_count(redis, db_notification.user_id, 1)
+
+    # 수신자의 열린 스트림으로 실시간 전송
+    payload = NotificationResponse.model_validate(db_notification).model_dump(mode="json")
+    await publish_notification_event(redis, db_notification.user_id, "notification", payload)
+    await publish_notification_event(redis, db_notification.user_id, "unread_count", {"delta": 1})
     return db_notification
 
 @router.get("/", response_model=NotificationListResponse)
@@ -45,7 +67,11 @@ async def list_notifications(
     notification_type: Optional[NotificationType] = Query(None, description="알림 타입 필터"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    include_total: bool = Query(True, description="전체 개수(total) 계산 여부"),
+    estimate_total: bool = Query(False, description="정확한 COUNT 대신 플래너 추정치 사용 (대용량 목록용)"),
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -54,62 +80,100 @@ async def list_notifications(
     - 최신순으로 정렬됩니다
     - is_read 파라미터로 읽음/안읽음 필터링 가능
     - notification_type으로 특정 타입만 필터링 가능
+    - cursor에 이전 응답의 next_cursor를 넘기면 keyset 페이지네이션으로 조회
     """
     # 현재 사용자의 알림만 조회
-    query = db.query(Notification).filter(Notification.user_id == current_user_id)
+    query = select(Notification).where(Notification.user_id == current_user_id)
 
     if is_read is not None:
-        query = query.filter(Notification.is_read == is_read)
+        query = query.where(Notification.is_read == is_read)
 
     if notification_type:
-        query = query.filter(Notification.notification_type == notification_type)
+        query = query.where(Notification.notification_type == notification_type)
 
-    total = query.count()
+    total, total_is_exact = await count_total(db, query, include_total, estimate_total)
 
-    # 읽지 않은 알림 개수 계산
-    unread_count = db.query(func.count(Notification.id)).filter(
-        Notification.user_id == current_user_id,
-        Notification.is_read == False
-    ).scalar()
+    # 읽지 않은 알림 개수 (Redis 캐시)
+    unread_count = await get_cached_unread_count(redis, db, current_user_id)
 
-    notifications = query.order_by(Notification.created_at.desc()).limit(limit).offset(offset).all()
+    notifications, next_cursor = await paginate(db, query, Notification, limit, offset, cursor)
 
     return {
         "total": total,
+        "total_is_exact": total_is_exact,
         "unread_count": unread_count,
         "items": notifications,
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor
     }
 
 @router.get("/unread-count", response_model=NotificationUnreadCountResponse)
 async def get_unread_count(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
     읽지 않은 알림 개수 조회
 
     헤더의 알림 뱃지 표시 등에 사용됩니다.
+    Redis에 캐시된 값을 반환하며, 캐시 미스 시 DB에서 계산합니다.
     """
-    unread_count = db.query(func.count(Notification.id)).filter(
-        Notification.user_id == current_user_id,
-        Notification.is_read == False
-    ).scalar()
+    unread_count = await get_cached_unread_count(redis, db, current_user_id)
 
     return {"unread_count": unread_count}
 
+@router.get("/stream")
+async def stream_notifications(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    실시간 알림 스트림 (Server-Sent Events)
+
+    unread-count 폴링 대신 사용합니다.
+    - 연결 직후: unread_count 스냅샷 ({"unread_count": n})
+    - notification: 새 알림
+    - unread_count: 개수 변화 ({"delta": n})
+    - resync: 클라이언트가 이벤트를 따라오지 못함. 재연결하여 스냅샷부터 다시 받아야 함
+    """
+    unread_count = await get_cached_unread_count(redis, db, current_user_id)
+    # 스트림이 열려 있는 동안 DB 커넥션을 점유하지 않도록 세션을 즉시 반환
+    await db.close()
+
+    queue = notification_broker.subscribe(current_user_id)
+
+    async def event_stream():
+        try:
+            async for chunk in notification_event_stream(request, queue, unread_count):
+                yield chunk
+        finally:
+            notification_broker.unsubscribe(current_user_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # Nginx Ingress 응답 버퍼링 비활성화
+            "X-Accel-Buffering": "no",
+        }
+    )
+
 @router.get("/{notification_id}", response_model=NotificationResponse)
 async def get_notification(
     notification_id: UUID = Path(..., description="알림 ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """특정 알림 조회"""
-    notification = db.query(Notification).filter(
+    notification = await db.scalar(select(Notification).where(
         Notification.id == notification_id,
         Notification.user_id == current_user_id
-    ).first()
+    ))
     if not notification:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -120,37 +184,42 @@ async def get_notification(
 @router.patch("/{notification_id}/read", response_model=NotificationMarkReadResponse)
 async def mark_notification_as_read(
     notification_id: UUID = Path(..., description="알림 ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
     알림을 읽음으로 표시
 
     is_read를 True로 설정하고 read_at에 현재 시각을 저장합니다.
+    확인과 수정을 한 문장으로 처리하므로 동시에 여러 번 요청해도 읽지 않은 알림 개수는 한 번만 줄어듭니다.
     """
-    notification = db.query(Notification).filter(
-        Notification.id == notification_id,
-        Notification.user_id == current_user_id
-    ).first()
-    if not notification:
+    updated = await update_if(
+        db, Notification,
+        [Notification.id == notification_id, Notification.user_id == current_user_id],
+        lambda before: before.is_read == False,
+        {"is_read": True, "read_at": datetime.utcnow(), "updated_by": current_user_id},
+        ["is_read", "read_at"]
+    )
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Notification {notification_id} not found"
         )
 
-    if notification.is_read:
+    notification, previous = updated
+    if notification is None:
         # 이미 읽음 상태
         return {
-            "id": notification.id,
-            "is_read": notification.is_read,
-            "read_at": notification.read_at
+            "id": notification_id,
+            "is_read": previous["is_read"],
+            "read_at": previous["read_at"]
         }
 
-    notification.is_read = True
-    notification.read_at = datetime.utcnow()
-    notification.updated_by = current_user_id
-    db.commit()
-    db.refresh(notification)
+    await db.commit()
+
+    await adjust_unread_count(redis, current_user_id, -1)
+    await publish_notification_event(redis, current_user_id, "unread_count", {"delta": -1})
 
     return {
         "id": notification.id,
@@ -160,7 +229,8 @@ async def mark_notification_as_read(
 
 @router.post("/mark-all-read", status_code=status.HTTP_200_OK)
 async def mark_all_notifications_as_read(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -168,16 +238,27 @@ async def mark_all_notifications_as_read(
 
     현재 사용자의 읽지 않은 알림을 모두 읽음 처리합니다.
     """
-    updated_count = db.query(Notification).filter(
-        Notification.user_id == current_user_id,
-        Notification.is_read == False
-    ).update({
-        "is_read": True,
-        "read_at": datetime.utcnow(),
-        "updated_by": current_user_id
-    }, synchronize_session=False)
+    result = await db.execute(
+        update(Notification)
+        .where(
+            Notification.user_id == current_user_id,
+            Notification.is_read == False
+        )
+        .values(
+            is_read=True,
+            read_at=datetime.utcnow(),
+            updated_by=current_user_id
+        )
+        .execution_options(synchronize_session=False)
+    )
+    updated_count = result.rowcount
+
+    await db.commit()
 
-    db.commit()
+    # 0으로 덮어쓰면 직후 생성된 알림의 증가분을 잃을 수 있으므로 캐시를 비움
+    await invalidate_unread_count(redis, current_user_id)
+    if updated_count:
+        await publish_notification_event(redis, current_user_id, "unread_count", {"delta": -updated_count})
 
     return {
         "message": f"{updated_count} notifications marked as read",
@@ -187,7 +268,8 @@ async def mark_all_notifications_as_read(
 @router.delete("/{notification_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_notification(
     notification_id: UUID = Path(..., description="알림 ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -196,16 +278,21 @@ async def delete_notification(
     알림은 소프트 삭제 대신 영구 삭제됩니다.
     사용자가 알림을 삭제하면 복구할 수 없습니다.
     """
-    notification = db.query(Notification).filter(
+    notification = await db.scalar(select(Notification).where(
         Notification.id == notification_id,
         Notification.user_id == current_user_id
-    ).first()
+    ))
     if not notification:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Notification {notification_id} not found"
         )
 
-    db.delete(notification)
-    db.commit()
+    was_unread = not notification.is_read
+    await db.delete(notification)
+    await db.commit()
+
+    if was_unread:
+        await adjust_unread_count(redis, current_user_id, -1)
+        await publish_notification_event(redis, current_user_id, "unread_count", {"delta": -1})
     return None
@@ -1,17 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query, Header, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import redis.asyncio as aioredis
 from typing import Optional
 from uuid import UUID
 from app.database import get_db
+from app.redis_client import get_redis
 from app.auth import get_current_user_id
+from app.config import settings
 from app.models.project import Project
+from app.models.ticket import Ticket
+from app.models.ticket_type import TicketType
+from app.utils.pagination import paginate, count_total
+from app.utils.etag import etag_matches, if_match_condition, make_etag, not_modified
+from app.utils.sql import update_if
+from app.services.cascade_delete import purge_project
+from app.services.notification_counter import invalidate_unread_counts
+from app.services.deletion_jobs import TARGET_PROJECT, enqueue_deletion_job
+from app.services.project_changes import get_changes
+from app.services.project_stats import get_project_stats as get_cached_project_stats
+from app.services.project_export import EXPORT_MEDIA_TYPES, export_project, gzip_stream
+from app.services.ticket_import import ImportAbortedError, aiter_lines, import_records, read_records
+from app.schemas.deletion_job import DeletionJobResponse
+from app.schemas.ticket_import import ImportResponse
+from app.schemas.board import BoardResponse
+from app.schemas.project_changes import ProjectChangesResponse
 from app.models.workspace import Workspace
-from app.models.enums import ProjectStatus, Priority
+from app.models.enums import ProjectStatus, Priority, TicketStatus
 from app.schemas.project import (
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
-    ProjectListResponse
+    ProjectListResponse,
+    ProjectStatsResponse
 )
 
 router = APIRouter()
@@ -19,12 +41,13 @@ router = APIRouter()
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_in: ProjectCreate,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """새로운 Project 생성"""
     # Workspace 존재 확인
-    workspace = db.query(Workspace).filter(Workspace.id == project_in.workspace_id).first()
+    workspace = await db.get(Workspace, project_in.workspace_id)
     if not workspace:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -36,8 +59,8 @@ async def create_project(
         created_by=current_user_id
     )
     db.add(db_project)
-    db.commit()
-    db.refresh(db_project)
+    await db.commit()
+    response.headers["ETag"] = make_etag(db_project.version)
     return db_project
 
 @router.get("/", response_model=ProjectListResponse)
@@ -47,99 +70,288 @@ async def list_projects(
     priority: Optional[Priority] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    include_total: bool = Query(True, description="전체 개수(total) 계산 여부"),
+    estimate_total: bool = Query(False, description="정확한 COUNT 대신 플래너 추정치 사용 (대용량 목록용)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Project 목록 조회 (필터링 및 페이지네이션)"""
-    query = db.query(Project)
+    """Project 목록 조회 (필터링 및 offset 또는 cursor 페이지네이션)"""
+    # 백그라운드 삭제 대기 중인 Project(is_deleted) 제외
+    query = select(Project).where(Project.is_deleted == False)
 
     if workspace_id:
-        query = query.filter(Project.workspace_id == workspace_id)
+        query = query.where(Project.workspace_id == workspace_id)
     if status_filter:
-        query = query.filter(Project.status == status_filter)
+        query = query.where(Project.status == status_filter)
     if priority:
-        query = query.filter(Project.priority == priority)
+        query = query.where(Project.priority == priority)
 
-    total = query.count()
-    projects = query.order_by(Project.created_at.desc()).limit(limit).offset(offset).all()
+    total, total_is_exact = await count_total(db, query, include_total, estimate_total)
+    projects, next_cursor = await paginate(db, query, Project, limit, offset, cursor)
 
     return {
         "total": total,
+        "total_is_exact": total_is_exact,
         "items": projects,
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor
     }
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 async def get_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (같으면 304)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """특정 Project 조회"""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    """특정 Project 조회 (If-None-Match가 현재 ETag와 같으면 본문 없이 304)"""
+    project = await db.get(Project, project_id)
+    if not project or project.is_deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project {project_id} not found"
         )
+    if etag_matches(if_none_match, project.version):
+        return not_modified(project.version)
+    response.headers["ETag"] = make_etag(project.version)
     return project
 
+@router.get("/{project_id}/board", response_model=BoardResponse)
+async def get_project_board(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    프로젝트 칸반 보드 조회 (한 번의 요청으로 보드 전체 반환)
+
+    Project, 티켓 타입, TicketStatus별로 묶은 Ticket(Task 진행 요약 포함)을
+    Ticket 수와 관계없이 고정된 3개의 쿼리로 조회합니다.
+    Task 요약은 tickets의 비정규화 카운터를 사용하므로 Task 테이블을 읽지 않습니다.
+    """
+    project = await db.get(Project, project_id)
+    if not project or project.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found"
+        )
+
+    ticket_types = (await db.scalars(
+        select(TicketType)
+        .where(TicketType.project_id == project_id, TicketType.is_deleted == False)
+        .order_by(TicketType.display_order.asc().nulls_last(), TicketType.type_name)
+    )).all()
+
+    tickets = (await db.scalars(
+        select(Ticket)
+        .where(Ticket.project_id == project_id, Ticket.is_deleted == False)
+        .order_by(Ticket.created_at, Ticket.id)
+    )).all()
+
+    columns = {ticket_status: [] for ticket_status in TicketStatus}
+    for ticket in tickets:
+        columns[ticket.status].append(ticket)
+
+    return {
+        "project": project,
+        "ticket_types": ticket_types,
+        "columns": [
+            {"status": ticket_status, "count": len(items), "tickets": items}
+            for ticket_status, items in columns.items()
+        ],
+    }
+
+@router.get("/{project_id}/stats", response_model=ProjectStatsResponse)
+async def get_project_stats(
+    project_id: UUID,
+    db: AsyncSession = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    프로젝트 대시보드 Ticket 집계 조회
+
+    상태/우선순위/티켓 타입/담당자별 Ticket 수와 기한 초과 수를 반환합니다.
+    Ticket 변경 시 갱신되는 요약 테이블(project_ticket_stats)만 읽으므로 Ticket 수와 무관합니다.
+    """
+    project = await db.get(Project, project_id)
+    if not project or project.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found"
+        )
+    return await get_cached_project_stats(db, project_id)
+
+@router.get("/{project_id}/changes", response_model=ProjectChangesResponse)
+async def get_project_changes(
+    project_id: UUID,
+    since: Optional[str] = Query(None, description="이전 응답의 next_token (생략 시 전체 동기화)"),
+    limit: int = Query(500, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    보드 변경 동기화 - since 이후 생성/수정/삭제된 Ticket, Task
+
+    클라이언트는 응답의 tickets/tasks를 id 기준으로 덮어쓰고 deleted를 제거한 뒤
+    next_token을 저장합니다. has_more가 true면 바로 다시 요청합니다.
+    같은 항목이 여러 번 전달될 수 있으므로 반영은 멱등이어야 합니다.
+    삭제 기록 보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)보다 오래된 토큰은 410이며 since 없이 다시 동기화해야 합니다.
+    """
+    project = await db.get(Project, project_id)
+    if not project or project.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found"
+        )
+    return await get_changes(db, project_id, since, limit)
+
+@router.post("/{project_id}/import", response_model=ImportResponse)
+async def import_project_tickets(
+    project_id: UUID,
+    request: Request,
+    import_format: Optional[str] = Query(
+        None, alias="format", pattern="^(ndjson|csv)$",
+        description="ndjson 또는 csv (기본값: Content-Type이 text/csv면 csv, 아니면 ndjson)"
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Ticket/Task/댓글 대량 가져오기
+
+    요청 본문(NDJSON 또는 CSV)을 스트리밍으로 읽어 chunk 단위로 검증하고 COPY로 적재합니다.
+    원본 시스템의 ID는 새 UUID로 바뀌며, 검증에 실패한 레코드는 건너뛰고 결과에 보고합니다.
+    수십만 건 이상은 scripts/import_tickets.py 사용을 권장합니다.
+    """
+    project = await db.get(Project, project_id)
+    if not project or project.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found"
+        )
+
+    if import_format is None:
+        import_format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    records = read_records(aiter_lines(request.stream()), import_format)
+    try:
+        return await import_records(db, project_id, current_user_id, records)
+    except ImportAbortedError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc)
+        )
+
+@router.get("/{project_id}/export")
+async def export_project_data(
+    project_id: UUID,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson 또는 csv"),
+    gzip: bool = Query(False, description="gzip으로 압축 (.gz 파일로 내려받음)"),
+    db: AsyncSession = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Project 전체 내보내기 (멤버, Ticket, Task, 댓글)
+
+    서버 측 커서로 읽은 batch를 바로 응답 본문으로 보내므로 Project 크기와 관계없이
+    메모리 사용량이 일정합니다. 레코드 형식은 가져오기(POST /{project_id}/import)와 같습니다.
+    """
+    project = await db.get(Project, project_id)
+    if not project or project.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Project {project_id} not found"
+        )
+    # 내보내기는 REPEATABLE READ 스냅샷 트랜잭션으로 새로 시작
+    # (세션은 get_db 의존성이 응답 전송이 끝난 뒤 닫음)
+    await db.rollback()
+
+    body = export_project(db, project_id, export_format)
+    filename = f"project-{project_id}.{export_format}"
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    if gzip:
+        body = gzip_stream(body)
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.patch("/{project_id}", response_model=ProjectResponse)
 async def update_project(
     project_id: UUID,
     project_in: ProjectUpdate,
-    db: Session = Depends(get_db),
+    response: Response,
+    if_match: Optional[str] = Header(None, description="조회한 ETag (그 사이 수정되었으면 412)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Project 정보 수정"""
-    project = db.query(Project).filter(Project.id == project_id).first()
-    if not project:
+    """Project 정보 수정 (If-Match 지정 시 ETag가 같을 때만 수정)"""
+    updated = await update_if(
+        db, Project, [Project.id == project_id, Project.is_deleted == False], if_match_condition(if_match),
+        {**project_in.model_dump(exclude_unset=True), "updated_by": current_user_id}
+    )
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project {project_id} not found"
         )
 
-    update_data = project_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(project, field, value)
-
-    project.updated_by = current_user_id
-
-    db.commit()
-    db.refresh(project)
+    project, _ = updated
+    if project is None:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Project {project_id} has been modified"
+        )
+    await db.commit()
+    response.headers["ETag"] = make_etag(project.version)
     return project
 
-@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{project_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": DeletionJobResponse}}
+)
 async def delete_project(
     project_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Project 삭제 (애플리케이션 레벨에서 CASCADE 처리)"""
-    from app.models.ticket import Ticket
-    from app.models.task import Task
+    """
+    Project 삭제 (애플리케이션 레벨에서 CASCADE 처리)
+
+    하위 Ticket/Task와 댓글, 첨부파일, 멤버, 티켓 타입, 관련 알림을
+    Ticket 묶음 단위로 배치 삭제합니다.
 
-    project = db.query(Project).filter(Project.id == project_id).first()
+    DELETION_JOBS_ENABLED이면 Project를 소프트 삭제로 표시하고 백그라운드 삭제 작업을
+    등록한 뒤 202와 작업 상태를 반환합니다 (GET /api/deletion-jobs/{job_id}로 진행률 조회).
+    """
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Project {project_id} not found"
         )
 
-    # 애플리케이션 레벨에서 CASCADE 삭제 (샤딩 대비)
-    # 1. project에 속한 모든 ticket 찾기
-    tickets = db.query(Ticket).filter(Ticket.project_id == project_id).all()
-    ticket_ids = [t.id for t in tickets]
-
-    if ticket_ids:
-        # 2. ticket들에 속한 모든 task 삭제
-        db.query(Task).filter(Task.ticket_id.in_(ticket_ids)).delete(synchronize_session=False)
+    if settings.DELETION_JOBS_ENABLED:
+        # 이미 소프트 삭제된 Project는 진행 중인 작업을 반환하거나 실패한 작업을 재등록
+        if not project.is_deleted:
+            project.is_deleted = True
+            project.updated_by = current_user_id
+            await db.commit()
+        job = await enqueue_deletion_job(redis, TARGET_PROJECT, project_id, current_user_id)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=DeletionJobResponse.model_validate(job).model_dump(mode="json")
+        )
 
-    # 3. project에 속한 모든 ticket 삭제
-    db.query(Ticket).filter(Ticket.project_id == project_id).delete(synchronize_session=False)
+    # 애플리케이션 레벨에서 CASCADE 삭제 (샤딩 대비) - project 자체도 삭제됨
+    result = await purge_project(db, project_id)
 
-    # 4. project 삭제
-    db.delete(project)
-    db.commit()
+    await invalidate_unread_counts(redis, result.notification_user_ids)
     return None
@@ -1,17 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from uuid import UUID
 from app.database import get_db
 from app.auth import get_current_user_id
 from app.models.task import Task
+from app.utils.pagination import paginate, count_total
+from app.utils.etag import etag_matches, if_match_condition, make_etag, not_modified
+from app.utils.sql import update_if
 from app.models.ticket import Ticket
 from app.models.enums import TaskStatus
+from app.config import settings
+from app.services.bulk_mutations import apply_task_bulk
+from app.services.project_changes import add_tombstones
+from app.services.task_rollup import task_added, task_removed, task_status_changed
 from app.schemas.task import (
     TaskCreate,
     TaskUpdate,
     TaskResponse,
-    TaskListResponse
+    TaskListResponse,
+    TaskBulkRequest,
+    TaskBulkResponse
 )
 
 router = APIRouter()
@@ -19,12 +29,13 @@ router = APIRouter()
 @router.post("/", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task_in: TaskCreate,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """새로운 Task 생성"""
     # Ticket 존재 확인
-    ticket = db.query(Ticket).filter(Ticket.id == task_in.ticket_id).first()
+    ticket = await db.get(Ticket, task_in.ticket_id)
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -36,117 +47,170 @@ async def create_task(
         created_by=current_user_id
     )
     db.add(db_task)
-    db.commit()
-    db.refresh(db_task)
+    await task_added(db, db_task)
+    await db.commit()
+    response.headers["ETag"] = make_etag(db_task.version)
     return db_task
 
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def bulk_tasks(
+    bulk_in: TaskBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Task 일괄 생성/수정/삭제 (한 트랜잭션)
+
+    같은 수정 내용의 항목은 UPDATE 한 번으로 처리하고, Ticket별 Task 개수도 함께 갱신합니다.
+    존재하지 않는 대상은 항목별 결과에 not_found로 표시하고 나머지는 반영합니다
+    (all_or_nothing=true면 아무것도 반영하지 않음).
+    """
+    if bulk_in.item_count > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Too many items (max {settings.BULK_MAX_ITEMS})"
+        )
+    return await apply_task_bulk(db, bulk_in, current_user_id)
+
 @router.get("/", response_model=TaskListResponse)
 async def list_tasks(
     ticket_id: Optional[UUID] = Query(None),
     status_filter: Optional[TaskStatus] = Query(None, alias="status"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    include_total: bool = Query(True, description="전체 개수(total) 계산 여부"),
+    estimate_total: bool = Query(False, description="정확한 COUNT 대신 플래너 추정치 사용 (대용량 목록용)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Task 목록 조회 (필터링 및 페이지네이션)"""
-    query = db.query(Task)
+    """Task 목록 조회 (필터링 및 offset 또는 cursor 페이지네이션)"""
+    query = select(Task)
 
     if ticket_id:
-        query = query.filter(Task.ticket_id == ticket_id)
+        query = query.where(Task.ticket_id == ticket_id)
     if status_filter:
-        query = query.filter(Task.status == status_filter)
+        query = query.where(Task.status == status_filter)
 
-    total = query.count()
-    tasks = query.order_by(Task.created_at.desc()).limit(limit).offset(offset).all()
+    total, total_is_exact = await count_total(db, query, include_total, estimate_total)
+    tasks, next_cursor = await paginate(db, query, Task, limit, offset, cursor)
 
     return {
         "total": total,
+        "total_is_exact": total_is_exact,
         "items": tasks,
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor
     }
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: UUID,
-    db: Session = Depends(get_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (같으면 304)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """특정 Task 조회"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    """특정 Task 조회 (If-None-Match가 현재 ETag와 같으면 본문 없이 304)"""
+    task = await db.get(Task, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task {task_id} not found"
         )
+    if etag_matches(if_none_match, task.version):
+        return not_modified(task.version)
+    response.headers["ETag"] = make_etag(task.version)
     return task
 
 @router.patch("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: UUID,
     task_in: TaskUpdate,
-    db: Session = Depends(get_db),
+    response: Response,
+    if_match: Optional[str] = Header(None, description="조회한 ETag (그 사이 수정되었으면 412)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Task 정보 수정"""
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
+    """Task 정보 수정 (If-Match 지정 시 ETag가 같을 때만 수정)"""
+    # Task 개수 증감용 수정 전 상태는 같은 UPDATE 문에서 행을 잠그고 읽음
+    updated = await update_if(
+        db, Task, [Task.id == task_id], if_match_condition(if_match),
+        {**task_in.model_dump(exclude_unset=True), "updated_by": current_user_id},
+        ["status"]
+    )
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task {task_id} not found"
         )
 
-    update_data = task_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
-    task.updated_by = current_user_id
-
-    db.commit()
-    db.refresh(task)
+    task, previous = updated
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Task {task_id} has been modified"
+        )
+    await task_status_changed(db, task, previous["status"])
+    await db.commit()
+    response.headers["ETag"] = make_etag(task.version)
     return task
 
 @router.patch("/{task_id}/complete", response_model=TaskResponse)
 async def complete_task(
     task_id: UUID,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Task 완료 처리 (상태를 DONE으로 변경 및 완료 시간 기록)"""
-    task = db.query(Task).filter(Task.id == task_id).first()
-    if not task:
+    # 확인과 수정을 한 문장으로 처리: 동시에 여러 번 눌러도 한 번만 완료되고 Task 개수도 한 번만 반영
+    updated = await update_if(
+        db, Task, [Task.id == task_id],
+        lambda before: before.status != TaskStatus.DONE,
+        {"status": TaskStatus.DONE, "completed_at": func.now(), "updated_by": current_user_id},
+        ["status"]
+    )
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task {task_id} not found"
         )
 
-    if task.status == TaskStatus.DONE:
+    task, previous = updated
+    if task is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Task is already completed"
         )
 
-    task.mark_completed()
-    task.updated_by = current_user_id
-    db.commit()
-    db.refresh(task)
+    await task_status_changed(db, task, previous["status"])
+    await db.commit()
+    response.headers["ETag"] = make_etag(task.version)
     return task
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Task 삭제"""
-    task = db.query(Task).filter(Task.id == task_id).first()
+    """
+    Task 삭제
+
+    행을 잠그고 읽은 상태로 Ticket의 Task 요약을 줄입니다. 동시에 상태를 바꾸거나 삭제하는
+    요청은 잠금을 기다린 뒤 최신 상태를 보므로 다른 상태 카운터를 줄이거나 두 번 줄이지 않습니다.
+    """
+    task = await db.get(Task, task_id, with_for_update=True)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task {task_id} not found"
         )
 
-    db.delete(task)
-    db.commit()
+    await add_tombstones(db, Task, [task_id], current_user_id)
+    await db.delete(task)
+    await task_removed(db, task)
+    await db.commit()
     return None
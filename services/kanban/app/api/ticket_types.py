@@ -1,10 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from uuid import UUID
 from app.database import get_db
 from app.auth import get_current_user_id
 from app.models.ticket_type import TicketType
+from app.utils.pagination import count_total
 from app.models.project import Project
 from app.schemas.ticket_type import (
     TicketTypeCreate,
@@ -19,7 +21,7 @@ router = APIRouter()
 async def create_ticket_type(
     project_id: UUID = Path(..., description="프로젝트 ID"),
     ticket_type_in: TicketTypeCreate = ...,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -32,10 +34,10 @@ async def create_ticket_type(
     - **display_order**: 표시 순서 (optional)
     """
     # 프로젝트 존재 확인
-    project = db.query(Project).filter(
+    project = await db.scalar(select(Project).where(
         Project.id == project_id,
         Project.is_deleted == False
-    ).first()
+    ))
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -43,11 +45,11 @@ async def create_ticket_type(
         )
 
     # 동일한 프로젝트 내에서 타입 이름 중복 확인
-    existing_type = db.query(TicketType).filter(
+    existing_type = await db.scalar(select(TicketType).where(
         TicketType.project_id == project_id,
         TicketType.type_name == ticket_type_in.type_name,
         TicketType.is_deleted == False
-    ).first()
+    ))
     if existing_type:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -60,8 +62,7 @@ async def create_ticket_type(
         created_by=current_user_id
     )
     db.add(db_ticket_type)
-    db.commit()
-    db.refresh(db_ticket_type)
+    await db.commit()
     return db_ticket_type
 
 @router.get("/", response_model=TicketTypeListResponse)
@@ -70,7 +71,9 @@ async def list_ticket_types(
     include_deleted: bool = Query(False, description="삭제된 항목 포함 여부"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    include_total: bool = Query(True, description="전체 개수(total) 계산 여부"),
+    estimate_total: bool = Query(False, description="정확한 COUNT 대신 플래너 추정치 사용 (대용량 목록용)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -78,19 +81,24 @@ async def list_ticket_types(
 
     display_order 순으로 정렬되어 반환됩니다.
     """
-    query = db.query(TicketType).filter(TicketType.project_id == project_id)
+    query = select(TicketType).where(TicketType.project_id == project_id)
 
     if not include_deleted:
-        query = query.filter(TicketType.is_deleted == False)
-
-    total = query.count()
-    ticket_types = query.order_by(
-        TicketType.display_order.asc().nulls_last(),
-        TicketType.created_at.asc()
-    ).limit(limit).offset(offset).all()
+        query = query.where(TicketType.is_deleted == False)
+
+    total, total_is_exact = await count_total(db, query, include_total, estimate_total)
+    ticket_types = (
+        await db.scalars(
+            query.order_by(
+                TicketType.display_order.asc().nulls_last(),
+                TicketType.created_at.asc()
+            ).limit(limit).offset(offset)
+        )
+    ).all()
 
     return {
         "total": total,
+        "total_is_exact": total_is_exact,
         "items": ticket_types,
         "limit": limit,
         "offset": offset
@@ -100,14 +108,14 @@ async def list_ticket_types(
 async def get_ticket_type(
     project_id: UUID = Path(..., description="프로젝트 ID"),
     type_id: UUID = Path(..., description="티켓 타입 ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """특정 티켓 타입 조회"""
-    ticket_type = db.query(TicketType).filter(
+    ticket_type = await db.scalar(select(TicketType).where(
         TicketType.id == type_id,
         TicketType.project_id == project_id
-    ).first()
+    ))
     if not ticket_type:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -120,15 +128,15 @@ async def update_ticket_type(
     project_id: UUID = Path(..., description="프로젝트 ID"),
     type_id: UUID = Path(..., description="티켓 타입 ID"),
     ticket_type_in: TicketTypeUpdate = ...,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """티켓 타입 정보 수정"""
-    ticket_type = db.query(TicketType).filter(
+    ticket_type = await db.scalar(select(TicketType).where(
         TicketType.id == type_id,
         TicketType.project_id == project_id,
         TicketType.is_deleted == False
-    ).first()
+    ))
     if not ticket_type:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -137,12 +145,12 @@ async def update_ticket_type(
 
     # 타입 이름 변경 시 중복 확인
     if ticket_type_in.type_name and ticket_type_in.type_name != ticket_type.type_name:
-        existing_type = db.query(TicketType).filter(
+        existing_type = await db.scalar(select(TicketType).where(
             TicketType.project_id == project_id,
             TicketType.type_name == ticket_type_in.type_name,
             TicketType.is_deleted == False,
             TicketType.id != type_id
-        ).first()
+        ))
         if existing_type:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -155,15 +163,14 @@ async def update_ticket_type(
         setattr(ticket_type, field, value)
 
     ticket_type.updated_by = current_user_id
-    db.commit()
-    db.refresh(ticket_type)
+    await db.commit()
     return ticket_type
 
 @router.delete("/{type_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_ticket_type(
     project_id: UUID = Path(..., description="프로젝트 ID"),
     type_id: UUID = Path(..., description="티켓 타입 ID"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """
@@ -172,10 +179,10 @@ async def delete_ticket_type(
     is_deleted 플래그를 True로 설정합니다.
     이미 이 타입을 사용하는 티켓들은 영향받지 않습니다.
     """
-    ticket_type = db.query(TicketType).filter(
+    ticket_type = await db.scalar(select(TicketType).where(
         TicketType.id == type_id,
         TicketType.project_id == project_id
-    ).first()
+    ))
     if not ticket_type:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -190,5 +197,5 @@ async def delete_ticket_type(
 
     ticket_type.is_deleted = True
     ticket_type.updated_by = current_user_id
-    db.commit()
+    await db.commit()
     return None
@@ -1,17 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from types import SimpleNamespace
 from typing import Optional
 from uuid import UUID
 from app.database import get_db
 from app.auth import get_current_user_id
 from app.models.ticket import Ticket
+from app.utils.pagination import paginate, count_total
+from app.utils.etag import etag_matches, if_match_condition, make_etag, not_modified
+from app.utils.sql import update_if
 from app.models.project import Project
 from app.models.enums import TicketStatus, Priority
+from app.config import settings
+from app.services.bulk_mutations import apply_ticket_bulk
+from app.services.project_changes import add_tombstones
+from app.services.project_stats import (
+    TICKET_STAT_COLUMNS, ticket_stat_keys, tickets_added, tickets_removed, ticket_changed
+)
 from app.schemas.ticket import (
     TicketCreate,
     TicketUpdate,
     TicketResponse,
-    TicketListResponse
+    TicketListResponse,
+    TicketBulkRequest,
+    TicketBulkResponse
 )
 
 router = APIRouter()
@@ -19,12 +32,13 @@ router = APIRouter()
 @router.post("/", response_model=TicketResponse, status_code=status.HTTP_201_CREATED)
 async def create_ticket(
     ticket_in: TicketCreate,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """새로운 Ticket 생성"""
     # Project 존재 확인
-    project = db.query(Project).filter(Project.id == ticket_in.project_id).first()
+    project = await db.get(Project, ticket_in.project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -36,10 +50,31 @@ async def create_ticket(
         created_by=current_user_id
     )
     db.add(db_ticket)
-    db.commit()
-    db.refresh(db_ticket)
+    await tickets_added(db, [db_ticket])
+    await db.commit()
+    response.headers["ETag"] = make_etag(db_ticket.version)
     return db_ticket
 
+@router.post("/bulk", response_model=TicketBulkResponse)
+async def bulk_tickets(
+    bulk_in: TicketBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user_id: UUID = Depends(get_current_user_id)
+):
+    """
+    Ticket 일괄 생성/수정/삭제 (한 트랜잭션)
+
+    같은 수정 내용(예: status=DONE)의 항목은 UPDATE 한 번으로 처리합니다.
+    존재하지 않는 대상은 항목별 결과에 not_found로 표시하고 나머지는 반영합니다
+    (all_or_nothing=true면 아무것도 반영하지 않음).
+    """
+    if bulk_in.item_count > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Too many items (max {settings.BULK_MAX_ITEMS})"
+        )
+    return await apply_ticket_bulk(db, bulk_in, current_user_id)
+
 @router.get("/", response_model=TicketListResponse)
 async def list_tickets(
     project_id: Optional[UUID] = Query(None),
@@ -47,79 +82,97 @@ async def list_tickets(
     priority: Optional[Priority] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    include_total: bool = Query(True, description="전체 개수(total) 계산 여부"),
+    estimate_total: bool = Query(False, description="정확한 COUNT 대신 플래너 추정치 사용 (대용량 목록용)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Ticket 목록 조회 (필터링 및 페이지네이션)"""
-    query = db.query(Ticket)
+    """Ticket 목록 조회 (필터링 및 offset 또는 cursor 페이지네이션)"""
+    query = select(Ticket)
 
     if project_id:
-        query = query.filter(Ticket.project_id == project_id)
+        query = query.where(Ticket.project_id == project_id)
     if status_filter:
-        query = query.filter(Ticket.status == status_filter)
+        query = query.where(Ticket.status == status_filter)
     if priority:
-        query = query.filter(Ticket.priority == priority)
+        query = query.where(Ticket.priority == priority)
 
-    total = query.count()
-    tickets = query.order_by(Ticket.created_at.desc()).limit(limit).offset(offset).all()
+    total, total_is_exact = await count_total(db, query, include_total, estimate_total)
+    tickets, next_cursor = await paginate(db, query, Ticket, limit, offset, cursor)
 
     return {
         "total": total,
+        "total_is_exact": total_is_exact,
         "items": tickets,
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor
     }
 
 @router.get("/{ticket_id}", response_model=TicketResponse)
 async def get_ticket(
     ticket_id: UUID,
-    db: Session = Depends(get_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(None, description="이전 응답의 ETag (같으면 304)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """특정 Ticket 조회"""
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    """특정 Ticket 조회 (If-None-Match가 현재 ETag와 같으면 본문 없이 304)"""
+    ticket = await db.get(Ticket, ticket_id)
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Ticket {ticket_id} not found"
         )
+    if etag_matches(if_none_match, ticket.version):
+        return not_modified(ticket.version)
+    response.headers["ETag"] = make_etag(ticket.version)
     return ticket
 
 @router.patch("/{ticket_id}", response_model=TicketResponse)
 async def update_ticket(
     ticket_id: UUID,
     ticket_in: TicketUpdate,
-    db: Session = Depends(get_db),
+    response: Response,
+    if_match: Optional[str] = Header(None, description="조회한 ETag (그 사이 수정되었으면 412)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Ticket 정보 수정"""
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
-    if not ticket:
+    """Ticket 정보 수정 (If-Match 지정 시 ETag가 같을 때만 수정)"""
+    # 집계 증감용 수정 전 값은 같은 UPDATE 문에서 행을 잠그고 읽음 (조회 왕복 없음, 동시 수정에도 정확)
+    updated = await update_if(
+        db, Ticket, [Ticket.id == ticket_id], if_match_condition(if_match),
+        {**ticket_in.model_dump(exclude_unset=True), "updated_by": current_user_id},
+        TICKET_STAT_COLUMNS
+    )
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Ticket {ticket_id} not found"
         )
 
-    update_data = ticket_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(ticket, field, value)
-
-    ticket.updated_by = current_user_id
-
-    db.commit()
-    db.refresh(ticket)
+    ticket, previous = updated
+    if ticket is None:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Ticket {ticket_id} has been modified"
+        )
+    await ticket_changed(db, ticket, ticket_stat_keys(SimpleNamespace(**previous)))
+    await db.commit()
+    response.headers["ETag"] = make_etag(ticket.version)
     return ticket
 
 @router.delete("/{ticket_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_ticket(
     ticket_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Ticket 삭제 (애플리케이션 레벨에서 CASCADE 처리)"""
     from app.models.task import Task
 
-    ticket = db.query(Ticket).filter(Ticket.id == ticket_id).first()
+    ticket = await db.get(Ticket, ticket_id, with_for_update=True)
     if not ticket:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -128,9 +181,13 @@ async def delete_ticket(
 
     # 애플리케이션 레벨에서 CASCADE 삭제 (샤딩 대비)
     # 1. ticket에 속한 모든 task 삭제
-    db.query(Task).filter(Task.ticket_id == ticket_id).delete(synchronize_session=False)
+    await db.execute(
+        delete(Task).where(Task.ticket_id == ticket_id).execution_options(synchronize_session=False)
+    )
 
-    # 2. ticket 삭제
-    db.delete(ticket)
-    db.commit()
+    # 2. ticket 삭제 및 프로젝트 집계, 변경 동기화용 삭제 기록 반영
+    await add_tombstones(db, Ticket, [ticket_id], current_user_id)
+    await db.delete(ticket)
+    await tickets_removed(db, [ticket])
+    await db.commit()
     return None
@@ -1,9 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+import redis.asyncio as aioredis
+from typing import Optional
 from uuid import UUID
 from app.database import get_db
+from app.redis_client import get_redis
 from app.auth import get_current_user_id
+from app.config import settings
 from app.models.workspace import Workspace
+from app.models.project import Project
+from app.utils.pagination import paginate, count_total
+from app.utils.sql import update_returning
+from app.services.cascade_delete import purge_workspace_projects
+from app.services.notification_counter import invalidate_unread_counts
+from app.services.deletion_jobs import TARGET_WORKSPACE, enqueue_deletion_job
+from app.schemas.deletion_job import DeletionJobResponse
 from app.schemas.workspace import (
     WorkspaceCreate,
     WorkspaceUpdate,
@@ -16,11 +29,11 @@ router = APIRouter()
 @router.post("/", response_model=WorkspaceResponse, status_code=status.HTTP_201_CREATED)
 async def create_workspace(
     workspace_in: WorkspaceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """새로운 Workspace 생성"""
-    existing = db.query(Workspace).filter(Workspace.name == workspace_in.name).first()
+    existing = await db.scalar(select(Workspace).where(Workspace.name == workspace_in.name))
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -32,41 +45,40 @@ async def create_workspace(
         created_by=current_user_id
     )
     db.add(db_workspace)
-    db.commit()
-    db.refresh(db_workspace)
+    await db.commit()
     return db_workspace
 
 @router.get("/", response_model=WorkspaceListResponse)
 async def list_workspaces(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 offset 무시)"),
+    include_total: bool = Query(True, description="전체 개수(total) 계산 여부"),
+    estimate_total: bool = Query(False, description="정확한 COUNT 대신 플래너 추정치 사용 (대용량 목록용)"),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Workspace 목록 조회 (페이지네이션)"""
-    total = db.query(Workspace).count()
-    workspaces = (
-        db.query(Workspace)
-        .order_by(Workspace.created_at.desc())
-        .limit(limit)
-        .offset(offset)
-        .all()
-    )
+    """Workspace 목록 조회 (offset 또는 cursor 페이지네이션)"""
+    query = select(Workspace)
+    total, total_is_exact = await count_total(db, query, include_total, estimate_total)
+    workspaces, next_cursor = await paginate(db, query, Workspace, limit, offset, cursor)
     return {
         "total": total,
+        "total_is_exact": total_is_exact,
         "items": workspaces,
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor
     }
 
 @router.get("/{workspace_id}", response_model=WorkspaceResponse)
 async def get_workspace(
     workspace_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """특정 Workspace 조회"""
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    workspace = await db.get(Workspace, workspace_id)
     if not workspace:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -78,66 +90,70 @@ async def get_workspace(
 async def update_workspace(
     workspace_id: UUID,
     workspace_in: WorkspaceUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
     """Workspace 정보 수정"""
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    workspace = await update_returning(
+        db, Workspace, [Workspace.id == workspace_id],
+        {**workspace_in.model_dump(exclude_unset=True), "updated_by": current_user_id}
+    )
     if not workspace:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workspace {workspace_id} not found"
         )
 
-    update_data = workspace_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(workspace, field, value)
-
-    workspace.updated_by = current_user_id
-
-    db.commit()
-    db.refresh(workspace)
+    await db.commit()
     return workspace
 
-@router.delete("/{workspace_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{workspace_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    responses={status.HTTP_202_ACCEPTED: {"model": DeletionJobResponse}}
+)
 async def delete_workspace(
     workspace_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    redis: aioredis.Redis = Depends(get_redis),
     current_user_id: UUID = Depends(get_current_user_id)
 ):
-    """Workspace 삭제 (애플리케이션 레벨에서 CASCADE 처리)"""
-    from app.models.project import Project
-    from app.models.ticket import Ticket
-    from app.models.task import Task
+    """
+    Workspace 삭제 (애플리케이션 레벨에서 CASCADE 처리)
+
+    하위 Project/Ticket/Task와 댓글, 첨부파일, 멤버, 티켓 타입, 관련 알림을
+    Ticket 묶음 단위로 배치 삭제합니다.
 
-    workspace = db.query(Workspace).filter(Workspace.id == workspace_id).first()
+    DELETION_JOBS_ENABLED이면 하위 Project를 소프트 삭제로 표시하고 백그라운드 삭제 작업을
+    등록한 뒤 202와 작업 상태를 반환합니다 (GET /api/deletion-jobs/{job_id}로 진행률 조회).
+    """
+    workspace = await db.get(Workspace, workspace_id)
     if not workspace:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Workspace {workspace_id} not found"
         )
 
-    # 애플리케이션 레벨에서 CASCADE 삭제 (샤딩 대비)
-    # 1. workspace에 속한 모든 project 찾기
-    projects = db.query(Project).filter(Project.workspace_id == workspace_id).all()
-    project_ids = [p.id for p in projects]
-
-    if project_ids:
-        # 2. project들에 속한 모든 ticket 찾기
-        tickets = db.query(Ticket).filter(Ticket.project_id.in_(project_ids)).all()
-        ticket_ids = [t.id for t in tickets]
-
-        if ticket_ids:
-            # 3. ticket들에 속한 모든 task 삭제
-            db.query(Task).filter(Task.ticket_id.in_(ticket_ids)).delete(synchronize_session=False)
+    if settings.DELETION_JOBS_ENABLED:
+        # Workspace에는 is_deleted가 없으므로 하위 Project를 숨기고 Workspace 행은 워커가 삭제
+        await db.execute(
+            update(Project)
+            .where(Project.workspace_id == workspace_id, Project.is_deleted == False)
+            .values(is_deleted=True, updated_by=current_user_id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        job = await enqueue_deletion_job(redis, TARGET_WORKSPACE, workspace_id, current_user_id)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=DeletionJobResponse.model_validate(job).model_dump(mode="json")
+        )
 
-        # 4. project들에 속한 모든 ticket 삭제
-        db.query(Ticket).filter(Ticket.project_id.in_(project_ids)).delete(synchronize_session=False)
+    # 애플리케이션 레벨에서 CASCADE 삭제 (샤딩 대비)
+    result = await purge_workspace_projects(db, workspace_id)
 
-    # 5. workspace에 속한 모든 project 삭제
-    db.query(Project).filter(Project.workspace_id == workspace_id).delete(synchronize_session=False)
+    await db.delete(workspace)
+    await db.commit()
 
-    # 6. workspace 삭제
-    db.delete(workspace)
-    db.commit()
+    await invalidate_unread_counts(redis, result.notification_user_ids)
     return None
@@ -2,7 +2,7 @@
 인증 및 JWT 검증 모듈
 
 Member 서비스와 동일한 SECRET_KEY를 공유하여 JWT 토큰 검증
-User 서비스와 통신하여 사용자 존재 여부 확인
+User 서비스와 통신하여 사용자 존재 여부 확인 (app.services.user_cache로 캐시)
 """
 from typing import Optional, Dict, Any
 from fastapi import Depends, HTTPException, status
@@ -10,7 +10,8 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from app.config import settings
 from app.logging_config import get_logger
-from app.clients.user_client import user_service_client
+from app.services.user_cache import user_info_cache
+from app.utils.token_cache import DecodedTokenCache
 from uuid import UUID
 
 logger = get_logger(__name__)
@@ -18,6 +19,12 @@ logger = get_logger(__name__)
 # HTTP Bearer 토큰 스키마
 security = HTTPBearer()
 
+# 검증된 토큰 캐시 (같은 토큰의 반복 서명 검증 생략)
+decoded_token_cache = DecodedTokenCache(
+    max_size=settings.JWT_CACHE_MAX_SIZE,
+    ttl=settings.JWT_CACHE_TTL,
+)
+
 
 def get_current_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -26,6 +33,7 @@ def get_current_user_id(
     JWT 토큰에서 user_id를 추출
 
     Member 서비스에서 발급한 JWT 토큰을 검증하고 user_id를 반환합니다.
+    이미 검증된 토큰은 만료 전까지 캐시된 user_id를 반환합니다.
 
     Args:
         credentials: HTTP Authorization Bearer 토큰
@@ -38,6 +46,10 @@ def get_current_user_id(
     """
     token = credentials.credentials
 
+    cached_user_id = decoded_token_cache.get(token)
+    if cached_user_id is not None:
+        return cached_user_id
+
     try:
         # JWT 디코딩 (Member 서비스와 같은 SECRET_KEY 사용)
         payload = jwt.decode(
@@ -57,7 +69,9 @@ def get_current_user_id(
             )
 
         logger.debug(f"JWT validated successfully for user_id: {user_id}")
-        return UUID(user_id)
+        user_uuid = UUID(user_id)
+        decoded_token_cache.set(token, user_uuid, payload.get("exp"))
+        return user_uuid
 
     except JWTError as e:
         logger.error(f"JWT validation failed: {str(e)}")
@@ -85,6 +99,10 @@ def get_current_user_id_optional(
     if credentials is None:
         return None
 
+    cached_user_id = decoded_token_cache.get(credentials.credentials)
+    if cached_user_id is not None:
+        return cached_user_id
+
     try:
         payload = jwt.decode(
             credentials.credentials,
@@ -92,7 +110,11 @@ def get_current_user_id_optional(
             algorithms=[settings.ALGORITHM]
         )
         user_id = payload.get("sub")
-        return UUID(user_id) if user_id else None
+        if not user_id:
+            return None
+        user_uuid = UUID(user_id)
+        decoded_token_cache.set(credentials.credentials, user_uuid, payload.get("exp"))
+        return user_uuid
     except JWTError:
         return None
 
@@ -101,7 +123,7 @@ async def get_verified_user_id(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> UUID:
     """
-    JWT 토큰 검증 + User Service에서 사용자 존재 확인
+    JWT 토큰 검증 + User Service에서 사용자 존재 확인 (사용자 정보 캐시 사용)
 
     Args:
         credentials: HTTP Authorization Bearer 토큰
@@ -118,7 +140,7 @@ async def get_verified_user_id(
 
     # 2. User Service에서 사용자 존재 확인
     try:
-        user_exists = await user_service_client.check_user_exists(user_id, token)
+        user_exists = await user_info_cache.get_user(user_id, token) is not None
 
         if not user_exists:
             logger.warning(f"User {user_id} not found in User Service")
@@ -144,7 +166,7 @@ async def get_user_info(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> Dict[str, Any]:
     """
-    사용자 정보를 User Service에서 가져옵니다.
+    사용자 정보를 User Service에서 가져옵니다. (사용자 정보 캐시 사용)
 
     Args:
         credentials: HTTP Authorization Bearer 토큰
@@ -158,7 +180,7 @@ async def get_user_info(
     user_id = get_current_user_id(credentials)
     token = credentials.credentials
 
-    user_info = await user_service_client.get_user_info(user_id, token)
+    user_info = await user_info_cache.get_user(user_id, token)
 
     if not user_info:
         logger.warning(f"Could not fetch user info for {user_id}")
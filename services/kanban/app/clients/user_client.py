@@ -1,28 +1,133 @@
 """
 User Service 클라이언트
 weAlist-User 서비스와의 통신을 담당합니다.
+
+애플리케이션 수명 동안 하나의 httpx.AsyncClient(커넥션 풀, keep-alive, HTTP/2)를
+공유하여 요청마다 TCP/TLS 연결을 새로 맺지 않습니다.
+앱 startup/shutdown에서 start()/close()를 호출합니다.
 """
 
+import asyncio
 import httpx
 import logging
 from typing import Optional, Dict, Any
 from uuid import UUID
 
+from app.config import settings
+from app.metrics import track_upstream
+
 logger = logging.getLogger(__name__)
 
 
+class UserServiceError(Exception):
+    """User Service 호출 실패 (사용자 없음(404)과 구분)"""
+
+
 class UserServiceClient:
     """
     User Service와 통신하는 HTTP 클라이언트
     """
 
-    def __init__(self, base_url: str = "http://user-service:8080"):
+    def __init__(
+        self,
+        base_url: str = "http://user-service:8080",
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        bulk_concurrency: int = 10,
+        bulk_path: Optional[str] = None,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         """
         Args:
             base_url: User Service의 기본 URL
+            timeout: 요청 타임아웃 (초)
+            max_connections: 커넥션 풀 최대 연결 수
+            bulk_concurrency: get_users_bulk의 동시 요청 수 상한
+            bulk_path: User Service의 일괄 조회 API 경로 (없으면 개별 요청을 병렬 실행)
+            http2: HTTP/2 사용 여부 (TLS 연결에서 ALPN으로 협상)
+            transport: 테스트용 httpx transport
         """
         self.base_url = base_url.rstrip("/")
-        self.timeout = httpx.Timeout(10.0)
+        self.timeout = httpx.Timeout(timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self.bulk_concurrency = bulk_concurrency
+        self.bulk_path = bulk_path
+        self.http2 = http2
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def start(self) -> None:
+        """공유 HTTP 클라이언트 생성 (앱 startup)"""
+        if self._client is None:
+            self._client = self._create_client()
+
+    async def close(self) -> None:
+        """공유 HTTP 클라이언트 종료 (앱 shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 (startup 이전 호출 시에는 지연 생성)"""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+            transport=self._transport,
+        )
+
+    @staticmethod
+    def _headers(token: str) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+
+    async def fetch_user(self, user_id: UUID, token: str) -> Optional[Dict[str, Any]]:
+        """
+        사용자 정보를 조회합니다.
+
+        Args:
+            user_id: 조회할 사용자 ID
+            token: JWT 액세스 토큰
+
+        Returns:
+            사용자 정보 딕셔너리 또는 None (사용자가 존재하지 않을 때)
+
+        Raises:
+            UserServiceError: 타임아웃, 연결 실패, 404 이외의 오류 응답
+        """
+        try:
+            with track_upstream("user_service", "fetch_user"):
+                response = await self.client.get(
+                    f"/api/users/{user_id}",
+                    headers=self._headers(token)
+                )
+        except httpx.TimeoutException as e:
+            raise UserServiceError(f"Timeout while fetching user {user_id}") from e
+        except httpx.RequestError as e:
+            raise UserServiceError(f"Request error while fetching user {user_id}: {str(e)}") from e
+
+        if response.status_code == 200:
+            return response.json()
+        elif response.status_code == 404:
+            logger.warning(f"User {user_id} not found")
+            return None
+        elif response.status_code == 401:
+            raise UserServiceError(f"Unauthorized access for user {user_id}")
+        else:
+            raise UserServiceError(f"Unexpected status code {response.status_code} from User Service")
 
     async def verify_user(self, user_id: UUID, token: str) -> Optional[Dict[str, Any]]:
         """
@@ -35,42 +140,19 @@ class UserServiceClient:
         Returns:
             사용자 정보 딕셔너리 또는 None (실패 시)
         """
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json"
-        }
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/api/users/{user_id}",
-                    headers=headers
-                )
-
-                if response.status_code == 200:
-                    user_data = response.json()
-                    logger.info(f"User {user_id} verified successfully")
-                    return user_data
-                elif response.status_code == 404:
-                    logger.warning(f"User {user_id} not found")
-                    return None
-                elif response.status_code == 401:
-                    logger.warning(f"Unauthorized access for user {user_id}")
-                    return None
-                else:
-                    logger.error(f"Unexpected status code {response.status_code} from User Service")
-                    return None
-
-        except httpx.TimeoutException:
-            logger.error(f"Timeout while verifying user {user_id}")
-            return None
-        except httpx.RequestError as e:
-            logger.error(f"Request error while verifying user {user_id}: {str(e)}")
+            user_data = await self.fetch_user(user_id, token)
+        except UserServiceError as e:
+            logger.error(str(e))
             return None
         except Exception as e:
             logger.error(f"Unexpected error while verifying user {user_id}: {str(e)}")
             return None
 
+        if user_data is not None:
+            logger.info(f"User {user_id} verified successfully")
+        return user_data
+
     async def get_user_info(self, user_id: UUID, token: str) -> Optional[Dict[str, Any]]:
         """
         사용자 상세 정보를 가져옵니다.
@@ -98,10 +180,42 @@ class UserServiceClient:
         user_info = await self.verify_user(user_id, token)
         return user_info is not None
 
+    async def _fetch_users_batch(self, user_ids: list[UUID], token: str) -> Optional[Dict[UUID, Dict[str, Any]]]:
+        """
+        User Service 일괄 조회 API 호출
+
+        Returns:
+            사용자 정보 딕셔너리, API를 사용할 수 없으면 None (개별 조회로 대체)
+        """
+        try:
+            with track_upstream("user_service", "fetch_users_batch"):
+                response = await self.client.post(
+                    self.bulk_path,
+                    json={"user_ids": [str(user_id) for user_id in user_ids]},
+                    headers=self._headers(token)
+                )
+        except httpx.RequestError as e:
+            logger.error(f"Request error while fetching users in bulk: {str(e)}")
+            return None
+
+        if response.status_code in (404, 405, 501):
+            # 일괄 조회 API 미지원 - 이후 요청은 개별 조회 사용
+            logger.warning(f"User Service bulk API {self.bulk_path} unavailable, disabling")
+            self.bulk_path = None
+            return None
+        if response.status_code != 200:
+            logger.error(f"Unexpected status code {response.status_code} from User Service bulk API")
+            return None
+
+        return {UUID(str(user["id"])): user for user in response.json()}
+
     async def get_users_bulk(self, user_ids: list[UUID], token: str) -> Dict[UUID, Dict[str, Any]]:
         """
         여러 사용자의 정보를 한 번에 가져옵니다.
 
+        일괄 조회 API가 설정되어 있으면 한 번의 요청으로, 아니면 개별 요청을
+        최대 bulk_concurrency개씩 동시에 보냅니다.
+
         Args:
             user_ids: 사용자 ID 리스트
             token: JWT 액세스 토큰
@@ -109,17 +223,31 @@ class UserServiceClient:
         Returns:
             사용자 ID를 키로 하는 사용자 정보 딕셔너리
         """
-        results = {}
+        unique_ids = list(dict.fromkeys(user_ids))
+        if not unique_ids:
+            return {}
+
+        if self.bulk_path:
+            results = await self._fetch_users_batch(unique_ids, token)
+            if results is not None:
+                return results
+
+        semaphore = asyncio.Semaphore(self.bulk_concurrency)
 
-        # TODO: User Service에 bulk API가 있다면 그것을 사용하는 것이 더 효율적입니다
-        # 현재는 각각 요청을 보내는 방식으로 구현
-        for user_id in user_ids:
-            user_info = await self.verify_user(user_id, token)
-            if user_info:
-                results[user_id] = user_info
+        async def fetch(user_id: UUID) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self.verify_user(user_id, token)
 
-        return results
+        users = await asyncio.gather(*(fetch(user_id) for user_id in unique_ids))
+        return {user_id: user for user_id, user in zip(unique_ids, users) if user}
 
 
 # 싱글톤 인스턴스
-user_service_client = UserServiceClient()
+user_service_client = UserServiceClient(
+    base_url=settings.USER_SERVICE_URL,
+    timeout=settings.USER_SERVICE_TIMEOUT,
+    max_connections=settings.USER_SERVICE_MAX_CONNECTIONS,
+    bulk_concurrency=settings.USER_SERVICE_BULK_CONCURRENCY,
+    bulk_path=settings.USER_SERVICE_BULK_PATH,
+    http2=settings.USER_SERVICE_HTTP2,
+)
@@ -1,7 +1,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import field_validator, Field
 from functools import lru_cache
-from typing import Union
+from typing import Optional, Union
 
 class Settings(BaseSettings):
     DATABASE_URL: str
@@ -9,10 +9,70 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "change-this-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 검증된 JWT 캐시 최대 항목 수 / 최대 캐시 시간 (초, 토큰 exp가 더 이르면 exp까지)
+    JWT_CACHE_MAX_SIZE: int = 10000
+    JWT_CACHE_TTL: int = 300
     ENV: str = "development"
     DEBUG: bool = True
     PROJECT_NAME: str = "Kanban Service"
     VERSION: str = "1.0.0"
+    # 목록 API estimate_total 사용 시, 추정치가 이 값 미만이면 정확한 COUNT(*) 수행
+    COUNT_ESTIMATE_THRESHOLD: int = 1000
+    # 읽지 않은 알림 개수 Redis 캐시 TTL / DB 보정 주기 (초)
+    UNREAD_COUNT_CACHE_TTL: int = 300
+    UNREAD_COUNT_RECONCILE_INTERVAL: int = 600
+    # 실시간 알림 스트림(SSE) 하트비트 주기 (초) / 연결별 이벤트 큐 크기
+    NOTIFICATION_STREAM_HEARTBEAT: int = 15
+    NOTIFICATION_STREAM_QUEUE_SIZE: int = 100
+    # User Service 클라이언트 (공유 커넥션 풀)
+    USER_SERVICE_URL: str = "http://user-service:8080"
+    USER_SERVICE_TIMEOUT: float = 10.0
+    USER_SERVICE_MAX_CONNECTIONS: int = 100
+    USER_SERVICE_HTTP2: bool = True
+    # 사용자 일괄 조회 시 동시 요청 수 / User Service 일괄 조회 API 경로 (미지원 시 비워둠)
+    USER_SERVICE_BULK_CONCURRENCY: int = 10
+    USER_SERVICE_BULK_PATH: Optional[str] = None
+    # 인증 시 사용자 정보 캐시 (로컬 LRU 크기, TTL/부정 캐시 TTL(초), Redis 2차 캐시 사용 여부)
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_NEGATIVE_TTL: int = 10
+    USER_CACHE_REDIS_ENABLED: bool = False
+    # Workspace/Project 삭제 시 한 번에 하위 데이터를 삭제할 Ticket 수 (배치마다 커밋)
+    CASCADE_DELETE_BATCH_SIZE: int = 500
+    # Workspace/Project 삭제를 백그라운드 작업(python -m app.worker)으로 처리 (202 + 작업 ID 응답)
+    DELETION_JOBS_ENABLED: bool = False
+    # 완료/실패한 삭제 작업 상태 보관 시간 (초) / 워커 큐 대기 시간 (초)
+    DELETION_JOB_RESULT_TTL: int = 86400
+    DELETION_WORKER_POLL_TIMEOUT: int = 5
+    # POST /api/tickets/bulk, /api/tasks/bulk 요청당 최대 항목 수 (create + update + delete)
+    BULK_MAX_ITEMS: int = 1000
+    # 대량 가져오기: 검증 후 한 번에 COPY할 레코드 수 / 허용할 검증 실패 레코드 수 (초과 시 전체 롤백)
+    IMPORT_CHUNK_SIZE: int = 5000
+    IMPORT_MAX_ERRORS: int = 1000
+    # 내보내기: 서버 측 커서에서 한 번에 읽어 응답으로 보낼 행 수
+    EXPORT_BATCH_SIZE: int = 1000
+    # 변경 동기화(GET /api/projects/{id}/changes): 삭제 기록 보관 기간 (일, 이보다 오래된 토큰은 410)
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+    # 요청 지표 (GET /metrics Prometheus 형식, 요청별 SQL 문 수 / DB 시간 / 풀 대기 / 외부 호출 시간)
+    # 와 요청 완료 로그 (지표 값을 로그 필드로 기록) 사용 여부
+    METRICS_ENABLED: bool = True
+    METRICS_REQUEST_LOG: bool = True
+    # N+1 / 느린 쿼리 감지 (개발 / CI용): 요청당 SQL 문 수 기준, 같은 형태 SQL 반복 횟수 기준,
+    # 느린 SQL 기준 (ms). 넘으면 SQL을 실행한 코드 위치와 함께 경고 로그
+    QUERY_DETECTOR_ENABLED: bool = False
+    QUERY_DETECTOR_MAX_STATEMENTS: int = 30
+    QUERY_DETECTOR_REPEAT_THRESHOLD: int = 5
+    QUERY_DETECTOR_SLOW_MS: int = 500
+    # Readiness probe: 백그라운드 의존성(DB / Redis) 확인 주기 (초), 확인별 타임아웃 (초),
+    # 마지막 확인이 이보다 오래되면 not_ready (초)
+    READINESS_CHECK_INTERVAL: float = 5.0
+    READINESS_CHECK_TIMEOUT: float = 2.0
+    READINESS_STALE_AFTER: float = 15.0
+    # 로그 출력: 포맷팅 / stdout 출력을 백그라운드 스레드(QueueListener)에서 수행, 출력 대기 큐 크기
+    # (가득 차면 버림), DEBUG 로그 중 남길 비율 (0~1, 1이면 모두 출력)
+    LOG_ASYNC: bool = True
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_DEBUG_SAMPLE_RATE: float = 1.0
     CORS_ORIGINS: Union[str, list[str]] = Field(
         default=["http://localhost:3000", "http://localhost:8000"]
     )
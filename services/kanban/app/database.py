@@ -1,15 +1,33 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import AsyncGenerator
 from app.config import settings
+from app.metrics import CheckoutTimedPool, instrument_engine
+from app.query_detector import install_query_detector
 
+
+def to_async_url(url: str) -> str:
+    """
+    동기 드라이버 URL을 asyncpg 드라이버 URL로 변환
+
+    예: postgresql://... -> postgresql+asyncpg://...
+    """
+    return make_url(url).set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+# SQL 로그는 echo 대신 "sqlalchemy.engine" 로거 레벨(setup_logging, DEBUG일 때 INFO)로 켭니다.
+# echo=True는 stdout에 바로 쓰는 별도 Handler를 추가해 로그 파이프라인을 우회하고 같은 SQL을 두 번 출력합니다.
+
+# 동기 엔진: Alembic 마이그레이션 및 관리 스크립트 전용
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
     pool_size=20,
     max_overflow=10,
-    echo=settings.DEBUG,
 )
 
 SessionLocal = sessionmaker(
@@ -18,11 +36,31 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# 비동기 엔진: API 라우터 전용 (이벤트 루프를 블로킹하지 않음)
+async_engine = create_async_engine(
+    to_async_url(settings.DATABASE_URL),
+    poolclass=CheckoutTimedPool if settings.METRICS_ENABLED else AsyncAdaptedQueuePool,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=10,
+)
+
+# 요청별 SQL 문 수 / 실행 시간 측정 (app.metrics)
+if settings.METRICS_ENABLED:
+    instrument_engine(async_engine)
+
+# 요청별 N+1 / 느린 쿼리 감지 (app.query_detector, 개발 / CI용)
+if settings.QUERY_DETECTOR_ENABLED:
+    install_query_detector(async_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 Base = declarative_base()
 
-def get_db() -> Generator[Session, None, None]:
-    db = SessionLocal()
-    try:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,6 +1,6 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 
-def get_database() -> Session:
+def get_database() -> AsyncSession:
     return Depends(get_db)
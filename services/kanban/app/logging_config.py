@@ -1,10 +1,32 @@
+import atexit
 import logging
 import json
+import queue
+import random
 import sys
-from datetime import datetime
-from typing import Any, Dict
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 from app.config import settings
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json으로 직렬화
+    orjson = None
+
+# LogRecord 기본 속성 (나머지는 logger.info(..., extra={...})로 넘긴 필드)
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "extra"}
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson이 처리하지 못하는 값 (64비트를 넘는 정수 등)
+            pass
+    return json.dumps(data, ensure_ascii=False, default=str)
+
 
 class JSONFormatter(logging.Formatter):
     """
@@ -14,7 +36,8 @@ class JSONFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            # 포맷팅 시각이 아니라 로그 발생 시각 (QueueListener 스레드에서 나중에 포맷팅됨)
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None).isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -22,9 +45,12 @@ class JSONFormatter(logging.Formatter):
             "environment": settings.ENV,
         }
 
-        # 추가 정보
+        # 추가 정보 (extra={"extra": {...}} 형식과 extra={...} 필드 모두)
         if hasattr(record, "extra"):
             log_data.update(record.extra)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                log_data[key] = value
 
         # 예외 정보
         if record.exc_info:
@@ -36,7 +62,79 @@ class JSONFormatter(logging.Formatter):
             log_data["file"] = record.pathname
             log_data["line"] = record.lineno
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return _dumps(log_data)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    LogRecord를 포맷팅하지 않고 큐에 넣는 Handler
+
+    표준 QueueHandler.prepare()는 호출한 스레드에서 format()까지 수행하므로,
+    메시지 인자만 확정하고 포맷팅(JSON 직렬화 포함)과 출력은 QueueListener 스레드에 맡깁니다.
+    출력이 밀려 큐가 가득 차면 기다리지 않고 버리며, 버린 개수는 다음 로그와 함께 경고로 남깁니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        if self.dropped:
+            dropped, self.dropped = self.dropped, 0
+            warning = logging.makeLogRecord({
+                "name": __name__,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Dropped {dropped} log records (log queue full)",
+            })
+            try:
+                self.queue.put_nowait(warning)
+            except queue.Full:
+                self.dropped += dropped
+
+
+class _DrainingQueueListener(QueueListener):
+    """종료 표식을 큐가 가득 찬 상태에서도 넣을 수 있는 QueueListener (남은 로그를 출력한 뒤 종료)"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+
+
+class DebugSampler(logging.Filter):
+    """DEBUG 로그는 rate 비율만 통과 (INFO 이상은 모두 통과)"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+# LOG_ASYNC일 때 출력 Handler를 실행하는 백그라운드 스레드
+_listener: Optional[_DrainingQueueListener] = None
+
+
+def stop_logging() -> None:
+    """QueueListener 종료 (큐에 남은 로그를 모두 출력한 뒤 반환, 프로세스 종료 시 자동 호출)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
 
 
 def setup_logging() -> None:
@@ -45,12 +143,18 @@ def setup_logging() -> None:
 
     개발 환경: 읽기 쉬운 포맷
     프로덕션: JSON 포맷 (로그 수집 도구용)
+
+    LOG_ASYNC이면 로거는 LogRecord를 큐에 넣기만 하고, 포맷팅과 stdout 출력은
+    QueueListener 스레드에서 수행하여 요청 처리 중 로그 비용을 줄입니다.
     """
+    global _listener
+
     # Root logger 설정
     root_logger = logging.getLogger()
 
     # 기존 핸들러 제거
     root_logger.handlers.clear()
+    stop_logging()
 
     # 로그 레벨 설정
     log_level = logging.DEBUG if settings.DEBUG else logging.INFO
@@ -72,6 +176,18 @@ def setup_logging() -> None:
         )
 
     handler.setFormatter(formatter)
+
+    # 비동기 출력: 로거 -> 큐 -> QueueListener 스레드 -> stdout
+    if settings.LOG_ASYNC:
+        log_queue: queue.Queue = queue.Queue(maxsize=settings.LOG_QUEUE_SIZE)
+        _listener = _DrainingQueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        handler = DeferredQueueHandler(log_queue)
+
+    # DEBUG 로그 샘플링 (큐에 넣기 전에 버림)
+    if settings.LOG_DEBUG_SAMPLE_RATE < 1:
+        handler.addFilter(DebugSampler(settings.LOG_DEBUG_SAMPLE_RATE))
+
     root_logger.addHandler(handler)
 
     # uvicorn 로거 설정
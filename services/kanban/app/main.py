@@ -1,8 +1,17 @@
-from fastapi import FastAPI
+import asyncio
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
-from app.database import engine, Base
+from app.database import engine, async_engine, Base
+from app.redis_client import redis_client
+from app.clients.user_client import user_service_client
+from app.services.notification_counter import run_unread_count_reconciler
+from app.services.notification_stream import notification_broker
+from app.services.user_cache import user_info_cache
+from app.services.readiness import readiness_monitor
 from app.logging_config import setup_logging, get_logger
+from app.metrics import MetricsMiddleware, render_latest
+from app.query_detector import QueryDetectorMiddleware
 
 # 로깅 설정
 setup_logging()
@@ -15,7 +24,7 @@ from app.models import (
     Task
 )
 
-from app.api import workspaces, projects, tickets, tasks, health, ticket_types, notifications
+from app.api import workspaces, projects, tickets, tasks, health, ticket_types, notifications, deletion_jobs
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -31,6 +40,7 @@ app = FastAPI(
         {"name": "tasks", "description": "Task management"},
         {"name": "ticket-types", "description": "Ticket type management (custom categories per project)"},
         {"name": "notifications", "description": "User notification system"},
+        {"name": "deletion-jobs", "description": "Background workspace/project deletion status"},
     ]
 )
 
@@ -42,6 +52,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# N+1 / 느린 쿼리 감지 (개발 / CI용)
+if settings.QUERY_DETECTOR_ENABLED:
+    app.add_middleware(QueryDetectorMiddleware)
+
+# 요청 지표 (가장 바깥 미들웨어로 등록해 CORS 처리까지 포함한 시간을 측정)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 @app.on_event("startup")
 async def startup_event():
     """
@@ -59,6 +77,29 @@ async def startup_event():
         }
     )
 
+    # User Service 공유 HTTP 클라이언트
+    await user_service_client.start()
+
+    # Readiness probe용 DB / Redis 상태 주기적 확인 (probe는 캐시된 결과만 반환)
+    app.state.readiness_monitor = asyncio.create_task(
+        readiness_monitor.run(async_engine, redis_client, settings.READINESS_CHECK_INTERVAL)
+    )
+
+    # 읽지 않은 알림 개수 캐시 주기적 보정
+    app.state.unread_count_reconciler = asyncio.create_task(
+        run_unread_count_reconciler(redis_client, settings.UNREAD_COUNT_RECONCILE_INTERVAL)
+    )
+
+    # 실시간 알림 이벤트 구독 (Redis pub/sub -> SSE 연결)
+    app.state.notification_listener = asyncio.create_task(
+        notification_broker.listen(redis_client)
+    )
+
+    # 사용자 정보 캐시 무효화 메시지 구독
+    app.state.user_cache_listener = asyncio.create_task(
+        user_info_cache.listen(redis_client)
+    )
+
     # 마이그레이션 사용을 위해 자동 테이블 생성 비활성화
     logger.info("Skipping table creation (using Alembic migrations)")
     # if settings.ENV == "development":
@@ -80,10 +121,24 @@ async def shutdown_event():
     """
     logger.info("Shutting down application gracefully")
 
+    # 백그라운드 태스크 정리
+    app.state.readiness_monitor.cancel()
+    app.state.unread_count_reconciler.cancel()
+    app.state.notification_listener.cancel()
+    app.state.user_cache_listener.cancel()
+
     # DB 엔진 정리
+    await async_engine.dispose()
     engine.dispose()
     logger.info("Database connections closed")
 
+    # User Service HTTP 연결 정리
+    await user_service_client.close()
+
+    # Redis 연결 정리
+    await redis_client.aclose()
+    logger.info("Redis connections closed")
+
 @app.get("/")
 async def root():
     return {
@@ -93,6 +148,13 @@ async def root():
         "health": "/health"
     }
 
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus 스크레이프용 지표 (텍스트 형식)"""
+        body, content_type = render_latest()
+        return Response(content=body, media_type=content_type)
+
 # Health check routes (K8s probes)
 app.include_router(health.router, tags=["health"])
 
@@ -103,3 +165,4 @@ app.include_router(tickets.router, prefix="/api/tickets", tags=["tickets"])
 app.include_router(tasks.router, prefix="/api/tasks", tags=["tasks"])
 app.include_router(ticket_types.router, prefix="/api/projects/{project_id}/ticket-types", tags=["ticket-types"])
 app.include_router(notifications.router, prefix="/api/notifications", tags=["notifications"])
+app.include_router(deletion_jobs.router, prefix="/api/deletion-jobs", tags=["deletion-jobs"])
@@ -0,0 +1,207 @@
+"""
+요청 단위 지표 (Prometheus /metrics + 요청 로그)
+
+요청마다 다음 값을 모아 Prometheus 히스토그램(route별)과 요청 완료 로그에 남깁니다.
+
+- 요청 처리 시간 (method, route 템플릿, 상태 코드)
+- 실행한 SQL 문 수와 DB 실행 시간 (SQLAlchemy before/after_cursor_execute 이벤트)
+- 커넥션 풀 획득 대기 시간 (CheckoutTimedPool)
+- User Service 등 외부 서비스 호출 시간 (track_upstream)
+
+요청별 값은 contextvar에 둔 RequestMetrics 하나에 더하기만 하므로
+(SQLAlchemy 비동기 실행의 greenlet도 같은 context를 사용) SQL 문당 비용은 perf_counter 두 번 정도입니다.
+METRICS_ENABLED=false면 미들웨어, 이벤트, 풀 측정을 모두 등록하지 않습니다.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, Histogram, generate_latest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.config import settings
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+NAMESPACE = "kanban"
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간",
+    ["method", "route", "status"], namespace=NAMESPACE,
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements", "요청당 실행한 SQL 문 수",
+    ["method", "route"], namespace=NAMESPACE,
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100, float("inf")),
+)
+REQUEST_DB_DURATION = Histogram(
+    "http_request_db_duration_seconds", "요청당 SQL 실행 시간 합계",
+    ["method", "route"], namespace=NAMESPACE,
+)
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "커넥션 풀에서 커넥션을 얻기까지 걸린 시간",
+    namespace=NAMESPACE,
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, float("inf")),
+)
+UPSTREAM_DURATION = Histogram(
+    "upstream_request_duration_seconds", "외부 서비스 호출 시간",
+    ["service", "operation"], namespace=NAMESPACE,
+)
+
+# 라우트에 매칭되지 않은 요청(404 등)의 route 라벨 (경로를 그대로 쓰면 라벨 수가 무한히 늘어남)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RequestMetrics:
+    """요청 하나 동안 누적하는 값"""
+    __slots__ = ("db_statements", "db_time", "pool_wait", "upstream_time")
+
+    def __init__(self):
+        self.db_statements = 0
+        self.db_time = 0.0
+        self.pool_wait = 0.0
+        self.upstream_time = 0.0
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("request_metrics", default=None)
+
+
+def current_request_metrics() -> Optional[RequestMetrics]:
+    """처리 중인 요청의 RequestMetrics (요청 밖이면 None)"""
+    return _current.get()
+
+
+def route_template(scope: dict) -> str:
+    """
+    라우팅된 요청의 경로 템플릿 (예: /api/tickets/{ticket_id})
+
+    라우터가 scope에 넣은 path_params 값을 이름으로 되돌려 만듭니다.
+    """
+    if "endpoint" not in scope:
+        return UNMATCHED_ROUTE
+    path = scope["path"]
+    for name, value in scope.get("path_params", {}).items():
+        path = path.replace(f"/{value}", f"/{{{name}}}", 1)
+    return path
+
+
+class MetricsMiddleware:
+    """요청 처리 시간과 요청 중 DB / 외부 호출 비용을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            _current.reset(token)
+            self._record(scope, status_code, duration, metrics)
+
+    @staticmethod
+    def _record(scope: dict, status_code: int, duration: float, metrics: RequestMetrics) -> None:
+        method = scope["method"]
+        route = route_template(scope)
+        REQUEST_DURATION.labels(method, route, status_code).observe(duration)
+        REQUEST_DB_STATEMENTS.labels(method, route).observe(metrics.db_statements)
+        REQUEST_DB_DURATION.labels(method, route).observe(metrics.db_time)
+
+        if settings.METRICS_REQUEST_LOG:
+            logger.info(
+                f"{method} {route} {status_code} {duration * 1000:.1f}ms "
+                f"(db {metrics.db_statements} statements {metrics.db_time * 1000:.1f}ms)",
+                extra={
+                    "method": method,
+                    "route": route,
+                    "status": status_code,
+                    "duration_ms": round(duration * 1000, 3),
+                    "db_statements": metrics.db_statements,
+                    "db_time_ms": round(metrics.db_time * 1000, 3),
+                    "pool_wait_ms": round(metrics.pool_wait * 1000, 3),
+                    "upstream_ms": round(metrics.upstream_time * 1000, 3),
+                },
+            )
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["metrics_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("metrics_started", None)
+    metrics = _current.get()
+    if metrics is not None and started is not None:
+        metrics.db_statements += 1
+        metrics.db_time += time.perf_counter() - started
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """엔진에 SQL 문 수 / 실행 시간 측정 이벤트 등록 (여러 번 호출해도 한 번만 등록)"""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def record_pool_wait(seconds: float) -> None:
+    POOL_CHECKOUT_WAIT.observe(seconds)
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.pool_wait += seconds
+
+
+class CheckoutTimedPool(AsyncAdaptedQueuePool):
+    """
+    커넥션 획득 대기 시간을 기록하는 비동기 커넥션 풀
+
+    풀이 가득 차 반납을 기다리는 시간과 새 커넥션을 여는 시간이 포함됩니다.
+    """
+    # 풀 로그를 app.metrics가 아닌 sqlalchemy.pool 로거 아래에 남김 (SQLAlchemy 로그 레벨 설정 적용)
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.CheckoutTimedPool"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            record_pool_wait(time.perf_counter() - started)
+
+
+@contextmanager
+def track_upstream(service: str, operation: str) -> Iterator[None]:
+    """외부 서비스 호출 시간 기록 (with 블록 전체, 실패한 호출 포함)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        if settings.METRICS_ENABLED:
+            UPSTREAM_DURATION.labels(service, operation).observe(elapsed)
+            metrics = _current.get()
+            if metrics is not None:
+                metrics.upstream_time += elapsed
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Prometheus 텍스트 형식의 현재 지표와 Content-Type"""
+    return generate_latest(), CONTENT_TYPE_LATEST
@@ -21,6 +21,8 @@ from app.models.comment import Comment
 from app.models.attachment import Attachment
 from app.models.ticket_type import TicketType
 from app.models.notification import Notification
+from app.models.project_ticket_stat import ProjectTicketStat
+from app.models.sync_tombstone import SyncTombstone
 
 __all__ = [
     "Base",
@@ -46,4 +48,6 @@ __all__ = [
     "Attachment",
     "TicketType",
     "Notification",
+    "ProjectTicketStat",
+    "SyncTombstone",
 ]
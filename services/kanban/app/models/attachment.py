@@ -10,7 +10,6 @@ class Attachment(BaseModel):
     target_type = Column(
         SQLEnum(TargetType),
         nullable=False,
-        index=True,
         comment="첨부 대상 타입 (PROJECT, TICKET, TASK)"
     )
     target_id = Column(
@@ -23,7 +22,7 @@ class Attachment(BaseModel):
     file_path = Column(String(500), nullable=False, comment="파일 저장 경로")
     file_size = Column(BigInteger, nullable=True, comment="파일 크기 (bytes)")
     mime_type = Column(String(100), nullable=True, comment="MIME 타입 (예: image/png, application/pdf)")
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
 
     def __repr__(self):
         return f"<Attachment(id={self.id}, target_type={self.target_type}, target_id={self.target_id}, file_name={self.file_name})>"
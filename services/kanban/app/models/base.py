@@ -1,6 +1,7 @@
 from uuid import UUID
-from sqlalchemy import Column, Integer, DateTime, text
+from sqlalchemy import Column, Integer, DateTime, literal_column, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import declared_attr
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -32,6 +33,27 @@ class AuditMixin:
         comment="References users.id from Member service (no FK for microservice)"
     )
 
+class VersionMixin:
+    """
+    낙관적 동시성 제어용 버전 (ETag / If-Match)
+
+    행이 수정될 때마다 UPDATE 문 안에서 1씩 증가합니다 (ORM flush, update() 문, 집계 카운터 갱신 모두 포함).
+    UPDATE ... FROM 문에서도 대상 테이블 컬럼을 가리키도록 테이블 이름을 붙여 증가시킵니다.
+    """
+    @declared_attr
+    def version(cls):
+        return Column(
+            Integer,
+            default=1,
+            server_default="1",
+            onupdate=literal_column(f"{cls.__tablename__}.version", Integer) + 1,
+            nullable=False,
+            comment="수정 시마다 증가하는 버전 (ETag)"
+        )
+
 class BaseModel(Base, TimestampMixin, AuditMixin):
     __abstract__ = True
-    id = Column(PG_UUID, primary_key=True, index=True, server_default=text("gen_random_uuid()"))
+    # 서버에서 정해지는 값(id, created_at, updated_at)을 INSERT/UPDATE ... RETURNING으로 바로 받음
+    # (커밋 후 db.refresh()로 다시 SELECT하지 않아도 응답에 사용할 수 있음)
+    __mapper_args__ = {"eager_defaults": True}
+    id = Column(PG_UUID, primary_key=True, server_default=text("gen_random_uuid()"))
@@ -10,7 +10,6 @@ class Comment(BaseModel):
     target_type = Column(
         SQLEnum(TargetType),
         nullable=False,
-        index=True,
         comment="댓글 대상 타입 (TICKET, TASK)"
     )
     target_id = Column(
@@ -32,7 +31,7 @@ class Comment(BaseModel):
         index=True,
         comment="대댓글인 경우 부모 댓글 ID (self-reference)"
     )
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
 
     def __repr__(self):
         return f"<Comment(id={self.id}, target_type={self.target_type}, target_id={self.target_id}, author_id={self.author_id})>"
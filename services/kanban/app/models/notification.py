@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, Enum as SQLEnum, DateTime
+from sqlalchemy import Column, String, Text, Boolean, Enum as SQLEnum, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
 from app.models.base import BaseModel
 from app.models.enums import NotificationType
@@ -6,17 +6,24 @@ from app.models.enums import NotificationType
 class Notification(BaseModel):
     """알림 테이블 - 사용자에게 전달되는 알림 저장"""
     __tablename__ = "notifications"
+    __table_args__ = (
+        # 목록 API keyset 페이지네이션 (ORDER BY created_at DESC, id DESC)
+        Index("ix_notifications_user_id_created_at_id", "user_id", "created_at", "id"),
+        # 안읽은 알림 목록 / 개수 (WHERE user_id = ? AND is_read = false) - 읽은 알림은 인덱스에 넣지 않음
+        Index(
+            "ix_notifications_user_id_created_at_id_unread", "user_id", "created_at", "id",
+            postgresql_where=text("is_read = false")
+        ),
+    )
 
     user_id = Column(
         PG_UUID,
         nullable=False,
-        index=True,
         comment="알림을 받을 사용자 ID (users.id 참조)"
     )
     notification_type = Column(
         SQLEnum(NotificationType),
         nullable=False,
-        index=True,
         comment="알림 타입 (TICKET_CREATED, COMMENT_ADDED 등)"
     )
     title = Column(
@@ -49,7 +56,6 @@ class Notification(BaseModel):
         Boolean,
         default=False,
         nullable=False,
-        index=True,
         comment="읽음 여부"
     )
     read_at = Column(
@@ -1,38 +1,41 @@
-from sqlalchemy import Column, String, Text, Integer, Enum as SQLEnum, Date, Boolean
+from sqlalchemy import Column, String, Text, Integer, Enum as SQLEnum, Date, Boolean, Index, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from app.models.base import BaseModel
+from app.models.base import BaseModel, VersionMixin
 from app.models.enums import ProjectStatus, Priority
 
-class Project(BaseModel):
+class Project(BaseModel, VersionMixin):
     __tablename__ = "projects"
+    __table_args__ = (
+        # 목록 API keyset 페이지네이션 (ORDER BY created_at DESC, id DESC)
+        Index("ix_projects_workspace_id_created_at_id", "workspace_id", "created_at", "id"),
+        # Workspace 필터 없는 목록 (WHERE is_deleted = false ORDER BY created_at DESC, id DESC)
+        Index("ix_projects_created_at_id_live", "created_at", "id", postgresql_where=text("is_deleted = false")),
+    )
 
     name = Column(String(200), nullable=False, index=True)
     description = Column(Text, nullable=True)
     status = Column(
         SQLEnum(ProjectStatus),
         default=ProjectStatus.PLANNING,
-        nullable=False,
-        index=True
+        nullable=False
     )
     priority = Column(
         SQLEnum(Priority),
         default=Priority.MEDIUM,
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # FK 제거: 샤딩 및 DB 분리 대비
     workspace_id = Column(
         PG_UUID,
         nullable=False,
-        index=True,
         comment="References workspaces.id (no FK for sharding)"
     )
 
     # ERD 추가 필드
     start_date = Column(Date, nullable=True, comment="프로젝트 시작일")
     end_date = Column(Date, nullable=True, comment="프로젝트 종료일")
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
 
     def __repr__(self):
         return f"<Project(id={self.id}, name={self.name})>"
@@ -24,7 +24,7 @@ class ProjectMember(BaseModel):
         index=True,
         comment="References project_roles.id (nullable - 역할 미부여 상태 가능)"
     )
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
 
     def __repr__(self):
         return f"<ProjectMember(id={self.id}, project_id={self.project_id}, user_id={self.user_id}, role_id={self.role_id})>"
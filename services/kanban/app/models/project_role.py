@@ -20,7 +20,7 @@ class ProjectRole(BaseModel):
     )
     description = Column(Text, nullable=True, comment="역할 설명")
     color = Column(String(7), nullable=True, comment="UI 표시 색상 (HEX, 예: #FF5733)")
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
 
     def __repr__(self):
         return f"<ProjectRole(id={self.id}, project_id={self.project_id}, role_name={self.role_name})>"
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, String, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from app.models.base import Base
+
+class ProjectTicketStat(Base):
+    """
+    프로젝트 대시보드용 Ticket 집계 (비정규화 요약 테이블)
+
+    (project_id, dimension, key)마다 Ticket 수를 보관하며 Ticket 생성/수정/삭제 시
+    app.services.project_stats가 증감합니다. 감사 컬럼이 필요 없는 파생 데이터이므로
+    BaseModel 대신 Base를 직접 상속합니다.
+
+    dimension / key:
+        status       TicketStatus 값
+        priority     Priority 값
+        ticket_type  ticket_type_id (없으면 "none")
+        assignee     assignee_id (없으면 "none")
+        open_due     미완료 Ticket의 due_date (ISO 날짜) - 기한 초과 수 계산용
+    """
+    __tablename__ = "project_ticket_stats"
+
+    project_id = Column(
+        PG_UUID,
+        primary_key=True,
+        comment="References projects.id (no FK for sharding)"
+    )
+    dimension = Column(String(20), primary_key=True, comment="집계 기준 (status, priority, ticket_type, assignee, open_due)")
+    key = Column(String(64), primary_key=True, comment="기준 값 (enum 값, UUID, ISO 날짜 또는 none)")
+    count = Column(Integer, nullable=False, default=0, comment="Ticket 수")
+
+    def __repr__(self):
+        return f"<ProjectTicketStat(project_id={self.project_id}, dimension={self.dimension}, key={self.key}, count={self.count})>"
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, DateTime, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.sql import func
+from app.models.base import Base
+from app.models.enums import TargetType
+
+class SyncTombstone(Base):
+    """
+    하드 삭제된 Ticket / Task 기록 (GET /api/projects/{id}/changes 동기화용)
+
+    삭제된 행은 updated_at으로 찾을 수 없으므로 삭제할 때 같은 트랜잭션에서 남깁니다.
+    Ticket 삭제 시 하위 Task는 따로 남기지 않습니다 (클라이언트가 Ticket과 함께 제거).
+    SYNC_TOMBSTONE_RETENTION_DAYS가 지난 기록은 scripts/purge_sync_tombstones.py로 삭제합니다.
+    """
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        # 변경 조회 keyset (WHERE project_id = ? AND (deleted_at, id) > (?, ?) ORDER BY deleted_at, id)
+        Index("ix_sync_tombstones_project_id_deleted_at_id", "project_id", "deleted_at", "id"),
+    )
+
+    id = Column(PG_UUID, primary_key=True, comment="삭제된 Ticket/Task의 id")
+    target_type = Column(SQLEnum(TargetType), nullable=False, comment="TICKET 또는 TASK")
+    project_id = Column(
+        PG_UUID,
+        nullable=False,
+        comment="References projects.id (no FK for sharding)"
+    )
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    deleted_by = Column(
+        PG_UUID,
+        nullable=True,
+        comment="References users.id from Member service (no FK for microservice)"
+    )
+
+    def __repr__(self):
+        return f"<SyncTombstone(id={self.id}, target_type={self.target_type}, project_id={self.project_id})>"
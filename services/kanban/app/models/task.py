@@ -1,18 +1,23 @@
-from sqlalchemy import Column, String, Text, Integer, Enum as SQLEnum, DateTime, Date, Boolean
+from sqlalchemy import Column, String, Text, Integer, Enum as SQLEnum, DateTime, Date, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from app.models.base import BaseModel
+from app.models.base import BaseModel, VersionMixin
 from app.models.enums import TaskStatus
 
-class Task(BaseModel):
+class Task(BaseModel, VersionMixin):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 목록 API keyset 페이지네이션 (ORDER BY created_at DESC, id DESC)
+        Index("ix_tasks_ticket_id_created_at_id", "ticket_id", "created_at", "id"),
+        # 변경 동기화 keyset (최근 변경된 Task부터 순서대로 읽고 Ticket으로 Project 확인)
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
+    )
 
     title = Column(String(300), nullable=False, index=True)
     description = Column(Text, nullable=True)
     status = Column(
         SQLEnum(TaskStatus),
         default=TaskStatus.TODO,
-        nullable=False,
-        index=True
+        nullable=False
     )
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
@@ -20,7 +25,6 @@ class Task(BaseModel):
     ticket_id = Column(
         PG_UUID,
         nullable=False,
-        index=True,
         comment="References tickets.id (no FK for sharding)"
     )
 
@@ -34,7 +38,7 @@ class Task(BaseModel):
 
     # ERD 추가 필드
     due_date = Column(Date, nullable=True, comment="태스크 마감일")
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
 
     def __repr__(self):
         return f"<Task(id={self.id}, title={self.title})>"
@@ -23,10 +23,9 @@ class TaskMember(BaseModel):
         SQLEnum(TaskParticipationType),
         default=TaskParticipationType.ASSIGNEE,
         nullable=False,
-        index=True,
         comment="참여 타입 (담당자/리뷰어)"
     )
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
 
     def __repr__(self):
         return f"<TaskMember(id={self.id}, task_id={self.task_id}, user_id={self.user_id}, type={self.participation_type})>"
@@ -1,31 +1,36 @@
-from sqlalchemy import Column, String, Text, Integer, Enum as SQLEnum, Date, Boolean
+from sqlalchemy import Column, String, Text, Integer, Enum as SQLEnum, Date, Boolean, Index
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from app.models.base import BaseModel
-from app.models.enums import TicketStatus, Priority
+from app.models.base import BaseModel, VersionMixin
+from app.models.enums import TicketStatus, TaskStatus, Priority
 
-class Ticket(BaseModel):
+class Ticket(BaseModel, VersionMixin):
     __tablename__ = "tickets"
+    __table_args__ = (
+        # 목록 API keyset 페이지네이션 (ORDER BY created_at DESC, id DESC)
+        Index("ix_tickets_project_id_created_at_id", "project_id", "created_at", "id"),
+        # 상태 필터 목록 (WHERE project_id = ? AND status = ? ORDER BY created_at DESC, id DESC)
+        Index("ix_tickets_project_id_status_created_at_id", "project_id", "status", "created_at", "id"),
+        # 변경 동기화 keyset (GET /api/projects/{id}/changes, ORDER BY updated_at, id)
+        Index("ix_tickets_project_id_updated_at_id", "project_id", "updated_at", "id"),
+    )
 
     title = Column(String(300), nullable=False, index=True)
     description = Column(Text, nullable=True)
     status = Column(
         SQLEnum(TicketStatus),
         default=TicketStatus.OPEN,
-        nullable=False,
-        index=True
+        nullable=False
     )
     priority = Column(
         SQLEnum(Priority),
         default=Priority.MEDIUM,
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # FK 제거: 샤딩 및 DB 분리 대비
     project_id = Column(
         PG_UUID,
         nullable=False,
-        index=True,
         comment="References projects.id (no FK for sharding)"
     )
 
@@ -53,7 +58,24 @@ class Ticket(BaseModel):
         comment="상위 티켓 ID (서브태스크용, self-reference)"
     )
     due_date = Column(Date, nullable=True, comment="티켓 마감일")
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
+
+    # 하위 Task 상태별 개수 (비정규화 - app.services.task_rollup에서 Task 변경과 같은 트랜잭션으로 갱신)
+    task_count_todo = Column(Integer, default=0, server_default="0", nullable=False, comment="TODO 상태 Task 수")
+    task_count_in_progress = Column(Integer, default=0, server_default="0", nullable=False, comment="IN_PROGRESS 상태 Task 수")
+    task_count_review = Column(Integer, default=0, server_default="0", nullable=False, comment="REVIEW 상태 Task 수")
+    task_count_done = Column(Integer, default=0, server_default="0", nullable=False, comment="DONE 상태 Task 수")
+
+    @property
+    def task_summary(self) -> dict:
+        """Task 진행 요약 (TicketResponse.tasks)"""
+        by_status = {
+            TaskStatus.TODO.value: self.task_count_todo or 0,
+            TaskStatus.IN_PROGRESS.value: self.task_count_in_progress or 0,
+            TaskStatus.REVIEW.value: self.task_count_review or 0,
+            TaskStatus.DONE.value: self.task_count_done or 0,
+        }
+        return {"total": sum(by_status.values()), "by_status": by_status}
 
     def __repr__(self):
         return f"<Ticket(id={self.id}, title={self.title})>"
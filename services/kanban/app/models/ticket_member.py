@@ -23,10 +23,9 @@ class TicketMember(BaseModel):
         SQLEnum(TicketParticipationType),
         default=TicketParticipationType.ASSIGNEE,
         nullable=False,
-        index=True,
         comment="참여 타입 (담당자/리뷰어/관찰자)"
     )
-    is_deleted = Column(Boolean, default=False, nullable=False, index=True, comment="소프트 삭제 플래그")
+    is_deleted = Column(Boolean, default=False, nullable=False, comment="소프트 삭제 플래그")
 
     def __repr__(self):
         return f"<TicketMember(id={self.id}, ticket_id={self.ticket_id}, user_id={self.user_id}, type={self.participation_type})>"
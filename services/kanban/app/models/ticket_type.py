@@ -42,7 +42,6 @@ class TicketType(BaseModel):
         Boolean,
         default=False,
         nullable=False,
-        index=True,
         comment="소프트 삭제 플래그"
     )
 
@@ -1,8 +1,12 @@
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, String, Text, Index
 from app.models.base import BaseModel
 
 class Workspace(BaseModel):
     __tablename__ = "workspaces"
+    __table_args__ = (
+        # 목록 API keyset 페이지네이션 (ORDER BY created_at DESC, id DESC)
+        Index("ix_workspaces_created_at_id", "created_at", "id"),
+    )
 
     name = Column(String(100), nullable=False, index=True)
     description = Column(Text, nullable=True)
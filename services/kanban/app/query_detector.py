@@ -0,0 +1,210 @@
+"""
+N+1 / 느린 쿼리 감지기 (개발 / CI용, QUERY_DETECTOR_ENABLED로 켬)
+
+요청마다 실행한 SQL 문을 형태(파라미터 자리와 IN 목록 길이를 지운 SQL)별로 세고
+다음 경우를 위반으로 기록해, 요청이 끝날 때 SQL을 실행한 애플리케이션 코드 위치(스택)와 함께 경고 로그를 남깁니다.
+
+- repeated: 같은 형태의 SQL을 QUERY_DETECTOR_REPEAT_THRESHOLD번 이상 실행 (반복문 안의 조회 = N+1)
+- statements: 요청 하나가 QUERY_DETECTOR_MAX_STATEMENTS개를 넘는 SQL 문을 실행
+- slow: SQL 문 하나의 실행 시간이 QUERY_DETECTOR_SLOW_MS 이상
+
+스택은 기준을 처음 넘은 SQL 문에서 한 번만 수집합니다.
+테스트에서는 collect_violations()로 위반을 모아 실패 처리합니다 (tests/conftest.py).
+"""
+import os
+import re
+import sys
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from greenlet import getcurrent
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.logging_config import get_logger
+from app.metrics import route_template
+
+logger = get_logger(__name__)
+
+# 스택에서 남길 프로젝트 코드 위치 (라이브러리 / 이 모듈 프레임은 제외)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PLACEHOLDER = re.compile(r"\$\d+(?:::[\w\[\]]+)?|%\(\w+\)s|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_VALUES_LIST = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """
+    SQL 문 형태 (같은 코드 위치에서 값만 바꿔 실행한 SQL을 하나로 묶는 키)
+
+    바인드 파라미터 자리, IN / VALUES 목록 길이와 공백 차이를 지웁니다.
+    """
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("?", shape)
+    shape = _VALUES_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryViolation:
+    """감지 기준을 넘은 SQL 실행 하나"""
+    kind: str
+    statement: str
+    count: int = 1
+    elapsed: float = 0.0
+    stack: list[str] = field(default_factory=list)
+    label: str = ""
+
+    def describe(self) -> str:
+        if self.kind == "repeated":
+            summary = f"같은 형태의 SQL을 {self.count}번 실행 (N+1 의심)"
+        elif self.kind == "statements":
+            summary = f"SQL 문 {self.count}개 실행 (기준 {settings.QUERY_DETECTOR_MAX_STATEMENTS}개)"
+        else:
+            summary = f"느린 SQL {self.elapsed * 1000:.1f}ms (기준 {settings.QUERY_DETECTOR_SLOW_MS}ms)"
+        return f"{self.label}: {summary}\n  SQL: {self.statement}\n" + "".join(self.stack)
+
+
+class QueryTrace:
+    """요청 하나 동안 실행한 SQL 문 형태별 횟수와 위반"""
+
+    def __init__(self):
+        self.statements = 0
+        self.shapes: Counter = Counter()
+        self.violations: list[QueryViolation] = []
+        self._repeated: dict[str, QueryViolation] = {}
+        self._budget: Optional[QueryViolation] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.statements += 1
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+
+        if self.shapes[shape] == settings.QUERY_DETECTOR_REPEAT_THRESHOLD:
+            violation = QueryViolation("repeated", shape, stack=caller_stack())
+            self._repeated[shape] = violation
+            self.violations.append(violation)
+        if self.statements == settings.QUERY_DETECTOR_MAX_STATEMENTS + 1:
+            self._budget = QueryViolation("statements", shape, stack=caller_stack())
+            self.violations.append(self._budget)
+        if elapsed * 1000 >= settings.QUERY_DETECTOR_SLOW_MS:
+            self.violations.append(QueryViolation("slow", shape, elapsed=elapsed, stack=caller_stack()))
+
+    def finish(self, label: str) -> list[QueryViolation]:
+        """최종 횟수를 채운 위반 목록"""
+        for shape, violation in self._repeated.items():
+            violation.count = self.shapes[shape]
+        if self._budget is not None:
+            self._budget.count = self.statements
+        for violation in self.violations:
+            violation.label = label
+        return self.violations
+
+
+_current: ContextVar[Optional[QueryTrace]] = ContextVar("query_trace", default=None)
+
+# collect_violations()로 등록한 수집 목록 (테스트용)
+_collectors: list[list[QueryViolation]] = []
+
+
+def caller_stack() -> list[str]:
+    """
+    SQL을 실행한 프로젝트 코드 위치
+
+    AsyncSession의 SQL은 별도 greenlet에서 실행되므로
+    await한 애플리케이션 코드는 부모 greenlet의 멈춘 프레임부터 거슬러 올라가 찾습니다.
+    """
+    frame = sys._getframe(1)
+    parent = getcurrent().parent
+    if parent is not None and parent.gr_frame is not None:
+        frame = parent.gr_frame
+    frames = [
+        summary for summary in traceback.extract_stack(frame)
+        if summary.filename.startswith(PROJECT_ROOT)
+        and "site-packages" not in summary.filename
+        and summary.filename != __file__
+    ]
+    return traceback.format_list(frames)
+
+
+@contextmanager
+def detect_queries() -> Iterator[QueryTrace]:
+    """with 블록 안에서 실행한 SQL 문을 QueryTrace에 기록"""
+    trace = QueryTrace()
+    token = _current.set(trace)
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+
+
+def report(label: str, trace: QueryTrace) -> None:
+    """위반을 경고 로그로 남기고 수집 목록에 전달"""
+    for violation in trace.finish(label):
+        logger.warning(
+            violation.describe(),
+            extra={
+                "route": label,
+                "violation": violation.kind,
+                "statement": violation.statement,
+                "count": violation.count,
+            },
+        )
+        for collector in _collectors:
+            collector.append(violation)
+
+
+@contextmanager
+def collect_violations() -> Iterator[list[QueryViolation]]:
+    """with 블록 동안 (다른 스레드의 요청 포함) 보고된 위반을 모은 목록"""
+    violations: list[QueryViolation] = []
+    _collectors.append(violations)
+    try:
+        yield violations
+    finally:
+        _collectors.remove(violations)
+
+
+class QueryDetectorMiddleware:
+    """요청마다 SQL 실행을 기록하고 끝날 때 위반을 보고하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with detect_queries() as trace:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                report(f"{scope['method']} {route_template(scope)}", trace)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_detector_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("query_detector_started", None)
+    trace = _current.get()
+    if trace is not None and started is not None:
+        trace.record(statement, time.perf_counter() - started)
+
+
+def install_query_detector(engine: AsyncEngine) -> None:
+    """엔진에 SQL 기록 이벤트 등록 (여러 번 호출해도 한 번만 등록)"""
+    sync_engine = engine.sync_engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
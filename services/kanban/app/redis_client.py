@@ -0,0 +1,18 @@
+"""
+Redis 클라이언트
+
+애플리케이션 전체에서 하나의 커넥션 풀을 공유하는 비동기 Redis 클라이언트입니다.
+실제 연결은 첫 명령 실행 시 생성됩니다.
+"""
+import redis.asyncio as aioredis
+from app.config import settings
+
+redis_client: aioredis.Redis = aioredis.from_url(
+    settings.REDIS_URL,
+    decode_responses=True,
+)
+
+
+def get_redis() -> aioredis.Redis:
+    """FastAPI 의존성 - 공유 Redis 클라이언트 반환 (테스트에서 override 가능)"""
+    return redis_client
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from datetime import date
+from typing import Optional
+from uuid import UUID
+from app.models.enums import TicketStatus
+from app.schemas.project import ProjectResponse
+from app.schemas.ticket import TicketResponse
+from app.schemas.ticket_type import TicketTypeResponse
+
+class BoardTicket(TicketResponse):
+    """보드 카드 (Ticket + 티켓 타입, Task 요약은 TicketResponse.tasks)"""
+    ticket_type_id: Optional[UUID] = None
+    due_date: Optional[date] = None
+
+class BoardColumn(BaseModel):
+    """TicketStatus별 보드 컬럼"""
+    status: TicketStatus
+    count: int
+    tickets: list[BoardTicket]
+
+class BoardResponse(BaseModel):
+    """프로젝트 칸반 보드 전체 (한 번의 요청으로 렌더링)"""
+    project: ProjectResponse
+    ticket_types: list[TicketTypeResponse]
+    columns: list[BoardColumn] = Field(..., description="TicketStatus 정의 순서, 빈 컬럼 포함")
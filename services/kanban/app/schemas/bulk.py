@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import Literal, Optional
+from uuid import UUID
+
+BulkOperation = Literal["create", "update", "delete"]
+BulkItemStatus = Literal["ok", "not_found", "skipped"]
+
+class BulkItemUpdate(BaseModel):
+    """일괄 수정 항목 공통 필드 (수정할 필드는 리소스별 Update 스키마)"""
+    id: UUID
+
+class BulkRequestBase(BaseModel):
+    """일괄 생성/수정/삭제 요청 공통 필드 (한 트랜잭션으로 처리)"""
+    delete: list[UUID] = Field(default_factory=list, description="삭제할 ID 목록")
+    all_or_nothing: bool = Field(False, description="true면 실패한 항목이 하나라도 있을 때 아무것도 반영하지 않음")
+
+    @model_validator(mode="after")
+    def check_unique_targets(self):
+        ids = [item.id for item in self.update] + list(self.delete)
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each id may appear only once across update and delete")
+        return self
+
+    @property
+    def item_count(self) -> int:
+        return len(self.create) + len(self.update) + len(self.delete)
+
+class BulkItemResult(BaseModel):
+    """일괄 요청 항목별 결과"""
+    op: BulkOperation
+    index: int = Field(..., description="요청의 create/update/delete 목록 내 위치")
+    id: Optional[UUID] = Field(None, description="대상 ID (생성 실패 시 null)")
+    status: BulkItemStatus = Field(..., description="ok, not_found, skipped (all_or_nothing으로 반영 안 됨)")
+    detail: Optional[str] = None
+
+class BulkResponseBase(BaseModel):
+    succeeded: int
+    failed: int
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+from uuid import UUID
+
+class CommentCreate(BaseModel):
+    """Ticket/Task 댓글 생성 (가져오기 등에서 사용)"""
+    target_type: Literal["TICKET", "TASK"] = Field(..., description="댓글 대상 타입")
+    target_id: UUID
+    content: str = Field(..., min_length=1, max_length=10000)
+    parent_id: Optional[UUID] = Field(None, description="대댓글인 경우 부모 댓글 ID")
+    author_id: Optional[UUID] = Field(None, description="작성자 ID (없으면 요청 사용자)")
@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field, computed_field
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+class DeletionJobResponse(BaseModel):
+    """백그라운드 삭제 작업 상태 응답 스키마"""
+    id: UUID
+    target_type: str = Field(..., description="삭제 대상 종류 (workspace, project)")
+    target_id: UUID
+    requested_by: UUID
+    status: str = Field(..., description="queued, running, completed, failed")
+    total_projects: int = Field(0, description="삭제할 Project 수 (작업 시작 시 계산)")
+    total_tickets: int = Field(0, description="삭제할 Ticket 수 (작업 시작 시 계산)")
+    processed_projects: int = 0
+    processed_tickets: int = 0
+    deleted_rows: int = Field(0, description="지금까지 삭제한 전체 행 수 (하위 테이블 포함)")
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @computed_field(description="진행률 (0.0 ~ 1.0, Ticket 기준)")
+    @property
+    def progress(self) -> float:
+        if self.status == "completed":
+            return 1.0
+        if not self.total_tickets:
+            return 0.0
+        return min(self.processed_tickets / self.total_tickets, 1.0)
@@ -33,11 +33,13 @@ class NotificationResponse(NotificationBase):
 
 class NotificationListResponse(BaseModel):
     """알림 목록 응답 스키마"""
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false이면 null)")
+    total_is_exact: bool = Field(True, description="total이 정확한 COUNT 결과인지 여부 (false면 추정치)")
     unread_count: int
     items: list[NotificationResponse]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 from uuid import UUID
 from app.models.enums import ProjectStatus, Priority
@@ -11,7 +11,7 @@ class ProjectBase(BaseModel):
     priority: Priority = Priority.MEDIUM
 
 class ProjectCreate(ProjectBase):
-    workspace_id: UUID = Field(..., gt=0)
+    workspace_id: UUID = Field(...)
 
 class ProjectUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=200)
@@ -21,6 +21,7 @@ class ProjectUpdate(BaseModel):
 
 class ProjectResponse(ProjectBase):
     id: UUID
+    version: int = Field(..., description="수정 시마다 증가 (ETag와 같은 값)")
     workspace_id: UUID
     created_at: datetime
     updated_at: datetime
@@ -31,10 +32,24 @@ class ProjectResponse(ProjectBase):
         from_attributes = True
 
 class ProjectListResponse(BaseModel):
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false이면 null)")
+    total_is_exact: bool = Field(True, description="total이 정확한 COUNT 결과인지 여부 (false면 추정치)")
     items: list[ProjectResponse]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+class ProjectStatsResponse(BaseModel):
+    """프로젝트 대시보드 Ticket 집계"""
+    project_id: UUID
+    total: int
+    by_status: dict[str, int] = Field(..., description="TicketStatus별 Ticket 수 (0개인 상태 포함)")
+    by_priority: dict[str, int] = Field(..., description="Priority별 Ticket 수 (0개인 우선순위 포함)")
+    by_ticket_type: dict[str, int] = Field(..., description="ticket_type_id별 Ticket 수 (타입 없음: none)")
+    by_assignee: dict[str, int] = Field(..., description="assignee_id별 Ticket 수 (담당자 없음: none)")
+    overdue: int = Field(..., description="마감일이 지난 미완료(DONE/CLOSED 제외) Ticket 수")
+    due_today: int = Field(..., description="오늘 마감인 미완료 Ticket 수")
+    as_of: date = Field(..., description="기한 초과 계산 기준일")
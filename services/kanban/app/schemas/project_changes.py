@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+from app.schemas.board import BoardTicket
+from app.schemas.task import TaskResponse
+
+class DeletedItem(BaseModel):
+    """하드 삭제된 항목 (ticket이면 하위 Task도 함께 삭제됨)"""
+    type: Literal["ticket", "task"]
+    id: UUID
+    deleted_at: datetime
+
+class ProjectChangesResponse(BaseModel):
+    """since 토큰 이후 생성/수정/삭제된 Ticket, Task (변경 시각 순)"""
+    tickets: list[BoardTicket] = Field(..., description="생성 또는 수정된 Ticket (현재 상태)")
+    tasks: list[TaskResponse] = Field(..., description="생성 또는 수정된 Task (현재 상태)")
+    deleted: list[DeletedItem]
+    next_token: str = Field(..., description="다음 요청의 since 값")
+    has_more: bool = Field(..., description="true면 next_token으로 바로 이어서 요청")
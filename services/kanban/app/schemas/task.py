@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 from app.models.enums import TaskStatus
+from app.schemas.bulk import BulkItemResult, BulkItemUpdate, BulkRequestBase, BulkResponseBase
 
 class TaskBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=300)
@@ -10,7 +11,7 @@ class TaskBase(BaseModel):
     status: TaskStatus = TaskStatus.TODO
 
 class TaskCreate(TaskBase):
-    ticket_id: UUID = Field(..., gt=0)
+    ticket_id: UUID = Field(...)
     assignee_id: Optional[UUID] = Field(None, description="담당자 ID")
 
 class TaskUpdate(BaseModel):
@@ -21,6 +22,7 @@ class TaskUpdate(BaseModel):
 
 class TaskResponse(TaskBase):
     id: UUID
+    version: int = Field(..., description="수정 시마다 증가 (ETag와 같은 값)")
     ticket_id: UUID
     completed_at: Optional[datetime] = None
     created_at: datetime
@@ -33,10 +35,26 @@ class TaskResponse(TaskBase):
         from_attributes = True
 
 class TaskListResponse(BaseModel):
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false이면 null)")
+    total_is_exact: bool = Field(True, description="total이 정확한 COUNT 결과인지 여부 (false면 추정치)")
     items: list[TaskResponse]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+class TaskBulkUpdate(TaskUpdate, BulkItemUpdate):
+    pass
+
+class TaskBulkRequest(BulkRequestBase):
+    """Task 일괄 생성/수정/삭제 (POST /api/tasks/bulk)"""
+    create: list[TaskCreate] = Field(default_factory=list)
+    update: list[TaskBulkUpdate] = Field(default_factory=list)
+
+class TaskBulkItemResult(BulkItemResult):
+    task: Optional[TaskResponse] = Field(None, description="생성/수정 성공 시 반영된 Task")
+
+class TaskBulkResponse(BulkResponseBase):
+    results: list[TaskBulkItemResult]
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 from app.models.enums import TicketStatus, Priority
+from app.schemas.bulk import BulkItemResult, BulkItemUpdate, BulkRequestBase, BulkResponseBase
 
 class TicketBase(BaseModel):
     title: str = Field(..., min_length=1, max_length=300)
@@ -11,7 +12,7 @@ class TicketBase(BaseModel):
     priority: Priority = Priority.MEDIUM
 
 class TicketCreate(TicketBase):
-    project_id: UUID = Field(..., gt=0)
+    project_id: UUID = Field(...)
     assignee_id: Optional[UUID] = Field(None, description="담당자 ID")
 
 class TicketUpdate(BaseModel):
@@ -21,23 +22,51 @@ class TicketUpdate(BaseModel):
     priority: Optional[Priority] = None
     assignee_id: Optional[UUID] = Field(None, description="담당자 ID")
 
+class TicketTaskSummary(BaseModel):
+    """Ticket별 하위 Task 진행 요약 (tickets의 비정규화 카운터)"""
+    total: int = 0
+    # 키는 TaskStatus 값 (str 키로 두어 Ticket 수천 개 응답 시 enum 검증 비용 절감)
+    by_status: dict[str, int] = Field(default_factory=dict, description="TaskStatus별 Task 수 (0개인 상태 포함)")
+
 class TicketResponse(TicketBase):
     id: UUID
+    version: int = Field(..., description="수정 시마다 증가 (ETag와 같은 값)")
     project_id: UUID
     created_at: datetime
     updated_at: datetime
     created_by: UUID
     updated_by: Optional[UUID] = None
     assignee_id: Optional[UUID] = None
+    tasks: TicketTaskSummary = Field(
+        default_factory=TicketTaskSummary,
+        validation_alias="task_summary",
+        description="하위 Task 상태별 개수 (예: by_status.DONE / total = 진행률)"
+    )
 
     class Config:
         from_attributes = True
 
 class TicketListResponse(BaseModel):
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false이면 null)")
+    total_is_exact: bool = Field(True, description="total이 정확한 COUNT 결과인지 여부 (false면 추정치)")
     items: list[TicketResponse]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+class TicketBulkUpdate(TicketUpdate, BulkItemUpdate):
+    pass
+
+class TicketBulkRequest(BulkRequestBase):
+    """Ticket 일괄 생성/수정/삭제 (POST /api/tickets/bulk)"""
+    create: list[TicketCreate] = Field(default_factory=list)
+    update: list[TicketBulkUpdate] = Field(default_factory=list)
+
+class TicketBulkItemResult(BulkItemResult):
+    ticket: Optional[TicketResponse] = Field(None, description="생성/수정 성공 시 반영된 Ticket")
+
+class TicketBulkResponse(BulkResponseBase):
+    results: list[TicketBulkItemResult]
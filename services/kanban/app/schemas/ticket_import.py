@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+from uuid import UUID
+
+class ImportRowError(BaseModel):
+    line: int = Field(..., description="입력의 레코드 번호 (1부터, CSV는 헤더 제외)")
+    error: str
+
+class ImportResponse(BaseModel):
+    """Ticket/Task/댓글 가져오기 결과"""
+    project_id: UUID
+    tickets: int
+    tasks: int
+    comments: int
+    skipped: int = Field(..., description="검증에 실패하여 건너뛴 레코드 수")
+    errors: list[ImportRowError] = Field(..., description="건너뛴 레코드 (최대 IMPORT_MAX_ERRORS개)")
+    elapsed_seconds: float
+    rows_per_second: float
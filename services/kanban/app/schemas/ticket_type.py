@@ -37,7 +37,8 @@ class TicketTypeResponse(TicketTypeBase):
 
 class TicketTypeListResponse(BaseModel):
     """티켓 타입 목록 응답 스키마"""
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false이면 null)")
+    total_is_exact: bool = Field(True, description="total이 정확한 COUNT 결과인지 여부 (false면 추정치)")
     items: list[TicketTypeResponse]
     limit: int
     offset: int
@@ -25,10 +25,12 @@ class WorkspaceResponse(WorkspaceBase):
         from_attributes = True
 
 class WorkspaceListResponse(BaseModel):
-    total: int
+    total: Optional[int] = Field(None, description="전체 개수 (include_total=false이면 null)")
+    total_is_exact: bool = Field(True, description="total이 정확한 COUNT 결과인지 여부 (false면 추정치)")
     items: list[WorkspaceResponse]
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
     class Config:
         from_attributes = True
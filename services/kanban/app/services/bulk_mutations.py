@@ -0,0 +1,241 @@
+"""
+Ticket / Task 일괄 생성/수정/삭제
+
+칸반 컬럼 간 이동이나 담당자 일괄 변경처럼 수백 개 항목을 바꿀 때 항목마다 PATCH 요청
+(조회 + 커밋 + refresh)을 보내지 않도록 한 요청, 한 트랜잭션으로 처리합니다.
+
+- 생성: INSERT ... RETURNING 한 문장 (상위 Project/Ticket 존재 확인도 한 번에)
+- 수정/삭제: 대상 행을 id 순으로 한 번에 잠근 뒤(SELECT ... FOR UPDATE), 수정 내용이 같은
+  항목끼리 묶어 UPDATE ... WHERE id = ANY(...) RETURNING / DELETE ... WHERE id = ANY(...)
+- 비정규화 집계(project_ticket_stats, tickets.task_count_*)도 항목별이 아닌 한 번에 반영
+- 결과: 요청 목록 순서대로 항목별 상태(ok, not_found, skipped) 반환
+"""
+from collections import Counter, defaultdict
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import TaskStatus
+from app.models.project import Project
+from app.models.task import Task
+from app.models.ticket import Ticket
+from app.schemas.bulk import BulkRequestBase
+from app.schemas.task import TaskBulkRequest, TaskResponse
+from app.schemas.ticket import TicketBulkRequest, TicketResponse
+from app.services.project_changes import add_tombstones
+from app.services.project_stats import apply_stat_deltas, ticket_stat_keys
+from app.services.task_rollup import apply_task_rollups
+from app.utils.sql import uuid_in
+
+
+class BulkResults:
+    """요청 항목별 결과 수집 (create/update/delete 순서)"""
+
+    def __init__(self, request: BulkRequestBase, item_field: str):
+        self.item_field = item_field
+        self.results = {
+            (op, index): {"op": op, "index": index, "id": target_id, "status": "ok", "detail": None}
+            for op, items in (
+                ("create", [None] * len(request.create)),
+                ("update", [item.id for item in request.update]),
+                ("delete", request.delete),
+            )
+            for index, target_id in enumerate(items)
+        }
+
+    def fail(self, op: str, index: int, detail: str) -> None:
+        self.results[(op, index)].update(status="not_found", detail=detail)
+
+    def succeed(self, op: str, index: int, item: Any, response_model) -> None:
+        result = self.results[(op, index)]
+        result["id"] = item.id
+        result[self.item_field] = response_model.model_validate(item)
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for result in self.results.values() if result["status"] != "ok")
+
+    def skip_all(self) -> None:
+        """all_or_nothing: 실패가 있으면 나머지 항목도 반영하지 않음"""
+        for result in self.results.values():
+            if result["status"] == "ok":
+                result["status"] = "skipped"
+
+    def response(self) -> dict:
+        failed = self.failed
+        return {
+            "succeeded": len(self.results) - failed,
+            "failed": failed,
+            "results": list(self.results.values()),
+        }
+
+
+async def _lock_targets(db: AsyncSession, model, ids: list[UUID]) -> dict:
+    """수정/삭제 대상 행을 id 순으로 잠그고 조회 (동시 일괄 요청 간 교착 상태 방지)"""
+    if not ids:
+        return {}
+    rows = await db.scalars(
+        select(model).where(uuid_in(model.id, ids)).order_by(model.id).with_for_update()
+    )
+    return {row.id: row for row in rows}
+
+
+def _group_updates(request: BulkRequestBase, found: dict) -> dict:
+    """수정 내용이 같은 항목끼리 묶음: (field, value) 튜플 -> [(index, id), ...]"""
+    groups = defaultdict(list)
+    for index, item in enumerate(request.update):
+        if item.id in found:
+            values = item.model_dump(exclude_unset=True, exclude={"id"})
+            groups[tuple(sorted(values.items()))].append((index, item.id))
+    return groups
+
+
+async def _update_grouped(db: AsyncSession, model, groups: dict, user_id: UUID) -> list[tuple[int, Any]]:
+    """묶음마다 UPDATE ... WHERE id = ANY(...) RETURNING 실행, (요청 index, 갱신된 행) 반환"""
+    updated = []
+    for values, items in groups.items():
+        statement = (
+            update(model)
+            .where(uuid_in(model.id, sorted(target_id for _, target_id in items)))
+            .values(**dict(values), updated_by=user_id)
+            .returning(model)
+        )
+        # 세션에 잠금 조회로 올라와 있는 객체를 RETURNING 값으로 갱신
+        rows = await db.scalars(
+            select(model).from_statement(statement).execution_options(populate_existing=True)
+        )
+        by_id = {row.id: row for row in rows}
+        updated.extend((index, by_id[target_id]) for index, target_id in items)
+    return updated
+
+
+async def _insert_returning(db: AsyncSession, model, rows: list[dict]) -> list:
+    """
+    INSERT ... VALUES (...), (...) RETURNING 으로 생성 (요청 순서대로 반환)
+
+    RETURNING 순서를 보장하도록(sort_by_parameter_order) 요청하면 id가 서버 기본값
+    (gen_random_uuid())인 테이블에서는 행마다 INSERT가 실행되므로, id를 미리 할당하고
+    반환된 행을 id로 다시 정렬합니다.
+    """
+    if not rows:
+        return []
+    rows = [{"id": uuid4(), **row} for row in rows]
+    by_id = {item.id: item for item in await db.scalars(insert(model).returning(model), rows)}
+    return [by_id[row["id"]] for row in rows]
+
+
+async def _existing_ids(db: AsyncSession, model, ids: set) -> set:
+    if not ids:
+        return set()
+    return set(await db.scalars(select(model.id).where(uuid_in(model.id, list(ids)))))
+
+
+async def apply_ticket_bulk(db: AsyncSession, request: TicketBulkRequest, user_id: UUID) -> dict:
+    """Ticket 일괄 생성/수정/삭제 (커밋 포함, 삭제 시 하위 Task도 삭제)"""
+    results = BulkResults(request, "ticket")
+
+    projects = await _existing_ids(db, Project, {item.project_id for item in request.create})
+    creates = []
+    for index, item in enumerate(request.create):
+        if item.project_id in projects:
+            creates.append((index, {**item.model_dump(), "created_by": user_id}))
+        else:
+            results.fail("create", index, f"Project {item.project_id} not found")
+
+    found = await _lock_targets(db, Ticket, [item.id for item in request.update] + list(request.delete))
+    for op, ids in (("update", [item.id for item in request.update]), ("delete", request.delete)):
+        for index, ticket_id in enumerate(ids):
+            if ticket_id not in found:
+                results.fail(op, index, f"Ticket {ticket_id} not found")
+
+    if request.all_or_nothing and results.failed:
+        await db.rollback()
+        results.skip_all()
+        return results.response()
+
+    stat_deltas = Counter()
+
+    created = await _insert_returning(db, Ticket, [row for _, row in creates])
+    for (index, _), ticket in zip(creates, created):
+        stat_deltas.update(ticket_stat_keys(ticket))
+        results.succeed("create", index, ticket, TicketResponse)
+
+    groups = _group_updates(request, found)
+    for items in groups.values():
+        for _, ticket_id in items:
+            stat_deltas.subtract(ticket_stat_keys(found[ticket_id]))
+    for index, ticket in await _update_grouped(db, Ticket, groups, user_id):
+        stat_deltas.update(ticket_stat_keys(ticket))
+        results.succeed("update", index, ticket, TicketResponse)
+
+    deleted_ids = [ticket_id for ticket_id in request.delete if ticket_id in found]
+    if deleted_ids:
+        await add_tombstones(db, Ticket, deleted_ids, user_id)
+        # 애플리케이션 레벨에서 CASCADE 삭제 (샤딩 대비)
+        await db.execute(
+            delete(Task).where(uuid_in(Task.ticket_id, deleted_ids)).execution_options(synchronize_session=False)
+        )
+        await db.execute(
+            delete(Ticket).where(uuid_in(Ticket.id, deleted_ids)).execution_options(synchronize_session=False)
+        )
+        for ticket_id in deleted_ids:
+            stat_deltas.subtract(ticket_stat_keys(found[ticket_id]))
+
+    await apply_stat_deltas(db, stat_deltas)
+    await db.commit()
+    return results.response()
+
+
+async def apply_task_bulk(db: AsyncSession, request: TaskBulkRequest, user_id: UUID) -> dict:
+    """Task 일괄 생성/수정/삭제 (커밋 포함)"""
+    results = BulkResults(request, "task")
+
+    tickets = await _existing_ids(db, Ticket, {item.ticket_id for item in request.create})
+    creates = []
+    for index, item in enumerate(request.create):
+        if item.ticket_id in tickets:
+            creates.append((index, {**item.model_dump(), "created_by": user_id}))
+        else:
+            results.fail("create", index, f"Ticket {item.ticket_id} not found")
+
+    found = await _lock_targets(db, Task, [item.id for item in request.update] + list(request.delete))
+    for op, ids in (("update", [item.id for item in request.update]), ("delete", request.delete)):
+        for index, task_id in enumerate(ids):
+            if task_id not in found:
+                results.fail(op, index, f"Task {task_id} not found")
+
+    if request.all_or_nothing and results.failed:
+        await db.rollback()
+        results.skip_all()
+        return results.response()
+
+    rollups: dict[UUID, Counter] = defaultdict(Counter)
+
+    created = await _insert_returning(db, Task, [row for _, row in creates])
+    for (index, _), task in zip(creates, created):
+        rollups[task.ticket_id][task.status] += 1
+        results.succeed("create", index, task, TaskResponse)
+
+    groups = _group_updates(request, found)
+    old_status: dict[UUID, TaskStatus] = {
+        task_id: found[task_id].status for items in groups.values() for _, task_id in items
+    }
+    for index, task in await _update_grouped(db, Task, groups, user_id):
+        rollups[task.ticket_id][old_status[task.id]] -= 1
+        rollups[task.ticket_id][task.status] += 1
+        results.succeed("update", index, task, TaskResponse)
+
+    deleted_ids = [task_id for task_id in request.delete if task_id in found]
+    if deleted_ids:
+        await add_tombstones(db, Task, deleted_ids, user_id)
+        await db.execute(
+            delete(Task).where(uuid_in(Task.id, deleted_ids)).execution_options(synchronize_session=False)
+        )
+        for task_id in deleted_ids:
+            rollups[found[task_id].ticket_id][found[task_id].status] -= 1
+
+    await apply_task_rollups(db, rollups)
+    await db.commit()
+    return results.response()
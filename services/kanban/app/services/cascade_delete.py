@@ -0,0 +1,225 @@
+"""
+Workspace / Project 하위 데이터 일괄 삭제 (애플리케이션 레벨 CASCADE)
+
+샤딩 대비로 DB FK CASCADE를 사용하지 않으므로 하위 데이터를 직접 삭제합니다.
+전체 하위 ID 목록을 한 번에 Python으로 가져오지 않고, Project별로 Ticket을 batch_size개씩
+keyset 순회하며 해당 Ticket 묶음의 하위 데이터를 삭제합니다. 묶음마다 커밋하여
+긴 잠금과 거대한 트랜잭션을 피합니다.
+
+삭제 순서 (자식 -> 부모):
+    Ticket 묶음마다: notifications(대상이 삭제되는 댓글/태스크/티켓) -> comments, attachments
+        -> task_members -> tasks -> ticket_members -> tickets
+    Project마다: notifications, comments, attachments -> ticket_types, project_ticket_stats,
+        sync_tombstones, project_members, project_roles -> projects
+
+중간에 실패해도 자식부터 지우므로 부모 없는 고아 행은 생기지 않으며,
+같은 함수를 다시 실행하면 남은 데이터를 이어서 삭제합니다.
+"""
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, delete, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import ColumnElement, Select
+
+from app.config import settings
+from app.logging_config import get_logger
+from app.models.attachment import Attachment
+from app.models.comment import Comment
+from app.models.enums import TargetType
+from app.models.notification import Notification
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.project_role import ProjectRole
+from app.models.project_ticket_stat import ProjectTicketStat
+from app.models.sync_tombstone import SyncTombstone
+from app.models.task import Task
+from app.models.task_member import TaskMember
+from app.models.ticket import Ticket
+from app.models.ticket_member import TicketMember
+from app.models.ticket_type import TicketType
+from app.utils.sql import uuid_in
+
+logger = get_logger(__name__)
+
+# 배치 삭제 진행 상황 콜백 (단계명 "tickets"/"projects", 처리한 Ticket/Project 수, 삭제한 전체 행 수)
+ProgressCallback = Callable[[str, int, int], Awaitable[None]]
+
+
+@dataclass
+class CascadeDeleteResult:
+    """테이블별 삭제 행 수 및 알림이 삭제된 사용자 (읽지 않은 개수 캐시 무효화용)"""
+    counts: dict[str, int] = field(default_factory=dict)
+    notification_user_ids: set[UUID] = field(default_factory=set)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+async def _delete(
+    db: AsyncSession,
+    model,
+    condition: ColumnElement,
+    result: CascadeDeleteResult,
+) -> int:
+    """condition에 해당하는 행 삭제 (커밋은 호출자가 수행)"""
+    stmt = delete(model).where(condition).execution_options(synchronize_session=False)
+    if model is Notification:
+        user_ids = (await db.execute(stmt.returning(Notification.user_id))).scalars().all()
+        result.notification_user_ids.update(user_ids)
+        deleted = len(user_ids)
+    else:
+        deleted = (await db.execute(stmt)).rowcount
+
+    if deleted:
+        table = model.__tablename__
+        result.counts[table] = result.counts.get(table, 0) + deleted
+    return deleted
+
+
+def _targets(model, target_type: TargetType, ids) -> ColumnElement:
+    if isinstance(ids, list):
+        return and_(model.target_type == target_type, uuid_in(model.target_id, ids))
+    return and_(model.target_type == target_type, model.target_id.in_(ids))
+
+
+async def _purge_tickets(db: AsyncSession, ticket_ids: list[UUID], result: CascadeDeleteResult) -> int:
+    """Ticket 묶음과 하위 Task, 멤버, 댓글, 첨부파일, 관련 알림 삭제"""
+    # 묶음 단위 ID만 메모리에 올리고 배열 파라미터로 전달 - IN (서브쿼리)는 comments 전체
+    # 해시 조인(순차 스캔)으로 계획되지만 = ANY(배열)은 target_id 인덱스를 사용
+    task_ids = list((await db.scalars(select(Task.id).where(uuid_in(Task.ticket_id, ticket_ids)))).all())
+    comment_ids = list((await db.scalars(
+        select(Comment.id).where(or_(
+            _targets(Comment, TargetType.TASK, task_ids),
+            _targets(Comment, TargetType.TICKET, ticket_ids),
+        ))
+    )).all())
+
+    steps = [
+        # 알림은 대상 행이 사라지기 전에 삭제
+        (Notification, uuid_in(Notification.target_id, comment_ids + task_ids + ticket_ids)),
+        # 댓글 / 첨부파일
+        (Comment, uuid_in(Comment.id, comment_ids)),
+        (Attachment, or_(
+            _targets(Attachment, TargetType.TASK, task_ids),
+            _targets(Attachment, TargetType.TICKET, ticket_ids),
+        )),
+        # Task
+        (TaskMember, uuid_in(TaskMember.task_id, task_ids)),
+        (Task, uuid_in(Task.id, task_ids)),
+        # Ticket
+        (TicketMember, uuid_in(TicketMember.ticket_id, ticket_ids)),
+        (Ticket, uuid_in(Ticket.id, ticket_ids)),
+    ]
+
+    deleted = 0
+    for model, condition in steps:
+        deleted += await _delete(db, model, condition, result)
+    return deleted
+
+
+async def _purge_project(
+    db: AsyncSession,
+    project_id: UUID,
+    batch_size: int,
+    result: CascadeDeleteResult,
+    progress: Optional[ProgressCallback],
+) -> None:
+    """Project 하나의 하위 데이터를 Ticket batch_size개 단위로 삭제한 뒤 Project 삭제"""
+    # (created_at, id) keyset으로 Ticket 묶음 조회 - ix_tickets_project_id_created_at_id 사용
+    ticket_query = (
+        select(Ticket.id, Ticket.created_at)
+        .where(Ticket.project_id == project_id)
+        .order_by(Ticket.created_at, Ticket.id)
+        .limit(batch_size)
+    )
+    last = None
+    while True:
+        query = ticket_query
+        if last is not None:
+            query = query.where(tuple_(Ticket.created_at, Ticket.id) > last)
+        rows = (await db.execute(query)).all()
+        if not rows:
+            break
+
+        deleted = await _purge_tickets(db, [row.id for row in rows], result)
+        await db.commit()
+        if progress is not None:
+            await progress("tickets", len(rows), deleted)
+
+        last = (rows[-1].created_at, rows[-1].id)
+        if len(rows) < batch_size:
+            break
+
+    comment_ids = select(Comment.id).where(_targets(Comment, TargetType.PROJECT, [project_id]))
+    steps = [
+        (Notification, Notification.target_id.in_(comment_ids)),
+        (Notification, Notification.target_id == project_id),
+        (Comment, _targets(Comment, TargetType.PROJECT, [project_id])),
+        (Attachment, _targets(Attachment, TargetType.PROJECT, [project_id])),
+        (TicketType, TicketType.project_id == project_id),
+        (ProjectTicketStat, ProjectTicketStat.project_id == project_id),
+        (SyncTombstone, SyncTombstone.project_id == project_id),
+        (ProjectMember, ProjectMember.project_id == project_id),
+        (ProjectRole, ProjectRole.project_id == project_id),
+        (Project, Project.id == project_id),
+    ]
+    deleted = 0
+    for model, condition in steps:
+        deleted += await _delete(db, model, condition, result)
+    await db.commit()
+    if progress is not None:
+        await progress("projects", 1, deleted)
+
+
+async def purge_projects(
+    db: AsyncSession,
+    project_ids: Select,
+    batch_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> CascadeDeleteResult:
+    """
+    project_ids(Project.id를 반환하는 SELECT)에 해당하는 프로젝트와 모든 하위 데이터 삭제
+
+    Project를 하나씩, 각 Project의 Ticket을 batch_size개씩 묶어 하위 데이터를
+    삭제하고 묶음마다 커밋합니다.
+
+    Returns:
+        CascadeDeleteResult
+    """
+    batch_size = batch_size or settings.CASCADE_DELETE_BATCH_SIZE
+    result = CascadeDeleteResult()
+
+    # 처리한 Project는 삭제되므로 남은 Project를 반복 조회
+    while True:
+        project_id = await db.scalar(project_ids.limit(1))
+        if project_id is None:
+            break
+        await _purge_project(db, project_id, batch_size, result, progress)
+
+    logger.info(f"Cascade delete finished: {result.counts}")
+    return result
+
+
+async def purge_project(
+    db: AsyncSession,
+    project_id: UUID,
+    batch_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> CascadeDeleteResult:
+    """Project 하나와 모든 하위 데이터 삭제"""
+    return await purge_projects(db, select(Project.id).where(Project.id == project_id), batch_size, progress)
+
+
+async def purge_workspace_projects(
+    db: AsyncSession,
+    workspace_id: UUID,
+    batch_size: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> CascadeDeleteResult:
+    """Workspace에 속한 모든 Project와 하위 데이터 삭제 (Workspace 자체는 호출자가 삭제)"""
+    return await purge_projects(
+        db, select(Project.id).where(Project.workspace_id == workspace_id), batch_size, progress
+    )
@@ -0,0 +1,257 @@
+"""
+Workspace / Project 백그라운드 삭제 작업 큐
+
+대규모 Workspace를 HTTP 요청 안에서 삭제하면 게이트웨이 타임아웃과 긴 잠금이
+발생하므로, 요청에서는 루트를 소프트 삭제(is_deleted)로 표시하고 Redis 큐에 작업을
+등록한 뒤 즉시 응답합니다. 별도 워커 프로세스(python -m app.worker)가 큐에서 작업을
+꺼내 cascade_delete로 하위 데이터를 배치 단위 삭제하며 진행 상황을 기록합니다.
+
+Redis 키:
+    kanban:deletion_jobs:queue                  대기 중인 작업 ID (LIST)
+    kanban:deletion_jobs:processing             워커가 처리 중인 작업 ID (LIST)
+    kanban:deletion_jobs:job:{job_id}           작업 상태 / 진행 상황 (HASH)
+    kanban:deletion_jobs:target:{type}:{id}     대상별 진행 중인 작업 ID (중복 등록 방지)
+
+삭제는 자식부터 수행하고 재실행 시 남은 데이터를 이어서 삭제하므로,
+실패한 작업은 같은 DELETE 요청을 다시 보내 재등록하면 됩니다.
+"""
+import asyncio
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID, uuid4
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.logging_config import get_logger
+from app.models.project import Project
+from app.models.ticket import Ticket
+from app.models.workspace import Workspace
+from app.services.cascade_delete import purge_project, purge_workspace_projects
+from app.services.notification_counter import invalidate_unread_counts
+
+logger = get_logger(__name__)
+
+DELETION_JOB_KEY_PREFIX = "kanban:deletion_jobs:"
+DELETION_QUEUE_KEY = f"{DELETION_JOB_KEY_PREFIX}queue"
+DELETION_PROCESSING_KEY = f"{DELETION_JOB_KEY_PREFIX}processing"
+
+# 삭제 대상 종류
+TARGET_WORKSPACE = "workspace"
+TARGET_PROJECT = "project"
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+# 정수로 반환할 진행 상황 필드
+COUNTER_FIELDS = (
+    "total_projects",
+    "total_tickets",
+    "processed_projects",
+    "processed_tickets",
+    "deleted_rows",
+)
+
+
+def job_key(job_id: str) -> str:
+    return f"{DELETION_JOB_KEY_PREFIX}job:{job_id}"
+
+
+def target_key(target_type: str, target_id: UUID) -> str:
+    return f"{DELETION_JOB_KEY_PREFIX}target:{target_type}:{target_id}"
+
+
+def _parse_job(data: Dict[str, str]) -> Dict[str, Any]:
+    job: Dict[str, Any] = dict(data)
+    for name in COUNTER_FIELDS:
+        job[name] = int(job.get(name) or 0)
+    for name in ("created_at", "started_at", "finished_at"):
+        job[name] = float(job[name]) if job.get(name) else None
+    job["error"] = job.get("error") or None
+    return job
+
+
+async def get_deletion_job(redis: aioredis.Redis, job_id: str) -> Optional[Dict[str, Any]]:
+    """작업 상태 조회 (없거나 만료되었으면 None)"""
+    data = await redis.hgetall(job_key(job_id))
+    if not data:
+        return None
+    return _parse_job(data)
+
+
+async def enqueue_deletion_job(
+    redis: aioredis.Redis,
+    target_type: str,
+    target_id: UUID,
+    requested_by: UUID,
+) -> Dict[str, Any]:
+    """
+    삭제 작업 등록
+
+    같은 대상에 대해 대기/실행 중인 작업이 있으면 새로 등록하지 않고 기존 작업을 반환합니다.
+    """
+    existing_id = await redis.get(target_key(target_type, target_id))
+    if existing_id:
+        existing = await get_deletion_job(redis, existing_id)
+        if existing is not None and existing["status"] in (STATUS_QUEUED, STATUS_RUNNING):
+            return existing
+
+    job_id = str(uuid4())
+    fields = {
+        "id": job_id,
+        "target_type": target_type,
+        "target_id": str(target_id),
+        "requested_by": str(requested_by),
+        "status": STATUS_QUEUED,
+        "created_at": time.time(),
+    }
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(job_key(job_id), mapping=fields)
+        pipe.set(target_key(target_type, target_id), job_id)
+        pipe.lpush(DELETION_QUEUE_KEY, job_id)
+        await pipe.execute()
+
+    logger.info(f"Queued deletion job {job_id} for {target_type} {target_id}")
+    return _parse_job({key: str(value) for key, value in fields.items()})
+
+
+async def _count_targets(db: AsyncSession, target_type: str, target_id: UUID) -> tuple[int, int]:
+    """삭제할 Project / Ticket 수 (진행률 계산용)"""
+    if target_type == TARGET_WORKSPACE:
+        project_ids = select(Project.id).where(Project.workspace_id == target_id)
+    else:
+        project_ids = select(Project.id).where(Project.id == target_id)
+    projects = await db.scalar(select(func.count()).select_from(project_ids.subquery()))
+    tickets = await db.scalar(select(func.count(Ticket.id)).where(Ticket.project_id.in_(project_ids)))
+    return projects, tickets
+
+
+async def run_deletion_job(
+    redis: aioredis.Redis,
+    job_id: str,
+    session_factory: async_sessionmaker = AsyncSessionLocal,
+    batch_size: Optional[int] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    삭제 작업 하나 실행 (워커에서 호출)
+
+    배치마다 처리한 Ticket/Project 수와 삭제한 행 수를 작업 HASH에 누적합니다.
+
+    Returns:
+        완료/실패 후 작업 상태 (작업이 없으면 None)
+    """
+    job = await get_deletion_job(redis, job_id)
+    if job is None:
+        logger.warning(f"Deletion job {job_id} not found, skipping")
+        return None
+
+    key = job_key(job_id)
+    target_type = job["target_type"]
+    target_id = UUID(job["target_id"])
+
+    async def progress(stage: str, processed: int, deleted: int) -> None:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(key, f"processed_{stage}", processed)
+            pipe.hincrby(key, "deleted_rows", deleted)
+            await pipe.execute()
+
+    try:
+        async with session_factory() as db:
+            total_projects, total_tickets = await _count_targets(db, target_type, target_id)
+            await redis.hset(key, mapping={
+                "status": STATUS_RUNNING,
+                "started_at": time.time(),
+                "total_projects": total_projects,
+                "total_tickets": total_tickets,
+            })
+
+            if target_type == TARGET_WORKSPACE:
+                result = await purge_workspace_projects(db, target_id, batch_size, progress)
+                workspace = await db.get(Workspace, target_id)
+                if workspace is not None:
+                    await db.delete(workspace)
+                    await db.commit()
+                    await progress("projects", 0, 1)
+            else:
+                result = await purge_project(db, target_id, batch_size, progress)
+
+        await invalidate_unread_counts(redis, result.notification_user_ids)
+        await redis.hset(key, mapping={"status": STATUS_COMPLETED, "finished_at": time.time()})
+        logger.info(f"Deletion job {job_id} completed: {result.counts}")
+    except Exception as e:
+        logger.error(f"Deletion job {job_id} failed: {str(e)}", exc_info=True)
+        await redis.hset(key, mapping={
+            "status": STATUS_FAILED,
+            "error": f"{type(e).__name__}: {str(e)}",
+            "finished_at": time.time(),
+        })
+
+    # 완료/실패한 작업은 일정 시간 후 만료, 대상은 다시 삭제 요청 가능
+    await redis.expire(key, settings.DELETION_JOB_RESULT_TTL)
+    await redis.delete(target_key(target_type, target_id))
+    return await get_deletion_job(redis, job_id)
+
+
+async def requeue_stalled_jobs(redis: aioredis.Redis) -> int:
+    """
+    처리 중 목록에 남은 작업을 대기 큐로 되돌림 (워커가 비정상 종료된 경우)
+
+    다른 워커가 실행 중인 작업도 되돌리므로 워커가 하나도 실행 중이지 않을 때만 사용합니다.
+    """
+    requeued = 0
+    while await redis.lmove(DELETION_PROCESSING_KEY, DELETION_QUEUE_KEY, "RIGHT", "RIGHT"):
+        requeued += 1
+    if requeued:
+        logger.info(f"Requeued {requeued} stalled deletion jobs")
+    return requeued
+
+
+async def process_next_job(
+    redis: aioredis.Redis,
+    session_factory: async_sessionmaker = AsyncSessionLocal,
+    timeout: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    대기 큐에서 작업 하나를 꺼내 실행
+
+    Args:
+        timeout: 대기 시간 (초, None이면 대기하지 않음)
+
+    Returns:
+        실행한 작업 상태 (큐가 비어 있으면 None)
+    """
+    # 실행 중 워커가 죽어도 작업 ID가 사라지지 않도록 처리 중 목록으로 옮긴 뒤 실행
+    if timeout is None:
+        job_id = await redis.lmove(DELETION_QUEUE_KEY, DELETION_PROCESSING_KEY, "RIGHT", "LEFT")
+    else:
+        job_id = await redis.blmove(DELETION_QUEUE_KEY, DELETION_PROCESSING_KEY, timeout, "RIGHT", "LEFT")
+    if job_id is None:
+        return None
+
+    try:
+        return await run_deletion_job(redis, job_id, session_factory)
+    finally:
+        await redis.lrem(DELETION_PROCESSING_KEY, 1, job_id)
+
+
+async def run_worker(
+    redis: aioredis.Redis,
+    session_factory: async_sessionmaker = AsyncSessionLocal,
+    poll_timeout: float = 5,
+    retry_interval: float = 1.0,
+) -> None:
+    """삭제 작업 워커 루프 (종료될 때까지 큐를 처리)"""
+    logger.info("Deletion worker started")
+    while True:
+        try:
+            await process_next_job(redis, session_factory, timeout=poll_timeout)
+        except RedisError as e:
+            logger.error(f"Deletion worker lost Redis connection: {str(e)}")
+            await asyncio.sleep(retry_interval)
@@ -0,0 +1,162 @@
+"""
+읽지 않은 알림 개수 캐시
+
+사용자별 읽지 않은 알림 개수를 Redis에 보관하여 헤더 폴링마다 발생하던
+COUNT 쿼리를 제거합니다.
+
+- 조회: Redis 값 반환, 캐시 미스 시 DB에서 COUNT 후 저장 (TTL 적용)
+- 쓰기: DB 커밋 후 키가 존재할 때만 INCRBY/DECRBY (write-through)
+  키가 없으면 아무것도 하지 않고 다음 조회 시 재구성합니다.
+- 보정: 주기적으로 캐시된 사용자의 개수를 DB와 다시 맞춤 (경합으로 인한 오차 제거)
+
+Redis 장애 시에는 DB COUNT로 대체하여 응답합니다.
+"""
+import asyncio
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError, WatchError
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.logging_config import get_logger
+from app.models.notification import Notification
+
+logger = get_logger(__name__)
+
+UNREAD_KEY_PREFIX = "kanban:notifications:unread:"
+
+
+def unread_key(user_id: UUID) -> str:
+    return f"{UNREAD_KEY_PREFIX}{user_id}"
+
+
+async def count_unread_from_db(db: AsyncSession, user_id: UUID) -> int:
+    """DB에서 읽지 않은 알림 개수 COUNT"""
+    return await db.scalar(
+        select(func.count(Notification.id)).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        )
+    )
+
+
+async def get_unread_count(redis: aioredis.Redis, db: AsyncSession, user_id: UUID) -> int:
+    """
+    읽지 않은 알림 개수 조회 (캐시 우선)
+
+    캐시 미스 시 DB에서 계산한 값을 SET NX로 저장합니다.
+    """
+    key = unread_key(user_id)
+    try:
+        cached = await redis.get(key)
+    except RedisError as e:
+        logger.warning(f"Redis unavailable, counting unread notifications from DB: {str(e)}")
+        return await count_unread_from_db(db, user_id)
+
+    if cached is not None:
+        return max(int(cached), 0)
+
+    count = await count_unread_from_db(db, user_id)
+    try:
+        await redis.set(key, count, ex=settings.UNREAD_COUNT_CACHE_TTL, nx=True)
+    except RedisError as e:
+        logger.warning(f"Failed to cache unread count for user {user_id}: {str(e)}")
+    return count
+
+
+async def adjust_unread_count(redis: aioredis.Redis, user_id: UUID, delta: int) -> None:
+    """
+    캐시된 개수를 delta만큼 증감 (DB 커밋 이후 호출)
+
+    키가 없으면 갱신하지 않습니다. EXISTS와 INCRBY 사이에 키가 만료되어
+    delta 값만 가진 키가 새로 생기지 않도록 WATCH로 보호합니다.
+    """
+    key = unread_key(user_id)
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    if not await pipe.exists(key):
+                        return
+                    pipe.multi()
+                    pipe.incrby(key, delta)
+                    (value,) = await pipe.execute()
+                    break
+                except WatchError:
+                    continue
+
+        # 음수는 경합으로 인한 오차이므로 캐시를 버리고 재구성
+        if value < 0:
+            await redis.delete(key)
+    except RedisError as e:
+        logger.warning(f"Failed to update unread count for user {user_id}: {str(e)}")
+
+
+async def invalidate_unread_count(redis: aioredis.Redis, user_id: UUID) -> None:
+    """캐시된 개수 삭제 - 다음 조회 시 DB에서 재구성"""
+    try:
+        await redis.delete(unread_key(user_id))
+    except RedisError as e:
+        logger.warning(f"Failed to invalidate unread count for user {user_id}: {str(e)}")
+
+
+async def invalidate_unread_counts(redis: aioredis.Redis, user_ids: set[UUID], chunk_size: int = 500) -> None:
+    """여러 사용자의 캐시된 개수 삭제 (대량 삭제로 알림이 지워진 경우)"""
+    keys = [unread_key(user_id) for user_id in user_ids]
+    try:
+        for i in range(0, len(keys), chunk_size):
+            await redis.delete(*keys[i:i + chunk_size])
+    except RedisError as e:
+        logger.warning(f"Failed to invalidate unread counts for {len(keys)} users: {str(e)}")
+
+
+async def reconcile_unread_counts(redis: aioredis.Redis, db: AsyncSession, batch_size: int = 500) -> int:
+    """
+    캐시된 모든 사용자의 개수를 DB 기준으로 보정
+
+    Returns:
+        보정한 사용자 수
+    """
+    reconciled = 0
+    batch: list[UUID] = []
+
+    async def flush() -> None:
+        nonlocal reconciled
+        rows = await db.execute(
+            select(Notification.user_id, func.count(Notification.id))
+            .where(Notification.user_id.in_(batch), Notification.is_read == False)
+            .group_by(Notification.user_id)
+        )
+        counts = dict(rows.all())
+        async with redis.pipeline(transaction=False) as pipe:
+            for user_id in batch:
+                # 보정 중 만료/삭제된 키는 되살리지 않음
+                pipe.set(unread_key(user_id), counts.get(user_id, 0), xx=True, keepttl=True)
+            await pipe.execute()
+        reconciled += len(batch)
+        batch.clear()
+
+    async for key in redis.scan_iter(match=f"{UNREAD_KEY_PREFIX}*", count=batch_size):
+        batch.append(UUID(key[len(UNREAD_KEY_PREFIX):]))
+        if len(batch) >= batch_size:
+            await flush()
+    if batch:
+        await flush()
+
+    return reconciled
+
+
+async def run_unread_count_reconciler(redis: aioredis.Redis, interval: int) -> None:
+    """interval초마다 reconcile_unread_counts 실행 (앱 startup에서 백그라운드 태스크로 시작)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSessionLocal() as db:
+                reconciled = await reconcile_unread_counts(redis, db)
+            logger.info(f"Reconciled unread notification counts for {reconciled} users")
+        except Exception as e:
+            logger.error(f"Unread count reconciliation failed: {str(e)}")
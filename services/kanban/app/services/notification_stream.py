@@ -0,0 +1,150 @@
+"""
+실시간 알림 스트림 (Server-Sent Events)
+
+알림 이벤트는 Redis pub/sub 채널 하나로 발행되어 모든 Pod에 전달되고,
+각 Pod의 NotificationBroker가 로컬 SSE 연결(사용자별 큐)로 분배합니다.
+Pod마다 Redis 구독 연결은 하나뿐이므로 SSE 연결 수와 무관합니다.
+
+- 이벤트: notification (새 알림), unread_count (개수 스냅샷 또는 증감 delta), resync
+- 백프레셔: 연결별 큐는 크기가 제한되며, 가득 찬 느린 클라이언트에는 resync 이벤트를
+  보내고 연결을 종료합니다. 클라이언트는 재연결 시 최신 스냅샷을 받습니다.
+- 하트비트: 일정 시간 이벤트가 없으면 SSE 주석(: ping)을 보내 프록시 유휴 타임아웃을 방지하고
+  끊어진 연결을 정리합니다.
+"""
+import asyncio
+import json
+from collections import defaultdict
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+from starlette.requests import Request
+
+from app.config import settings
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+NOTIFICATION_EVENTS_CHANNEL = "kanban:notifications:events"
+
+# 큐 overflow 발생 시 스트림에 전달되는 표식
+OVERFLOW = object()
+
+
+def format_sse(event: str, data: Any) -> str:
+    """SSE 메시지 형식으로 직렬화"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def publish_notification_event(
+    redis: aioredis.Redis,
+    user_id: UUID,
+    event: str,
+    data: dict[str, Any],
+) -> None:
+    """알림 이벤트를 모든 Pod에 발행 (DB 커밋 이후 호출, 실패해도 요청은 성공 처리)"""
+    message = json.dumps({"user_id": str(user_id), "event": event, "data": data}, default=str)
+    try:
+        await redis.publish(NOTIFICATION_EVENTS_CHANNEL, message)
+    except RedisError as e:
+        logger.warning(f"Failed to publish notification event for user {user_id}: {str(e)}")
+
+
+class NotificationBroker:
+    """
+    Pod 내 SSE 연결 관리 및 pub/sub 메시지 분배
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscribers: dict[UUID, set[asyncio.Queue]] = defaultdict(set)
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def subscribe(self, user_id: UUID) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: UUID, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def dispatch(self, user_id: UUID, event: str, data: dict[str, Any]) -> None:
+        """해당 사용자의 모든 로컬 연결에 이벤트 전달"""
+        for queue in list(self._subscribers.get(user_id, ())):
+            try:
+                queue.put_nowait((event, data))
+            except asyncio.QueueFull:
+                # 느린 클라이언트: 대기 중인 이벤트를 버리고 재동기화 요청
+                logger.warning(f"Notification stream queue full for user {user_id}, forcing resync")
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(OVERFLOW)
+
+    def handle_message(self, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+            self.dispatch(UUID(message["user_id"]), message["event"], message["data"])
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed notification event: {str(e)}")
+
+    async def listen(self, redis: aioredis.Redis, retry_interval: float = 1.0) -> None:
+        """Redis 채널을 구독하여 로컬 연결로 분배 (앱 startup에서 백그라운드 태스크로 시작)"""
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(NOTIFICATION_EVENTS_CHANNEL)
+                logger.info("Subscribed to notification events channel")
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.handle_message(message["data"])
+            except RedisError as e:
+                logger.error(f"Notification events subscription lost: {str(e)}")
+                await asyncio.sleep(retry_interval)
+            finally:
+                await pubsub.aclose()
+
+
+async def notification_event_stream(
+    request: Request,
+    queue: asyncio.Queue,
+    unread_count: int,
+    heartbeat_interval: Optional[float] = None,
+) -> AsyncIterator[str]:
+    """
+    SSE 응답 본문 생성기
+
+    연결 직후 unread_count 스냅샷을 보내고 이후 큐의 이벤트를 전달합니다.
+    """
+    heartbeat_interval = heartbeat_interval or settings.NOTIFICATION_STREAM_HEARTBEAT
+
+    yield "retry: 3000\n\n"
+    yield format_sse("unread_count", {"unread_count": unread_count})
+
+    while True:
+        try:
+            item = await asyncio.wait_for(queue.get(), timeout=heartbeat_interval)
+        except asyncio.TimeoutError:
+            if await request.is_disconnected():
+                break
+            yield ": ping\n\n"
+            continue
+
+        if item is OVERFLOW:
+            yield format_sse("resync", {})
+            break
+
+        event, data = item
+        yield format_sse(event, data)
+
+
+# 싱글톤 인스턴스
+notification_broker = NotificationBroker(queue_size=settings.NOTIFICATION_STREAM_QUEUE_SIZE)
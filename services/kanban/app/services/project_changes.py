@@ -0,0 +1,153 @@
+"""
+Project 변경 동기화 (GET /api/projects/{id}/changes)
+
+보드 클라이언트가 Ticket 목록 전체를 다시 받지 않고 마지막 동기화 이후 바뀐 것만 받도록
+생성/수정된 Ticket·Task(updated_at)와 하드 삭제 기록(sync_tombstones)을 변경 시각 순으로 반환합니다.
+
+- 토큰: 마지막으로 반환한 변경의 (변경 시각, id)를 인코딩한 불투명 문자열 (목록 cursor와 같은 형식)
+  - (변경 시각, id) keyset이므로 한 트랜잭션에서 수만 건이 같은 시각으로 바뀌어도 페이지가 끊기지 않음
+  - 인덱스: ix_tickets_project_id_updated_at_id, ix_tasks_updated_at_id,
+    ix_sync_tombstones_project_id_deleted_at_id
+- 변경 시각은 now()(트랜잭션 시작 시각)이므로, 먼저 시작했지만 아직 커밋되지 않은 트랜잭션의 변경이
+  나중에 토큰보다 이른 시각으로 보일 수 있습니다. 이를 놓치지 않도록 진행 중인 트랜잭션 중 가장 먼저
+  시작한 시각 이전의 변경만 반환합니다 (그 이후 변경은 해당 트랜잭션이 끝난 뒤의 동기화에서 전달).
+- Ticket 삭제 기록만 남기며 하위 Task는 Ticket과 함께 삭제된 것으로 처리합니다.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, insert, literal, select, text, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.enums import TargetType
+from app.models.sync_tombstone import SyncTombstone
+from app.models.task import Task
+from app.models.ticket import Ticket
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.sql import uuid_in
+
+# 이 시각 이전의 변경은 모두 커밋됨: 진행 중인 다른 트랜잭션 중 가장 먼저 시작한 시각 (없으면 현재 시각)
+# (아직 쓰기 전인 트랜잭션도 이후 now()로 이 시각을 쓸 수 있으므로 backend_xid로 거르지 않음,
+#  다른 DB 사용자의 트랜잭션 시각은 pg_read_all_stats 권한이 있어야 보임)
+_SAFE_UNTIL = text(
+    """
+    SELECT least(min(xact_start), statement_timestamp()) FROM pg_stat_activity
+    WHERE datname = current_database() AND backend_type = 'client backend'
+      AND xact_start IS NOT NULL AND pid <> pg_backend_pid()
+    """
+)
+
+_MIN_ID = UUID(int=0)
+
+
+async def add_tombstones(db: AsyncSession, model, ids: list[UUID], user_id: UUID) -> None:
+    """
+    삭제할 Ticket / Task의 삭제 기록 추가 (삭제 전에, 같은 트랜잭션에서 호출)
+
+    Project는 행에서 INSERT ... SELECT로 찾으므로 왕복 1회입니다.
+    """
+    if not ids:
+        return
+    if model is Ticket:
+        rows = select(Ticket.id, literal(TargetType.TICKET), Ticket.project_id, literal(user_id)).where(
+            uuid_in(Ticket.id, ids)
+        )
+    else:
+        rows = (
+            select(Task.id, literal(TargetType.TASK), Ticket.project_id, literal(user_id))
+            .join(Ticket, Ticket.id == Task.ticket_id)
+            .where(uuid_in(Task.id, ids))
+        )
+    await db.execute(
+        insert(SyncTombstone).from_select(["id", "target_type", "project_id", "deleted_by"], rows)
+    )
+
+
+def _changed_between(key, since: Optional[tuple[datetime, UUID]], safe_until: datetime):
+    conditions = [key[0] < safe_until]
+    if since:
+        conditions.append(tuple_(*key) > since)
+    return and_(*conditions)
+
+
+async def _load(db: AsyncSession, model, ids: list[UUID]) -> dict:
+    if not ids:
+        return {}
+    return {row.id: row for row in await db.scalars(select(model).where(uuid_in(model.id, ids)))}
+
+
+async def get_changes(db: AsyncSession, project_id: UUID, since: Optional[str], limit: int) -> dict:
+    """
+    since 토큰 이후 변경을 (변경 시각, id) 순으로 최대 limit개 반환
+
+    Args:
+        since: 이전 응답의 next_token (None이면 처음부터 - 전체 동기화)
+
+    Raises:
+        HTTPException: 토큰 형식 오류 400, 삭제 기록 보관 기간이 지난 토큰 410 (전체 동기화 필요)
+    """
+    safe_until = await db.scalar(_SAFE_UNTIL)
+    last = decode_cursor(since) if since else None
+    if last and last[0] < safe_until - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync token expired; sync again without since"
+        )
+
+    # 종류마다 keyset 인덱스로 limit + 1개씩 읽은 뒤 합쳐서 다시 정렬
+    sources = [
+        select(literal("ticket").label("kind"), Ticket.id, Ticket.updated_at.label("changed_at"))
+        .where(Ticket.project_id == project_id, _changed_between((Ticket.updated_at, Ticket.id), last, safe_until))
+        .order_by(Ticket.updated_at, Ticket.id),
+        select(literal("task").label("kind"), Task.id, Task.updated_at.label("changed_at"))
+        .join(Ticket, Ticket.id == Task.ticket_id)
+        .where(Ticket.project_id == project_id, _changed_between((Task.updated_at, Task.id), last, safe_until))
+        .order_by(Task.updated_at, Task.id),
+        select(literal("deleted").label("kind"), SyncTombstone.id, SyncTombstone.deleted_at.label("changed_at"))
+        .where(
+            SyncTombstone.project_id == project_id,
+            _changed_between((SyncTombstone.deleted_at, SyncTombstone.id), last, safe_until),
+        )
+        .order_by(SyncTombstone.deleted_at, SyncTombstone.id),
+    ]
+    changes = union_all(*[source.limit(limit + 1) for source in sources]).subquery()
+    rows = (await db.execute(
+        select(changes).order_by(changes.c.changed_at, changes.c.id).limit(limit + 1)
+    )).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    ids = {kind: [row.id for row in rows if row.kind == kind] for kind in ("ticket", "task", "deleted")}
+    tickets = await _load(db, Ticket, ids["ticket"])
+    tasks = await _load(db, Task, ids["task"])
+    deleted = await _load(db, SyncTombstone, ids["deleted"])
+
+    # 다음 토큰: 마지막으로 반환한 변경 (변경이 없으면 이전 토큰, 처음이면 safe_until 직전)
+    next_key = (rows[-1].changed_at, rows[-1].id) if rows else last or (safe_until, _MIN_ID)
+
+    return {
+        # 조회 사이에 삭제된 행은 빠짐 (삭제 기록이 다음 동기화에서 전달됨)
+        "tickets": [tickets[ticket_id] for ticket_id in ids["ticket"] if ticket_id in tickets],
+        "tasks": [tasks[task_id] for task_id in ids["task"] if task_id in tasks],
+        "deleted": [
+            {"type": deleted[tombstone_id].target_type.value.lower(), "id": tombstone_id,
+             "deleted_at": deleted[tombstone_id].deleted_at}
+            for tombstone_id in ids["deleted"]
+        ],
+        "next_token": encode_cursor(*next_key),
+        "has_more": has_more,
+    }
+
+
+async def purge_tombstones(db: AsyncSession, retention_days: Optional[int] = None) -> int:
+    """보관 기간이 지난 삭제 기록 삭제 (해당 시점 이전 토큰은 이미 410으로 거부됨)"""
+    retention_days = retention_days if retention_days is not None else settings.SYNC_TOMBSTONE_RETENTION_DAYS
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    result = await db.execute(
+        SyncTombstone.__table__.delete().where(SyncTombstone.deleted_at < cutoff)
+    )
+    await db.commit()
+    return result.rowcount
@@ -0,0 +1,170 @@
+"""
+Project 전체 내보내기 (백업 / 분석용 스트리밍)
+
+목록 API(limit 최대 100)로 페이지를 넘기지 않도록 멤버, Ticket, Task, 댓글을 서버 측 커서
+(yield_per)로 EXPORT_BATCH_SIZE행씩 읽어 바로 응답 본문으로 내보냅니다.
+한 번에 한 batch만 메모리에 두므로 Project 크기와 관계없이 메모리 사용량이 일정합니다.
+
+- 레코드 형식은 ticket_import와 같음 (NDJSON 한 줄 / CSV 한 행이 레코드 하나, type으로 구분)
+  - 순서: member -> ticket -> task -> comment (부모가 먼저, 같은 종류는 created_at 순)
+  - member를 제외한 레코드는 그대로 POST /api/projects/{id}/import로 다시 가져올 수 있음
+- CSV는 네 테이블 컬럼의 합집합을 헤더로 사용하고 해당 없는 칸은 비워둠
+- 값 직렬화(row_to_json, to_json)는 PostgreSQL에서 하고 Python은 문자열을 이어 붙이기만 함
+- 전체를 REPEATABLE READ 트랜잭션 하나에서 읽어 Ticket/Task/댓글이 같은 시점 기준으로 일치
+"""
+import csv
+import io
+import zlib
+from typing import AsyncIterable, AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy import DateTime, Text, cast, func, literal, literal_column, null, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.logging_config import get_logger
+from app.models.comment import Comment
+from app.models.enums import TargetType
+from app.models.project_member import ProjectMember
+from app.models.task import Task
+from app.models.ticket import Ticket
+
+logger = get_logger(__name__)
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+# CSV 헤더: type, id + 내보내는 테이블 컬럼의 합집합 (처음 나온 순서)
+CSV_COLUMNS = ("type", *dict.fromkeys(
+    ["id"] + [column.name for model in (ProjectMember, Ticket, Task, Comment) for column in model.__table__.columns]
+))
+
+# gzip 압축 수준 (1~9, 높을수록 느리고 작음)
+GZIP_LEVEL = 6
+
+
+def _export_sources(project_id: UUID) -> list:
+    """
+    레코드 type별 행 (type, id, 나머지 컬럼 순)
+
+    댓글은 대상 종류별로 JOIN한 뒤 합침 (target_id IN (서브쿼리) OR ... 형태는 Task 쪽 서브쿼리를
+    댓글 행마다 다시 실행하는 계획이 나옴)
+    """
+    members = select(ProjectMember.__table__).where(ProjectMember.project_id == project_id)
+    tickets = select(Ticket.__table__).where(Ticket.project_id == project_id)
+    tasks = (
+        select(Task.__table__)
+        .join(Ticket, Ticket.id == Task.ticket_id)
+        .where(Ticket.project_id == project_id)
+    )
+    comments = union_all(
+        select(Comment.__table__)
+        .join(Ticket, Ticket.id == Comment.target_id)
+        .where(Comment.target_type == TargetType.TICKET, Ticket.project_id == project_id),
+        select(Comment.__table__)
+        .join(Task, Task.id == Comment.target_id)
+        .join(Ticket, Ticket.id == Task.ticket_id)
+        .where(Comment.target_type == TargetType.TASK, Ticket.project_id == project_id),
+    )
+    sources = []
+    for kind, rows in (("member", members), ("ticket", tickets), ("task", tasks), ("comment", comments)):
+        rows = rows.subquery()
+        columns = [column for column in rows.c if column.name != "id"]
+        sources.append((kind, select(literal(kind).label("type"), rows.c.id, *columns).subquery(f"{kind}_export")))
+    return sources
+
+
+def _as_text(column):
+    """NDJSON과 같은 표기의 텍스트로 변환 (시각만 to_json으로 ISO 8601, 나머지는 ::text)"""
+    if isinstance(column.type, DateTime):
+        return func.to_json(column).op("#>>", return_type=Text)(literal_column("'{}'"))
+    return cast(column, Text)
+
+
+class _NdjsonEncoder:
+    """행을 PostgreSQL에서 JSON 문자열로 만들어 읽음 (Python json.dumps보다 수 배 빠름)"""
+
+    def header(self) -> str:
+        return ""
+
+    def query(self, source):
+        return select(cast(func.row_to_json(source.table_valued()), Text))
+
+    def encode(self, rows: list) -> str:
+        return "".join(row[0] + "\n" for row in rows)
+
+
+class _CsvEncoder:
+    """CSV_COLUMNS 순서의 텍스트 컬럼으로 읽어 csv.writer로 바로 기록 (값 변환을 Python에서 하지 않음)"""
+
+    def __init__(self):
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+
+    def _drain(self) -> str:
+        text = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return text
+
+    def header(self) -> str:
+        self.writer.writerow(CSV_COLUMNS)
+        return self._drain()
+
+    def query(self, source):
+        return select(*[
+            _as_text(source.c[name]).label(name) if name in source.c else null().label(name)
+            for name in CSV_COLUMNS
+        ])
+
+    def encode(self, rows: list) -> str:
+        self.writer.writerows(rows)
+        return self._drain()
+
+
+async def export_project(
+    db: AsyncSession,
+    project_id: UUID,
+    export_format: str = "ndjson",
+    batch_size: Optional[int] = None,
+) -> AsyncIterator[bytes]:
+    """
+    Project 하위 레코드를 batch 단위 UTF-8 청크로 생성
+
+    db는 트랜잭션이 시작되지 않은 세션이어야 합니다 (REPEATABLE READ로 새로 시작).
+
+    Args:
+        export_format: ndjson 또는 csv
+        batch_size: 서버 측 커서에서 한 번에 가져올 행 수 (기본값: EXPORT_BATCH_SIZE)
+    """
+    batch_size = batch_size or settings.EXPORT_BATCH_SIZE
+    encoder = _NdjsonEncoder() if export_format == "ndjson" else _CsvEncoder()
+    counts = {}
+
+    # ORM 결과 처리를 거치지 않도록 Core 커넥션에서 직접 스트리밍
+    connection = await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    try:
+        header = encoder.header()
+        if header:
+            yield header.encode()
+        for kind, source in _export_sources(project_id):
+            counts[kind] = 0
+            query = encoder.query(source).order_by(source.c.created_at, source.c.id)
+            result = await connection.stream(query.execution_options(yield_per=batch_size))
+            async for rows in result.partitions():
+                counts[kind] += len(rows)
+                yield encoder.encode(rows).encode()
+    finally:
+        await db.rollback()
+    logger.info(f"Exported project {project_id} ({export_format}): {counts}")
+
+
+async def gzip_stream(chunks: AsyncIterable[bytes], level: int = GZIP_LEVEL) -> AsyncIterator[bytes]:
+    """청크 스트림을 gzip 형식으로 압축 (전체를 메모리에 모으지 않음)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
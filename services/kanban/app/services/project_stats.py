@@ -0,0 +1,165 @@
+"""
+프로젝트 대시보드 Ticket 집계
+
+대시보드가 상태/우선순위/티켓 타입/담당자별 Ticket 수와 기한 초과 수를 얻기 위해
+조건별 COUNT(*)를 여러 번 실행하지 않도록 project_ticket_stats 요약 테이블을 유지합니다.
+
+- 갱신: Ticket 생성/수정/삭제 시 같은 트랜잭션에서 (dimension, key)별 증감량을
+  INSERT ... ON CONFLICT DO UPDATE SET count = count + n 한 문장으로 반영
+  (키 순서로 정렬해 동시 트랜잭션 간 교착 상태 방지)
+- 기한 초과: 날짜가 지나면 값이 바뀌므로 개수 대신 미완료 Ticket의 due_date별 개수를
+  보관하고, 조회 시 오늘 이전 날짜의 개수를 합산
+- 조회: 프로젝트당 요약 행(상태 수 + 우선순위 수 + 타입 수 + 담당자 수 + 마감일 수)만
+  읽으므로 Ticket 수와 무관
+- 보정: rebuild_project_stats가 tickets에서 다시 집계 (scripts/rebuild_project_stats.py)
+"""
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import String, cast, delete, func, insert, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.enums import Priority, TicketStatus
+from app.models.project_ticket_stat import ProjectTicketStat
+from app.models.ticket import Ticket
+
+# 담당자 / 티켓 타입이 없는 Ticket의 key
+NONE_KEY = "none"
+
+# 기한 초과 계산에서 제외하는 (완료된) 상태
+CLOSED_STATUSES = (TicketStatus.DONE, TicketStatus.CLOSED)
+
+StatKey = tuple[UUID, str, str]
+
+# ticket_stat_keys가 읽는 Ticket 컬럼 (수정 전 값을 RETURNING으로 받을 때 사용)
+TICKET_STAT_COLUMNS = ("project_id", "status", "priority", "ticket_type_id", "assignee_id", "due_date")
+
+
+def ticket_stat_keys(ticket: Ticket) -> list[StatKey]:
+    """Ticket이 집계에 기여하는 (project_id, dimension, key) 목록 (TICKET_STAT_COLUMNS 속성만 읽음)"""
+    ticket_status = TicketStatus(ticket.status)
+    keys = [
+        (ticket.project_id, "status", ticket_status.value),
+        (ticket.project_id, "priority", Priority(ticket.priority).value),
+        (ticket.project_id, "ticket_type", str(ticket.ticket_type_id) if ticket.ticket_type_id else NONE_KEY),
+        (ticket.project_id, "assignee", str(ticket.assignee_id) if ticket.assignee_id else NONE_KEY),
+    ]
+    if ticket.due_date is not None and ticket_status not in CLOSED_STATUSES:
+        keys.append((ticket.project_id, "open_due", ticket.due_date.isoformat()))
+    return keys
+
+
+async def apply_stat_deltas(db: AsyncSession, deltas: Counter) -> None:
+    """(project_id, dimension, key)별 증감량 반영 (커밋은 호출자가 Ticket 변경과 함께 수행)"""
+    rows = [
+        {"project_id": project_id, "dimension": dimension, "key": key, "count": delta}
+        for (project_id, dimension, key), delta in sorted(deltas.items(), key=lambda item: tuple(map(str, item[0])))
+        if delta
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(ProjectTicketStat).values(rows)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[ProjectTicketStat.project_id, ProjectTicketStat.dimension, ProjectTicketStat.key],
+        set_={"count": ProjectTicketStat.count + stmt.excluded.count},
+    ))
+
+
+async def tickets_added(db: AsyncSession, tickets: Iterable[Ticket]) -> None:
+    deltas = Counter()
+    for ticket in tickets:
+        deltas.update(ticket_stat_keys(ticket))
+    await apply_stat_deltas(db, deltas)
+
+
+async def tickets_removed(db: AsyncSession, tickets: Iterable[Ticket]) -> None:
+    deltas = Counter()
+    for ticket in tickets:
+        deltas.subtract(ticket_stat_keys(ticket))
+    await apply_stat_deltas(db, deltas)
+
+
+async def ticket_changed(db: AsyncSession, ticket: Ticket, old_keys: list[StatKey]) -> None:
+    """Ticket 수정 반영 (old_keys: 수정 전 ticket_stat_keys 결과)"""
+    deltas = Counter(ticket_stat_keys(ticket))
+    deltas.subtract(old_keys)
+    await apply_stat_deltas(db, deltas)
+
+
+def _stat_selects(project_id: UUID):
+    """tickets에서 dimension별 집계를 만드는 SELECT 목록 (rebuild용)"""
+    live = (Ticket.project_id == project_id, Ticket.is_deleted == False)
+    dimensions = [
+        ("status", cast(Ticket.status, String), ()),
+        ("priority", cast(Ticket.priority, String), ()),
+        ("ticket_type", func.coalesce(cast(Ticket.ticket_type_id, String), NONE_KEY), ()),
+        ("assignee", func.coalesce(cast(Ticket.assignee_id, String), NONE_KEY), ()),
+        ("open_due", cast(Ticket.due_date, String), (
+            Ticket.due_date.is_not(None),
+            Ticket.status.not_in(CLOSED_STATUSES),
+        )),
+    ]
+    return [
+        select(Ticket.project_id, literal(dimension, String), key, func.count())
+        .where(*live, *conditions)
+        .group_by(Ticket.project_id, key)
+        for dimension, key, conditions in dimensions
+    ]
+
+
+async def rebuild_project_stats(db: AsyncSession, project_id: UUID) -> None:
+    """Project의 집계를 tickets에서 다시 계산 (커밋 포함)"""
+    await db.execute(delete(ProjectTicketStat).where(ProjectTicketStat.project_id == project_id))
+    await db.execute(
+        insert(ProjectTicketStat).from_select(
+            ["project_id", "dimension", "key", "count"],
+            union_all(*_stat_selects(project_id)),
+        )
+    )
+    await db.commit()
+
+
+async def get_project_stats(db: AsyncSession, project_id: UUID, today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    대시보드 집계 조회 (요약 행만 읽음)
+
+    Returns:
+        total, by_status, by_priority, by_ticket_type, by_assignee, overdue, due_today
+    """
+    today = today or date.today()
+    rows = await db.execute(
+        select(ProjectTicketStat.dimension, ProjectTicketStat.key, ProjectTicketStat.count)
+        .where(ProjectTicketStat.project_id == project_id, ProjectTicketStat.count != 0)
+    )
+
+    stats = {
+        "status": {ticket_status.value: 0 for ticket_status in TicketStatus},
+        "priority": {priority.value: 0 for priority in Priority},
+        "ticket_type": {},
+        "assignee": {},
+    }
+    overdue = due_today = 0
+    today_key = today.isoformat()
+    for dimension, key, count in rows:
+        if dimension == "open_due":
+            if key < today_key:
+                overdue += count
+            elif key == today_key:
+                due_today += count
+        else:
+            stats[dimension][key] = count
+
+    return {
+        "project_id": project_id,
+        "total": sum(stats["status"].values()),
+        "by_status": stats["status"],
+        "by_priority": stats["priority"],
+        "by_ticket_type": stats["ticket_type"],
+        "by_assignee": stats["assignee"],
+        "overdue": overdue,
+        "due_today": due_today,
+        "as_of": today,
+    }
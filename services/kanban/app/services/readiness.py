@@ -0,0 +1,92 @@
+"""
+Readiness 상태 캐시 (GET /health/ready)
+
+DB / Redis 확인은 백그라운드 태스크가 READINESS_CHECK_INTERVAL초마다 실행하고,
+probe 요청은 마지막 확인 결과를 그대로 반환합니다. probe가 몰려도 DB 세션이나
+Redis 연결을 새로 만들지 않으며 (공유 엔진 풀 / 공유 Redis 클라이언트 사용),
+느린 의존성 때문에 probe 응답이 늦어지지 않습니다.
+
+마지막 확인이 READINESS_STALE_AFTER초보다 오래되면 (확인 태스크 중단 등) 준비되지 않은 것으로 봅니다.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import redis.asyncio as aioredis
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class ReadinessMonitor:
+    """의존성 확인 결과와 확인 시각 보관"""
+
+    def __init__(self):
+        self.checks: dict[str, str] = {}
+        self.checked_at: Optional[datetime] = None
+        self._checked_monotonic: Optional[float] = None
+
+    async def _check(self, probe) -> str:
+        try:
+            await asyncio.wait_for(probe, timeout=settings.READINESS_CHECK_TIMEOUT)
+            return "healthy"
+        except asyncio.TimeoutError:
+            return f"unhealthy: timed out after {settings.READINESS_CHECK_TIMEOUT}s"
+        except Exception as e:
+            return f"unhealthy: {str(e)}"
+
+    async def refresh(self, engine: AsyncEngine, redis: aioredis.Redis) -> dict[str, str]:
+        """DB / Redis를 동시에 확인하고 결과 저장"""
+        async def ping_database():
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+
+        database, redis_status = await asyncio.gather(
+            self._check(ping_database()),
+            self._check(redis.ping()),
+        )
+        checks = {"database": database, "redis": redis_status}
+        if checks != self.checks:
+            log = logger.info if all(value == "healthy" for value in checks.values()) else logger.warning
+            log(f"Readiness checks changed: {checks}")
+
+        self.checks = checks
+        self.checked_at = datetime.now(timezone.utc)
+        self._checked_monotonic = time.monotonic()
+        return checks
+
+    async def run(self, engine: AsyncEngine, redis: aioredis.Redis, interval: float) -> None:
+        """interval초마다 refresh 실행 (앱 startup에서 백그라운드 태스크로 시작)"""
+        while True:
+            try:
+                await self.refresh(engine, redis)
+            except Exception as e:
+                logger.error(f"Readiness check failed: {str(e)}")
+            await asyncio.sleep(interval)
+
+    def snapshot(self) -> tuple[bool, dict[str, Any]]:
+        """(준비 여부, 응답 본문) - 마지막 확인 결과와 경과 시간"""
+        if self._checked_monotonic is None:
+            age = None
+            stale = True
+        else:
+            age = time.monotonic() - self._checked_monotonic
+            stale = age > settings.READINESS_STALE_AFTER
+
+        ready = not stale and all(value == "healthy" for value in self.checks.values())
+        return ready, {
+            "status": "ready" if ready else "not_ready",
+            "service": settings.PROJECT_NAME,
+            "checks": self.checks,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "age_seconds": round(age, 3) if age is not None else None,
+            "stale": stale,
+        }
+
+
+readiness_monitor = ReadinessMonitor()
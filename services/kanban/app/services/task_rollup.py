@@ -0,0 +1,159 @@
+"""
+Ticket별 Task 진행 요약 (비정규화 카운터)
+
+티켓 카드마다 "7/10 완료"를 표시하기 위해 Task를 COUNT하지 않도록
+tickets.task_count_{todo,in_progress,review,done} 컬럼을 유지합니다.
+
+- 갱신: Task 생성/상태 변경/삭제 시 같은 트랜잭션에서 UPDATE ... SET col = col + n
+  (읽고-쓰기 없이 원자적으로 증감하므로 동시 요청에도 개수가 어긋나지 않음)
+- Ticket 삭제: 카운터가 Ticket 행에 있으므로 함께 사라짐
+- 보정: reconcile_task_rollups가 Task 테이블에서 다시 집계하여 어긋난 Ticket만 수정
+  (scripts/reconcile_task_rollups.py)
+"""
+from typing import Mapping, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.logging_config import get_logger
+from app.models.enums import TaskStatus
+from app.models.task import Task
+from app.models.ticket import Ticket
+from app.utils.sql import uuid_in
+
+logger = get_logger(__name__)
+
+# TaskStatus -> tickets 카운터 컬럼명
+TASK_COUNT_COLUMNS = {
+    TaskStatus.TODO: "task_count_todo",
+    TaskStatus.IN_PROGRESS: "task_count_in_progress",
+    TaskStatus.REVIEW: "task_count_review",
+    TaskStatus.DONE: "task_count_done",
+}
+
+
+async def adjust_task_rollup(db: AsyncSession, ticket_id: UUID, deltas: Mapping[TaskStatus, int]) -> None:
+    """
+    Ticket의 상태별 Task 개수 증감 (커밋은 호출자가 Task 변경과 함께 수행)
+
+    Args:
+        deltas: 상태별 증감량 (예: {TaskStatus.TODO: -1, TaskStatus.DONE: 1})
+    """
+    values = {
+        TASK_COUNT_COLUMNS[task_status]: getattr(Ticket, TASK_COUNT_COLUMNS[task_status]) + delta
+        for task_status, delta in deltas.items()
+        if delta
+    }
+    if not values:
+        return
+    await db.execute(
+        update(Ticket)
+        .where(Ticket.id == ticket_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def apply_task_rollups(db: AsyncSession, deltas: Mapping[UUID, Mapping[TaskStatus, int]]) -> None:
+    """
+    여러 Ticket의 카운터 증감 (일괄 Task 변경용)
+
+    증감량이 같은 Ticket끼리 묶어 UPDATE ... WHERE id = ANY(...) 한 문장으로 반영합니다.
+    (예: Ticket 200개에서 Task 1개씩 완료 처리 -> UPDATE 1번)
+
+    Args:
+        deltas: Ticket ID -> 상태별 증감량
+    """
+    groups = {}
+    for ticket_id, ticket_deltas in deltas.items():
+        key = tuple(sorted((task_status, delta) for task_status, delta in ticket_deltas.items() if delta))
+        if key:
+            groups.setdefault(key, []).append(ticket_id)
+
+    for key, ticket_ids in groups.items():
+        await db.execute(
+            update(Ticket)
+            .where(uuid_in(Ticket.id, sorted(ticket_ids)))
+            .values(**{
+                TASK_COUNT_COLUMNS[task_status]: getattr(Ticket, TASK_COUNT_COLUMNS[task_status]) + delta
+                for task_status, delta in key
+            })
+            .execution_options(synchronize_session=False)
+        )
+
+
+async def task_added(db: AsyncSession, task: Task) -> None:
+    await adjust_task_rollup(db, task.ticket_id, {task.status: 1})
+
+
+async def task_removed(db: AsyncSession, task: Task) -> None:
+    await adjust_task_rollup(db, task.ticket_id, {task.status: -1})
+
+
+async def task_status_changed(db: AsyncSession, task: Task, old_status: TaskStatus) -> None:
+    if old_status != task.status:
+        await adjust_task_rollup(db, task.ticket_id, {old_status: -1, task.status: 1})
+
+
+async def reconcile_task_rollups(
+    db: AsyncSession,
+    project_id: Optional[UUID] = None,
+    batch_size: int = 1000,
+) -> int:
+    """
+    Task 테이블에서 상태별 개수를 다시 집계하여 어긋난 Ticket의 카운터를 수정
+
+    Ticket을 id 순으로 batch_size개씩 처리하고 배치마다 커밋합니다.
+
+    Returns:
+        카운터를 수정한 Ticket 수
+    """
+    ticket_query = select(Ticket.id).order_by(Ticket.id).limit(batch_size)
+    if project_id is not None:
+        ticket_query = ticket_query.where(Ticket.project_id == project_id)
+
+    counted = aliased(Ticket)
+    corrected = 0
+    last_id = None
+    while True:
+        query = ticket_query if last_id is None else ticket_query.where(Ticket.id > last_id)
+        ticket_ids = (await db.scalars(query)).all()
+        if not ticket_ids:
+            break
+
+        counts = (
+            select(
+                counted.id.label("ticket_id"),
+                *[
+                    func.count(Task.id).filter(Task.status == task_status).label(column)
+                    for task_status, column in TASK_COUNT_COLUMNS.items()
+                ],
+            )
+            .select_from(counted)
+            .outerjoin(Task, and_(Task.ticket_id == counted.id, Task.is_deleted == False))
+            .where(uuid_in(counted.id, ticket_ids))
+            .group_by(counted.id)
+            .subquery()
+        )
+        columns = TASK_COUNT_COLUMNS.values()
+        result = await db.execute(
+            update(Ticket)
+            .where(
+                Ticket.id == counts.c.ticket_id,
+                or_(*[getattr(Ticket, column) != counts.c[column] for column in columns]),
+            )
+            .values({column: counts.c[column] for column in columns})
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        corrected += result.rowcount
+
+        last_id = ticket_ids[-1]
+        if len(ticket_ids) < batch_size:
+            break
+
+    if corrected:
+        logger.warning(f"Corrected task rollups on {corrected} tickets")
+    return corrected
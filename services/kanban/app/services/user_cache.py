@@ -0,0 +1,231 @@
+"""
+사용자 정보 캐시
+
+인증 의존성(get_verified_user_id, get_user_info)이 요청마다 User Service를
+호출하지 않도록 사용자 정보를 캐시합니다.
+
+- 1차: 프로세스 내 LRU (TTL 적용, 최대 크기 제한)
+- 2차: Redis (선택, USER_CACHE_REDIS_ENABLED) - Pod 간 공유
+- 부정 캐시: 존재하지 않는 사용자(404)는 짧은 TTL로 캐시
+  타임아웃/연결 실패 등 User Service 오류는 캐시하지 않습니다.
+- 요청 병합: 같은 사용자에 대한 동시 캐시 미스는 User Service 호출 하나를 공유
+- 무효화: Redis 채널(kanban:users:invalidate)에 사용자 ID 또는 "*"를 발행하면
+  모든 Pod의 로컬 캐시에서 제거
+"""
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import UUID
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.config import settings
+from app.logging_config import get_logger
+from app.clients.user_client import user_service_client, UserServiceError
+from app.redis_client import redis_client
+
+logger = get_logger(__name__)
+
+USER_CACHE_KEY_PREFIX = "kanban:users:info:"
+USER_INVALIDATION_CHANNEL = "kanban:users:invalidate"
+
+# 부정 캐시(사용자 없음)를 Redis에 저장할 때의 값
+NOT_FOUND = "null"
+
+UserLoader = Callable[[UUID, str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def user_cache_key(user_id: UUID) -> str:
+    return f"{USER_CACHE_KEY_PREFIX}{user_id}"
+
+
+class UserInfoCache:
+    """
+    TTL + LRU 사용자 정보 캐시
+    """
+
+    def __init__(
+        self,
+        loader: UserLoader,
+        max_size: int = 10000,
+        ttl: float = 60,
+        negative_ttl: float = 10,
+        redis: Optional[aioredis.Redis] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            loader: 캐시 미스 시 호출 (사용자 정보, 없으면 None, 오류 시 UserServiceError)
+            max_size: 로컬 캐시 최대 항목 수
+            ttl: 사용자 정보 TTL (초)
+            negative_ttl: 존재하지 않는 사용자 TTL (초)
+            redis: 2차 캐시로 사용할 Redis (None이면 로컬 캐시만 사용)
+            clock: 만료 계산용 시계 (테스트에서 교체)
+        """
+        self.loader = loader
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.redis = redis
+        self.clock = clock
+        self._entries: OrderedDict[UUID, tuple[float, Optional[Dict[str, Any]]]] = OrderedDict()
+        self._inflight: dict[UUID, asyncio.Task] = {}
+        # 무효화 시 증가 - 무효화 이전에 시작된 조회 결과를 저장하지 않기 위함
+        self._generation = 0
+        self.metrics = {
+            "hits": 0,
+            "negative_hits": 0,
+            "redis_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "errors": 0,
+        }
+
+    def stats(self) -> Dict[str, int]:
+        """히트/미스 등 캐시 지표"""
+        return {**self.metrics, "size": len(self._entries)}
+
+    async def get_user(self, user_id: UUID, token: str) -> Optional[Dict[str, Any]]:
+        """
+        사용자 정보 조회 (캐시 우선)
+
+        Returns:
+            사용자 정보 딕셔너리 또는 None (사용자가 없거나 User Service 오류)
+        """
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at > self.clock():
+                self._entries.move_to_end(user_id)
+                self.metrics["hits" if user is not None else "negative_hits"] += 1
+                return user
+            del self._entries[user_id]
+
+        task = self._inflight.get(user_id)
+        if task is not None:
+            self.metrics["coalesced"] += 1
+        else:
+            self.metrics["misses"] += 1
+            task = asyncio.ensure_future(self._load(user_id, token, self._generation))
+            self._inflight[user_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(user_id, None))
+
+        try:
+            # 먼저 요청한 쪽이 취소되어도 나머지 대기자를 위해 조회는 계속 진행
+            return await asyncio.shield(task)
+        except UserServiceError as e:
+            logger.error(f"User Service lookup failed for user {user_id}: {str(e)}")
+            return None
+
+    async def _load(self, user_id: UUID, token: str, generation: int) -> Optional[Dict[str, Any]]:
+        found, user = await self._get_from_redis(user_id)
+        if found:
+            self.metrics["redis_hits"] += 1
+        else:
+            try:
+                user = await self.loader(user_id, token)
+            except UserServiceError:
+                self.metrics["errors"] += 1
+                raise
+            await self._set_in_redis(user_id, user)
+
+        if generation == self._generation:
+            self._store(user_id, user)
+        return user
+
+    def _store(self, user_id: UUID, user: Optional[Dict[str, Any]]) -> None:
+        ttl = self.ttl if user is not None else self.negative_ttl
+        self._entries[user_id] = (self.clock() + ttl, user)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.metrics["evictions"] += 1
+
+    async def _get_from_redis(self, user_id: UUID) -> tuple[bool, Optional[Dict[str, Any]]]:
+        if self.redis is None:
+            return False, None
+        try:
+            cached = await self.redis.get(user_cache_key(user_id))
+        except RedisError as e:
+            logger.warning(f"Failed to read cached user {user_id}: {str(e)}")
+            return False, None
+        if cached is None:
+            return False, None
+        return True, json.loads(cached)
+
+    async def _set_in_redis(self, user_id: UUID, user: Optional[Dict[str, Any]]) -> None:
+        if self.redis is None:
+            return
+        ttl = self.ttl if user is not None else self.negative_ttl
+        try:
+            await self.redis.set(
+                user_cache_key(user_id),
+                json.dumps(user) if user is not None else NOT_FOUND,
+                ex=max(int(ttl), 1),
+            )
+        except RedisError as e:
+            logger.warning(f"Failed to cache user {user_id}: {str(e)}")
+
+    def invalidate(self, user_id: Optional[UUID] = None) -> None:
+        """로컬 캐시에서 사용자 제거 (user_id가 None이면 전체)"""
+        self._generation += 1
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+    def handle_invalidation(self, message: str) -> None:
+        """무효화 메시지 처리 ("*" 또는 사용자 ID)"""
+        if message == "*":
+            self.invalidate()
+            return
+        try:
+            self.invalidate(UUID(message))
+        except ValueError:
+            logger.warning(f"Ignoring malformed user invalidation message: {message}")
+
+    async def listen(self, redis: aioredis.Redis, retry_interval: float = 1.0) -> None:
+        """무효화 채널 구독 (앱 startup에서 백그라운드 태스크로 시작)"""
+        while True:
+            pubsub = redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(USER_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self.handle_invalidation(message["data"])
+            except RedisError as e:
+                logger.error(f"User invalidation subscription lost: {str(e)}")
+                await asyncio.sleep(retry_interval)
+            finally:
+                await pubsub.aclose()
+
+
+async def publish_user_invalidation(redis: aioredis.Redis, user_id: Optional[UUID] = None) -> None:
+    """
+    모든 Pod의 사용자 캐시 무효화 (user_id가 None이면 전체)
+
+    Redis 2차 캐시 항목도 함께 삭제합니다.
+    """
+    try:
+        if user_id is not None:
+            await redis.delete(user_cache_key(user_id))
+        else:
+            async for key in redis.scan_iter(match=f"{USER_CACHE_KEY_PREFIX}*", count=500):
+                await redis.delete(key)
+        await redis.publish(USER_INVALIDATION_CHANNEL, str(user_id) if user_id else "*")
+    except RedisError as e:
+        logger.warning(f"Failed to publish user invalidation for {user_id or '*'}: {str(e)}")
+
+
+# 싱글톤 인스턴스
+user_info_cache = UserInfoCache(
+    loader=user_service_client.fetch_user,
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL,
+    negative_ttl=settings.USER_CACHE_NEGATIVE_TTL,
+    redis=redis_client if settings.USER_CACHE_REDIS_ENABLED else None,
+)
@@ -0,0 +1,49 @@
+"""
+ETag / 조건부 요청 헬퍼
+
+Ticket, Task, Project의 ETag는 행의 version 컬럼("<version>")이며 행이 수정될 때마다 바뀝니다.
+
+- GET + If-None-Match: ETag가 같으면 본문 없이 304 Not Modified (폴링 클라이언트의 전송량 절감)
+- PATCH + If-Match: 클라이언트가 읽은 version일 때만 수정, 그 사이 다른 수정이 있었으면 412
+  (UPDATE 문의 조건으로 확인하므로 확인과 수정 사이에 끼어드는 수정이 없음)
+"""
+from typing import Any, Callable, Optional
+
+from fastapi import Response, status
+from sqlalchemy.sql import ColumnElement
+
+
+def make_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def _entity_tags(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def etag_matches(if_none_match: Optional[str], version: int) -> bool:
+    """If-None-Match 일치 여부 (약한 비교: W/ 접두사 무시, *는 항상 일치)"""
+    if not if_none_match:
+        return False
+    etag = make_etag(version)
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in _entity_tags(if_none_match))
+
+
+def if_match_condition(if_match: Optional[str]) -> Optional[Callable[[Any], ColumnElement]]:
+    """
+    If-Match 헤더를 update_if 조건으로 변환 (강한 비교: 약한 ETag는 일치하지 않음)
+
+    Returns:
+        헤더가 없거나 *이면 None (대상이 있으면 항상 수정), 아니면 수정 전 version이 목록에 있어야 하는 조건
+    """
+    if not if_match:
+        return None
+    tags = _entity_tags(if_match)
+    if "*" in tags:
+        return None
+    versions = [int(tag[1:-1]) for tag in tags if tag[1:-1].isdigit() and tag[0] == tag[-1] == '"']
+    return lambda before: before.version.in_(versions)
+
+
+def not_modified(version: int) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": make_etag(version)})
@@ -0,0 +1,130 @@
+"""
+페이지네이션 유틸리티
+
+목록 API는 (created_at DESC, id DESC) 순으로 정렬하며 두 가지 모드를 지원합니다.
+
+- offset 모드: 기존 LIMIT/OFFSET (하위 호환용)
+- cursor 모드: 마지막 항목의 (created_at, id)를 인코딩한 불투명 커서 기반 keyset 페이지네이션
+  깊은 페이지에서도 인덱스 범위 스캔으로 일정한 속도를 유지하고,
+  동시 삽입 시에도 중복/누락이 발생하지 않습니다.
+
+전체 개수(total)는 정확한 COUNT(*), 플래너 추정치, 생략 중에서 선택할 수 있습니다.
+"""
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    """(created_at, id)를 URL-safe 불투명 커서 문자열로 인코딩"""
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    커서 문자열을 (created_at, id)로 디코딩
+
+    Raises:
+        HTTPException: 커서 형식이 올바르지 않을 경우 400 에러
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    model: Any,
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> tuple[Sequence[Any], Optional[str]]:
+    """
+    목록 쿼리에 정렬과 페이지네이션을 적용하여 실행
+
+    cursor가 주어지면 keyset 모드로 동작하며 offset은 무시됩니다.
+    다음 페이지 존재 여부를 알기 위해 limit + 1개를 조회합니다.
+
+    Args:
+        db: 비동기 DB 세션
+        query: 필터가 적용된 select(model) 쿼리
+        model: created_at, id 컬럼을 가진 모델 클래스
+        limit: 페이지 크기
+        offset: offset 모드에서 건너뛸 항목 수
+        cursor: 이전 응답의 next_cursor
+
+    Returns:
+        (페이지 항목 리스트, 다음 페이지 커서 또는 None)
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.created_at, model.id) < (created_at, last_id))
+    elif offset:
+        query = query.offset(offset)
+
+    items = (await db.scalars(query.limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+
+    return items, next_cursor
+
+
+async def estimate_count(db: AsyncSession, query: Select) -> int:
+    """
+    EXPLAIN의 플래너 추정 행 수(Plan Rows)를 반환
+
+    테이블 통계(pg_class.reltuples, pg_statistic)만 사용하므로 행을 읽지 않습니다.
+    필터 값은 UUID/Enum 등 타입이 보장된 값이므로 리터럴로 렌더링합니다.
+    """
+    compiled = query.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+    plan = await db.scalar(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_total(
+    db: AsyncSession,
+    query: Select,
+    include_total: bool = True,
+    estimate: bool = False,
+) -> tuple[Optional[int], bool]:
+    """
+    목록 쿼리의 전체 개수 계산
+
+    - include_total=False: 개수를 계산하지 않음 (보드 뷰 등 total이 필요 없는 경우)
+    - estimate=True: 플래너 추정치 사용. 추정치가 COUNT_ESTIMATE_THRESHOLD 미만이면
+      정확한 COUNT(*)도 충분히 싸므로 정확한 값으로 대체합니다.
+
+    Returns:
+        (전체 개수 또는 None, 정확한 값인지 여부)
+    """
+    if not include_total:
+        return None, False
+
+    if estimate:
+        estimated = await estimate_count(db, query)
+        if estimated >= settings.COUNT_ESTIMATE_THRESHOLD:
+            return estimated, False
+
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
+    return total, True
@@ -0,0 +1,83 @@
+"""
+SQL 조건 헬퍼
+"""
+from typing import Any, Callable, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import ARRAY, any_, bindparam, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import ColumnElement
+
+
+def uuid_in(column, ids: Sequence[UUID]) -> ColumnElement:
+    """
+    column = ANY(:ids) - 이미 조회한 ID 목록으로 필터링
+
+    IN (...) 목록과 달리 배열 파라미터 하나로 전달하므로 asyncpg 파라미터 수 제한(32767)이 없고,
+    IN (서브쿼리)가 큰 테이블 전체 해시 조인(순차 스캔)으로 계획되는 경우에도 인덱스를 사용합니다.
+    """
+    return column == any_(bindparam(None, list(ids), type_=ARRAY(PG_UUID(as_uuid=True))))
+
+
+async def update_returning(db: AsyncSession, model, where: Sequence[ColumnElement], values: dict) -> Optional[Any]:
+    """
+    UPDATE ... WHERE ... RETURNING 한 문장으로 수정하고 수정된 행을 ORM 객체로 반환 (대상이 없으면 None)
+
+    조회(SELECT) 후 속성 변경 + flush 대신 사용하며, 세션에 이미 있는 객체도 RETURNING 값으로 갱신합니다.
+    """
+    statement = update(model).where(*where).values(**values).returning(model)
+    return await db.scalar(
+        select(model).from_statement(statement).execution_options(populate_existing=True)
+    )
+
+
+async def update_if(
+    db: AsyncSession,
+    model,
+    where: Sequence[ColumnElement],
+    condition: Optional[Callable[[Any], ColumnElement]],
+    values: dict,
+    previous: Sequence[str] = (),
+) -> Optional[tuple[Optional[Any], dict]]:
+    """
+    조건부 UPDATE 한 문장 - 대상 행을 잠그고 읽은 수정 전 값이 condition을 만족할 때만 수정
+
+    RETURNING은 수정 후 값만 돌려주고, WHERE에 조건을 넣으면 "대상 없음"과 "조건 불만족"을
+    구분할 수 없으므로 잠근 행(CTE)과 UPDATE 결과(CTE)를 외부 조인해 함께 받습니다:
+
+        WITH target AS (SELECT * FROM t WHERE ... FOR UPDATE),
+             updated AS (UPDATE t SET ... FROM target WHERE t.id = target.id AND <condition> RETURNING t.*)
+        SELECT updated.*, target.id, target.<previous> FROM target LEFT JOIN updated ON updated.id = target.id
+
+    조회 후 Python에서 확인하고 수정하는 방식과 달리 왕복 1회이며, 동시 요청이 같은 행을
+    수정하면 잠금을 기다린 뒤 최신 값으로 조건을 다시 확인합니다.
+
+    Args:
+        condition: 수정 전 행의 컬럼(target.c)을 받아 조건식을 반환 (None이면 항상 수정)
+        previous: 함께 반환할 수정 전 컬럼 이름
+
+    Returns:
+        대상이 없으면 None, 조건 불만족이면 (None, 수정 전 값), 수정했으면 (수정된 객체, 수정 전 값)
+    """
+    target = (
+        select(model.__table__)
+        .where(*where)
+        .with_for_update()
+        .cte("target")
+    )
+    statement = update(model).where(model.id == target.c.id)
+    if condition is not None:
+        statement = statement.where(condition(target.c))
+    updated = aliased(model, statement.values(**values).returning(model).cte("updated"))
+    row = (await db.execute(
+        # target.id도 함께 선택 (엔티티 하나만 선택하면 외부 조인으로 NULL인 행이 결과에서 빠짐)
+        select(updated, target.c.id, *[target.c[name] for name in previous])
+        .select_from(target)
+        .outerjoin(updated, updated.id == target.c.id)
+        .execution_options(populate_existing=True)
+    )).first()
+    if row is None:
+        return None
+    return row[0], dict(zip(previous, row[2:]))
@@ -0,0 +1,78 @@
+"""
+검증된 JWT 캐시
+
+클라이언트는 같은 액세스 토큰을 만료 전까지 반복 사용하므로, 한 번 검증한 토큰의
+user_id를 캐시하여 요청마다 서명 검증(HMAC)과 클레임 파싱을 생략합니다.
+
+- 키: 토큰의 SHA-256 다이제스트 (토큰 원문은 메모리에 보관하지 않음)
+- 만료: 토큰의 exp와 최대 TTL 중 이른 시각까지만 사용
+- 검증에 실패한 토큰은 캐시하지 않음
+- 동기 의존성은 스레드풀에서 실행되므로 Lock으로 보호
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+from uuid import UUID
+
+
+class DecodedTokenCache:
+    """
+    토큰 다이제스트 -> (user_id, 만료 시각) LRU 캐시
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl: float = 300,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            max_size: 최대 항목 수
+            ttl: 최대 캐시 시간 (초, exp가 더 이르면 exp까지)
+            clock: 현재 시각 (epoch 초, 테스트에서 교체)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict[bytes, tuple[UUID, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[UUID]:
+        """캐시된 user_id (없거나 만료되었으면 None)"""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            user_id, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return user_id
+
+    def set(self, token: str, user_id: UUID, exp: Optional[float] = None) -> None:
+        """검증된 토큰 저장 (exp: 토큰 만료 시각, epoch 초)"""
+        expires_at = self.clock() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,44 @@
+"""
+백그라운드 삭제 작업 워커
+
+API 서버와 별도 프로세스로 실행하여 Redis 큐의 Workspace/Project 삭제 작업을 처리합니다.
+
+사용법:
+    python -m app.worker
+    python -m app.worker --requeue-stalled   # 이전 워커가 비정상 종료되어 남은 작업 재등록
+"""
+import argparse
+import asyncio
+
+from app.config import settings
+from app.database import async_engine
+from app.logging_config import setup_logging, get_logger
+from app.redis_client import redis_client
+from app.services.deletion_jobs import requeue_stalled_jobs, run_worker
+
+setup_logging()
+logger = get_logger(__name__)
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        if args.requeue_stalled:
+            await requeue_stalled_jobs(redis_client)
+        await run_worker(redis_client, poll_timeout=settings.DELETION_WORKER_POLL_TIMEOUT)
+    finally:
+        await async_engine.dispose()
+        await redis_client.aclose()
+        logger.info("Deletion worker stopped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Workspace/Project 백그라운드 삭제 워커")
+    parser.add_argument(
+        "--requeue-stalled",
+        action="store_true",
+        help="처리 중 목록에 남은 작업을 대기 큐로 되돌린 뒤 시작 (다른 워커가 없을 때만 사용)",
+    )
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
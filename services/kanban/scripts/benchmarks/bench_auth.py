@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+인증 의존성(get_current_user_id) 마이크로 벤치마크
+
+같은 토큰으로 의존성을 반복 호출하여 요청당 소요 시간을 측정합니다.
+검증 토큰 캐시를 매번 비운 경우(기존 동작: 매 요청 서명 검증)와
+캐시를 사용하는 경우를 비교합니다.
+
+사용법:
+    python scripts/benchmarks/bench_auth.py
+    python scripts/benchmarks/bench_auth.py --iterations 200000
+"""
+import sys
+import os
+import time
+import argparse
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.auth import get_current_user_id, decoded_token_cache
+from scripts.generate_test_token import generate_token
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID
+
+
+def measure(credentials: HTTPAuthorizationCredentials, iterations: int, use_cache: bool) -> float:
+    """호출당 평균 소요 시간 (us)"""
+    decoded_token_cache.clear()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        if not use_cache:
+            decoded_token_cache.clear()
+        user_id = get_current_user_id(credentials)
+    elapsed = time.perf_counter() - start
+    assert user_id == BENCH_USER_ID
+    return elapsed / iterations * 1_000_000
+
+
+def main(args: argparse.Namespace) -> None:
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=generate_token(BENCH_USER_ID))
+
+    # 워밍업
+    measure(credentials, 1000, use_cache=False)
+
+    uncached = measure(credentials, args.iterations, use_cache=False)
+    cached = measure(credentials, args.iterations, use_cache=True)
+
+    print("=" * 80)
+    print(f"반복 횟수: {args.iterations}")
+    print(f"{'방식':<24}{'us/요청':>12}")
+    print(f"{'jwt.decode 매번':<24}{uncached:>12.2f}")
+    print(f"{'검증 토큰 캐시':<24}{cached:>12.2f}")
+    print(f"{'속도 향상':<24}{uncached / cached:>11.1f}x")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="인증 의존성 마이크로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=50_000, help="반복 횟수 (기본값: 50000)")
+    main(parser.parse_args())
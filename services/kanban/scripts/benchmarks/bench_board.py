@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+칸반 보드 조회 벤치마크
+
+Ticket 2,000개 x Task 10개 프로젝트의 보드를 렌더링하는 데 필요한 요청 수, SQL 쿼리 수,
+지연 시간을 두 가지 방식으로 비교합니다. 앱을 같은 프로세스에서 ASGI로 호출하므로
+서버를 따로 띄울 필요가 없습니다 (DATABASE_URL의 DB 사용).
+
+- 클라이언트 측 조립: Project 조회 + 티켓 타입 목록 + Ticket 목록(cursor 페이지) + Ticket마다 Task 목록
+- GET /api/projects/{id}/board 한 번
+
+사용법:
+    python scripts/benchmarks/bench_board.py
+    python scripts/benchmarks/bench_board.py --tickets 2000 --tasks-per-ticket 10 --concurrency 6
+"""
+import sys
+import os
+import time
+import asyncio
+import logging
+import argparse
+import statistics
+from uuid import UUID
+
+import httpx
+from sqlalchemy import event, text
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.main import app
+from app.auth import get_current_user_id
+from app.database import SessionLocal, async_engine
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID
+
+
+def seed(tickets: int, tasks_per_ticket: int) -> UUID:
+    """보드 벤치마크용 Project 생성 (티켓 타입 5개, 상태/타입을 고르게 분배)"""
+    params = {"user_id": BENCH_USER_ID, "tickets": tickets, "tasks_per_ticket": tasks_per_ticket}
+    with SessionLocal() as db:
+        workspace_id = db.execute(
+            text("INSERT INTO workspaces (name, created_by) VALUES ('board bench ' || now(), :user_id) RETURNING id"),
+            params,
+        ).scalar_one()
+        params["project_id"] = db.execute(
+            text(
+                """
+                INSERT INTO projects (name, workspace_id, status, priority, is_deleted, created_by)
+                VALUES ('board bench', :workspace_id, 'ACTIVE', 'MEDIUM', false, :user_id) RETURNING id
+                """
+            ),
+            {**params, "workspace_id": workspace_id},
+        ).scalar_one()
+        statements = [
+            """
+            INSERT INTO ticket_types (project_id, type_name, display_order, is_deleted, created_by)
+            SELECT :project_id, 'type ' || g, g, false, :user_id FROM generate_series(1, 5) AS g
+            """,
+            """
+            INSERT INTO tickets (title, project_id, status, priority, ticket_type_id, is_deleted, created_by, created_at)
+            SELECT 'ticket ' || g, :project_id,
+                   (enum_range(NULL::ticketstatus))[1 + g % 7], 'MEDIUM',
+                   (SELECT id FROM ticket_types WHERE project_id = :project_id AND display_order = 1 + g % 5),
+                   false, :user_id, now() - g * interval '1 second'
+            FROM generate_series(1, :tickets) AS g
+            """,
+            """
+            INSERT INTO tasks (title, ticket_id, status, is_deleted, created_by)
+            SELECT 'task ' || g, t.id, (enum_range(NULL::taskstatus))[1 + g % 4], false, :user_id
+            FROM tickets t, generate_series(1, :tasks_per_ticket) AS g
+            WHERE t.project_id = :project_id
+            """,
+        ]
+        for statement in statements:
+            db.execute(text(statement), params)
+        db.commit()
+        for table in ("tickets", "tasks", "ticket_types"):
+            db.execute(text(f"ANALYZE {table}"))
+        db.commit()
+    return params["project_id"]
+
+
+class Counter:
+    """HTTP 요청 수 / SQL 쿼리 수"""
+
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+
+    def on_query(self, *args) -> None:
+        self.queries += 1
+
+
+async def client_side_assembly(client: httpx.AsyncClient, project_id: UUID, counter: Counter, concurrency: int) -> int:
+    """기존 프론트엔드 방식: 목록 API를 조합하고 Ticket마다 Task 목록 조회"""
+    async def get(path: str, **params) -> dict:
+        counter.requests += 1
+        response = await client.get(path, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    await get(f"/api/projects/{project_id}")
+    await get(f"/api/projects/{project_id}/ticket-types/", limit=100)
+
+    tickets, cursor = [], None
+    while True:
+        params = {"project_id": str(project_id), "limit": 100, "include_total": "false"}
+        if cursor:
+            params["cursor"] = cursor
+        page = await get("/api/tickets/", **params)
+        tickets.extend(page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    # 브라우저의 호스트당 동시 연결 수 제한을 흉내냄
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def tasks_of(ticket_id: str) -> None:
+        async with semaphore:
+            await get("/api/tasks/", ticket_id=ticket_id, limit=100, include_total="false")
+
+    await asyncio.gather(*(tasks_of(ticket["id"]) for ticket in tickets))
+    return len(tickets)
+
+
+async def board_endpoint(client: httpx.AsyncClient, project_id: UUID, counter: Counter, concurrency: int) -> int:
+    counter.requests += 1
+    response = await client.get(f"/api/projects/{project_id}/board")
+    response.raise_for_status()
+    return sum(column["count"] for column in response.json()["columns"])
+
+
+async def measure(fn, client: httpx.AsyncClient, project_id: UUID, args: argparse.Namespace) -> dict:
+    """rounds회 실행한 지연 시간(p50/max)과 1회당 요청/쿼리 수"""
+    timings = []
+    for _ in range(args.rounds):
+        counter = Counter()
+        event.listen(async_engine.sync_engine, "before_cursor_execute", counter.on_query)
+        start = time.perf_counter()
+        tickets = await fn(client, project_id, counter, args.concurrency)
+        timings.append((time.perf_counter() - start) * 1000)
+        event.remove(async_engine.sync_engine, "before_cursor_execute", counter.on_query)
+        assert tickets == args.tickets
+    return {
+        "requests": counter.requests,
+        "queries": counter.queries,
+        "p50": statistics.median(timings),
+        "max": max(timings),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    project_id = args.project_id
+    if project_id is None:
+        print(f"Ticket {args.tickets}개 x Task {args.tasks_per_ticket}개 생성 중...")
+        project_id = seed(args.tickets, args.tasks_per_ticket)
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    app.dependency_overrides[get_current_user_id] = lambda: BENCH_USER_ID
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 커넥션 풀 / 쿼리 캐시 워밍업
+        await board_endpoint(client, project_id, Counter(), args.concurrency)
+        rows = [
+            ("client-side assembly", await measure(client_side_assembly, client, project_id, args)),
+            ("GET /board", await measure(board_endpoint, client, project_id, args)),
+        ]
+    await async_engine.dispose()
+
+    print("=" * 80)
+    print(f"Project {project_id}: Ticket {args.tickets}개 x Task {args.tasks_per_ticket}개, {args.rounds}회 반복")
+    print(f"{'방식':<24}{'requests':>10}{'queries':>10}{'p50(ms)':>12}{'max(ms)':>12}")
+    for name, row in rows:
+        print(f"{name:<24}{row['requests']:>10}{row['queries']:>10}{row['p50']:>12.1f}{row['max']:>12.1f}")
+    print("* 앱을 같은 프로세스에서 호출하므로 네트워크 왕복 지연은 포함되지 않음")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="칸반 보드 조회 벤치마크")
+    parser.add_argument("--tickets", type=int, default=2000, help="Ticket 수 (기본값: 2000)")
+    parser.add_argument("--tasks-per-ticket", type=int, default=10, help="Ticket당 Task 수 (기본값: 10)")
+    parser.add_argument("--concurrency", type=int, default=6, help="클라이언트 측 조립 시 동시 요청 수 (기본값: 6)")
+    parser.add_argument("--rounds", type=int, default=5, help="반복 횟수 (기본값: 5)")
+    parser.add_argument("--project-id", type=UUID, help="기존 벤치마크 Project 재사용 (생성 생략)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+일괄 변경 API 처리량 벤치마크
+
+Ticket N개(기본 200)를 생성 -> 컬럼 이동(status 변경) -> 담당자 변경 -> 삭제하는 작업과
+Task N개를 생성 -> 완료 처리하는 작업을 두 가지 방식으로 비교합니다.
+앱을 같은 프로세스에서 ASGI로 호출하므로 서버를 따로 띄울 필요가 없습니다 (DATABASE_URL의 DB 사용).
+
+- 단건 API: 항목마다 POST / PATCH / DELETE 요청
+- 일괄 API: 단계마다 POST /api/tickets/bulk, POST /api/tasks/bulk 한 번
+
+사용법:
+    python scripts/benchmarks/bench_bulk.py
+    python scripts/benchmarks/bench_bulk.py --items 200 --rounds 5
+"""
+import sys
+import os
+import time
+import uuid
+import asyncio
+import logging
+import argparse
+import statistics
+from uuid import UUID
+
+import httpx
+from sqlalchemy import event, text
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.main import app
+from app.auth import get_current_user_id
+from app.database import SessionLocal, async_engine
+from scripts.benchmarks.bench_board import Counter
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID
+
+STAGES = ["create tickets", "move tickets", "reassign tickets", "create tasks", "complete tasks", "delete tickets"]
+
+
+def seed() -> UUID:
+    """벤치마크용 빈 Project 생성"""
+    with SessionLocal() as db:
+        workspace_id = db.execute(
+            text("INSERT INTO workspaces (name, created_by) VALUES ('bulk bench ' || now(), :user_id) RETURNING id"),
+            {"user_id": BENCH_USER_ID},
+        ).scalar_one()
+        project_id = db.execute(
+            text(
+                """
+                INSERT INTO projects (name, workspace_id, status, priority, is_deleted, created_by)
+                VALUES ('bulk bench', :workspace_id, 'ACTIVE', 'MEDIUM', false, :user_id) RETURNING id
+                """
+            ),
+            {"workspace_id": workspace_id, "user_id": BENCH_USER_ID},
+        ).scalar_one()
+        db.commit()
+    return project_id
+
+
+async def call(client: httpx.AsyncClient, counter: Counter, method: str, path: str, body=None) -> dict:
+    counter.requests += 1
+    response = await client.request(method, path, json=body)
+    response.raise_for_status()
+    return response.json() if response.content else {}
+
+
+async def single_item(client: httpx.AsyncClient, project_id: UUID, items: int, counter: Counter, stage: str, state: dict):
+    """기존 방식: 항목마다 요청 (순차)"""
+    if stage == "create tickets":
+        state["tickets"] = [
+            (await call(client, counter, "POST", "/api/tickets/", {"title": f"T{i}", "project_id": str(project_id)}))["id"]
+            for i in range(items)
+        ]
+    elif stage == "move tickets":
+        for ticket_id in state["tickets"]:
+            await call(client, counter, "PATCH", f"/api/tickets/{ticket_id}", {"status": "IN_PROGRESS"})
+    elif stage == "reassign tickets":
+        for ticket_id in state["tickets"]:
+            await call(client, counter, "PATCH", f"/api/tickets/{ticket_id}", {"assignee_id": state["assignee"]})
+    elif stage == "create tasks":
+        state["tasks"] = [
+            (await call(client, counter, "POST", "/api/tasks/", {"title": "t", "ticket_id": ticket_id}))["id"]
+            for ticket_id in state["tickets"]
+        ]
+    elif stage == "complete tasks":
+        for task_id in state["tasks"]:
+            await call(client, counter, "PATCH", f"/api/tasks/{task_id}", {"status": "DONE"})
+    elif stage == "delete tickets":
+        for ticket_id in state["tickets"]:
+            await call(client, counter, "DELETE", f"/api/tickets/{ticket_id}")
+
+
+async def bulk(client: httpx.AsyncClient, project_id: UUID, items: int, counter: Counter, stage: str, state: dict):
+    """일괄 API: 단계마다 요청 한 번"""
+    if stage == "create tickets":
+        body = {"create": [{"title": f"T{i}", "project_id": str(project_id)} for i in range(items)]}
+        data = await call(client, counter, "POST", "/api/tickets/bulk", body)
+        state["tickets"] = [result["id"] for result in data["results"]]
+    elif stage == "move tickets":
+        body = {"update": [{"id": ticket_id, "status": "IN_PROGRESS"} for ticket_id in state["tickets"]]}
+        await call(client, counter, "POST", "/api/tickets/bulk", body)
+    elif stage == "reassign tickets":
+        body = {"update": [{"id": ticket_id, "assignee_id": state["assignee"]} for ticket_id in state["tickets"]]}
+        await call(client, counter, "POST", "/api/tickets/bulk", body)
+    elif stage == "create tasks":
+        body = {"create": [{"title": "t", "ticket_id": ticket_id} for ticket_id in state["tickets"]]}
+        data = await call(client, counter, "POST", "/api/tasks/bulk", body)
+        state["tasks"] = [result["id"] for result in data["results"]]
+    elif stage == "complete tasks":
+        body = {"update": [{"id": task_id, "status": "DONE"} for task_id in state["tasks"]]}
+        await call(client, counter, "POST", "/api/tasks/bulk", body)
+    elif stage == "delete tickets":
+        await call(client, counter, "POST", "/api/tickets/bulk", {"delete": state["tickets"]})
+
+
+async def measure(fn, client: httpx.AsyncClient, project_id: UUID, args: argparse.Namespace) -> dict:
+    """단계별 rounds회 실행한 지연 시간(p50)과 1회당 요청/쿼리 수"""
+    timings = {stage: [] for stage in STAGES}
+    counts = {}
+    for _ in range(args.rounds):
+        state = {"assignee": str(uuid.uuid4())}
+        for stage in STAGES:
+            counter = Counter()
+            event.listen(async_engine.sync_engine, "before_cursor_execute", counter.on_query)
+            start = time.perf_counter()
+            await fn(client, project_id, args.items, counter, stage, state)
+            timings[stage].append((time.perf_counter() - start) * 1000)
+            event.remove(async_engine.sync_engine, "before_cursor_execute", counter.on_query)
+            counts[stage] = (counter.requests, counter.queries)
+    return {stage: (*counts[stage], statistics.median(timings[stage])) for stage in STAGES}
+
+
+async def main(args: argparse.Namespace) -> None:
+    project_id = seed()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    app.dependency_overrides[get_current_user_id] = lambda: BENCH_USER_ID
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 커넥션 풀 / 쿼리 캐시 워밍업
+        await bulk(client, project_id, 1, Counter(), "create tickets", {})
+        single = await measure(single_item, client, project_id, args)
+        batched = await measure(bulk, client, project_id, args)
+    await async_engine.dispose()
+
+    print("=" * 96)
+    print(f"Project {project_id}: 단계당 {args.items}개 항목, {args.rounds}회 반복 (p50)")
+    print(f"{'단계':<20}{'single req/queries':>20}{'p50(ms)':>10}{'bulk req/queries':>18}{'p50(ms)':>10}"
+          f"{'items/s single':>16}{'items/s bulk':>14}")
+    for stage in STAGES:
+        s_req, s_queries, s_ms = single[stage]
+        b_req, b_queries, b_ms = batched[stage]
+        print(f"{stage:<20}{f'{s_req}/{s_queries}':>20}{s_ms:>10.1f}{f'{b_req}/{b_queries}':>18}{b_ms:>10.1f}"
+              f"{args.items / s_ms * 1000:>16.0f}{args.items / b_ms * 1000:>14.0f}")
+    print("* 앱을 같은 프로세스에서 호출하므로 네트워크 왕복 지연은 포함되지 않음 (실제 차이는 더 큼)")
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="일괄 변경 API 처리량 벤치마크")
+    parser.add_argument("--items", type=int, default=200, help="단계당 항목 수 (기본값: 200)")
+    parser.add_argument("--rounds", type=int, default=5, help="반복 횟수 (기본값: 5)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Workspace CASCADE 삭제 벤치마크
+
+대량의 하위 데이터(기본: Task 500,000개)를 가진 Workspace를 생성한 뒤 삭제하며
+소요 시간과 최대 메모리(Python 힙 최대치, 프로세스 RSS 최대치)를 측정합니다.
+
+- legacy: 기존 방식 (Project/Ticket ORM 객체를 모두 로딩 후 IN (...) 목록으로 삭제)
+- set-based: Ticket 묶음 단위 배치 삭제 (app.services.cascade_delete)
+
+각 방식은 별도 프로세스에서 실행하여 메모리 측정이 섞이지 않게 합니다.
+
+사용법:
+    python scripts/benchmarks/bench_cascade_delete.py
+    python scripts/benchmarks/bench_cascade_delete.py --tasks 500000 --projects 5 --tasks-per-ticket 10
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+import resource
+import subprocess
+import tracemalloc
+from uuid import UUID
+
+from sqlalchemy import select, delete, text
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database import SessionLocal, AsyncSessionLocal, async_engine
+from app.models import Workspace, Project, Ticket, Task
+from app.services.cascade_delete import purge_workspace_projects
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID
+
+
+def seed(tasks: int, projects: int, tasks_per_ticket: int) -> UUID:
+    """벤치마크용 Workspace 하위 데이터 생성 (Task의 10%에 댓글, 모든 Ticket에 멤버)"""
+    tickets_per_project = max(tasks // tasks_per_ticket // projects, 1)
+    params = {
+        "user_id": BENCH_USER_ID,
+        "projects": projects,
+        "tickets_per_project": tickets_per_project,
+        "tasks_per_ticket": tasks_per_ticket,
+    }
+    with SessionLocal() as db:
+        workspace_id = db.execute(
+            text("INSERT INTO workspaces (name, created_by) VALUES ('cascade bench', :user_id) RETURNING id"),
+            params,
+        ).scalar_one()
+        params["workspace_id"] = workspace_id
+        statements = [
+            """
+            INSERT INTO projects (name, workspace_id, status, priority, is_deleted, created_by)
+            SELECT 'bench ' || g, :workspace_id, 'ACTIVE', 'MEDIUM', false, :user_id
+            FROM generate_series(1, :projects) AS g
+            """,
+            """
+            INSERT INTO tickets (title, project_id, status, priority, is_deleted, created_by)
+            SELECT 'ticket ' || g, p.id, 'OPEN', 'MEDIUM', false, :user_id
+            FROM projects p, generate_series(1, :tickets_per_project) AS g
+            WHERE p.workspace_id = :workspace_id
+            """,
+            """
+            INSERT INTO tasks (title, ticket_id, status, is_deleted, created_by)
+            SELECT 'task ' || g, t.id, 'TODO', false, :user_id
+            FROM tickets t JOIN projects p ON p.id = t.project_id, generate_series(1, :tasks_per_ticket) AS g
+            WHERE p.workspace_id = :workspace_id
+            """,
+            """
+            INSERT INTO ticket_members (ticket_id, user_id, participation_type, is_deleted, created_by)
+            SELECT t.id, :user_id, 'WATCHER', false, :user_id
+            FROM tickets t JOIN projects p ON p.id = t.project_id
+            WHERE p.workspace_id = :workspace_id
+            """,
+            """
+            INSERT INTO comments (target_type, target_id, author_id, content, is_deleted, created_by)
+            SELECT 'TASK', k.id, :user_id, 'comment', false, :user_id
+            FROM tasks k JOIN tickets t ON t.id = k.ticket_id JOIN projects p ON p.id = t.project_id
+            WHERE p.workspace_id = :workspace_id AND random() < 0.1
+            """,
+        ]
+        for statement in statements:
+            db.execute(text(statement), params)
+        db.commit()
+        for table in ("projects", "tickets", "tasks", "ticket_members", "comments"):
+            db.execute(text(f"ANALYZE {table}"))
+        db.commit()
+    return workspace_id
+
+
+async def delete_legacy(workspace_id: UUID) -> None:
+    """기존 delete_workspace 구현"""
+    async with AsyncSessionLocal() as db:
+        workspace = await db.get(Workspace, workspace_id)
+        projects = (await db.scalars(select(Project).where(Project.workspace_id == workspace_id))).all()
+        project_ids = [p.id for p in projects]
+        if project_ids:
+            tickets = (await db.scalars(select(Ticket).where(Ticket.project_id.in_(project_ids)))).all()
+            ticket_ids = [t.id for t in tickets]
+            if ticket_ids:
+                await db.execute(
+                    delete(Task).where(Task.ticket_id.in_(ticket_ids)).execution_options(synchronize_session=False)
+                )
+            await db.execute(
+                delete(Ticket).where(Ticket.project_id.in_(project_ids)).execution_options(synchronize_session=False)
+            )
+        await db.execute(
+            delete(Project).where(Project.workspace_id == workspace_id).execution_options(synchronize_session=False)
+        )
+        await db.delete(workspace)
+        await db.commit()
+
+
+async def delete_set_based(workspace_id: UUID) -> None:
+    """Ticket 묶음 단위 배치 삭제"""
+    async with AsyncSessionLocal() as db:
+        workspace = await db.get(Workspace, workspace_id)
+        await purge_workspace_projects(db, workspace_id)
+        await db.delete(workspace)
+        await db.commit()
+
+
+async def run_mode(mode: str, workspace_id: UUID) -> None:
+    """한 가지 방식으로 삭제하고 결과를 한 줄로 출력 (자식 프로세스)"""
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        await (delete_legacy if mode == "legacy" else delete_set_based)(workspace_id)
+        status = "ok"
+    except Exception as e:
+        # 예: asyncpg는 쿼리 파라미터가 32767개를 넘으면 IN (...) 목록 쿼리를 거부
+        status = f"failed: {type(e).__name__}"
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    await async_engine.dispose()
+    print(f"RESULT {mode} {elapsed:.2f} {peak / 1024 / 1024:.1f} {(rss_after - rss_before) / 1024:.1f} {status}")
+
+
+def main(args: argparse.Namespace) -> None:
+    rows = []
+    for mode in args.modes:
+        print(f"[{mode}] Task {args.tasks}개 생성 중...")
+        workspace_id = seed(args.tasks, args.projects, args.tasks_per_ticket)
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run-mode", mode, "--workspace-id", str(workspace_id)],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        result = next(line for line in output.splitlines() if line.startswith("RESULT"))
+        rows.append(result.split(maxsplit=5)[1:])
+
+    print("=" * 80)
+    print(f"Task {args.tasks}개 (Project {args.projects}개, Ticket당 Task {args.tasks_per_ticket}개)")
+    print(f"{'mode':<12}{'time(s)':>10}{'py peak(MB)':>14}{'RSS growth(MB)':>16}  result")
+    for mode, elapsed, peak, rss, status in rows:
+        print(f"{mode:<12}{elapsed:>10}{peak:>14}{rss:>16}  {status}")
+    print("* legacy는 tasks/tickets/projects만 삭제, set-based는 댓글/멤버 등 하위 테이블 전체 삭제")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Workspace CASCADE 삭제 벤치마크")
+    parser.add_argument("--tasks", type=int, default=500_000, help="생성할 Task 수 (기본값: 500000)")
+    parser.add_argument("--projects", type=int, default=5, help="Project 수 (기본값: 5)")
+    parser.add_argument("--tasks-per-ticket", type=int, default=10, help="Ticket당 Task 수 (기본값: 10)")
+    parser.add_argument("--modes", nargs="+", default=["legacy", "set-based"], choices=["legacy", "set-based"])
+    parser.add_argument("--run-mode", help=argparse.SUPPRESS)
+    parser.add_argument("--workspace-id", type=UUID, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_mode:
+        asyncio.run(run_mode(args.run_mode, args.workspace_id))
+    else:
+        main(args)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+동시 요청 처리량 벤치마크
+
+실행 중인 Kanban 서버에 목록/단건 조회 요청을 동시에 보내고
+초당 처리량(req/s)과 지연 시간(p50/p95/p99)을 측정합니다.
+동기 Session 버전과 AsyncSession 버전을 같은 조건에서 실행해 비교합니다.
+
+사용법:
+    uvicorn app.main:app --port 8000 --workers 1
+    python scripts/benchmarks/bench_concurrency.py --base-url http://localhost:8000
+    python scripts/benchmarks/bench_concurrency.py --concurrency 200 --requests 5000
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+import statistics
+from uuid import UUID
+
+import httpx
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.generate_test_token import generate_token
+
+BENCH_USER_ID = UUID("00000000-0000-0000-0000-00000000be01")
+
+
+async def seed(client: httpx.AsyncClient, tickets: int) -> dict:
+    """벤치마크용 Workspace / Project / Ticket 생성"""
+    suffix = int(time.time() * 1000)
+    workspace = (await client.post("/api/workspaces/", json={"name": f"bench-{suffix}"})).json()
+    project = (await client.post(
+        "/api/projects/",
+        json={"name": "bench", "workspace_id": workspace["id"]}
+    )).json()
+
+    ticket_ids = []
+    for i in range(tickets):
+        ticket = (await client.post(
+            "/api/tickets/",
+            json={"title": f"ticket {i}", "project_id": project["id"]}
+        )).json()
+        ticket_ids.append(ticket["id"])
+
+    return {"workspace_id": workspace["id"], "project_id": project["id"], "ticket_ids": ticket_ids}
+
+
+async def run_load(client: httpx.AsyncClient, paths: list[str], total: int, concurrency: int) -> dict:
+    """paths를 순환하며 total개의 요청을 concurrency개씩 동시에 전송"""
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(paths[i % len(paths)])
+            latencies.append(time.perf_counter() - started)
+            if response.status_code != 200:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    token = generate_token(BENCH_USER_ID)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=limits,
+        timeout=60.0,
+    ) as client:
+        data = await seed(client, args.tickets)
+
+        scenarios = {
+            "list tickets": [f"/api/tickets/?project_id={data['project_id']}&limit=20"],
+            "get ticket": [f"/api/tickets/{ticket_id}" for ticket_id in data["ticket_ids"]],
+            "list projects": [f"/api/projects/?workspace_id={data['workspace_id']}"],
+            "get project": [f"/api/projects/{data['project_id']}"],
+        }
+
+        # 워밍업 (커넥션 풀 채우기)
+        await run_load(client, scenarios["get project"], args.concurrency, args.concurrency)
+
+        print("=" * 80)
+        print(f"동시성: {args.concurrency}, 시나리오별 요청 수: {args.requests}")
+        print("=" * 80)
+        print(f"{'scenario':<16}{'req/s':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'errors':>8}")
+        for name, paths in scenarios.items():
+            result = await run_load(client, paths, args.requests, args.concurrency)
+            print(
+                f"{name:<16}{result['rps']:>10.1f}{result['p50']:>10.1f}"
+                f"{result['p95']:>10.1f}{result['p99']:>10.1f}{result['errors']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="동시 요청 처리량 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Kanban 서버 주소")
+    parser.add_argument("--concurrency", type=int, default=100, help="동시 요청 수 (기본값: 100)")
+    parser.add_argument("--requests", type=int, default=2000, help="시나리오별 요청 수 (기본값: 2000)")
+    parser.add_argument("--tickets", type=int, default=50, help="생성할 티켓 수 (기본값: 50)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+조건부 조회(ETag / If-None-Match) 폴링 벤치마크
+
+보드 화면처럼 Ticket N개를 주기적으로 다시 조회하는 클라이언트를 흉내 냅니다.
+라운드마다 --churn 비율의 Ticket을 수정한 뒤 전체를 다시 조회하며,
+기존 방식(매번 전체 본문 수신)과 If-None-Match 방식(바뀐 Ticket만 본문 수신, 나머지 304)의
+전송량(상태 줄 + 헤더 + 본문)과 요청 지연 시간(p50/p95)을 비교합니다.
+
+사용법:
+    uvicorn app.main:app --port 8000 --workers 1
+    python scripts/benchmarks/bench_etag.py --base-url http://localhost:8000
+    python scripts/benchmarks/bench_etag.py --tickets 200 --rounds 20 --churn 0.05
+"""
+import sys
+import os
+import time
+import random
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID, seed
+from scripts.generate_test_token import generate_token
+
+
+def wire_size(response: httpx.Response) -> int:
+    """HTTP/1.1 응답 크기 근사치 (상태 줄 + 헤더 + 본문)"""
+    headers = sum(len(name) + len(value) + 4 for name, value in response.headers.raw)
+    return len(f"HTTP/1.1 {response.status_code} {response.reason_phrase}\r\n") + headers + 2 + len(response.content)
+
+
+async def poll(client: httpx.AsyncClient, ticket_ids: list[str], etags: dict, concurrency: int) -> dict:
+    """Ticket 전체를 한 번 다시 조회 (etags가 None이면 조건 없이 조회)"""
+    stats = {"bytes": 0, "ok": 0, "not_modified": 0, "latencies": []}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(ticket_id: str) -> None:
+        headers = {"If-None-Match": etags[ticket_id]} if etags is not None and ticket_id in etags else {}
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(f"/api/tickets/{ticket_id}", headers=headers)
+            stats["latencies"].append(time.perf_counter() - started)
+        stats["bytes"] += wire_size(response)
+        if response.status_code == 304:
+            stats["not_modified"] += 1
+        else:
+            response.raise_for_status()
+            stats["ok"] += 1
+            if etags is not None:
+                etags[ticket_id] = response.headers["ETag"]
+
+    await asyncio.gather(*(one(ticket_id) for ticket_id in ticket_ids))
+    return stats
+
+
+async def run(client: httpx.AsyncClient, ticket_ids: list[str], args: argparse.Namespace, conditional: bool) -> dict:
+    """첫 라운드(캐시 채우기) 이후 --rounds번: churn만큼 수정 -> 전체 다시 조회"""
+    rng = random.Random(args.seed)
+    etags = {} if conditional else None
+    await poll(client, ticket_ids, etags, args.concurrency)
+
+    total = {"bytes": 0, "ok": 0, "not_modified": 0, "latencies": []}
+    changed = max(1, int(len(ticket_ids) * args.churn))
+    for round_no in range(args.rounds):
+        for ticket_id in rng.sample(ticket_ids, changed):
+            await client.patch(f"/api/tickets/{ticket_id}", json={"title": f"round {round_no}"})
+        stats = await poll(client, ticket_ids, etags, args.concurrency)
+        for key in ("bytes", "ok", "not_modified"):
+            total[key] += stats[key]
+        total["latencies"].extend(stats["latencies"])
+
+    latencies = sorted(total["latencies"])
+    return {
+        **total,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    token = generate_token(BENCH_USER_ID)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=60.0,
+    ) as client:
+        data = await seed(client, args.tickets)
+        ticket_ids = data["ticket_ids"]
+        # 보드 카드처럼 설명과 하위 Task가 있는 Ticket
+        for ticket_id in ticket_ids:
+            await client.patch(f"/api/tickets/{ticket_id}", json={"description": "회의록 및 요구사항 정리. " * 20})
+            for i in range(3):
+                await client.post("/api/tasks/", json={"title": f"task {i}", "ticket_id": ticket_id})
+
+        results = {
+            "full GET": await run(client, ticket_ids, args, conditional=False),
+            "If-None-Match": await run(client, ticket_ids, args, conditional=True),
+        }
+
+    requests = args.rounds * len(ticket_ids)
+    print("=" * 88)
+    print(f"Ticket {args.tickets}개, {args.rounds}라운드, 라운드마다 {args.churn:.0%} 수정 (요청 {requests}개)")
+    print(f"{'방식':<16}{'200':>8}{'304':>8}{'전송(KB)':>12}{'라운드당(KB)':>14}{'p50(ms)':>10}{'p95(ms)':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<16}{result['ok']:>8}{result['not_modified']:>8}{result['bytes'] / 1024:>12.1f}"
+            f"{result['bytes'] / 1024 / args.rounds:>14.1f}{result['p50']:>10.2f}{result['p95']:>10.2f}"
+        )
+    print("=" * 88)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ETag 조건부 조회 폴링 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Kanban 서버 주소")
+    parser.add_argument("--tickets", type=int, default=100, help="보드의 Ticket 수 (기본값: 100)")
+    parser.add_argument("--rounds", type=int, default=20, help="폴링 라운드 수 (기본값: 20)")
+    parser.add_argument("--churn", type=float, default=0.02, help="라운드마다 수정할 Ticket 비율 (기본값: 0.02)")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수 (기본값: 10)")
+    parser.add_argument("--seed", type=int, default=20261018, help="수정 대상 선택용 난수 시드")
+    asyncio.run(main(parser.parse_args()))
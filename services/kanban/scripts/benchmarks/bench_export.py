@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Project 내보내기 벤치마크 (처리량 / 메모리)
+
+대량 Project(기본: bench_import.py의 1,000,000행 합성 파일을 가져온 Project)를
+GET /api/projects/{id}/export와 같은 스트림(export_project)으로 NDJSON, CSV, gzip NDJSON으로
+내보내면서 초당 행 수와 RSS 증가량을 측정합니다. 출력은 버리므로 RSS 증가량이 곧 서버 측 메모리 사용량입니다.
+비교용으로 기존 방식(GET /api/tickets/ 를 limit=100 cursor로 끝까지 넘기기)의 Ticket 처리량도 측정합니다.
+
+사용법:
+    python scripts/benchmarks/bench_export.py
+    python scripts/benchmarks/bench_export.py --project-id <project_id> --page-sample 20000
+"""
+import sys
+import os
+import time
+import asyncio
+import logging
+import argparse
+from uuid import UUID
+
+import httpx
+from sqlalchemy import func, select
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.main import app
+from app.auth import get_current_user_id
+from app.database import AsyncSessionLocal, async_engine
+from app.models import Ticket
+from app.services.project_export import export_project, gzip_stream
+from app.services.ticket_import import aiter_lines, import_records, read_records
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID
+from scripts.benchmarks.bench_import import create_project, generate
+from scripts.import_tickets import read_file
+
+
+def current_rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+
+
+async def seed(args: argparse.Namespace) -> UUID:
+    """bench_import.py 합성 파일을 새 Project로 가져오기"""
+    if not os.path.exists(args.file):
+        print(f"{args.rows}행 파일 생성 중: {args.file}")
+        generate(args.file, args.rows)
+    project_id = create_project()
+    async with AsyncSessionLocal() as db:
+        records = read_records(aiter_lines(read_file(args.file)), "ndjson")
+        await import_records(db, project_id, BENCH_USER_ID, records)
+    return project_id
+
+
+async def measure_export(project_id: UUID, export_format: str, gzip: bool) -> tuple[int, int, float, float]:
+    """(행 수, 바이트 수, 소요 시간, 최대 RSS 증가량 MB)"""
+    baseline = peak = current_rss_mb()
+    lines = [0]
+    size = 0
+
+    async def count_lines(chunks):
+        async for chunk in chunks:
+            lines[0] += chunk.count(b"\n")
+            yield chunk
+
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        body = count_lines(export_project(db, project_id, export_format))
+        if gzip:
+            body = gzip_stream(body)
+        async for chunk in body:
+            size += len(chunk)
+            peak = max(peak, current_rss_mb())
+    elapsed = time.perf_counter() - start
+    # CSV는 헤더 행 제외
+    rows = lines[0] - (1 if export_format == "csv" else 0)
+    return rows, size, elapsed, peak - baseline
+
+
+async def measure_paging(project_id: UUID, sample: int) -> float:
+    """기존 방식: GET /api/tickets/ limit=100 cursor 페이지 넘기기 (Ticket/s)"""
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    app.dependency_overrides[get_current_user_id] = lambda: BENCH_USER_ID
+    transport = httpx.ASGITransport(app=app)
+    fetched, cursor = 0, None
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        while fetched < sample:
+            params = {"project_id": str(project_id), "limit": 100, "include_total": "false"}
+            if cursor:
+                params["cursor"] = cursor
+            data = (await client.get("/api/tickets/", params=params)).json()
+            fetched += len(data["items"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+        return fetched / (time.perf_counter() - start)
+
+
+async def main(args: argparse.Namespace) -> None:
+    project_id = args.project_id or await seed(args)
+    async with AsyncSessionLocal() as db:
+        tickets = await db.scalar(select(func.count()).where(Ticket.project_id == project_id))
+
+    paging_rate = await measure_paging(project_id, args.page_sample)
+    results = [
+        (label, *await measure_export(project_id, export_format, gzip))
+        for label, export_format, gzip in (
+            ("export ndjson", "ndjson", False),
+            ("export csv", "csv", False),
+            ("export ndjson + gzip", "ndjson", True),
+        )
+    ]
+    await async_engine.dispose()
+
+    print("=" * 88)
+    print(f"Project {project_id}: Ticket {tickets}")
+    print(f"{'방식':<26}{'rows':>10}{'MB':>10}{'초':>10}{'rows/s':>12}{'RSS 증가(MB)':>16}")
+    print(f"{'tickets 목록 limit=100':<26}{'':>10}{'':>10}{tickets / paging_rate:>10.1f}{paging_rate:>12.0f}"
+          f"{'':>16}   (Ticket만, {args.page_sample}행 실측 후 추정)")
+    for label, rows, size, elapsed, rss in results:
+        print(f"{label:<26}{rows:>10}{size / 1024 / 1024:>10.1f}{elapsed:>10.1f}{rows / elapsed:>12.0f}{rss:>16.1f}")
+    print("=" * 88)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Project 내보내기 벤치마크")
+    parser.add_argument("--project-id", type=UUID, help="내보낼 Project (기본값: 합성 파일을 가져와 새로 생성)")
+    parser.add_argument("--rows", type=int, default=1000000, help="합성 파일 행 수 (기본값: 1000000)")
+    parser.add_argument("--file", default="/tmp/kanban_import_bench.ndjson", help="합성 파일 경로")
+    parser.add_argument("--page-sample", type=int, default=20000, help="목록 API로 넘겨볼 Ticket 수 (기본값: 20000)")
+    asyncio.run(main(parser.parse_args()))
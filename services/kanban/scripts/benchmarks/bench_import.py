@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+대량 가져오기 벤치마크
+
+합성 NDJSON 파일(기본 1,000,000행: Ticket 20%, Task 50%, 댓글 30%)을 만들어
+scripts/import_tickets.py와 같은 파이프라인(스트리밍 검증 + COPY)으로 적재하고 초당 행 수를 측정합니다.
+비교용으로 create_ticket / create_task처럼 행마다 ORM INSERT + 커밋하는 방식을
+앞부분 --orm-sample 행에 대해 실행하여 전체 파일 소요 시간을 추정합니다.
+
+사용법:
+    python scripts/benchmarks/bench_import.py
+    python scripts/benchmarks/bench_import.py --rows 1000000 --orm-sample 5000 --file /tmp/import.ndjson
+"""
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+import resource
+from itertools import islice
+
+from sqlalchemy import text
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import Comment, Task, Ticket
+from app.models.enums import TargetType
+from app.services.project_stats import tickets_added
+from app.services.task_rollup import task_added
+from app.services.ticket_import import aiter_lines, import_records, read_records
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID
+from scripts.import_tickets import read_file
+
+TICKET_STATUSES = ["OPEN", "IN_PROGRESS", "REVIEW", "TESTING", "DONE", "CLOSED", "BLOCKED"]
+TASK_STATUSES = ["TODO", "IN_PROGRESS", "REVIEW", "DONE"]
+
+
+def generate(path: str, rows: int) -> None:
+    """Ticket 1개당 Task 2~3개, 댓글 1~2개가 이어지는 합성 파일 (부모가 먼저 나옴)"""
+    with open(path, "w") as f:
+        written = ticket = 0
+        while written < rows:
+            ticket += 1
+            lines = [{"type": "ticket", "id": f"T-{ticket}", "title": f"Imported ticket {ticket}",
+                      "description": "Migrated from legacy tracker", "status": TICKET_STATUSES[ticket % 7],
+                      "priority": ["LOW", "MEDIUM", "HIGH", "URGENT"][ticket % 4]}]
+            for task in range(2 + ticket % 2):
+                lines.append({"type": "task", "id": f"T-{ticket}-{task}", "ticket_id": f"T-{ticket}",
+                              "title": f"Task {task}", "status": TASK_STATUSES[(ticket + task) % 4]})
+            for comment in range(1 + (ticket + 1) % 2):
+                lines.append({"type": "comment", "target_type": "TICKET" if comment == 0 else "TASK",
+                              "target_id": f"T-{ticket}" if comment == 0 else f"T-{ticket}-0",
+                              "content": "Looks good to me"})
+            for line in lines[:rows - written]:
+                f.write(json.dumps(line) + "\n")
+            written += len(lines)
+
+
+def create_project() -> str:
+    with SessionLocal() as db:
+        workspace_id = db.execute(
+            text("INSERT INTO workspaces (name, created_by) VALUES ('import bench ' || now(), :user_id) RETURNING id"),
+            {"user_id": BENCH_USER_ID},
+        ).scalar_one()
+        project_id = db.execute(
+            text(
+                """
+                INSERT INTO projects (name, workspace_id, status, priority, is_deleted, created_by)
+                VALUES ('import bench', :workspace_id, 'ACTIVE', 'MEDIUM', false, :user_id) RETURNING id
+                """
+            ),
+            {"workspace_id": workspace_id, "user_id": BENCH_USER_ID},
+        ).scalar_one()
+        db.commit()
+    return project_id
+
+
+async def orm_row_by_row(path: str, project_id, sample: int) -> float:
+    """기존 API 방식: 레코드마다 ORM INSERT + 집계 갱신 + 커밋 + refresh (앞부분 sample행)"""
+    ids = {}
+    start = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        with open(path) as f:
+            for line in islice(f, sample):
+                record = json.loads(line)
+                if record["type"] == "ticket":
+                    row = Ticket(title=record["title"], description=record["description"], status=record["status"],
+                                 priority=record["priority"], project_id=project_id, created_by=BENCH_USER_ID)
+                    db.add(row)
+                    await tickets_added(db, [row])
+                elif record["type"] == "task":
+                    row = Task(title=record["title"], status=record["status"],
+                               ticket_id=ids[record["ticket_id"]], created_by=BENCH_USER_ID)
+                    db.add(row)
+                    await task_added(db, row)
+                else:
+                    row = Comment(target_type=TargetType(record["target_type"]), target_id=ids[record["target_id"]],
+                                  author_id=BENCH_USER_ID, content=record["content"], created_by=BENCH_USER_ID)
+                    db.add(row)
+                await db.commit()
+                await db.refresh(row)
+                if "id" in record:
+                    ids[record["id"]] = row.id
+    return time.perf_counter() - start
+
+
+async def main(args: argparse.Namespace) -> None:
+    if not os.path.exists(args.file) or args.regenerate:
+        print(f"{args.rows}행 파일 생성 중: {args.file}")
+        generate(args.file, args.rows)
+    size_mb = os.path.getsize(args.file) / 1024 / 1024
+
+    orm_seconds = await orm_row_by_row(args.file, create_project(), args.orm_sample)
+
+    project_id = create_project()
+    async with AsyncSessionLocal() as db:
+        records = read_records(aiter_lines(read_file(args.file)), "ndjson")
+        result = await import_records(db, project_id, BENCH_USER_ID, records)
+    await async_engine.dispose()
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    rows = result["tickets"] + result["tasks"] + result["comments"]
+    orm_rate = args.orm_sample / orm_seconds
+    print("=" * 80)
+    print(f"파일: {args.file} ({size_mb:.0f}MB, {rows}행: Ticket {result['tickets']}, "
+          f"Task {result['tasks']}, 댓글 {result['comments']})")
+    print(f"{'방식':<28}{'rows/s':>12}{f'{rows}행 소요':>20}")
+    print(f"{'ORM row-by-row (추정)':<28}{orm_rate:>12.0f}{rows / orm_rate / 60:>17.1f}min"
+          f"   ({args.orm_sample}행 실측)")
+    print(f"{'streaming COPY import':<28}{result['rows_per_second']:>12.0f}{result['elapsed_seconds']:>19.1f}s")
+    print(f"최대 RSS: {peak_rss_mb:.0f}MB (Task 개수/프로젝트 집계 재계산 포함)")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대량 가져오기 벤치마크")
+    parser.add_argument("--rows", type=int, default=1000000, help="합성 파일 행 수 (기본값: 1000000)")
+    parser.add_argument("--orm-sample", type=int, default=5000, help="ORM 방식으로 측정할 행 수 (기본값: 5000)")
+    parser.add_argument("--file", default="/tmp/kanban_import_bench.ndjson", help="합성 파일 경로")
+    parser.add_argument("--regenerate", action="store_true", help="파일이 있어도 다시 생성")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+로그 출력 비용 벤치마크 (요청당)
+
+DEBUG=True(SQL 로그 포함)에서 로그 설정별로 앱을 각각 별도 프로세스에서 불러와(설정은 import 시 결정)
+같은 조회 요청을 ASGI로 직접 순차 실행하고 요청당 서버 처리 시간을 비교합니다.
+
+- off: 로그 끔 (logging.disable) - 기준값
+- sync text / sync json: 요청 처리 중 포맷팅 + stdout 출력 (LOG_ASYNC=false)
+- async text / async json: 큐에만 넣고 QueueListener 스레드에서 포맷팅 + 출력 (LOG_ASYNC=true)
+- async json (stdlib): async json과 같되 orjson 대신 표준 json 사용
+- async json debug 10%: async json과 같되 DEBUG 로그(커넥션 풀 등)를 10%만 출력 (LOG_DEBUG_SAMPLE_RATE=0.1)
+
+로그는 임시 파일로 출력합니다 (컨테이너 stdout처럼 실제 write 비용 포함).
+--sink-rate를 주면 대신 파이프를 초당 해당 KB만 읽어 느린 로그 수집기를 흉내냅니다
+(파이프 버퍼가 차면 sync 모드는 요청 처리 중 write에서 멈춤).
+async 모드의 drain은 측정이 끝난 뒤 큐에 남은 로그를 모두 출력하는 데 걸린 시간입니다.
+두 모드 이상을 --rounds번 번갈아(라운드마다 순서를 바꿔) 실행하고 라운드별 평균의 중앙값을 출력합니다.
+
+DATABASE_URL, REDIS_URL 등 설정은 현재 환경 변수를 그대로 사용합니다.
+
+사용법:
+    python scripts/benchmarks/bench_logging.py
+    python scripts/benchmarks/bench_logging.py --requests 2000 --rounds 8
+    python scripts/benchmarks/bench_logging.py --modes "sync json" "async json" --sink-rate 256
+"""
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+import logging
+import statistics
+import subprocess
+import tempfile
+
+import httpx
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID, seed
+from scripts.generate_test_token import generate_token
+
+# 모드: (환경 변수, 옵션)
+MODES = {
+    "off": ({"ENV": "production", "LOG_ASYNC": "false"}, {"disable": True}),
+    "sync text": ({"ENV": "development", "LOG_ASYNC": "false"}, {}),
+    "async text": ({"ENV": "development", "LOG_ASYNC": "true"}, {}),
+    "sync json": ({"ENV": "production", "LOG_ASYNC": "false"}, {}),
+    "async json": ({"ENV": "production", "LOG_ASYNC": "true"}, {}),
+    "async json (stdlib)": ({"ENV": "production", "LOG_ASYNC": "true"}, {"stdlib_json": True}),
+    "async json debug 10%": ({"ENV": "production", "LOG_ASYNC": "true", "LOG_DEBUG_SAMPLE_RATE": "0.1"}, {}),
+}
+
+
+def asgi_client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://kanban",
+        headers={"Authorization": f"Bearer {generate_token(BENCH_USER_ID)}"},
+    )
+
+
+async def measure(scenarios: dict, requests: int, options: dict) -> dict:
+    """(자식 프로세스) 시나리오별 요청 requests개를 순차 실행한 요청당 평균 / p50 (ms)와 drain 시간"""
+    import app.logging_config as logging_config
+    from app.main import app
+
+    if options.get("disable"):
+        logging.disable(logging.CRITICAL)
+    if options.get("stdlib_json"):
+        logging_config.orjson = None
+
+    await app.router.startup()
+    results = {}
+    try:
+        async with asgi_client(app) as client:
+            for name, paths in scenarios.items():
+                # 워밍업 (커넥션 풀, 인증 캐시)
+                for i in range(200):
+                    (await client.get(paths[i % len(paths)])).raise_for_status()
+                latencies = []
+                for i in range(requests):
+                    started = time.perf_counter()
+                    response = await client.get(paths[i % len(paths)])
+                    latencies.append(time.perf_counter() - started)
+                    response.raise_for_status()
+                results[name] = {
+                    "mean": statistics.fmean(latencies) * 1000,
+                    "p50": statistics.median(latencies) * 1000,
+                }
+    finally:
+        await app.router.shutdown()
+
+    started = time.perf_counter()
+    logging_config.stop_logging()
+    results["drain"] = (time.perf_counter() - started) * 1000
+    return results
+
+
+def drain_slowly(stream, bytes_per_second: int) -> None:
+    """느린 로그 수집기: 파이프를 초당 bytes_per_second만큼만 읽음"""
+    chunk = 4096
+    while stream.read(chunk):
+        time.sleep(chunk / bytes_per_second)
+
+
+def run_mode(mode: str, scenarios: dict, requests: int, sink_rate: int) -> dict:
+    env, _ = MODES[mode]
+    with tempfile.NamedTemporaryFile("r", suffix=".json") as output:
+        command = [
+            sys.executable, os.path.abspath(__file__), "--measure", json.dumps(scenarios),
+            "--mode", mode, "--requests", str(requests), "--output", output.name,
+        ]
+        env = {**os.environ, "DEBUG": "true", **env}
+        if sink_rate:
+            process = subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.PIPE)
+            drain_slowly(process.stdout, sink_rate * 1024)
+            if process.wait():
+                raise subprocess.CalledProcessError(process.returncode, command)
+        else:
+            with tempfile.TemporaryFile("w") as log_file:
+                subprocess.run(command, cwd=ROOT, env=env, stdout=log_file, check=True)
+        return json.load(output)
+
+
+async def seed_data(tickets: int) -> dict:
+    from app.main import app
+
+    logging.disable(logging.CRITICAL)
+    async with asgi_client(app) as client:
+        return await seed(client, tickets)
+
+
+def main(args: argparse.Namespace) -> None:
+    data = asyncio.run(seed_data(args.tickets))
+    scenarios = {
+        "get ticket": [f"/api/tickets/{ticket_id}" for ticket_id in data["ticket_ids"]],
+        "list tickets": [f"/api/tickets/?project_id={data['project_id']}&limit=20"],
+    }
+
+    modes = args.modes or list(MODES)
+    results = {mode: [] for mode in modes}
+    for round_no in range(args.rounds):
+        # 먼저 실행하는 쪽이 유리/불리하지 않도록 라운드마다 순서를 바꿈
+        order = modes if round_no % 2 == 0 else list(reversed(modes))
+        for mode in order:
+            results[mode].append(run_mode(mode, scenarios, args.requests, args.sink_rate))
+
+    print("=" * 80)
+    sink = f"파이프 {args.sink_rate}KB/s" if args.sink_rate else "파일"
+    print(f"DEBUG=True, 시나리오별 순차 요청 {args.requests}개, 라운드: {args.rounds} (중앙값), 로그 출력: {sink}")
+    print("=" * 80)
+    print(f"{'scenario':<14}{'mode':<24}{'mean(ms)':>10}{'p50(ms)':>10}{'overhead':>12}")
+    for name in scenarios:
+        baseline = statistics.median(r[name]["mean"] for r in results["off"]) if "off" in results else None
+        for mode in modes:
+            mean = statistics.median(r[name]["mean"] for r in results[mode])
+            p50 = statistics.median(r[name]["p50"] for r in results[mode])
+            overhead = f"{(mean - baseline) * 1000:+.0f}us" if baseline is not None and mode != "off" else ""
+            print(f"{name:<14}{mode:<24}{mean:>10.3f}{p50:>10.3f}{overhead:>12}")
+    print("-" * 80)
+    for mode in modes:
+        drain = statistics.median(r["drain"] for r in results[mode])
+        print(f"drain  {mode:<24}{drain:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로그 출력 비용 벤치마크")
+    parser.add_argument("--requests", type=int, default=1000, help="시나리오별 요청 수 (기본값: 1000)")
+    parser.add_argument("--rounds", type=int, default=6, help="모드별 반복 횟수 (기본값: 6)")
+    parser.add_argument("--tickets", type=int, default=50, help="생성할 티켓 수 (기본값: 50)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), help="실행할 모드 (기본값: 전체)")
+    parser.add_argument("--sink-rate", type=int, default=0, help="로그 파이프를 읽는 속도 KB/s (기본값: 0, 파일로 출력)")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        results = asyncio.run(measure(json.loads(args.measure), args.requests, MODES[args.mode][1]))
+        with open(args.output, "w") as f:
+            json.dump(results, f)
+    else:
+        main(args)
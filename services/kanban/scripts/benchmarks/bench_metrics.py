@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+요청 지표(app.metrics) 오버헤드 벤치마크
+
+METRICS_ENABLED=true / false로 앱을 각각 별도 프로세스에서 불러와(설정은 import 시 결정)
+같은 조회 요청을 ASGI로 직접 순차 실행하고 요청당 서버 처리 시간을 비교합니다.
+네트워크와 클라이언트 부하를 빼고 서버 쪽 비용만 재므로 작은 차이도 보입니다.
+
+- 두 모드를 --rounds번 번갈아(라운드마다 순서를 바꿔) 실행하고 라운드별 평균의 중앙값을 출력
+- 요청 완료 로그는 /dev/null로 보내므로 로그 포맷팅 비용은 포함, 터미널 출력 비용은 제외
+
+DATABASE_URL, REDIS_URL 등 설정은 현재 환경 변수를 그대로 사용합니다 (DEBUG=False 권장).
+
+사용법:
+    python scripts/benchmarks/bench_metrics.py
+    python scripts/benchmarks/bench_metrics.py --requests 3000 --rounds 12
+"""
+import sys
+import os
+import json
+import time
+import asyncio
+import argparse
+import logging
+import statistics
+import subprocess
+
+import httpx
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID, seed
+from scripts.generate_test_token import generate_token
+
+MODES = {"metrics on": "true", "metrics off": "false"}
+
+
+def asgi_client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://kanban",
+        headers={"Authorization": f"Bearer {generate_token(BENCH_USER_ID)}"},
+    )
+
+
+def silence_logs() -> None:
+    """앱 로그 핸들러 출력을 /dev/null로 (포맷팅은 그대로 수행)"""
+    for handler in logging.getLogger().handlers:
+        handler.setStream(open(os.devnull, "w"))
+
+
+async def measure(scenarios: dict, requests: int) -> dict:
+    """(자식 프로세스) 시나리오별 요청 requests개를 순차 실행한 요청당 평균 / p50 (ms)"""
+    from app.main import app
+
+    silence_logs()
+    await app.router.startup()
+    results = {}
+    try:
+        async with asgi_client(app) as client:
+            for name, paths in scenarios.items():
+                # 워밍업 (커넥션 풀, 인증 캐시)
+                for i in range(200):
+                    (await client.get(paths[i % len(paths)])).raise_for_status()
+                latencies = []
+                for i in range(requests):
+                    started = time.perf_counter()
+                    response = await client.get(paths[i % len(paths)])
+                    latencies.append(time.perf_counter() - started)
+                    response.raise_for_status()
+                results[name] = {
+                    "mean": statistics.fmean(latencies) * 1000,
+                    "p50": statistics.median(latencies) * 1000,
+                }
+    finally:
+        await app.router.shutdown()
+    return results
+
+
+def run_mode(metrics_enabled: str, scenarios: dict, requests: int) -> dict:
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--measure", json.dumps(scenarios), "--requests", str(requests)],
+        cwd=ROOT,
+        env={**os.environ, "METRICS_ENABLED": metrics_enabled},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+async def seed_data(tickets: int) -> dict:
+    from app.main import app
+
+    silence_logs()
+    async with asgi_client(app) as client:
+        return await seed(client, tickets)
+
+
+def main(args: argparse.Namespace) -> None:
+    data = asyncio.run(seed_data(args.tickets))
+    scenarios = {
+        "get ticket": [f"/api/tickets/{ticket_id}" for ticket_id in data["ticket_ids"]],
+        "list tickets": [f"/api/tickets/?project_id={data['project_id']}&limit=20"],
+    }
+
+    results = {mode: [] for mode in MODES}
+    for round_no in range(args.rounds):
+        # 먼저 실행하는 쪽이 유리/불리하지 않도록 라운드마다 순서를 바꿈
+        modes = list(MODES.items())
+        if round_no % 2:
+            modes.reverse()
+        for mode, metrics_enabled in modes:
+            results[mode].append(run_mode(metrics_enabled, scenarios, args.requests))
+
+    print("=" * 72)
+    print(f"시나리오별 순차 요청 {args.requests}개, 라운드: {args.rounds} (중앙값)")
+    print("=" * 72)
+    print(f"{'scenario':<16}{'mode':<14}{'mean(ms)':>10}{'p50(ms)':>10}{'overhead':>12}")
+    for name in scenarios:
+        baseline = statistics.median(r[name]["mean"] for r in results["metrics off"])
+        for mode in MODES:
+            mean = statistics.median(r[name]["mean"] for r in results[mode])
+            p50 = statistics.median(r[name]["p50"] for r in results[mode])
+            overhead = f"{(mean - baseline) * 1000:+.0f}us" if mode == "metrics on" else ""
+            print(f"{name:<16}{mode:<14}{mean:>10.3f}{p50:>10.3f}{overhead:>12}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요청 지표 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=1500, help="시나리오별 요청 수 (기본값: 1500)")
+    parser.add_argument("--rounds", type=int, default=8, help="모드별 반복 횟수 (기본값: 8)")
+    parser.add_argument("--tickets", type=int, default=50, help="생성할 티켓 수 (기본값: 50)")
+    parser.add_argument("--measure", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        print(json.dumps(asyncio.run(measure(json.loads(args.measure), args.requests))))
+    else:
+        main(args)
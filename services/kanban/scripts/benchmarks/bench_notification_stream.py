@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+/api/notifications/stream 유휴 연결 메모리 벤치마크
+
+한 프로세스에서 수천 개의 SSE 연결을 열어 유지한 뒤, 서버 프로세스의
+RSS 증가량으로 연결당 메모리를 계산합니다. 연결을 유지한 상태에서 알림을
+하나 생성해 이벤트가 모든 연결에 전달되는 데 걸리는 시간도 측정합니다.
+
+서버 RSS는 /proc/<pid>/status에서 읽으므로 같은 호스트에서 실행해야 합니다.
+연결 수만큼 파일 디스크립터가 필요하므로 ulimit -n을 충분히 올려두세요.
+
+사용법:
+    python scripts/benchmarks/bench_notification_stream.py --server-pid 12345
+    python scripts/benchmarks/bench_notification_stream.py --connections 5000 --server-pid 12345
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+import resource
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from scripts.generate_test_token import generate_token
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID
+
+
+def read_rss_kb(pid: int) -> Optional[int]:
+    """프로세스 RSS (KB)"""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def raise_fd_limit(needed: int) -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < needed:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, hard), hard))
+
+
+async def open_stream(host: str, port: int, token: str) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    SSE 연결을 열고 초기 unread_count 스냅샷까지 읽음
+
+    연결 수천 개를 가볍게 유지하기 위해 HTTP 클라이언트 대신 소켓을 직접 사용합니다.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(
+        (
+            "GET /api/notifications/stream HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            f"Authorization: Bearer {token}\r\n"
+            "Accept: text/event-stream\r\n"
+            "\r\n"
+        ).encode()
+    )
+    await writer.drain()
+
+    status_line = await reader.readline()
+    if b" 200 " not in status_line:
+        raise RuntimeError(f"unexpected response: {status_line!r}")
+    await reader.readuntil(b"event: unread_count")
+    await reader.readuntil(b"\n\n")
+    return reader, writer
+
+
+async def wait_for_event(reader: asyncio.StreamReader) -> None:
+    await reader.readuntil(b"event: notification")
+
+
+async def main(args: argparse.Namespace) -> None:
+    raise_fd_limit(args.connections + 256)
+
+    url = urlsplit(args.base_url)
+    host, port = url.hostname, url.port or 80
+    token = generate_token(BENCH_USER_ID)
+
+    rss_before = read_rss_kb(args.server_pid) if args.server_pid else None
+
+    print(f"SSE 연결 {args.connections}개 생성 중...")
+    start = time.perf_counter()
+    streams = []
+    for offset in range(0, args.connections, args.batch):
+        batch = min(args.batch, args.connections - offset)
+        streams += await asyncio.gather(*(open_stream(host, port, token) for _ in range(batch)))
+    connect_elapsed = time.perf_counter() - start
+
+    # 유휴 상태에서 서버 메모리 안정화 대기
+    await asyncio.sleep(args.settle)
+    rss_after = read_rss_kb(args.server_pid) if args.server_pid else None
+
+    # 알림 하나를 생성해 모든 연결로 전달되는 시간 측정
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=60.0,
+    ) as client:
+        waiters = [asyncio.create_task(wait_for_event(reader)) for reader, _ in streams]
+        start = time.perf_counter()
+        response = await client.post(
+            "/api/notifications/",
+            json={"user_id": str(BENCH_USER_ID), "notification_type": "MENTION", "title": "stream bench"},
+        )
+        response.raise_for_status()
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=60.0)
+        fanout_elapsed = time.perf_counter() - start
+
+    for _, writer in streams:
+        writer.close()
+
+    print("=" * 80)
+    print(f"연결 수: {len(streams)} (연결 시간 {connect_elapsed:.2f}s)")
+    if rss_before is not None and rss_after is not None:
+        per_connection = (rss_after - rss_before) / len(streams)
+        print(f"서버 RSS: {rss_before / 1024:.1f}MB -> {rss_after / 1024:.1f}MB")
+        print(f"연결당 메모리: {per_connection:.1f}KB")
+    print(f"알림 fan-out ({len(streams)}개 연결): {fanout_elapsed * 1000:.1f}ms")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="알림 스트림 유휴 연결 메모리 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Kanban 서버 주소")
+    parser.add_argument("--server-pid", type=int, help="서버 프로세스 PID (RSS 측정용)")
+    parser.add_argument("--connections", type=int, default=2000, help="열어둘 연결 수 (기본값: 2000)")
+    parser.add_argument("--batch", type=int, default=200, help="동시에 여는 연결 수 (기본값: 200)")
+    parser.add_argument("--settle", type=float, default=2.0, help="측정 전 대기 시간 (초)")
+    asyncio.run(main(parser.parse_args()))
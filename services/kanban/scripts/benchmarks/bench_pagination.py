@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+offset vs cursor 페이지네이션 벤치마크
+
+하나의 프로젝트에 대량의 티켓을 생성한 뒤, 페이지 깊이별로
+list_tickets와 동일한 쿼리(app.utils.pagination.paginate)의 지연 시간을 측정합니다.
+
+사용법:
+    python scripts/benchmarks/bench_pagination.py
+    python scripts/benchmarks/bench_pagination.py --tickets 1000000 --pages 1 100 1000 10000 49000
+    python scripts/benchmarks/bench_pagination.py --project-id <기존 벤치마크 프로젝트 ID>
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+import statistics
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, text
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database import SessionLocal, AsyncSessionLocal, async_engine
+from app.models import Ticket
+from app.utils.pagination import paginate, encode_cursor
+
+BENCH_USER_ID = UUID("00000000-0000-0000-0000-00000000be01")
+
+
+def seed(tickets: int) -> UUID:
+    """generate_series로 티켓을 일괄 생성 (created_at은 1초 간격)"""
+    project_id = uuid4()
+    with SessionLocal() as db:
+        db.execute(
+            text(
+                """
+                INSERT INTO tickets (title, status, priority, project_id, created_by, is_deleted, created_at, updated_at)
+                SELECT 'bench ' || g, 'OPEN', 'MEDIUM', :project_id, :user_id, false,
+                       now() - g * interval '1 second', now()
+                FROM generate_series(1, :tickets) AS g
+                """
+            ),
+            {"project_id": project_id, "user_id": BENCH_USER_ID, "tickets": tickets},
+        )
+        db.commit()
+        db.execute(text("ANALYZE tickets"))
+        db.commit()
+    return project_id
+
+
+async def measure(project_id: UUID, page: int, limit: int, repeat: int) -> tuple[float, float]:
+    """page번째 페이지의 offset/cursor 모드 중앙값 지연 시간(ms)"""
+    offset = (page - 1) * limit
+    query = select(Ticket).where(Ticket.project_id == project_id)
+
+    async with AsyncSessionLocal() as db:
+        # cursor 모드 준비: 이전 페이지의 마지막 항목으로 커서 생성
+        cursor = None
+        if offset:
+            previous = await db.scalar(
+                query.order_by(Ticket.created_at.desc(), Ticket.id.desc()).offset(offset - 1).limit(1)
+            )
+            cursor = encode_cursor(previous.created_at, previous.id)
+
+        offset_times, cursor_times = [], []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await paginate(db, query, Ticket, limit, offset=offset)
+            offset_times.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await paginate(db, query, Ticket, limit, cursor=cursor)
+            cursor_times.append(time.perf_counter() - started)
+            db.expunge_all()
+
+    return statistics.median(offset_times) * 1000, statistics.median(cursor_times) * 1000
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.project_id:
+        project_id = UUID(args.project_id)
+    else:
+        print(f"티켓 {args.tickets}개 생성 중...")
+        started = time.perf_counter()
+        project_id = seed(args.tickets)
+        print(f"생성 완료: {time.perf_counter() - started:.1f}s (project_id={project_id})")
+
+    print("=" * 80)
+    print(f"{'page':>8}{'offset(ms)':>14}{'cursor(ms)':>14}{'speedup':>10}")
+    for page in args.pages:
+        offset_ms, cursor_ms = await measure(project_id, page, args.limit, args.repeat)
+        print(f"{page:>8}{offset_ms:>14.2f}{cursor_ms:>14.2f}{offset_ms / cursor_ms:>9.1f}x")
+    print("=" * 80)
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="offset vs cursor 페이지네이션 벤치마크")
+    parser.add_argument("--tickets", type=int, default=1_000_000, help="생성할 티켓 수 (기본값: 1,000,000)")
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기 (기본값: 20)")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000, 10000, 49000], help="측정할 페이지 번호")
+    parser.add_argument("--repeat", type=int, default=5, help="페이지별 반복 횟수 (기본값: 5)")
+    parser.add_argument("--project-id", help="이미 생성된 벤치마크 프로젝트 ID (지정 시 생성 생략)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+프로젝트 대시보드 집계 벤치마크
+
+Ticket 100,000개 프로젝트의 대시보드(상태/우선순위/티켓 타입/담당자별 Ticket 수 + 기한 초과 수)를
+두 가지 방식으로 조회하여 SQL 쿼리 수와 지연 시간을 비교합니다. 앱을 같은 프로세스에서 ASGI로
+호출하므로 서버를 따로 띄울 필요가 없습니다 (DATABASE_URL의 DB 사용).
+
+- 조건별 COUNT: 상태/우선순위마다 GET /api/tickets/?status=...&limit=1 (total 사용),
+  목록 API에 필터가 없는 티켓 타입/담당자/기한 초과는 조건별 COUNT(*) 쿼리
+- GET /api/projects/{id}/stats 한 번 (project_ticket_stats 요약 행만 읽음)
+
+사용법:
+    python scripts/benchmarks/bench_project_stats.py
+    python scripts/benchmarks/bench_project_stats.py --tickets 100000 --assignees 20 --rounds 5
+"""
+import sys
+import os
+import time
+import uuid
+import asyncio
+import logging
+import argparse
+import statistics
+from datetime import date
+from uuid import UUID
+
+import httpx
+from sqlalchemy import event, func, select, text
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.main import app
+from app.auth import get_current_user_id
+from app.database import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import Ticket
+from app.models.enums import Priority, TicketStatus
+from app.services.project_stats import CLOSED_STATUSES, rebuild_project_stats
+from scripts.benchmarks.bench_board import Counter
+from scripts.benchmarks.bench_concurrency import BENCH_USER_ID
+
+
+def seed(tickets: int, assignees: int) -> UUID:
+    """
+    집계 벤치마크용 Project 생성
+
+    티켓 타입 5개, 담당자 assignees명(일부는 미지정)에 상태/우선순위를 고르게 분배하고
+    마감일은 오늘 기준 -30일 ~ +29일로 설정합니다.
+    """
+    assignee_ids = [str(uuid.uuid4()) for _ in range(assignees)]
+    params = {"user_id": BENCH_USER_ID, "tickets": tickets, "assignees": assignee_ids}
+    with SessionLocal() as db:
+        workspace_id = db.execute(
+            text("INSERT INTO workspaces (name, created_by) VALUES ('stats bench ' || now(), :user_id) RETURNING id"),
+            params,
+        ).scalar_one()
+        params["project_id"] = db.execute(
+            text(
+                """
+                INSERT INTO projects (name, workspace_id, status, priority, is_deleted, created_by)
+                VALUES ('stats bench', :workspace_id, 'ACTIVE', 'MEDIUM', false, :user_id) RETURNING id
+                """
+            ),
+            {**params, "workspace_id": workspace_id},
+        ).scalar_one()
+        statements = [
+            """
+            INSERT INTO ticket_types (project_id, type_name, display_order, is_deleted, created_by)
+            SELECT :project_id, 'type ' || g, g, false, :user_id FROM generate_series(1, 5) AS g
+            """,
+            """
+            INSERT INTO tickets (title, project_id, status, priority, ticket_type_id, assignee_id, due_date,
+                                 is_deleted, created_by)
+            SELECT 'ticket ' || g, :project_id,
+                   (enum_range(NULL::ticketstatus))[1 + g % 7], (enum_range(NULL::priority))[1 + g % 4],
+                   (SELECT id FROM ticket_types WHERE project_id = :project_id AND display_order = 1 + g % 5),
+                   (CAST(:assignees AS uuid[]))[1 + g % (cardinality(CAST(:assignees AS uuid[])) + 1)],
+                   current_date + (g % 60 - 30), false, :user_id
+            FROM generate_series(1, :tickets) AS g
+            """,
+        ]
+        for statement in statements:
+            db.execute(text(statement), params)
+        db.commit()
+        db.execute(text("ANALYZE tickets"))
+        db.commit()
+    return params["project_id"]
+
+
+async def filtered_counts(client: httpx.AsyncClient, project_id: UUID, counter: Counter) -> int:
+    """기존 대시보드 방식: 값마다 필터를 걸어 COUNT(*)"""
+    async def api_total(**params) -> int:
+        counter.requests += 1
+        response = await client.get(
+            "/api/tickets/", params={"project_id": str(project_id), "limit": 1, **params}
+        )
+        response.raise_for_status()
+        return response.json()["total"]
+
+    by_status = {s.value: await api_total(status=s.value) for s in TicketStatus}
+    for priority in Priority:
+        await api_total(priority=priority.value)
+
+    # 목록 API에 없는 필터는 대시보드 백엔드가 조건별 COUNT(*)를 직접 실행
+    live = (Ticket.project_id == project_id, Ticket.is_deleted == False)
+    async with AsyncSessionLocal() as db:
+        type_ids = (await db.scalars(
+            select(Ticket.ticket_type_id).where(*live).distinct()
+        )).all()
+        for type_id in type_ids:
+            column = Ticket.ticket_type_id
+            await db.scalar(select(func.count()).where(*live, column == type_id if type_id else column.is_(None)))
+        assignee_ids = (await db.scalars(select(Ticket.assignee_id).where(*live).distinct())).all()
+        for assignee_id in assignee_ids:
+            column = Ticket.assignee_id
+            await db.scalar(select(func.count()).where(*live, column == assignee_id if assignee_id else column.is_(None)))
+        for condition in (Ticket.due_date < date.today(), Ticket.due_date == date.today()):
+            await db.scalar(select(func.count()).where(*live, condition, Ticket.status.not_in(CLOSED_STATUSES)))
+    return sum(by_status.values())
+
+
+async def stats_endpoint(client: httpx.AsyncClient, project_id: UUID, counter: Counter) -> int:
+    counter.requests += 1
+    response = await client.get(f"/api/projects/{project_id}/stats")
+    response.raise_for_status()
+    return response.json()["total"]
+
+
+async def measure(fn, client: httpx.AsyncClient, project_id: UUID, args: argparse.Namespace) -> dict:
+    """rounds회 실행한 지연 시간(p50/max)과 1회당 요청/쿼리 수"""
+    timings = []
+    for _ in range(args.rounds):
+        counter = Counter()
+        event.listen(async_engine.sync_engine, "before_cursor_execute", counter.on_query)
+        start = time.perf_counter()
+        total = await fn(client, project_id, counter)
+        timings.append((time.perf_counter() - start) * 1000)
+        event.remove(async_engine.sync_engine, "before_cursor_execute", counter.on_query)
+        assert total == args.tickets
+    return {
+        "requests": counter.requests,
+        "queries": counter.queries,
+        "p50": statistics.median(timings),
+        "max": max(timings),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    project_id = args.project_id
+    if project_id is None:
+        print(f"Ticket {args.tickets}개 생성 중...")
+        project_id = seed(args.tickets, args.assignees)
+        start = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            await rebuild_project_stats(db, project_id)
+        print(f"rebuild_project_stats: {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    app.dependency_overrides[get_current_user_id] = lambda: BENCH_USER_ID
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 커넥션 풀 / 쿼리 캐시 워밍업
+        await stats_endpoint(client, project_id, Counter())
+        rows = [
+            ("filtered COUNT(*)", await measure(filtered_counts, client, project_id, args)),
+            ("GET /stats", await measure(stats_endpoint, client, project_id, args)),
+        ]
+    await async_engine.dispose()
+
+    print("=" * 80)
+    print(f"Project {project_id}: Ticket {args.tickets}개, {args.rounds}회 반복")
+    print(f"{'방식':<24}{'requests':>10}{'queries':>10}{'p50(ms)':>12}{'max(ms)':>12}")
+    for name, row in rows:
+        print(f"{name:<24}{row['requests']:>10}{row['queries']:>10}{row['p50']:>12.1f}{row['max']:>12.1f}")
+    print("* 앱을 같은 프로세스에서 호출하므로 네트워크 왕복 지연은 포함되지 않음")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="프로젝트 대시보드 집계 벤치마크")
+    parser.add_argument("--tickets", type=int, default=100000, help="Ticket 수 (기본값: 100000)")
+    parser.add_argument("--assignees", type=int, default=20, help="담당자 수 (기본값: 20)")
+    parser.add_argument("--rounds", type=int, default=5, help="반복 횟수 (기본값: 5)")
+    parser.add_argument("--project-id", type=UUID, help="기존 벤치마크 Project 재사용 (생성 생략)")
+    asyncio.run(main(parser.parse_args()))
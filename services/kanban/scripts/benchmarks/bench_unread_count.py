@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+/api/notifications/unread-count 부하 벤치마크
+
+벤치마크 사용자에게 알림을 대량 생성한 뒤 실행 중인 서버의
+unread-count 엔드포인트에 동시 요청을 보내 처리량과 지연 시간을 측정합니다.
+Redis 캐시 적용 전/후 서버를 같은 조건에서 실행해 비교합니다.
+
+사용법:
+    python scripts/benchmarks/bench_unread_count.py --base-url http://localhost:8000
+    python scripts/benchmarks/bench_unread_count.py --notifications 200000 --concurrency 50
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+from uuid import UUID
+
+import httpx
+from sqlalchemy import text
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.database import SessionLocal
+from scripts.generate_test_token import generate_token
+from scripts.benchmarks.bench_concurrency import run_load, BENCH_USER_ID
+
+
+def seed(notifications: int, user_id: UUID) -> None:
+    """벤치마크 사용자의 알림을 초기화하고 다시 생성 (절반은 읽음 상태)"""
+    with SessionLocal() as db:
+        db.execute(text("DELETE FROM notifications WHERE user_id = :user_id"), {"user_id": user_id})
+        db.execute(
+            text(
+                """
+                INSERT INTO notifications (user_id, notification_type, title, is_read, created_by)
+                SELECT :user_id, 'COMMENT_ADDED', 'bench ' || g, g % 2 = 0, :user_id
+                FROM generate_series(1, :notifications) AS g
+                """
+            ),
+            {"user_id": user_id, "notifications": notifications},
+        )
+        db.commit()
+        db.execute(text("ANALYZE notifications"))
+        db.commit()
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.notifications:
+        print(f"알림 {args.notifications}개 생성 중...")
+        seed(args.notifications, BENCH_USER_ID)
+
+    token = generate_token(BENCH_USER_ID)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=limits,
+        timeout=60.0,
+    ) as client:
+        paths = ["/api/notifications/unread-count"]
+        print(f"unread_count = {(await client.get(paths[0])).json()['unread_count']}")
+
+        # 워밍업 (캐시 채우기)
+        await run_load(client, paths, args.concurrency, args.concurrency)
+        result = await run_load(client, paths, args.requests, args.concurrency)
+
+    print("=" * 80)
+    print(f"동시성: {args.concurrency}, 요청 수: {args.requests}")
+    print(f"{'req/s':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'errors':>8}")
+    print(
+        f"{result['rps']:>10.1f}{result['p50']:>10.1f}"
+        f"{result['p95']:>10.1f}{result['p99']:>10.1f}{result['errors']:>8}"
+    )
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="unread-count 부하 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Kanban 서버 주소")
+    parser.add_argument("--notifications", type=int, default=100_000, help="생성할 알림 수 (0이면 생성 생략)")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수 (기본값: 50)")
+    parser.add_argument("--requests", type=int, default=3000, help="요청 수 (기본값: 3000)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+UserServiceClient 일괄 조회 벤치마크
+
+User Service를 흉내내는 로컬 스텁 서버(응답 지연 설정 가능)를 같은 프로세스에서
+띄우고, 사용자 N명 조회 지연 시간을 세 가지 방식으로 비교합니다.
+
+- 기존 방식: 요청마다 httpx.AsyncClient 생성, 순차 조회
+- 공유 커넥션 풀 + 동시성 제한 gather
+- 일괄 조회 API 한 번 호출
+
+사용법:
+    python scripts/benchmarks/bench_user_client.py
+    python scripts/benchmarks/bench_user_client.py --users 100 --latency-ms 20 --concurrency 10
+"""
+import sys
+import os
+import time
+import asyncio
+import argparse
+import statistics
+from uuid import UUID, uuid4
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from app.clients.user_client import UserServiceClient
+
+
+def create_stub_app(latency: float) -> FastAPI:
+    """User Service 스텁 (단건 조회 / 일괄 조회)"""
+    stub = FastAPI()
+
+    @stub.get("/api/users/{user_id}")
+    async def get_user(user_id: UUID):
+        await asyncio.sleep(latency)
+        return {"id": str(user_id), "name": f"user-{user_id}"}
+
+    @stub.post("/api/users/bulk")
+    async def get_users(body: dict):
+        await asyncio.sleep(latency)
+        return [{"id": user_id, "name": f"user-{user_id}"} for user_id in body["user_ids"]]
+
+    return stub
+
+
+async def fetch_per_call_sequential(base_url: str, user_ids: list[UUID], token: str) -> int:
+    """기존 구현: 요청마다 새 클라이언트, 순차 조회"""
+    results = {}
+    for user_id in user_ids:
+        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
+            response = await client.get(
+                f"{base_url}/api/users/{user_id}",
+                headers={"Authorization": f"Bearer {token}"}
+            )
+            if response.status_code == 200:
+                results[user_id] = response.json()
+    return len(results)
+
+
+async def measure(fn, rounds: int) -> tuple[float, float]:
+    """rounds회 실행한 지연 시간 (p50, max) ms"""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), max(timings)
+
+
+async def main(args: argparse.Namespace) -> None:
+    server = uvicorn.Server(uvicorn.Config(
+        create_stub_app(args.latency_ms / 1000),
+        port=args.port,
+        log_level="warning",
+        access_log=False,
+    ))
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    user_ids = [uuid4() for _ in range(args.users)]
+    token = "bench-token"
+
+    pooled = UserServiceClient(base_url=base_url, bulk_concurrency=args.concurrency)
+    batched = UserServiceClient(base_url=base_url, bulk_path="/api/users/bulk")
+    await pooled.start()
+    await batched.start()
+
+    async def run_pooled():
+        assert len(await pooled.get_users_bulk(user_ids, token)) == args.users
+
+    async def run_batched():
+        assert len(await batched.get_users_bulk(user_ids, token)) == args.users
+
+    async def run_baseline():
+        assert await fetch_per_call_sequential(base_url, user_ids, token) == args.users
+
+    rows = [
+        ("per-call client, sequential", await measure(run_baseline, args.rounds)),
+        (f"pooled, gather (<= {args.concurrency})", await measure(run_pooled, args.rounds)),
+        ("pooled, bulk endpoint", await measure(run_batched, args.rounds)),
+    ]
+
+    await pooled.close()
+    await batched.close()
+    server.should_exit = True
+    await server_task
+
+    print("=" * 80)
+    print(f"사용자 {args.users}명, 스텁 응답 지연 {args.latency_ms}ms, {args.rounds}회 반복")
+    print(f"{'방식':<36}{'p50(ms)':>12}{'max(ms)':>12}")
+    for name, (p50, worst) in rows:
+        print(f"{name:<36}{p50:>12.1f}{worst:>12.1f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UserServiceClient 일괄 조회 벤치마크")
+    parser.add_argument("--users", type=int, default=100, help="조회할 사용자 수 (기본값: 100)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="스텁 응답 지연 (기본값: 20ms)")
+    parser.add_argument("--concurrency", type=int, default=10, help="gather 동시 요청 수 (기본값: 10)")
+    parser.add_argument("--rounds", type=int, default=5, help="반복 횟수 (기본값: 5)")
+    parser.add_argument("--port", type=int, default=18080, help="스텁 서버 포트")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Ticket/Task/댓글 대량 가져오기 스크립트
+
+NDJSON 또는 CSV 파일을 읽어 Project에 COPY로 적재합니다 (형식은 app.services.ticket_import 참고).
+POST /api/projects/{id}/import와 같은 파이프라인이며, 요청 시간 제한 없이 대용량 파일을 처리할 수 있습니다.
+
+사용법:
+    python scripts/import_tickets.py export.ndjson --project-id <project_id>
+    python scripts/import_tickets.py export.csv --project-id <project_id> --user-id <user_id>
+"""
+import sys
+import os
+import json
+import asyncio
+import argparse
+from uuid import UUID
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.models import Project
+from app.services.ticket_import import ImportAbortedError, aiter_lines, import_records, read_records
+
+# 파일 읽기 단위 (바이트)
+READ_SIZE = 1024 * 1024
+
+
+async def read_file(path: str):
+    with open(path, "rb") as f:
+        while chunk := f.read(READ_SIZE):
+            yield chunk
+
+
+async def main(args: argparse.Namespace) -> int:
+    import_format = args.format or ("csv" if args.file.lower().endswith(".csv") else "ndjson")
+    try:
+        async with AsyncSessionLocal() as db:
+            project = await db.get(Project, args.project_id)
+            if not project or project.is_deleted:
+                print(f"Project {args.project_id} not found", file=sys.stderr)
+                return 1
+            user_id = args.user_id or project.created_by
+            records = read_records(aiter_lines(read_file(args.file)), import_format)
+            result = await import_records(db, args.project_id, user_id, records, chunk_size=args.chunk_size)
+    except ImportAbortedError as exc:
+        print(f"Import aborted, nothing was imported: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        await async_engine.dispose()
+
+    print(json.dumps(result, default=str, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ticket/Task/댓글 대량 가져오기")
+    parser.add_argument("file", help="NDJSON 또는 CSV 파일 경로")
+    parser.add_argument("--project-id", type=UUID, required=True, help="가져올 Project ID")
+    parser.add_argument("--user-id", type=UUID, help="created_by로 기록할 사용자 (기본값: Project 생성자)")
+    parser.add_argument("--format", choices=["ndjson", "csv"], help="입력 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--chunk-size", type=int, help="한 번에 COPY할 레코드 수 (기본값: IMPORT_CHUNK_SIZE)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+변경 동기화 삭제 기록 정리 스크립트
+
+보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)이 지난 sync_tombstones 행을 삭제합니다.
+그보다 오래된 토큰은 GET /api/projects/{id}/changes에서 이미 410으로 거부되므로 더 이상 필요 없습니다.
+(CronJob 등으로 하루 한 번 실행)
+
+사용법:
+    python scripts/purge_sync_tombstones.py
+    python scripts/purge_sync_tombstones.py --retention-days 7
+"""
+import sys
+import os
+import asyncio
+import argparse
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.services.project_changes import purge_tombstones
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as db:
+        deleted = await purge_tombstones(db, args.retention_days)
+    await async_engine.dispose()
+    print(f"Purged {deleted} sync tombstones")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="변경 동기화 삭제 기록 정리")
+    parser.add_argument("--retention-days", type=int, help="보관 기간 (기본값: SYNC_TOMBSTONE_RETENTION_DAYS)")
+    asyncio.run(main(parser.parse_args()))
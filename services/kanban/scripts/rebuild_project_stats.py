@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+프로젝트 대시보드 집계 재계산 스크립트
+
+project_ticket_stats를 tickets에서 다시 집계합니다.
+(직접 SQL로 Ticket을 수정했거나 장애로 집계 갱신이 누락된 경우)
+
+사용법:
+    python scripts/rebuild_project_stats.py
+    python scripts/rebuild_project_stats.py --project-id <project_id>
+"""
+import sys
+import os
+import asyncio
+import argparse
+from uuid import UUID
+
+from sqlalchemy import select
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.models import Project
+from app.services.project_stats import rebuild_project_stats
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as db:
+        if args.project_id:
+            project_ids = [args.project_id]
+        else:
+            project_ids = (await db.scalars(select(Project.id).order_by(Project.id))).all()
+
+        # Project 단위로 커밋하여 잠금 시간을 짧게 유지
+        for project_id in project_ids:
+            await rebuild_project_stats(db, project_id)
+    await async_engine.dispose()
+    print(f"Rebuilt ticket stats for {len(project_ids)} projects")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="프로젝트 대시보드 집계 재계산")
+    parser.add_argument("--project-id", type=UUID, help="재계산할 Project (기본값: 전체)")
+    asyncio.run(main(parser.parse_args()))
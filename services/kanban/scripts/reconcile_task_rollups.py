@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Ticket별 Task 진행 요약 보정 스크립트
+
+tickets.task_count_* 카운터를 Task 테이블에서 다시 집계하여 어긋난 Ticket만 수정합니다.
+(직접 SQL로 Task를 수정했거나 장애로 카운터 갱신이 누락된 경우)
+
+사용법:
+    python scripts/reconcile_task_rollups.py
+    python scripts/reconcile_task_rollups.py --project-id <project_id>
+    python scripts/reconcile_task_rollups.py --batch-size 5000
+"""
+import sys
+import os
+import asyncio
+import argparse
+from uuid import UUID
+
+# 프로젝트 루트를 PYTHONPATH에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.services.task_rollup import reconcile_task_rollups
+
+
+async def main(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as db:
+        corrected = await reconcile_task_rollups(db, args.project_id, args.batch_size)
+    await async_engine.dispose()
+    print(f"Corrected task rollups on {corrected} tickets")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ticket별 Task 진행 요약 보정")
+    parser.add_argument("--project-id", type=UUID, help="보정할 Project (기본값: 전체)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="배치당 Ticket 수 (기본값: 1000)")
+    asyncio.run(main(parser.parse_args()))
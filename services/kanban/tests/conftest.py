@@ -2,13 +2,23 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import NullPool
 from uuid import UUID
 import os
+import fakeredis
+from fakeredis import aioredis as fake_aioredis
+
+# 테스트에서는 N+1 / 느린 쿼리 감지를 켬 (app 설정을 읽기 전에 지정)
+os.environ.setdefault("QUERY_DETECTOR_ENABLED", "true")
 
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_db, to_async_url
 from app.models import Workspace, Project, Ticket, Task
 from app.auth import get_current_user_id
+from app.redis_client import get_redis
+from app.metrics import instrument_engine
+from app.query_detector import collect_violations, install_query_detector
 
 # PostgreSQL 테스트 DB 설정
 KANBAN_DB_HOST = os.getenv("KANBAN_DB_HOST", "localhost")
@@ -29,6 +39,22 @@ engine = create_engine(
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# API 요청용 비동기 엔진 (TestClient는 테스트마다 이벤트 루프가 바뀌므로 커넥션 풀 미사용)
+async_engine = create_async_engine(
+    to_async_url(SQLALCHEMY_TEST_DATABASE_URL),
+    poolclass=NullPool
+)
+
+# 앱 엔진과 같이 요청별 SQL 문 수 / DB 시간 측정 (app.metrics)
+instrument_engine(async_engine)
+install_query_detector(async_engine)
+
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # 테스트용 user_id
 TEST_USER_ID = UUID('12345678-1234-5678-1234-567812345678')
 
@@ -50,24 +76,63 @@ def db():
         Base.metadata.drop_all(bind=engine)
 
 @pytest.fixture(scope="function")
-def client(db):
-    def override_get_db():
-        try:
-            yield db
-        finally:
-            pass
+def redis_server():
+    """테스트마다 격리된 인메모리 Redis 서버"""
+    return fakeredis.FakeServer()
+
+@pytest.fixture(scope="function")
+def redis(redis_server):
+    """테스트 코드에서 Redis 상태를 확인하기 위한 동기 클라이언트"""
+    return fakeredis.FakeRedis(server=redis_server, decode_responses=True)
+
+@pytest.fixture(scope="function")
+def client(db, redis_server):
+    async def override_get_db():
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
 
     # startup/shutdown event handlers 제거 (테스트 환경)
     app.router.on_startup = []
     app.router.on_shutdown = []
 
+    async_redis = fake_aioredis.FakeRedis(server=redis_server, decode_responses=True)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_redis] = lambda: async_redis
     app.dependency_overrides[get_current_user_id] = override_get_current_user_id
 
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
+@pytest.fixture(scope="function")
+def query_log():
+    """API 요청이 실행한 SQL 문 기록 (쿼리 수 검증용)"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+
+@pytest.fixture(autouse=True)
+def query_detector(request):
+    """
+    API 요청이 SQL 문 수 기준을 넘거나 같은 형태의 SQL을 반복(N+1)하면 테스트 실패
+
+    느린 SQL은 실행 환경에 따라 달라지므로 경고 로그만 남깁니다.
+    많은 SQL이 의도된 테스트는 @pytest.mark.allow_query_violations로 제외합니다.
+    """
+    with collect_violations() as violations:
+        yield violations
+    failures = [violation for violation in violations if violation.kind != "slow"]
+    if failures and not request.node.get_closest_marker("allow_query_violations"):
+        pytest.fail("\n\n".join(violation.describe() for violation in failures), pytrace=False)
+
 @pytest.fixture(scope="function")
 def sample_workspace(db):
     workspace = Workspace(
@@ -120,6 +185,77 @@ def sample_task(db, sample_ticket):
         created_by=TEST_USER_ID
     )
     db.add(task)
+    sample_ticket.task_count_todo += 1
     db.commit()
     db.refresh(task)
     return task
+
+def build_project_tree(db, workspace_id, tickets=3, tasks_per_ticket=2, user_id=TEST_USER_ID):
+    """
+    삭제 CASCADE 테스트용 Project 하위 데이터 생성
+
+    ticket type, role, member, ticket/task, 멤버, 댓글, 첨부파일, 알림, 대시보드 집계를 모두 포함합니다.
+    """
+    from app.models import (
+        ProjectRole, ProjectMember, TicketMember, TaskMember,
+        TicketType, Comment, Attachment, Notification, ProjectTicketStat
+    )
+    from app.models.enums import (
+        TargetType, TicketParticipationType, TaskParticipationType, NotificationType
+    )
+
+    project = Project(name="Tree Project", workspace_id=workspace_id, created_by=user_id)
+    db.add(project)
+    db.flush()
+
+    role = ProjectRole(project_id=project.id, role_name="ADMIN", created_by=user_id)
+    db.add(role)
+    db.flush()
+    db.add(ProjectMember(project_id=project.id, user_id=user_id, role_id=role.id, created_by=user_id))
+    ticket_type = TicketType(project_id=project.id, type_name="Bug", created_by=user_id)
+    db.add(ticket_type)
+    db.flush()
+
+    def attach(target_type, target_id):
+        comment = Comment(target_type=target_type, target_id=target_id, author_id=user_id,
+                          content="댓글", created_by=user_id)
+        db.add(comment)
+        db.add(Attachment(target_type=target_type, target_id=target_id, file_name="a.png",
+                          file_path="/files/a.png", created_by=user_id))
+        db.flush()
+        db.add(Notification(user_id=user_id, notification_type=NotificationType.COMMENT_ADDED,
+                            title="댓글", target_type="COMMENT", target_id=comment.id, created_by=user_id))
+        db.add(Notification(user_id=user_id, notification_type=NotificationType.MENTION,
+                            title="멘션", target_type=target_type.value, target_id=target_id, created_by=user_id))
+
+    attach(TargetType.PROJECT, project.id)
+    for i in range(tickets):
+        ticket = Ticket(title=f"Ticket {i}", project_id=project.id, ticket_type_id=ticket_type.id,
+                        task_count_todo=tasks_per_ticket, created_by=user_id)
+        db.add(ticket)
+        db.flush()
+        db.add(TicketMember(ticket_id=ticket.id, user_id=user_id,
+                            participation_type=TicketParticipationType.WATCHER, created_by=user_id))
+        attach(TargetType.TICKET, ticket.id)
+        for j in range(tasks_per_ticket):
+            task = Task(title=f"Task {i}-{j}", ticket_id=ticket.id, created_by=user_id)
+            db.add(task)
+            db.flush()
+            db.add(TaskMember(task_id=task.id, user_id=user_id,
+                              participation_type=TaskParticipationType.ASSIGNEE, created_by=user_id))
+            attach(TargetType.TASK, task.id)
+    db.add(ProjectTicketStat(project_id=project.id, dimension="status", key="OPEN", count=tickets))
+
+    db.commit()
+    return project
+
+def count_rows(db):
+    """테이블별 행 수"""
+    from sqlalchemy import text
+    db.expire_all()
+    tables = [
+        "projects", "tickets", "tasks", "ticket_members", "task_members", "ticket_types",
+        "project_members", "project_roles", "comments", "attachments", "notifications",
+        "project_ticket_stats"
+    ]
+    return {table: db.execute(text(f"SELECT count(*) FROM {table}")).scalar() for table in tables}
@@ -0,0 +1,77 @@
+import asyncio
+
+import fakeredis
+import pytest
+from fakeredis import aioredis as fake_aioredis
+from fastapi import status
+
+from app.api import health
+from app.config import settings
+from app.services.readiness import ReadinessMonitor
+from tests.conftest import async_engine
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monitor = ReadinessMonitor()
+    monkeypatch.setattr(health, "readiness_monitor", monitor)
+    return monitor
+
+
+def test_ready_before_first_check(client, monitor):
+    """첫 확인 전에는 not_ready"""
+    response = client.get("/health/ready")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()["stale"] is True
+    assert response.json()["checked_at"] is None
+
+
+def test_ready_returns_cached_result(client, monitor, redis_server, query_log):
+    """probe는 DB / Redis에 접근하지 않고 마지막 확인 결과와 경과 시간을 반환"""
+    redis = fake_aioredis.FakeRedis(server=redis_server)
+    asyncio.run(monitor.refresh(async_engine, redis))
+
+    query_log.clear()
+    response = client.get("/health/ready")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["checks"] == {"database": "healthy", "redis": "healthy"}
+    assert data["stale"] is False
+    assert 0 <= data["age_seconds"] < settings.READINESS_STALE_AFTER
+    assert query_log == []
+
+
+def test_not_ready_when_dependency_down(client, monitor):
+    server = fakeredis.FakeServer()
+    server.connected = False
+    asyncio.run(monitor.refresh(async_engine, fake_aioredis.FakeRedis(server=server)))
+
+    response = client.get("/health/ready")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    data = response.json()
+    assert data["status"] == "not_ready"
+    assert data["checks"]["database"] == "healthy"
+    assert data["checks"]["redis"].startswith("unhealthy")
+
+
+def test_not_ready_when_result_stale(client, monitor, redis_server, monkeypatch):
+    """확인 태스크가 멈춰 결과가 오래되면 not_ready"""
+    asyncio.run(monitor.refresh(async_engine, fake_aioredis.FakeRedis(server=redis_server)))
+    monkeypatch.setattr(settings, "READINESS_STALE_AFTER", 0)
+
+    response = client.get("/health/ready")
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.json()["stale"] is True
+
+
+def test_slow_dependency_times_out(monitor, monkeypatch):
+    """응답 없는 의존성은 타임아웃 후 unhealthy (확인 주기가 밀리지 않음)"""
+    class HangingRedis:
+        async def ping(self):
+            await asyncio.sleep(10)
+
+    monkeypatch.setattr(settings, "READINESS_CHECK_TIMEOUT", 0.05)
+    checks = asyncio.run(monitor.refresh(async_engine, HangingRedis()))
+    assert checks["redis"] == "unhealthy: timed out after 0.05s"
+    assert checks["database"] == "healthy"
@@ -0,0 +1,125 @@
+"""
+목록 API 실행 계획 검증
+
+목록 API가 실제로 실행한 페이지 쿼리(ORDER BY ... LIMIT)를 같은 파라미터로 EXPLAIN하여
+쿼리 형태에 맞는 인덱스를 순서대로 읽는지(Seq Scan / Sort 없음) 확인합니다.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import event, text
+
+from tests.conftest import TEST_USER_ID, async_engine
+
+
+@pytest.fixture
+def seeded(db, sample_workspace, sample_project):
+    """
+    플래너가 인덱스를 고를 만한 크기의 데이터
+
+    Workspace 2,000 / Project 5,000 (10% 삭제 대기) / Ticket 20,000 (Project 20개) /
+    Task 20,000 (Ticket 100개) / 알림 20,000 (현재 사용자 2,000개 중 500개 안읽음)
+    """
+    params = {"workspace_id": sample_workspace.id, "project_id": sample_project.id, "user_id": TEST_USER_ID}
+    statements = [
+        """
+        INSERT INTO workspaces (name, created_by, created_at)
+        SELECT 'Workspace ' || g, :user_id, now() - g * interval '1 minute' FROM generate_series(1, 2000) g
+        """,
+        """
+        INSERT INTO projects (name, workspace_id, status, priority, is_deleted, created_by, created_at)
+        SELECT 'Project ' || g, CASE WHEN g % 10 = 0 THEN :workspace_id ELSE gen_random_uuid() END,
+               'ACTIVE', 'MEDIUM', g % 10 = 1, :user_id, now() - g * interval '1 minute'
+        FROM generate_series(1, 5000) g
+        """,
+        """
+        INSERT INTO tickets (project_id, title, status, priority, is_deleted, created_by, created_at)
+        SELECT CASE WHEN g % 20 = 0 THEN :project_id ELSE (md5((g % 20)::text))::uuid END, 'Ticket ' || g,
+               (ARRAY['OPEN', 'IN_PROGRESS', 'REVIEW', 'DONE'])[g / 20 % 4 + 1]::ticketstatus,
+               'MEDIUM', false, :user_id, now() - g * interval '1 minute'
+        FROM generate_series(1, 20000) g
+        """,
+        """
+        WITH picked AS (SELECT id FROM tickets WHERE project_id = :project_id ORDER BY id LIMIT 100)
+        INSERT INTO tasks (ticket_id, title, status, is_deleted, created_by, created_at)
+        SELECT id, 'Task ' || g, 'TODO', false, :user_id, now() - g * interval '1 minute'
+        FROM picked, generate_series(1, 200) g
+        """,
+        """
+        INSERT INTO notifications (user_id, notification_type, title, is_read, created_by, created_at)
+        SELECT CASE WHEN g % 10 = 0 THEN :user_id ELSE gen_random_uuid() END, 'TICKET_UPDATED',
+               'Notification ' || g, g % 40 <> 0, :user_id, now() - g * interval '1 minute'
+        FROM generate_series(1, 20000) g
+        """,
+    ]
+    for statement in statements:
+        db.execute(text(statement), params)
+    db.commit()
+    db.connection().exec_driver_sql("ANALYZE")
+    db.commit()
+
+    ticket_id = db.scalar(text("SELECT ticket_id FROM tasks LIMIT 1"))
+    return {"workspace_id": sample_workspace.id, "project_id": sample_project.id, "ticket_id": ticket_id}
+
+
+def page_query_plan(client, url: str) -> dict:
+    """GET 요청이 실행한 페이지 쿼리(ORDER BY ... LIMIT)의 실행 계획 (EXPLAIN FORMAT JSON)"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", record)
+    assert response.status_code == 200, response.text
+
+    pages = [(statement, parameters) for statement, parameters in executed
+             if "ORDER BY" in statement and "LIMIT" in statement]
+    assert len(pages) == 1, [statement for statement, _ in executed]
+    statement, parameters = pages[0]
+
+    async def explain():
+        async with async_engine.connect() as conn:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            return result.scalar()
+
+    return asyncio.run(explain())[0]["Plan"]
+
+
+def plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def assert_ordered_index_scan(plan: dict, index_name: str):
+    nodes = list(plan_nodes(plan))
+    node_types = [node["Node Type"] for node in nodes]
+    assert "Seq Scan" not in node_types, node_types
+    assert "Sort" not in node_types, node_types
+    assert index_name in [node.get("Index Name") for node in nodes], nodes
+
+
+@pytest.mark.parametrize("url, index_name", [
+    ("/api/tickets/?project_id={project_id}", "ix_tickets_project_id_created_at_id"),
+    ("/api/tickets/?project_id={project_id}&status=IN_PROGRESS", "ix_tickets_project_id_status_created_at_id"),
+    ("/api/tasks/?ticket_id={ticket_id}", "ix_tasks_ticket_id_created_at_id"),
+    ("/api/notifications/", "ix_notifications_user_id_created_at_id"),
+    ("/api/notifications/?is_read=false", "ix_notifications_user_id_created_at_id_unread"),
+    ("/api/projects/", "ix_projects_created_at_id_live"),
+    ("/api/projects/?workspace_id={workspace_id}", "ix_projects_workspace_id_created_at_id"),
+    ("/api/workspaces/", "ix_workspaces_created_at_id"),
+])
+def test_list_endpoints_use_index_scan(client, seeded, url, index_name):
+    """목록 API 첫 페이지와 cursor 다음 페이지가 모두 쿼리 형태에 맞는 인덱스를 사용"""
+    url = url.format(**seeded)
+    separator = "&" if "?" in url else "?"
+    url = f"{url}{separator}include_total=false"
+    assert_ordered_index_scan(page_query_plan(client, url), index_name)
+
+    next_cursor = client.get(url).json()["next_cursor"]
+    assert next_cursor
+    assert_ordered_index_scan(page_query_plan(client, f"{url}&cursor={next_cursor}"), index_name)
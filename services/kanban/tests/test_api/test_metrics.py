@@ -0,0 +1,91 @@
+import asyncio
+import json
+import logging
+
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.database import to_async_url
+from app.logging_config import JSONFormatter
+from app.metrics import CheckoutTimedPool
+from tests.conftest import SQLALCHEMY_TEST_DATABASE_URL
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_request_metrics_by_route(client, sample_project, query_log):
+    """route 템플릿별로 요청 시간, SQL 문 수, DB 시간을 기록"""
+    route = {"method": "GET", "route": "/api/projects/{project_id}"}
+    requests_before = sample("kanban_http_request_duration_seconds_count", status="200", **route)
+    statements_before = sample("kanban_http_request_db_statements_sum", **route)
+    db_time_before = sample("kanban_http_request_db_duration_seconds_sum", **route)
+
+    response = client.get(f"/api/projects/{sample_project.id}")
+    assert response.status_code == 200
+
+    assert sample("kanban_http_request_duration_seconds_count", status="200", **route) == requests_before + 1
+    assert sample("kanban_http_request_db_statements_sum", **route) == statements_before + len(query_log)
+    assert sample("kanban_http_request_db_duration_seconds_sum", **route) > db_time_before
+
+
+def test_unmatched_route_label(client):
+    """라우트가 없는 경로는 경로 대신 unmatched 라벨 하나로 모음"""
+    before = sample("kanban_http_request_duration_seconds_count", method="GET", route="unmatched", status="404")
+    assert client.get("/api/no-such-path/123").status_code == 404
+    assert sample(
+        "kanban_http_request_duration_seconds_count", method="GET", route="unmatched", status="404"
+    ) == before + 1
+
+
+def test_metrics_endpoint(client, sample_project):
+    """GET /metrics는 Prometheus 텍스트 형식"""
+    client.get(f"/api/projects/{sample_project.id}")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'kanban_http_request_duration_seconds_bucket{le="0.005",method="GET",route="/api/projects/{project_id}"' \
+        in response.text
+    assert "kanban_db_pool_checkout_wait_seconds_count" in response.text
+
+
+def test_request_log_fields(client, sample_project, query_log, caplog):
+    """요청 완료 로그에 지표 값을 필드로 남기고 JSON 로그에 그대로 포함"""
+    with caplog.at_level(logging.INFO, logger="app.metrics"):
+        client.get(f"/api/projects/{sample_project.id}")
+
+    record = next(record for record in caplog.records if record.name == "app.metrics")
+    assert record.route == "/api/projects/{project_id}"
+    assert record.status == 200
+    assert record.db_statements == len(query_log)
+
+    log = json.loads(JSONFormatter().format(record))
+    assert log["route"] == "/api/projects/{project_id}"
+    assert log["db_statements"] == len(query_log)
+    assert {"duration_ms", "db_time_ms", "pool_wait_ms", "upstream_ms"} <= log.keys()
+
+
+def test_pool_checkout_wait():
+    """풀이 가득 차면 반납을 기다린 시간이 checkout 대기로 기록됨"""
+    engine = create_async_engine(
+        to_async_url(SQLALCHEMY_TEST_DATABASE_URL), poolclass=CheckoutTimedPool, pool_size=1, max_overflow=0
+    )
+
+    async def hold_and_wait():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            waiter = asyncio.create_task(engine.connect().__aenter__())
+            await asyncio.sleep(0.05)
+        conn = await waiter
+        await conn.close()
+        await engine.dispose()
+
+    count_before = sample("kanban_db_pool_checkout_wait_seconds_count")
+    slow_before = sample("kanban_db_pool_checkout_wait_seconds_bucket", le="0.01")
+    asyncio.run(hold_and_wait())
+
+    assert sample("kanban_db_pool_checkout_wait_seconds_count") == count_before + 2
+    # 두 번째 checkout은 첫 커넥션 반납까지 약 50ms 대기
+    assert sample("kanban_db_pool_checkout_wait_seconds_bucket", le="0.01") - slow_before <= 1
@@ -0,0 +1,228 @@
+import asyncio
+import json
+import random
+from fastapi import status
+from uuid import UUID
+from sqlalchemy import func, select
+from fakeredis import aioredis as fake_aioredis
+from app.models import Notification
+from app.api import notifications as notifications_api
+from app.services.notification_counter import unread_key, reconcile_unread_counts
+from app.services.notification_stream import (
+    NOTIFICATION_EVENTS_CHANNEL,
+    OVERFLOW,
+    NotificationBroker,
+    format_sse,
+    notification_event_stream,
+)
+from tests.conftest import TEST_USER_ID, TestingAsyncSessionLocal
+
+def create_notification(client, user_id=TEST_USER_ID, title="새 댓글"):
+    response = client.post(
+        "/api/notifications/",
+        json={
+            "user_id": str(user_id),
+            "notification_type": "COMMENT_ADDED",
+            "title": title
+        }
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()
+
+def db_unread_count(db, user_id=TEST_USER_ID):
+    db.expire_all()
+    return db.scalar(
+        select(func.count(Notification.id)).where(
+            Notification.user_id == user_id,
+            Notification.is_read == False
+        )
+    )
+
+def test_create_notification_success(client):
+    """알림 생성 성공"""
+    data = create_notification(client)
+    assert data["user_id"] == str(TEST_USER_ID)
+    assert data["is_read"] is False
+
+def test_unread_count_cached_after_first_read(client, redis):
+    """첫 조회 시 DB에서 계산하여 Redis에 저장"""
+    create_notification(client)
+    assert redis.get(unread_key(TEST_USER_ID)) is None
+
+    response = client.get("/api/notifications/unread-count")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["unread_count"] == 1
+    assert redis.get(unread_key(TEST_USER_ID)) == "1"
+
+def test_unread_count_write_through(client, redis):
+    """생성/읽음/삭제 시 캐시 값 갱신"""
+    client.get("/api/notifications/unread-count")
+    first = create_notification(client)
+    second = create_notification(client)
+    assert redis.get(unread_key(TEST_USER_ID)) == "2"
+
+    client.patch(f"/api/notifications/{first['id']}/read")
+    assert redis.get(unread_key(TEST_USER_ID)) == "1"
+
+    client.delete(f"/api/notifications/{second['id']}")
+    assert redis.get(unread_key(TEST_USER_ID)) == "0"
+
+def test_mark_all_read_invalidates_cache(client, redis):
+    """모두 읽음 처리 후 캐시를 비우고 다음 조회 시 재구성"""
+    create_notification(client)
+    client.get("/api/notifications/unread-count")
+
+    response = client.post("/api/notifications/mark-all-read")
+    assert response.json()["count"] == 1
+    assert redis.get(unread_key(TEST_USER_ID)) is None
+    assert client.get("/api/notifications/unread-count").json()["unread_count"] == 0
+
+def test_list_notifications_unread_count(client):
+    """목록 응답의 unread_count"""
+    create_notification(client)
+    create_notification(client, user_id=UUID('00000000-0000-0000-0000-000000000002'))
+
+    data = client.get("/api/notifications/").json()
+    assert data["total"] == 1
+    assert data["unread_count"] == 1
+
+def test_unread_count_consistency_random_operations(client, db, redis):
+    """무작위 작업 순서에서 캐시 값이 항상 DB COUNT와 일치"""
+    rng = random.Random(42)
+    notification_ids = []
+
+    for step in range(60):
+        operation = rng.choice(["create", "create", "read", "delete", "mark_all", "evict"])
+        if operation == "create":
+            notification_ids.append(create_notification(client, title=f"알림 {step}")["id"])
+        elif operation == "read" and notification_ids:
+            client.patch(f"/api/notifications/{rng.choice(notification_ids)}/read")
+        elif operation == "delete" and notification_ids:
+            notification_id = notification_ids.pop(rng.randrange(len(notification_ids)))
+            client.delete(f"/api/notifications/{notification_id}")
+        elif operation == "mark_all":
+            client.post("/api/notifications/mark-all-read")
+        elif operation == "evict":
+            redis.delete(unread_key(TEST_USER_ID))
+
+        cached = client.get("/api/notifications/unread-count").json()["unread_count"]
+        assert cached == db_unread_count(db), f"step {step} ({operation})"
+
+async def test_reconcile_unread_counts_fixes_drift(db, redis_server):
+    """보정 작업이 어긋난 캐시 값을 DB 기준으로 되돌림"""
+    db.add(Notification(
+        user_id=TEST_USER_ID,
+        notification_type="MENTION",
+        title="멘션",
+        created_by=TEST_USER_ID
+    ))
+    db.commit()
+
+    async_redis = fake_aioredis.FakeRedis(server=redis_server, decode_responses=True)
+    await async_redis.set(unread_key(TEST_USER_ID), 7)
+
+    async with TestingAsyncSessionLocal() as async_db:
+        reconciled = await reconcile_unread_counts(async_redis, async_db)
+
+    assert reconciled == 1
+    assert await async_redis.get(unread_key(TEST_USER_ID)) == "1"
+
+def test_notification_events_published(client, redis):
+    """알림 생성/읽음 시 pub/sub 채널로 이벤트 발행"""
+    pubsub = redis.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(NOTIFICATION_EVENTS_CHANNEL)
+
+    created = create_notification(client, title="실시간")
+    client.patch(f"/api/notifications/{created['id']}/read")
+
+    # 구독 확인 메시지는 무시되어 None으로 반환되므로 여러 번 읽음
+    events = []
+    for _ in range(5):
+        message = pubsub.get_message(timeout=0.05)
+        if message is not None:
+            events.append(json.loads(message["data"]))
+    pubsub.close()
+
+    assert [(e["event"], e["data"].get("delta")) for e in events] == [
+        ("notification", None),
+        ("unread_count", 1),
+        ("unread_count", -1),
+    ]
+    assert events[0]["user_id"] == str(TEST_USER_ID)
+    assert events[0]["data"]["title"] == "실시간"
+
+def test_stream_sends_snapshot_then_events(client, monkeypatch):
+    """스트림 연결 시 unread_count 스냅샷 후 큐의 이벤트 전달, 종료 시 구독 해제"""
+    create_notification(client)
+    broker = NotificationBroker()
+    monkeypatch.setattr(notifications_api, "notification_broker", broker)
+
+    original_subscribe = broker.subscribe
+    def subscribe_with_events(user_id):
+        queue = original_subscribe(user_id)
+        broker.dispatch(user_id, "unread_count", {"delta": 1})
+        queue.put_nowait(OVERFLOW)
+        return queue
+    monkeypatch.setattr(broker, "subscribe", subscribe_with_events)
+
+    response = client.get("/api/notifications/stream")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        "retry: 3000\n\n"
+        + format_sse("unread_count", {"unread_count": 1})
+        + format_sse("unread_count", {"delta": 1})
+        + format_sse("resync", {})
+    )
+    assert broker.connection_count == 0
+
+def test_broker_routes_events_per_user():
+    """브로커는 해당 사용자의 연결에만 이벤트 분배"""
+    broker = NotificationBroker()
+    other_user_id = UUID('00000000-0000-0000-0000-000000000002')
+    first = broker.subscribe(TEST_USER_ID)
+    second = broker.subscribe(TEST_USER_ID)
+    other = broker.subscribe(other_user_id)
+
+    broker.handle_message(json.dumps({
+        "user_id": str(TEST_USER_ID), "event": "unread_count", "data": {"delta": 1}
+    }))
+    broker.handle_message("not json")
+
+    assert first.get_nowait() == ("unread_count", {"delta": 1})
+    assert second.get_nowait() == ("unread_count", {"delta": 1})
+    assert other.empty()
+
+    broker.unsubscribe(TEST_USER_ID, first)
+    broker.unsubscribe(TEST_USER_ID, second)
+    assert broker.connection_count == 1
+
+def test_broker_backpressure_forces_resync():
+    """큐가 가득 찬 느린 연결은 버퍼를 비우고 resync 표식만 받음"""
+    broker = NotificationBroker(queue_size=3)
+    queue = broker.subscribe(TEST_USER_ID)
+
+    for i in range(4):
+        broker.dispatch(TEST_USER_ID, "unread_count", {"delta": 1})
+
+    assert queue.qsize() == 1
+    assert queue.get_nowait() is OVERFLOW
+
+async def test_event_stream_heartbeat_and_disconnect():
+    """이벤트가 없으면 하트비트를 보내고, 연결이 끊기면 종료"""
+    class FakeRequest:
+        def __init__(self):
+            self.disconnected = False
+        async def is_disconnected(self):
+            return self.disconnected
+
+    request = FakeRequest()
+    queue = asyncio.Queue()
+    stream = notification_event_stream(request, queue, unread_count=0, heartbeat_interval=0.01)
+
+    assert await stream.__anext__() == "retry: 3000\n\n"
+    assert await stream.__anext__() == format_sse("unread_count", {"unread_count": 0})
+    assert await stream.__anext__() == ": ping\n\n"
+
+    request.disconnected = True
+    assert [chunk async for chunk in stream] == []
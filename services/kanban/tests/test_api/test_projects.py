@@ -1,6 +1,7 @@
 import pytest
 from fastapi import status
 from uuid import UUID
+from tests.conftest import build_project_tree, count_rows
 
 def test_create_project_success(client, sample_workspace):
     """Project 생성 성공 테스트"""
@@ -70,7 +71,454 @@ def test_update_project_success(client, sample_project):
     data = response.json()
     assert data["status"] == "COMPLETED"
 
+def test_project_etag(client, sample_project):
+    """Project 조회 304 / If-Match 불일치 412"""
+    etag = client.get(f"/api/projects/{sample_project.id}").headers["ETag"]
+    response = client.get(f"/api/projects/{sample_project.id}", headers={"If-None-Match": f"W/{etag}"})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = client.patch(f"/api/projects/{sample_project.id}", json={"name": "A"}, headers={"If-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    response = client.patch(f"/api/projects/{sample_project.id}", json={"name": "B"}, headers={"If-Match": etag})
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
 def test_delete_project_success(client, sample_project):
     """Project 삭제 성공 (Cascade로 하위 Ticket, Task 삭제)"""
     response = client.delete(f"/api/projects/{sample_project.id}")
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+def test_delete_project_cascades_only_its_children(client, db, sample_workspace):
+    """Project 삭제 시 해당 Project의 하위 데이터만 삭제"""
+    remaining = count_rows(db)
+    kept_id = build_project_tree(db, sample_workspace.id, tickets=1, tasks_per_ticket=1).id
+    remaining_with_kept = count_rows(db)
+    assert remaining_with_kept != remaining
+
+    project_id = build_project_tree(db, sample_workspace.id).id
+    response = client.delete(f"/api/projects/{project_id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    assert count_rows(db) == remaining_with_kept
+    assert client.get(f"/api/projects/{kept_id}").status_code == status.HTTP_200_OK
+    assert client.get(f"/api/projects/{project_id}").status_code == status.HTTP_404_NOT_FOUND
+
+def test_delete_project_in_background(client, db, redis_server, sample_workspace, monkeypatch):
+    """백그라운드 삭제 모드: 소프트 삭제 후 202, 워커 실행 후 하위 데이터 삭제"""
+    import asyncio
+    from fakeredis import aioredis as fake_aioredis
+    from app.config import settings
+    from app.services.deletion_jobs import process_next_job
+    from tests.conftest import TestingAsyncSessionLocal
+
+    monkeypatch.setattr(settings, "DELETION_JOBS_ENABLED", True)
+    remaining = count_rows(db)
+    project_id = build_project_tree(db, sample_workspace.id).id
+    before = count_rows(db)
+
+    response = client.delete(f"/api/projects/{project_id}")
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["target_type"] == "project"
+
+    # 워커 실행 전: 숨겨지지만 데이터는 남아 있음, 같은 요청은 같은 작업 반환
+    assert client.get(f"/api/projects/{project_id}").status_code == status.HTTP_404_NOT_FOUND
+    assert client.get("/api/projects/").json()["items"] == []
+    assert count_rows(db) == before
+    assert client.delete(f"/api/projects/{project_id}").json()["id"] == job["id"]
+
+    redis = fake_aioredis.FakeRedis(server=redis_server, decode_responses=True)
+    asyncio.run(process_next_job(redis, TestingAsyncSessionLocal))
+
+    assert count_rows(db) == remaining
+    response = client.get(f"/api/deletion-jobs/{job['id']}")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["status"] == "completed"
+    assert data["progress"] == 1.0
+    assert data["total_tickets"] == data["processed_tickets"] == 3
+    assert data["processed_projects"] == 1
+    assert data["deleted_rows"] == sum(before.values()) - sum(remaining.values())
+
+def test_get_project_board(client, db, sample_workspace, query_log):
+    """보드: TicketStatus별 컬럼, 티켓 타입, Ticket별 Task 요약을 고정된 쿼리 수로 반환"""
+    from app.models import Ticket, Task
+    from app.models.enums import TicketStatus
+
+    project = build_project_tree(db, sample_workspace.id, tickets=2, tasks_per_ticket=3)
+    project_id = project.id
+    tickets = db.query(Ticket).filter(Ticket.project_id == project_id).order_by(Ticket.created_at).all()
+    tickets[1].status = TicketStatus.DONE
+    done_ticket_id = tickets[1].id
+    db.commit()
+    task_id = db.query(Task).filter(Task.ticket_id == done_ticket_id).first().id
+    assert client.patch(f"/api/tasks/{task_id}/complete").status_code == status.HTTP_200_OK
+
+    query_log.clear()
+    response = client.get(f"/api/projects/{project_id}/board")
+    assert response.status_code == status.HTTP_200_OK
+    queries = len(query_log)
+
+    data = response.json()
+    assert data["project"]["id"] == str(project_id)
+    assert [t["type_name"] for t in data["ticket_types"]] == ["Bug"]
+    assert [c["status"] for c in data["columns"]] == [s.value for s in TicketStatus]
+
+    columns = {c["status"]: c for c in data["columns"]}
+    assert columns["OPEN"]["count"] == 1
+    assert columns["DONE"]["count"] == 1
+    assert columns["BLOCKED"]["tickets"] == []
+    done_ticket = columns["DONE"]["tickets"][0]
+    assert done_ticket["ticket_type_id"] == data["ticket_types"][0]["id"]
+    assert done_ticket["tasks"] == {
+        "total": 3,
+        "by_status": {"TODO": 2, "IN_PROGRESS": 0, "REVIEW": 0, "DONE": 1},
+    }
+
+    # Ticket이 늘어나도 쿼리 수는 그대로
+    for i in range(5):
+        ticket = client.post("/api/tickets/", json={"title": f"More {i}", "project_id": str(project_id)}).json()
+        client.post("/api/tasks/", json={"title": "t", "ticket_id": ticket["id"]})
+
+    query_log.clear()
+    response = client.get(f"/api/projects/{project_id}/board")
+    assert sum(c["count"] for c in response.json()["columns"]) == 7
+    assert response.json()["columns"][0]["tickets"][-1]["tasks"]["total"] == 1
+    assert len(query_log) == queries
+
+def test_get_project_board_not_found(client):
+    """존재하지 않는 Project 보드 조회 시 404"""
+    response = client.get("/api/projects/" + str(UUID('00000000-0000-0000-0000-000000000001')) + "/board")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+def test_get_project_stats(client, db, sample_project):
+    """대시보드 집계: Ticket 생성/수정/삭제가 요약 테이블에 반영되고 rebuild 결과와 일치"""
+    import asyncio
+    from datetime import date, timedelta
+    from app.models import Ticket
+    from app.services.project_stats import get_project_stats, rebuild_project_stats
+    from tests.conftest import TEST_USER_ID, TestingAsyncSessionLocal
+
+    project_id = sample_project.id
+    ids = [
+        client.post("/api/tickets/", json={"title": f"T{i}", "project_id": str(project_id)}).json()["id"]
+        for i in range(4)
+    ]
+    client.patch(f"/api/tickets/{ids[0]}", json={"status": "DONE", "priority": "HIGH"})
+    client.patch(f"/api/tickets/{ids[1]}", json={"assignee_id": str(TEST_USER_ID)})
+    assert client.delete(f"/api/tickets/{ids[2]}").status_code == status.HTTP_204_NO_CONTENT
+
+    response = client.get(f"/api/projects/{project_id}/stats")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] == 3
+    assert data["by_status"]["OPEN"] == 2
+    assert data["by_status"]["DONE"] == 1
+    assert data["by_status"]["BLOCKED"] == 0
+    assert data["by_priority"] == {"LOW": 0, "MEDIUM": 2, "HIGH": 1, "URGENT": 0}
+    assert data["by_assignee"] == {str(TEST_USER_ID): 1, "none": 2}
+    assert data["by_ticket_type"] == {"none": 3}
+
+    # 기한 초과: 미완료 Ticket만, 오늘 기준으로 계산
+    today = date.today()
+    for ticket_id, due_date in [(ids[0], today - timedelta(days=3)), (ids[1], today - timedelta(days=1)),
+                                (ids[3], today)]:
+        db.get(Ticket, ticket_id).due_date = due_date
+    db.commit()
+
+    async def rebuilt_stats(day):
+        async with TestingAsyncSessionLocal() as async_db:
+            await rebuild_project_stats(async_db, project_id)
+            return await get_project_stats(async_db, project_id, today=day)
+
+    stats = asyncio.run(rebuilt_stats(today))
+    assert (stats["overdue"], stats["due_today"]) == (1, 1)
+    stats = asyncio.run(rebuilt_stats(today + timedelta(days=1)))
+    assert (stats["overdue"], stats["due_today"]) == (2, 0)
+
+    # 증분 갱신: 완료 처리하면 기한 초과에서 빠짐
+    client.patch(f"/api/tickets/{ids[1]}", json={"status": "CLOSED"})
+    data = client.get(f"/api/projects/{project_id}/stats").json()
+    assert (data["overdue"], data["due_today"]) == (0, 1)
+    assert data["by_status"]["CLOSED"] == 1
+
+def test_get_project_stats_not_found(client):
+    """존재하지 않는 Project 집계 조회 시 404"""
+    response = client.get("/api/projects/" + str(UUID('00000000-0000-0000-0000-000000000001')) + "/stats")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+def sync_project(client, project_id, token, tickets, tasks, limit=5000):
+    """GET /changes를 has_more가 false일 때까지 반복하며 클라이언트 사본(id -> version) 갱신"""
+    received = 0
+    while True:
+        params = {"limit": limit, **({"since": token} if token else {})}
+        response = client.get(f"/api/projects/{project_id}/changes", params=params)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        for ticket in data["tickets"]:
+            tickets[ticket["id"]] = ticket["version"]
+        for task in data["tasks"]:
+            tasks[task["id"]] = (task["ticket_id"], task["version"])
+        for item in data["deleted"]:
+            if item["type"] == "ticket":
+                tickets.pop(item["id"], None)
+                for task_id in [task_id for task_id, (ticket_id, _) in tasks.items() if ticket_id == item["id"]]:
+                    del tasks[task_id]
+            else:
+                tasks.pop(item["id"], None)
+        received += len(data["tickets"]) + len(data["tasks"]) + len(data["deleted"])
+        token = data["next_token"]
+        if not data["has_more"]:
+            return token, received
+
+def test_get_project_changes(client, db, sample_project):
+    """since 토큰 이후 생성/수정/삭제만 전달하고, 페이지를 나눠도 누락이 없음"""
+    from datetime import datetime, timezone
+    from uuid import uuid4
+    from app.utils.pagination import encode_cursor
+
+    project_id = sample_project.id
+    # 픽스처의 열린 트랜잭션 종료 (진행 중인 트랜잭션보다 늦은 변경은 전달을 미룸)
+    db.rollback()
+
+    ticket_ids = [
+        client.post("/api/tickets/", json={"title": f"T{i}", "project_id": str(project_id)}).json()["id"]
+        for i in range(3)
+    ]
+    task_id = client.post("/api/tasks/", json={"title": "t", "ticket_id": ticket_ids[0]}).json()["id"]
+
+    tickets, tasks = {}, {}
+    token, received = sync_project(client, project_id, None, tickets, tasks, limit=1)
+    assert set(tickets) == set(ticket_ids)
+    assert set(tasks) == {task_id}
+    assert received == 4
+
+    # 변경 없음
+    response = client.get(f"/api/projects/{project_id}/changes", params={"since": token}).json()
+    assert response["tickets"] == response["tasks"] == response["deleted"] == []
+    assert response["has_more"] is False
+    assert response["next_token"] == token
+
+    client.patch(f"/api/tickets/{ticket_ids[1]}", json={"title": "changed"})
+    client.delete(f"/api/tasks/{task_id}")
+    client.delete(f"/api/tickets/{ticket_ids[2]}")
+    response = client.get(f"/api/projects/{project_id}/changes", params={"since": token}).json()
+    # Task 삭제로 ticket_ids[0]의 Task 요약도 바뀜
+    assert {ticket["id"] for ticket in response["tickets"]} == {ticket_ids[0], ticket_ids[1]}
+    assert response["tasks"] == []
+    assert [(item["type"], item["id"]) for item in response["deleted"]] == [
+        ("task", task_id), ("ticket", ticket_ids[2])
+    ]
+
+    response = client.get(f"/api/projects/{project_id}/changes", params={"since": "invalid"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    expired = encode_cursor(datetime(2000, 1, 1, tzinfo=timezone.utc), uuid4())
+    response = client.get(f"/api/projects/{project_id}/changes", params={"since": expired})
+    assert response.status_code == status.HTTP_410_GONE
+    response = client.get(f"/api/projects/{uuid4()}/changes")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+def test_project_changes_large_project_churn(client, db, sample_project):
+    """Ticket 50,000개 Project: 전체 동기화 후 1% 변경 시 변경분만 받아 사본이 서버와 일치"""
+    import random
+    from sqlalchemy import text
+    from tests.conftest import TEST_USER_ID
+
+    project_id = sample_project.id
+    params = {"project_id": project_id, "user_id": TEST_USER_ID}
+    db.execute(text(
+        """
+        INSERT INTO tickets (project_id, title, status, priority, is_deleted, created_by)
+        SELECT :project_id, 'Ticket ' || g, 'OPEN', 'MEDIUM', false, :user_id FROM generate_series(1, 50000) g
+        """
+    ), params)
+    db.execute(text(
+        """
+        WITH picked AS (SELECT id FROM tickets WHERE project_id = :project_id ORDER BY id LIMIT 5000)
+        INSERT INTO tasks (ticket_id, title, status, is_deleted, created_by)
+        SELECT id, 'Task', 'TODO', false, :user_id FROM picked
+        """
+    ), params)
+    db.execute(text(
+        "UPDATE tickets SET task_count_todo = 1 WHERE id IN (SELECT ticket_id FROM tasks)"
+    ))
+    db.commit()
+
+    tickets, tasks = {}, {}
+    token, received = sync_project(client, project_id, None, tickets, tasks)
+    assert len(tickets) == 50000 and len(tasks) == 5000
+    assert received == 55000
+
+    # 1% 변경 (500건): Ticket 수정 300 / 생성 100 / 삭제 50, Task 수정 40 / 삭제 10
+    rng = random.Random(20261018)
+    task_ticket_ids = {ticket_id for ticket_id, _ in tasks.values()}
+    deleted_tickets = rng.sample(sorted(set(tickets) - task_ticket_ids), 50)
+    updated_tickets = rng.sample(sorted(set(tickets) - set(deleted_tickets)), 300)
+    changed_tasks = rng.sample(sorted(tasks), 50)
+    response = client.post("/api/tickets/bulk", json={
+        "create": [{"title": f"New {i}", "project_id": str(project_id)} for i in range(100)],
+        "update": [{"id": ticket_id, "status": "IN_PROGRESS"} for ticket_id in updated_tickets],
+        "delete": deleted_tickets,
+    })
+    assert response.json()["failed"] == 0
+    response = client.post("/api/tasks/bulk", json={
+        "update": [{"id": task_id, "status": "DONE"} for task_id in changed_tasks[:40]],
+        "delete": changed_tasks[40:],
+    })
+    assert response.json()["failed"] == 0
+
+    token, received = sync_project(client, project_id, token, tickets, tasks)
+    # 변경 500건 + Task 변경으로 요약이 바뀐 Ticket (최대 50)
+    assert 500 <= received <= 550
+
+    server_tickets = dict(db.execute(
+        text("SELECT id::text, version FROM tickets WHERE project_id = :project_id"), params
+    ).all())
+    server_tasks = {
+        task_id: (ticket_id, version) for task_id, ticket_id, version in db.execute(text(
+            """
+            SELECT tasks.id::text, tasks.ticket_id::text, tasks.version FROM tasks
+            JOIN tickets ON tickets.id = tasks.ticket_id WHERE tickets.project_id = :project_id
+            """
+        ), params).all()
+    }
+    db.rollback()
+    assert tickets == server_tickets
+    assert tasks == server_tasks
+
+def test_import_project_ndjson(client, db, sample_project):
+    """NDJSON 가져오기: 원본 ID 매핑, 잘못된 레코드 건너뜀, Task 요약/프로젝트 집계 반영"""
+    import json
+    from app.models import Comment, Task, Ticket
+
+    records = [
+        {"type": "ticket", "id": "A-1", "title": "로그인", "status": "IN_PROGRESS", "priority": "HIGH"},
+        {"type": "ticket", "id": 2, "title": "회원가입"},
+        {"type": "ticket", "title": "잘못된 상태", "status": "NOPE"},
+        {"type": "task", "id": "A-1-1", "ticket_id": "A-1", "title": "API", "status": "DONE"},
+        {"type": "task", "ticket_id": "A-1", "title": "UI"},
+        {"type": "task", "ticket_id": 2, "title": "폼"},
+        {"type": "task", "ticket_id": "MISSING", "title": "고아"},
+        {"type": "comment", "id": "C-1", "target_type": "ticket", "target_id": "A-1", "content": "확인"},
+        {"type": "comment", "target_type": "TASK", "target_id": "A-1-1", "content": "답글", "parent_id": "C-1"},
+    ]
+    body = "\n".join(json.dumps(record, ensure_ascii=False) for record in records) + "\nnot json\n"
+    response = client.post(
+        f"/api/projects/{sample_project.id}/import",
+        content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["tickets"], data["tasks"], data["comments"], data["skipped"]) == (2, 3, 2, 3)
+    assert [error["line"] for error in data["errors"]] == [3, 7, 10]
+    assert data["errors"][1]["error"] == "ticket_id: unknown ticket id 'MISSING'"
+
+    tickets = {t["title"]: t for t in client.get(f"/api/tickets/?project_id={sample_project.id}").json()["items"]}
+    assert tickets["로그인"]["priority"] == "HIGH"
+    assert tickets["로그인"]["tasks"] == {
+        "total": 2, "by_status": {"TODO": 1, "IN_PROGRESS": 0, "REVIEW": 0, "DONE": 1},
+    }
+    assert tickets["회원가입"]["tasks"]["total"] == 1
+
+    task = db.query(Task).filter(Task.title == "API").one()
+    assert str(task.ticket_id) == tickets["로그인"]["id"]
+    reply = db.query(Comment).filter(Comment.content == "답글").one()
+    parent = db.query(Comment).filter(Comment.content == "확인").one()
+    assert (reply.target_id, reply.parent_id) == (task.id, parent.id)
+    assert str(parent.target_id) == tickets["로그인"]["id"]
+
+    stats = client.get(f"/api/projects/{sample_project.id}/stats").json()
+    assert stats["total"] == 2
+    assert stats["by_status"]["IN_PROGRESS"] == 1
+
+def test_import_project_csv(client, sample_project):
+    """CSV 가져오기: 따옴표 안의 줄바꿈/쉼표를 한 필드로 처리"""
+    body = (
+        "type,id,ticket_id,title,description,status\r\n"
+        'ticket,T1,,"제목, 쉼표","첫 줄\r\n둘째 줄 ""인용""",DONE\r\n'
+        "task,,T1,하위 작업,,\r\n"
+    )
+    response = client.post(
+        f"/api/projects/{sample_project.id}/import",
+        content=body.encode(),
+        headers={"Content-Type": "text/csv"},
+    )
+    data = response.json()
+    assert (data["tickets"], data["tasks"], data["skipped"]) == (1, 1, 0)
+    ticket = client.get(f"/api/tickets/?project_id={sample_project.id}").json()["items"][0]
+    assert ticket["title"] == "제목, 쉼표"
+    assert ticket["description"] == '첫 줄\n둘째 줄 "인용"'
+    assert ticket["status"] == "DONE"
+    assert ticket["tasks"]["total"] == 1
+
+def test_import_project_too_many_errors(client, db, sample_project, monkeypatch):
+    """검증 실패가 IMPORT_MAX_ERRORS를 넘으면 422, 아무것도 반영하지 않음"""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "IMPORT_MAX_ERRORS", 1)
+    monkeypatch.setattr(settings, "IMPORT_CHUNK_SIZE", 1)
+    body = '{"type": "ticket", "title": "ok"}\n{"type": "ticket"}\n{"type": "bug"}\n'
+    response = client.post(f"/api/projects/{sample_project.id}/import", content=body.encode())
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert client.get(f"/api/tickets/?project_id={sample_project.id}").json()["total"] == 0
+
+    response = client.post("/api/projects/" + str(UUID(int=1)) + "/import", content=body.encode())
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+def test_export_project_ndjson(client, db, sample_workspace):
+    """NDJSON 내보내기: 해당 Project의 멤버/Ticket/Task/댓글만 부모 먼저 순서로 포함"""
+    import json
+    from tests.conftest import build_project_tree
+
+    project = build_project_tree(db, sample_workspace.id, tickets=3, tasks_per_ticket=2)
+    build_project_tree(db, sample_workspace.id, tickets=1)
+
+    response = client.get(f"/api/projects/{project.id}/export")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert f'filename="project-{project.id}.ndjson"' in response.headers["content-disposition"]
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    types = [record["type"] for record in records]
+    assert types == ["member"] + ["ticket"] * 3 + ["task"] * 6 + ["comment"] * 9
+    ticket_ids = {record["id"] for record in records if record["type"] == "ticket"}
+    assert all(record["ticket_id"] in ticket_ids for record in records if record["type"] == "task")
+    ticket = records[1]
+    assert (ticket["project_id"], ticket["status"], ticket["task_count_todo"]) == (str(project.id), "OPEN", 2)
+    assert {record["target_type"] for record in records if record["type"] == "comment"} == {"TICKET", "TASK"}
+
+    response = client.get("/api/projects/" + str(UUID(int=1)) + "/export")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+def test_export_project_csv_gzip_round_trip(client, db, sample_workspace, sample_project):
+    """gzip CSV 내보내기 결과를 (멤버 제외) 그대로 다른 Project로 가져올 수 있음"""
+    import csv
+    import gzip
+    import io
+    from tests.conftest import build_project_tree
+
+    project = build_project_tree(db, sample_workspace.id, tickets=2, tasks_per_ticket=3)
+
+    response = client.get(f"/api/projects/{project.id}/export?format=csv&gzip=true")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"].endswith('.csv.gz"')
+
+    text = gzip.decompress(response.content).decode()
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert [row["type"] for row in rows].count("task") == 6
+    assert rows[1]["is_deleted"] == "false"
+    lines = text.splitlines(keepends=True)
+    body = "".join(line for line in lines if not line.startswith("member,"))
+
+    response = client.post(
+        f"/api/projects/{sample_project.id}/import",
+        content=body.encode(),
+        headers={"Content-Type": "text/csv"},
+    )
+    data = response.json()
+    assert (data["tickets"], data["tasks"], data["comments"], data["skipped"]) == (2, 6, 8, 0)
+    imported = client.get(f"/api/tickets/?project_id={sample_project.id}").json()["items"]
+    assert sorted(ticket["title"] for ticket in imported) == ["Ticket 0", "Ticket 1"]
+    assert all(ticket["tasks"]["total"] == 3 for ticket in imported)
@@ -0,0 +1,59 @@
+"""
+쓰기 API별 SQL 문 수 회귀 테스트
+
+서버에서 정해지는 값(id, created_at, updated_at)은 INSERT/UPDATE ... RETURNING으로 받으므로
+커밋 후 refresh SELECT가 없어야 합니다. 수가 늘어나면 표를 고치기 전에 원인을 확인하세요.
+"""
+import pytest
+from fastapi import status
+from tests.conftest import TEST_USER_ID
+
+# (method, path, body, SQL 문 수) - path의 {...}와 body의 값은 ids fixture로 채움
+WRITE_ENDPOINTS = [
+    # 이름 중복 확인 + INSERT
+    ("POST", "/api/workspaces/", {"name": "W"}, 2),
+    ("PATCH", "/api/workspaces/{workspace}", {"name": "W2"}, 1),
+    # Workspace 확인 + INSERT
+    ("POST", "/api/projects/", {"name": "P", "workspace_id": "{workspace}"}, 2),
+    ("PATCH", "/api/projects/{project}", {"name": "P2"}, 1),
+    # Project 확인 + 집계 + INSERT
+    ("POST", "/api/tickets/", {"title": "T", "project_id": "{project}"}, 3),
+    # UPDATE (수정 전 값 포함) + 집계
+    ("PATCH", "/api/tickets/{ticket}", {"status": "DONE"}, 2),
+    # Ticket 확인 + Task 개수 + INSERT
+    ("POST", "/api/tasks/", {"title": "t", "ticket_id": "{ticket}"}, 3),
+    ("PATCH", "/api/tasks/{task}", {"title": "t2"}, 1),
+    ("PATCH", "/api/tasks/{task}", {"status": "REVIEW"}, 2),
+    ("PATCH", "/api/tasks/{task}/complete", None, 2),
+    ("POST", "/api/notifications/", {"user_id": "{user}", "notification_type": "COMMENT_ADDED", "title": "N"}, 1),
+    ("PATCH", "/api/notifications/{notification}/read", None, 1),
+]
+
+@pytest.fixture
+def ids(client, sample_workspace, sample_project, sample_ticket, sample_task):
+    notification = client.post("/api/notifications/", json={
+        "user_id": str(TEST_USER_ID), "notification_type": "COMMENT_ADDED", "title": "N"
+    }).json()
+    return {
+        "workspace": str(sample_workspace.id),
+        "project": str(sample_project.id),
+        "ticket": str(sample_ticket.id),
+        "task": str(sample_task.id),
+        "notification": notification["id"],
+        "user": str(TEST_USER_ID),
+    }
+
+@pytest.mark.parametrize("method, path, body, expected", WRITE_ENDPOINTS)
+def test_write_endpoint_query_count(client, ids, query_log, method, path, body, expected):
+    """쓰기 API별 SQL 문 수 (refresh 등 불필요한 왕복이 다시 생기지 않도록)"""
+    body = {key: value.format(**ids) for key, value in body.items()} if body else None
+    query_log.clear()
+    response = client.request(method, path.format(**ids), json=body)
+    assert response.status_code < 300
+    assert len(query_log) == expected, query_log
+
+    # RETURNING으로 받은 서버 값이 응답에 포함됨
+    data = response.json()
+    assert data["id"]
+    if method == "PATCH" and "updated_by" in data:
+        assert data["updated_by"] == str(TEST_USER_ID)
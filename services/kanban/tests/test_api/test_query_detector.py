@@ -0,0 +1,69 @@
+import logging
+
+import pytest
+
+from app.config import settings
+from app.models import Ticket
+from app.query_detector import detect_queries, report, statement_shape
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def test_statement_shape_ignores_values_and_list_length():
+    """파라미터 자리와 IN / VALUES 목록 길이가 달라도 같은 형태"""
+    assert statement_shape("SELECT * FROM tickets\n WHERE id IN ($1::UUID, $2::UUID)") == \
+        statement_shape("SELECT * FROM tickets WHERE id IN ($1::UUID)")
+    assert statement_shape("INSERT INTO t (a) VALUES ($1), ($2), ($3)") == \
+        statement_shape("INSERT INTO t (a) VALUES ($1)")
+    assert statement_shape("SELECT * FROM tickets WHERE id = $1") != \
+        statement_shape("SELECT * FROM tasks WHERE id = $1")
+
+
+async def load_tickets_one_by_one(ticket_ids):
+    async with TestingAsyncSessionLocal() as async_db:
+        for ticket_id in ticket_ids:
+            await async_db.get(Ticket, ticket_id)
+
+
+@pytest.mark.allow_query_violations
+async def test_repeated_statement_reported_with_caller_stack(db, sample_project, query_detector, caplog):
+    """같은 형태의 SQL 반복(N+1)을 SQL을 실행한 코드 위치와 함께 경고"""
+    tickets = [Ticket(title=f"T{i}", project_id=sample_project.id, created_by=sample_project.created_by)
+               for i in range(settings.QUERY_DETECTOR_REPEAT_THRESHOLD + 1)]
+    db.add_all(tickets)
+    db.commit()
+
+    with detect_queries() as trace:
+        await load_tickets_one_by_one([ticket.id for ticket in tickets])
+
+    violations = trace.finish("test")
+    assert [violation.kind for violation in violations] == ["repeated"]
+    assert violations[0].count == len(tickets)
+    assert "FROM tickets" in violations[0].statement
+    # 스택은 라이브러리 프레임을 빼고 get()을 호출한 코드 위치를 가리킴
+    assert "load_tickets_one_by_one" in "".join(violations[0].stack)
+    assert not any("site-packages" in line for line in violations[0].stack)
+
+    with caplog.at_level(logging.WARNING, logger="app.query_detector"):
+        report("test", trace)
+    assert "N+1" in caplog.records[-1].getMessage()
+    assert caplog.records[-1].violation == "repeated"
+    assert query_detector == violations
+
+
+@pytest.mark.allow_query_violations
+def test_request_over_statement_budget(client, sample_project, query_log, query_detector, monkeypatch):
+    """요청이 SQL 문 수 기준을 넘으면 route와 함께 보고 (query_detector fixture가 수집)"""
+    monkeypatch.setattr(settings, "QUERY_DETECTOR_MAX_STATEMENTS", 2)
+    response = client.post("/api/tickets/", json={"title": "T", "project_id": str(sample_project.id)})
+    assert response.status_code == 201
+
+    assert len(query_log) > 2
+    assert [(violation.kind, violation.label, violation.count) for violation in query_detector] == [
+        ("statements", "POST /api/tickets/", len(query_log))
+    ]
+    assert "create_ticket" in "".join(query_detector[0].stack)
+
+
+def test_request_within_budget_not_reported(client, sample_project, query_detector):
+    client.get(f"/api/projects/{sample_project.id}")
+    assert query_detector == []
@@ -69,6 +69,19 @@ def test_update_task_success(client, sample_task):
     data = response.json()
     assert data["status"] == "IN_PROGRESS"
 
+def test_task_etag(client, sample_task):
+    """Task 조회 304 / If-Match 불일치 412"""
+    etag = client.get(f"/api/tasks/{sample_task.id}").headers["ETag"]
+    response = client.get(f"/api/tasks/{sample_task.id}", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    response = client.patch(f"/api/tasks/{sample_task.id}/complete")
+    assert response.headers["ETag"] != etag
+
+    response = client.patch(f"/api/tasks/{sample_task.id}", json={"status": "TODO"}, headers={"If-Match": etag})
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert client.get(f"/api/tasks/{sample_task.id}").json()["status"] == "DONE"
+
 def test_complete_task_success(client, sample_task):
     """Task 완료 처리 성공"""
     response = client.patch(f"/api/tasks/{sample_task.id}/complete")
@@ -86,7 +99,165 @@ def test_complete_task_already_completed(client, sample_task):
     response = client.patch(f"/api/tasks/{sample_task.id}/complete")
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+async def test_complete_task_concurrent_requests(client, sample_task):
+    """같은 Task에 완료 요청 100개를 동시에 보내도 한 번만 완료되고 Ticket의 Task 요약도 한 번만 반영"""
+    import asyncio
+    import httpx
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from app.main import app
+    from app.database import get_db, to_async_url
+    from tests.conftest import SQLALCHEMY_TEST_DATABASE_URL
+
+    # 커넥션 수가 max_connections를 넘지 않도록 풀 크기 제한 (나머지 요청은 풀에서 대기)
+    engine = create_async_engine(to_async_url(SQLALCHEMY_TEST_DATABASE_URL), pool_size=20, max_overflow=0)
+    sessions = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def pooled_get_db():
+        async with sessions() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = pooled_get_db
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            responses = await asyncio.gather(*(
+                http.patch(f"/api/tasks/{sample_task.id}/complete") for _ in range(100)
+            ))
+    finally:
+        await engine.dispose()
+
+    codes = [response.status_code for response in responses]
+    assert codes.count(status.HTTP_200_OK) == 1
+    assert codes.count(status.HTTP_400_BAD_REQUEST) == 99
+
+    summary = client.get(f"/api/tickets/{sample_task.ticket_id}").json()["tasks"]
+    assert summary["total"] == 1
+    assert summary["by_status"]["DONE"] == 1
+    assert summary["by_status"]["TODO"] == 0
+
 def test_delete_task_success(client, sample_task):
     """Task 삭제 성공"""
     response = client.delete(f"/api/tasks/{sample_task.id}")
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+def test_task_rollup_matches_after_random_mutations(client, db, sample_project):
+    """Task 생성/수정/완료/삭제를 무작위로 반복해도 Ticket의 Task 요약이 실제 개수와 일치"""
+    import random
+    from collections import Counter
+
+    rng = random.Random(20261018)
+    ticket_ids = [
+        client.post("/api/tickets/", json={"title": f"T{i}", "project_id": str(sample_project.id)}).json()["id"]
+        for i in range(3)
+    ]
+    statuses = ["TODO", "IN_PROGRESS", "REVIEW", "DONE"]
+    tasks = {}  # task_id -> (ticket_id, status)
+
+    for _ in range(60):
+        action = rng.choice(["create", "create", "update", "complete", "delete"]) if tasks else "create"
+        if action == "create":
+            ticket_id, task_status = rng.choice(ticket_ids), rng.choice(statuses)
+            task = client.post("/api/tasks/", json={"title": "t", "ticket_id": ticket_id, "status": task_status}).json()
+            tasks[task["id"]] = (ticket_id, task_status)
+            continue
+
+        task_id = rng.choice(list(tasks))
+        ticket_id, task_status = tasks[task_id]
+        if action == "update":
+            new_status = rng.choice(statuses)
+            response = client.patch(f"/api/tasks/{task_id}", json={"status": new_status, "title": "u"})
+            assert response.status_code == status.HTTP_200_OK
+            tasks[task_id] = (ticket_id, new_status)
+        elif action == "complete":
+            response = client.patch(f"/api/tasks/{task_id}/complete")
+            expected = status.HTTP_400_BAD_REQUEST if task_status == "DONE" else status.HTTP_200_OK
+            assert response.status_code == expected
+            tasks[task_id] = (ticket_id, "DONE")
+        else:
+            assert client.delete(f"/api/tasks/{task_id}").status_code == status.HTTP_204_NO_CONTENT
+            del tasks[task_id]
+
+    for ticket_id in ticket_ids:
+        counts = Counter(s for t, s in tasks.values() if t == ticket_id)
+        summary = client.get(f"/api/tickets/{ticket_id}").json()["tasks"]
+        assert summary == {
+            "total": sum(counts.values()),
+            "by_status": {s: counts.get(s, 0) for s in statuses},
+        }
+
+async def test_task_rollup_after_concurrent_delete_and_complete(client, db, sample_ticket):
+    """같은 Task에 삭제와 완료 요청을 동시에 보내도 Ticket의 Task 요약이 실제 개수와 일치"""
+    import asyncio
+    import httpx
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from app.main import app
+    from app.database import get_db, to_async_url
+    from tests.conftest import SQLALCHEMY_TEST_DATABASE_URL
+
+    task_ids = [
+        client.post("/api/tasks/", json={"title": f"t{i}", "ticket_id": str(sample_ticket.id)}).json()["id"]
+        for i in range(10)
+    ]
+
+    engine = create_async_engine(to_async_url(SQLALCHEMY_TEST_DATABASE_URL), pool_size=20, max_overflow=0)
+    sessions = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def pooled_get_db():
+        async with sessions() as session:
+            yield session
+
+    previous_get_db = app.dependency_overrides[get_db]
+    app.dependency_overrides[get_db] = pooled_get_db
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+            # Task마다 삭제 2개 + 완료 2개를 섞어서 동시에 실행
+            requests = []
+            for task_id in task_ids:
+                requests += [
+                    http.delete(f"/api/tasks/{task_id}"),
+                    http.patch(f"/api/tasks/{task_id}/complete"),
+                    http.delete(f"/api/tasks/{task_id}"),
+                    http.patch(f"/api/tasks/{task_id}/complete"),
+                ]
+            responses = await asyncio.gather(*requests)
+    finally:
+        app.dependency_overrides[get_db] = previous_get_db
+        await engine.dispose()
+
+    delete_codes = [response.status_code for response in responses[0::2]]
+    assert delete_codes.count(status.HTTP_204_NO_CONTENT) == len(task_ids)
+    assert delete_codes.count(status.HTTP_404_NOT_FOUND) == len(task_ids)
+
+    summary = client.get(f"/api/tickets/{sample_ticket.id}").json()["tasks"]
+    assert summary == {
+        "total": 0,
+        "by_status": {"TODO": 0, "IN_PROGRESS": 0, "REVIEW": 0, "DONE": 0},
+    }
+
+def test_bulk_tasks_keep_rollups(client, sample_project):
+    """Task 일괄 생성/수정/삭제 후 Ticket의 Task 요약이 실제 개수와 일치"""
+    ticket_ids = [
+        client.post("/api/tickets/", json={"title": f"T{i}", "project_id": str(sample_project.id)}).json()["id"]
+        for i in range(2)
+    ]
+    response = client.post("/api/tasks/bulk", json={
+        "create": [{"title": f"t{i}", "ticket_id": ticket_ids[i % 2]} for i in range(6)]
+        + [{"title": "orphan", "ticket_id": str(UUID('00000000-0000-0000-0000-000000000001'))}],
+    })
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (6, 1)
+    task_ids = [result["task"]["id"] for result in data["results"][:6]]
+
+    # Ticket 0: t0, t2, t4 / Ticket 1: t1, t3, t5
+    response = client.post("/api/tasks/bulk", json={
+        "update": [{"id": task_id, "status": "DONE"} for task_id in task_ids[:3]]
+        + [{"id": task_ids[3], "status": "REVIEW", "title": "review"}],
+        "delete": [task_ids[4], task_ids[5]],
+    })
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (6, 0)
+    assert data["results"][3]["task"]["title"] == "review"
+
+    summaries = [client.get(f"/api/tickets/{ticket_id}").json()["tasks"] for ticket_id in ticket_ids]
+    assert summaries[0] == {"total": 2, "by_status": {"TODO": 0, "IN_PROGRESS": 0, "REVIEW": 0, "DONE": 2}}
+    assert summaries[1] == {"total": 2, "by_status": {"TODO": 0, "IN_PROGRESS": 0, "REVIEW": 1, "DONE": 1}}
@@ -1,6 +1,8 @@
 import pytest
 from fastapi import status
 from uuid import UUID
+from app.models import Ticket
+from tests.conftest import TEST_USER_ID
 
 def test_create_ticket_success(client, sample_project):
     """Ticket 생성 성공 테스트"""
@@ -48,6 +50,62 @@ def test_list_tickets_with_filters(client, sample_ticket):
     data = response.json()
     assert data["total"] == 1
 
+def test_list_tickets_cursor_pagination(client, db, sample_project):
+    """cursor 페이지네이션으로 모든 Ticket을 중복/누락 없이 순회"""
+    # 같은 트랜잭션에서 생성하여 created_at이 동일 -> id로 순서 결정
+    db.add_all([
+        Ticket(title=f"Ticket {i}", project_id=sample_project.id, created_by=TEST_USER_ID)
+        for i in range(5)
+    ])
+    db.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        url = f"/api/tickets/?project_id={sample_project.id}&limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        data = client.get(url).json()
+        seen.extend(item["id"] for item in data["items"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+def test_list_tickets_invalid_cursor(client):
+    """잘못된 cursor로 조회 시 400"""
+    response = client.get("/api/tickets/?cursor=not-a-cursor")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_list_tickets_without_total(client, sample_ticket):
+    """include_total=false이면 COUNT 생략"""
+    response = client.get("/api/tickets/?include_total=false")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total"] is None
+    assert data["total_is_exact"] is False
+    assert len(data["items"]) == 1
+
+def test_list_tickets_estimated_total(client, sample_ticket, monkeypatch):
+    """estimate_total=true이면 플래너 추정치 반환"""
+    from app.config import settings
+    monkeypatch.setattr(settings, "COUNT_ESTIMATE_THRESHOLD", 0)
+
+    response = client.get(f"/api/tickets/?project_id={sample_ticket.project_id}&estimate_total=true")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total_is_exact"] is False
+    assert data["total"] >= 0
+
+def test_list_tickets_estimated_total_small_is_exact(client, sample_ticket):
+    """추정치가 임계값 미만이면 정확한 COUNT로 대체"""
+    response = client.get("/api/tickets/?estimate_total=true")
+    data = response.json()
+    assert data["total"] == 1
+    assert data["total_is_exact"] is True
+
 def test_get_ticket_success(client, sample_ticket):
     """Ticket 조회 성공"""
     response = client.get(f"/api/tickets/{sample_ticket.id}")
@@ -70,7 +128,120 @@ def test_update_ticket_success(client, sample_ticket):
     data = response.json()
     assert data["status"] == "DONE"
 
+def test_get_ticket_not_modified(client, sample_ticket):
+    """If-None-Match가 현재 ETag와 같으면 본문 없이 304, 수정 후에는 새 ETag로 200"""
+    response = client.get(f"/api/tickets/{sample_ticket.id}")
+    etag = response.headers["ETag"]
+    assert etag == f'"{response.json()["version"]}"'
+
+    response = client.get(f"/api/tickets/{sample_ticket.id}", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    # 하위 Task 변경도 Ticket 응답(tasks 요약)을 바꾸므로 버전이 올라감
+    client.post("/api/tasks/", json={"title": "t", "ticket_id": str(sample_ticket.id)})
+    response = client.get(f"/api/tickets/{sample_ticket.id}", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert response.json()["tasks"]["total"] == 1
+
+def test_update_ticket_if_match(client, sample_ticket):
+    """If-Match가 오래된 ETag면 412로 거부하여 다른 사용자의 수정을 덮어쓰지 않음"""
+    etag = client.get(f"/api/tickets/{sample_ticket.id}").headers["ETag"]
+
+    first = client.patch(f"/api/tickets/{sample_ticket.id}", json={"title": "A"}, headers={"If-Match": etag})
+    assert first.status_code == status.HTTP_200_OK
+    assert first.headers["ETag"] != etag
+    assert first.json()["version"] == sample_ticket.version + 1
+
+    second = client.patch(f"/api/tickets/{sample_ticket.id}", json={"title": "B"}, headers={"If-Match": etag})
+    assert second.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert client.get(f"/api/tickets/{sample_ticket.id}").json()["title"] == "A"
+
+    retried = client.patch(
+        f"/api/tickets/{sample_ticket.id}", json={"title": "B"}, headers={"If-Match": first.headers["ETag"]}
+    )
+    assert retried.status_code == status.HTTP_200_OK
+    assert retried.json()["title"] == "B"
+
+    # 약한 ETag는 If-Match에서 일치하지 않고, *는 항상 일치
+    weak = client.patch(
+        f"/api/tickets/{sample_ticket.id}", json={"title": "C"}, headers={"If-Match": f"W/{retried.headers['ETag']}"}
+    )
+    assert weak.status_code == status.HTTP_412_PRECONDITION_FAILED
+    response = client.patch(f"/api/tickets/{sample_ticket.id}", json={"title": "C"}, headers={"If-Match": "*"})
+    assert response.status_code == status.HTTP_200_OK
+
+    missing = UUID('00000000-0000-0000-0000-000000000001')
+    response = client.patch(f"/api/tickets/{missing}", json={"title": "C"}, headers={"If-Match": etag})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
 def test_delete_ticket_success(client, sample_ticket):
     """Ticket 삭제 성공 (Cascade로 하위 Task 삭제)"""
     response = client.delete(f"/api/tickets/{sample_ticket.id}")
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+def test_bulk_tickets(client, db, sample_project, query_log):
+    """일괄 생성/수정/삭제: 한 요청으로 반영, 항목별 결과, 프로젝트 집계 일치"""
+    from app.models import Task
+
+    project_id = str(sample_project.id)
+    response = client.post("/api/tickets/bulk", json={
+        "create": [{"title": f"T{i}", "project_id": project_id} for i in range(6)]
+        + [{"title": "orphan", "project_id": str(UUID('00000000-0000-0000-0000-000000000001'))}],
+    })
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (6, 1)
+    assert data["results"][-1]["status"] == "not_found"
+    ids = [result["id"] for result in data["results"][:6]]
+    assert [result["ticket"]["title"] for result in data["results"][:6]] == [f"T{i}" for i in range(6)]
+    client.post("/api/tasks/", json={"title": "t", "ticket_id": ids[5]})
+
+    # 같은 수정 내용은 UPDATE 한 번으로 처리 (항목 수와 무관한 쿼리 수)
+    missing = str(UUID('00000000-0000-0000-0000-000000000002'))
+    query_log.clear()
+    response = client.post("/api/tickets/bulk", json={
+        "update": [{"id": ticket_id, "status": "DONE"} for ticket_id in ids[:4]]
+        + [{"id": ids[4], "priority": "HIGH", "assignee_id": str(TEST_USER_ID)}, {"id": missing, "title": "x"}],
+        "delete": [ids[5]],
+    })
+    data = response.json()
+    assert (data["succeeded"], data["failed"]) == (6, 1)
+    assert [r["status"] for r in data["results"]] == ["ok"] * 5 + ["not_found", "ok"]
+    assert data["results"][0]["ticket"]["status"] == "DONE"
+    assert data["results"][4]["ticket"]["priority"] == "HIGH"
+    assert data["results"][4]["ticket"]["updated_by"] == str(TEST_USER_ID)
+    assert len(query_log) <= 8
+
+    assert client.get(f"/api/tickets/{ids[5]}").status_code == status.HTTP_404_NOT_FOUND
+    assert db.query(Task).filter(Task.ticket_id == UUID(ids[5])).count() == 0
+    stats = client.get(f"/api/projects/{project_id}/stats").json()
+    assert stats["total"] == 5
+    assert (stats["by_status"]["DONE"], stats["by_status"]["OPEN"]) == (4, 1)
+    assert stats["by_priority"]["HIGH"] == 1
+    assert stats["by_assignee"] == {str(TEST_USER_ID): 1, "none": 4}
+
+def test_bulk_tickets_all_or_nothing(client, sample_ticket):
+    """all_or_nothing: 실패 항목이 있으면 아무것도 반영하지 않음"""
+    response = client.post("/api/tickets/bulk", json={
+        "update": [{"id": str(sample_ticket.id), "status": "DONE"}],
+        "delete": [str(UUID('00000000-0000-0000-0000-000000000001'))],
+        "all_or_nothing": True,
+    })
+    data = response.json()
+    assert [r["status"] for r in data["results"]] == ["skipped", "not_found"]
+    assert client.get(f"/api/tickets/{sample_ticket.id}").json()["status"] == "OPEN"
+
+def test_bulk_tickets_invalid_request(client, sample_ticket, monkeypatch):
+    """같은 ID 중복 / 최대 항목 수 초과 시 422"""
+    from app.config import settings
+
+    ticket_id = str(sample_ticket.id)
+    response = client.post("/api/tickets/bulk", json={"update": [{"id": ticket_id, "title": "x"}], "delete": [ticket_id]})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    monkeypatch.setattr(settings, "BULK_MAX_ITEMS", 1)
+    response = client.post("/api/tickets/bulk", json={"delete": [ticket_id, str(UUID(int=1))]})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,6 +1,7 @@
 import pytest
 from fastapi import status
 from uuid import UUID
+from tests.conftest import TEST_USER_ID, build_project_tree, count_rows
 
 def test_create_workspace_success(client):
     """Workspace 생성 성공 테스트"""
@@ -85,3 +86,66 @@ def test_delete_workspace_not_found(client):
     """존재하지 않는 Workspace 삭제 시 실패"""
     response = client.delete("/api/workspaces/" + str(UUID('00000000-0000-0000-0000-000000000001')))
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.allow_query_violations
+def test_delete_workspace_cascades_all_children(client, db, redis, sample_workspace, monkeypatch):
+    """Workspace 삭제 시 하위 데이터 전체 삭제 (작은 배치로 여러 번 나누어 삭제)"""
+    from app.config import settings
+    from app.models import Workspace
+    from app.services.notification_counter import unread_key
+
+    monkeypatch.setattr(settings, "CASCADE_DELETE_BATCH_SIZE", 2)
+    other_workspace = Workspace(name="Other", created_by=TEST_USER_ID)
+    db.add(other_workspace)
+    db.commit()
+    other_workspace_id = other_workspace.id
+    build_project_tree(db, other_workspace_id, tickets=1, tasks_per_ticket=1)
+    remaining = count_rows(db)
+
+    workspace_id = sample_workspace.id
+    build_project_tree(db, workspace_id)
+    build_project_tree(db, workspace_id)
+    client.get("/api/notifications/unread-count")
+    assert redis.get(unread_key(TEST_USER_ID)) is not None
+
+    response = client.delete(f"/api/workspaces/{workspace_id}")
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    assert count_rows(db) == remaining
+    assert redis.get(unread_key(TEST_USER_ID)) is None
+    assert client.get(f"/api/workspaces/{other_workspace_id}").status_code == status.HTTP_200_OK
+
+def test_delete_workspace_in_background(client, db, redis_server, sample_workspace, monkeypatch):
+    """백그라운드 삭제 모드: 하위 Project 소프트 삭제 후 202, 워커가 Workspace까지 삭제"""
+    import asyncio
+    from fakeredis import aioredis as fake_aioredis
+    from app.config import settings
+    from app.services.deletion_jobs import process_next_job
+    from tests.conftest import TestingAsyncSessionLocal
+
+    monkeypatch.setattr(settings, "DELETION_JOBS_ENABLED", True)
+    monkeypatch.setattr(settings, "CASCADE_DELETE_BATCH_SIZE", 2)
+    workspace_id = sample_workspace.id
+    remaining = count_rows(db)
+    project_ids = [build_project_tree(db, workspace_id).id for _ in range(2)]
+
+    response = client.delete(f"/api/workspaces/{workspace_id}")
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    job_id = response.json()["id"]
+    for project_id in project_ids:
+        assert client.get(f"/api/projects/{project_id}").status_code == status.HTTP_404_NOT_FOUND
+
+    redis = fake_aioredis.FakeRedis(server=redis_server, decode_responses=True)
+    asyncio.run(process_next_job(redis, TestingAsyncSessionLocal))
+
+    assert count_rows(db) == remaining
+    assert client.get(f"/api/workspaces/{workspace_id}").status_code == status.HTTP_404_NOT_FOUND
+    data = client.get(f"/api/deletion-jobs/{job_id}").json()
+    assert data["status"] == "completed"
+    assert data["total_projects"] == data["processed_projects"] == 2
+    assert data["total_tickets"] == data["processed_tickets"] == 6
+
+def test_get_deletion_job_not_found(client):
+    """존재하지 않는 삭제 작업 조회 시 404"""
+    response = client.get("/api/deletion-jobs/" + str(UUID('00000000-0000-0000-0000-000000000001')))
+    assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -0,0 +1,86 @@
+import time
+import pytest
+from uuid import uuid4
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+from app import auth
+from app.config import settings
+from app.utils.token_cache import DecodedTokenCache
+
+def make_token(user_id, exp_in=3600):
+    return jwt.encode(
+        {"sub": str(user_id), "exp": int(time.time()) + exp_in},
+        settings.SECRET_KEY,
+        algorithm=settings.ALGORITHM
+    )
+
+def bearer(token):
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """jwt.decode 호출 횟수 기록 (캐시는 테스트마다 비움)"""
+    auth.decoded_token_cache.clear()
+    calls = []
+    original_decode = auth.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return original_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    yield calls
+    auth.decoded_token_cache.clear()
+
+def test_repeated_token_decoded_once(decode_calls):
+    """같은 토큰은 한 번만 서명 검증"""
+    user_id = uuid4()
+    token = make_token(user_id)
+
+    for _ in range(5):
+        assert auth.get_current_user_id(bearer(token)) == user_id
+    assert auth.get_current_user_id_optional(bearer(token)) == user_id
+    assert len(decode_calls) == 1
+
+def test_invalid_token_not_cached(decode_calls):
+    """검증 실패한 토큰은 캐시하지 않고 매번 401"""
+    token = make_token(uuid4()) + "x"
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            auth.get_current_user_id(bearer(token))
+        assert exc_info.value.status_code == 401
+    assert auth.get_current_user_id_optional(bearer(token)) is None
+    assert len(decode_calls) == 3
+
+def test_cache_honours_token_expiry():
+    """토큰 exp 이후에는 캐시된 값을 사용하지 않음"""
+    now = [1000.0]
+    cache = DecodedTokenCache(ttl=300, clock=lambda: now[0])
+    user_id = uuid4()
+
+    cache.set("short-lived", user_id, exp=1010)
+    cache.set("long-lived", user_id, exp=99999)
+    assert cache.get("short-lived") == user_id
+
+    now[0] = 1010
+    assert cache.get("short-lived") is None
+    assert cache.get("long-lived") == user_id
+
+    now[0] = 1300
+    assert cache.get("long-lived") is None
+
+def test_cache_bounded_size():
+    """최대 크기 초과 시 가장 오래 사용하지 않은 토큰 제거"""
+    cache = DecodedTokenCache(max_size=2)
+    user_ids = [uuid4() for _ in range(3)]
+
+    cache.set("a", user_ids[0])
+    cache.set("b", user_ids[1])
+    cache.get("a")
+    cache.set("c", user_ids[2])
+
+    assert len(cache) == 2
+    assert cache.get("a") == user_ids[0]
+    assert cache.get("b") is None
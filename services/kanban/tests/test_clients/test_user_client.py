@@ -0,0 +1,120 @@
+import asyncio
+import json
+import httpx
+from uuid import uuid4
+from app.clients.user_client import UserServiceClient
+
+def make_client(handler, **kwargs):
+    return UserServiceClient(
+        base_url="http://user-service",
+        transport=httpx.MockTransport(handler),
+        http2=False,
+        **kwargs
+    )
+
+async def test_verify_user_reuses_shared_client():
+    """요청마다 클라이언트를 새로 만들지 않고 공유 클라이언트 사용"""
+    user_id = uuid4()
+
+    def handler(request):
+        assert request.headers["Authorization"] == "Bearer token"
+        return httpx.Response(200, json={"id": str(user_id)})
+
+    client = make_client(handler)
+    await client.start()
+    shared = client.client
+
+    assert await client.verify_user(user_id, "token") == {"id": str(user_id)}
+    assert await client.check_user_exists(user_id, "token") is True
+    assert client.client is shared
+
+    await client.close()
+    assert shared.is_closed
+
+async def test_verify_user_not_found():
+    """404 응답 시 None"""
+    client = make_client(lambda request: httpx.Response(404))
+    assert await client.verify_user(uuid4(), "token") is None
+    await client.close()
+
+async def test_get_users_bulk_bounded_concurrency():
+    """일괄 조회는 중복을 제거하고 bulk_concurrency 이하로 동시에 요청"""
+    user_ids = [uuid4() for _ in range(20)]
+    missing_id = user_ids[-1]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        user_id = request.url.path.rsplit("/", 1)[-1]
+        if user_id == str(missing_id):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"id": user_id})
+
+    client = make_client(handler, bulk_concurrency=5)
+    results = await client.get_users_bulk(user_ids + user_ids[:5], "token")
+
+    assert set(results) == set(user_ids[:-1])
+    assert max_in_flight == 5
+    await client.close()
+
+async def test_get_users_bulk_uses_batch_endpoint():
+    """일괄 조회 API가 설정되어 있으면 한 번의 요청으로 조회"""
+    user_ids = [uuid4() for _ in range(3)]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        body = json.loads(request.content)
+        return httpx.Response(200, json=[{"id": user_id} for user_id in body["user_ids"]])
+
+    client = make_client(handler, bulk_path="/api/users/bulk")
+    results = await client.get_users_bulk(user_ids, "token")
+
+    assert len(requests) == 1
+    assert requests[0].method == "POST"
+    assert set(results) == set(user_ids)
+    await client.close()
+
+async def test_get_users_bulk_falls_back_when_batch_endpoint_missing():
+    """일괄 조회 API가 없으면(404) 개별 조회로 대체하고 이후 사용하지 않음"""
+    user_ids = [uuid4() for _ in range(3)]
+
+    def handler(request):
+        if request.url.path == "/api/users/bulk":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    client = make_client(handler, bulk_path="/api/users/bulk")
+    results = await client.get_users_bulk(user_ids, "token")
+
+    assert set(results) == set(user_ids)
+    assert results[user_ids[0]] == {"id": str(user_ids[0])}
+    assert client.bulk_path is None
+    await client.close()
+
+async def test_fetch_user_records_upstream_latency():
+    """User Service 호출 시간을 upstream 지표로 기록 (실패한 호출 포함)"""
+    from prometheus_client import REGISTRY
+
+    labels = {"service": "user_service", "operation": "fetch_user"}
+
+    def observed():
+        return REGISTRY.get_sample_value("kanban_upstream_request_duration_seconds_count", labels) or 0
+
+    before = observed()
+    client = make_client(lambda request: httpx.Response(404))
+    assert await client.verify_user(uuid4(), "token") is None
+
+    def fail(request):
+        raise httpx.ConnectError("refused")
+
+    failing = make_client(fail)
+    assert await failing.verify_user(uuid4(), "token") is None
+    assert observed() == before + 2
+    await client.close()
+    await failing.close()
@@ -0,0 +1,100 @@
+import json
+import logging
+import queue
+import threading
+from uuid import UUID
+
+import pytest
+
+from app.config import settings
+from app.logging_config import DebugSampler, DeferredQueueHandler, JSONFormatter, setup_logging, stop_logging
+
+
+@pytest.fixture
+def app_logging(monkeypatch):
+    """JSON + 비동기 출력으로 로깅을 다시 설정하고 테스트 후 원래 설정으로 복원"""
+    monkeypatch.setattr(settings, "ENV", "production")
+    monkeypatch.setattr(settings, "LOG_ASYNC", True)
+    yield
+    monkeypatch.undo()
+    setup_logging()
+
+
+def make_record(msg, *args, level=logging.INFO, **extra):
+    record = logging.LogRecord("app.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_fields_and_fallback():
+    """extra 필드, UUID, 한글을 그대로 직렬화하고 orjson이 못 다루는 값은 json으로 처리"""
+    record = make_record("알림 %s개", 3, user_id=UUID(int=1), big=2 ** 70)
+    record.created = 0.5
+
+    log = json.loads(JSONFormatter().format(record))
+    assert log["message"] == "알림 3개"
+    assert log["user_id"] == str(UUID(int=1))
+    assert log["big"] == 2 ** 70
+    # 포맷팅 시각이 아니라 로그 발생 시각
+    assert log["timestamp"] == "1970-01-01T00:00:00.500000Z"
+
+
+def test_async_pipeline_formats_in_listener_thread(app_logging, capsys, monkeypatch):
+    """로거는 큐에 넣기만 하고 JSON 포맷팅 / 출력은 QueueListener 스레드에서 수행"""
+    setup_logging()
+    root_handler = logging.getLogger().handlers[0]
+    assert isinstance(root_handler, DeferredQueueHandler)
+
+    formatted_in = []
+    original_format = JSONFormatter.format
+
+    def tracking_format(self, record):
+        formatted_in.append(threading.current_thread())
+        return original_format(self, record)
+
+    monkeypatch.setattr(JSONFormatter, "format", tracking_format)
+    tags = ["first"]
+    logging.getLogger("app.test").info("tags %s", tags, extra={"route": "/api/tickets/{ticket_id}"})
+    # 큐에 넣을 때 메시지 인자를 확정하므로 이후 변경은 출력에 반영되지 않음
+    tags.append("second")
+    stop_logging()
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.startswith("{")]
+    log = next(line for line in lines if line["logger"] == "app.test")
+    assert log["message"] == "tags ['first']"
+    assert log["route"] == "/api/tickets/{ticket_id}"
+    assert formatted_in and threading.main_thread() not in formatted_in
+
+
+def test_full_queue_drops_without_blocking():
+    """큐가 가득 차면 기다리지 않고 버리고, 자리가 나면 버린 개수를 경고로 남김"""
+    log_queue = queue.Queue(maxsize=2)
+    handler = DeferredQueueHandler(log_queue)
+    for i in range(3):
+        handler.handle(make_record("record %d", i))
+    assert handler.dropped == 1
+
+    # 경고를 넣을 자리가 없으면 버린 개수를 유지했다가 다음 로그와 함께 기록
+    log_queue.get_nowait()
+    handler.handle(make_record("record 3"))
+    assert handler.dropped == 1
+
+    log_queue.get_nowait()
+    log_queue.get_nowait()
+    handler.handle(make_record("record 4"))
+    assert handler.dropped == 0
+    assert log_queue.get_nowait().getMessage() == "record 4"
+    warning = log_queue.get_nowait()
+    assert warning.levelno == logging.WARNING
+    assert warning.getMessage() == "Dropped 1 log records (log queue full)"
+
+
+def test_debug_sampler():
+    """DEBUG 로그만 비율대로 샘플링하고 INFO 이상은 모두 통과"""
+    assert not DebugSampler(0).filter(make_record("debug", level=logging.DEBUG))
+    assert DebugSampler(0).filter(make_record("info", level=logging.INFO))
+    assert DebugSampler(1).filter(make_record("debug", level=logging.DEBUG))
+
+    sampler = DebugSampler(0.25)
+    kept = sum(sampler.filter(make_record("debug", level=logging.DEBUG)) for _ in range(4000))
+    assert 800 < kept < 1200
@@ -0,0 +1,74 @@
+from uuid import uuid4
+import fakeredis
+from fakeredis import aioredis as fake_aioredis
+from app.services.deletion_jobs import (
+    DELETION_PROCESSING_KEY,
+    DELETION_QUEUE_KEY,
+    TARGET_PROJECT,
+    enqueue_deletion_job,
+    get_deletion_job,
+    process_next_job,
+    requeue_stalled_jobs,
+    target_key,
+)
+
+def fake_redis():
+    return fake_aioredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+class FailingSession:
+    """세션 생성 시 실패하는 session_factory 대역"""
+    def __call__(self):
+        raise RuntimeError("database unavailable")
+
+async def test_enqueue_is_idempotent_per_target():
+    """같은 대상의 진행 중인 작업이 있으면 새로 등록하지 않음"""
+    redis = fake_redis()
+    target_id, user_id = uuid4(), uuid4()
+
+    first = await enqueue_deletion_job(redis, TARGET_PROJECT, target_id, user_id)
+    second = await enqueue_deletion_job(redis, TARGET_PROJECT, target_id, user_id)
+
+    assert first["id"] == second["id"]
+    assert first["status"] == "queued"
+    assert await redis.lrange(DELETION_QUEUE_KEY, 0, -1) == [first["id"]]
+
+    other = await enqueue_deletion_job(redis, TARGET_PROJECT, uuid4(), user_id)
+    assert other["id"] != first["id"]
+
+async def test_failed_job_is_recorded_and_can_be_requeued():
+    """실패한 작업은 오류를 기록하고, 같은 대상을 다시 등록할 수 있음"""
+    redis = fake_redis()
+    target_id = uuid4()
+    job = await enqueue_deletion_job(redis, TARGET_PROJECT, target_id, uuid4())
+
+    result = await process_next_job(redis, FailingSession())
+
+    assert result["status"] == "failed"
+    assert "database unavailable" in result["error"]
+    assert result["finished_at"] is not None
+    assert await redis.ttl(f"kanban:deletion_jobs:job:{job['id']}") > 0
+    assert await redis.get(target_key(TARGET_PROJECT, target_id)) is None
+    assert await redis.llen(DELETION_PROCESSING_KEY) == 0
+
+    retry = await enqueue_deletion_job(redis, TARGET_PROJECT, target_id, uuid4())
+    assert retry["id"] != job["id"]
+
+async def test_empty_queue_and_missing_job():
+    """큐가 비었으면 None, 만료된 작업 ID는 건너뜀"""
+    redis = fake_redis()
+    assert await process_next_job(redis, FailingSession()) is None
+
+    await redis.lpush(DELETION_QUEUE_KEY, "expired-job")
+    assert await process_next_job(redis, FailingSession()) is None
+    assert await get_deletion_job(redis, "expired-job") is None
+    assert await redis.llen(DELETION_PROCESSING_KEY) == 0
+
+async def test_requeue_stalled_jobs():
+    """처리 중 목록에 남은 작업을 대기 큐 앞쪽(먼저 꺼낼 위치)으로 되돌림"""
+    redis = fake_redis()
+    await redis.lpush(DELETION_QUEUE_KEY, "waiting")
+    await redis.lpush(DELETION_PROCESSING_KEY, "stalled")
+
+    assert await requeue_stalled_jobs(redis) == 1
+    assert await redis.llen(DELETION_PROCESSING_KEY) == 0
+    assert await redis.rpop(DELETION_QUEUE_KEY) == "stalled"
@@ -0,0 +1,43 @@
+import tracemalloc
+
+from sqlalchemy import text
+
+from app.services.project_export import export_project
+from tests.conftest import TEST_USER_ID, TestingAsyncSessionLocal
+
+def add_tickets(db, project_id, count):
+    db.execute(
+        text(
+            """
+            INSERT INTO tickets (title, description, status, priority, project_id, is_deleted, created_by)
+            SELECT 'Ticket ' || i, repeat('설명 ', 50), 'OPEN', 'MEDIUM', :project_id, false, :user_id
+            FROM generate_series(1, :count) AS i
+            """
+        ),
+        {"project_id": project_id, "user_id": TEST_USER_ID, "count": count},
+    )
+    db.commit()
+
+async def export_peak_memory(project_id, batch_size):
+    """내보내기 결과 크기와 내보내는 동안 Python 힙 최대 증가량 (결과는 모으지 않음)"""
+    size = 0
+    async with TestingAsyncSessionLocal() as async_db:
+        tracemalloc.start()
+        async for chunk in export_project(async_db, project_id, "ndjson", batch_size=batch_size):
+            size += len(chunk)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return size, peak
+
+async def test_export_memory_stays_flat(db, sample_project):
+    """Project 크기가 10배가 되어도 내보내기 중 메모리 사용량은 batch 크기에만 비례"""
+    add_tickets(db, sample_project.id, 1000)
+    await export_peak_memory(sample_project.id, 200)
+    small_size, small_peak = await export_peak_memory(sample_project.id, 200)
+
+    add_tickets(db, sample_project.id, 9000)
+    large_size, large_peak = await export_peak_memory(sample_project.id, 200)
+
+    assert large_size > small_size * 9
+    assert large_peak < small_peak * 1.5
+    assert large_peak < large_size / 4
@@ -0,0 +1,34 @@
+from app.models import Ticket, Task
+from app.models.enums import TaskStatus
+from app.services.task_rollup import reconcile_task_rollups
+from tests.conftest import TEST_USER_ID, TestingAsyncSessionLocal
+
+def add_ticket(db, project_id, statuses):
+    ticket = Ticket(title="T", project_id=project_id, created_by=TEST_USER_ID)
+    db.add(ticket)
+    db.flush()
+    for task_status in statuses:
+        db.add(Task(title="t", ticket_id=ticket.id, status=task_status, created_by=TEST_USER_ID))
+    db.commit()
+    return ticket
+
+async def test_reconcile_recomputes_only_drifted_tickets(db, sample_project):
+    """카운터가 어긋난 Ticket만 Task 테이블 기준으로 다시 계산 (여러 배치)"""
+    drifted = add_ticket(db, sample_project.id, [TaskStatus.TODO, TaskStatus.DONE, TaskStatus.DONE])
+    empty = add_ticket(db, sample_project.id, [])
+    empty.task_count_review = 4
+    correct = add_ticket(db, sample_project.id, [TaskStatus.REVIEW])
+    correct.task_count_review = 1
+    db.commit()
+
+    async with TestingAsyncSessionLocal() as async_db:
+        assert await reconcile_task_rollups(async_db, batch_size=2) == 2
+        assert await reconcile_task_rollups(async_db, sample_project.id) == 0
+
+    db.expire_all()
+    assert drifted.task_summary == {
+        "total": 3,
+        "by_status": {"TODO": 1, "IN_PROGRESS": 0, "REVIEW": 0, "DONE": 2},
+    }
+    assert empty.task_summary["total"] == 0
+    assert correct.task_summary["by_status"]["REVIEW"] == 1
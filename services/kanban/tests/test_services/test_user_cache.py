@@ -0,0 +1,137 @@
+import asyncio
+from uuid import uuid4
+from fakeredis import aioredis as fake_aioredis
+from app.clients.user_client import UserServiceError
+from app.services.user_cache import UserInfoCache, user_cache_key
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    def __call__(self):
+        return self.now
+
+class FakeUserService:
+    """User Service 대역 - 호출 횟수 기록"""
+    def __init__(self, users=(), delay=0.0):
+        self.users = {user_id: {"id": str(user_id)} for user_id in users}
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    async def __call__(self, user_id, token):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise UserServiceError("unavailable")
+        return self.users.get(user_id)
+
+async def test_hit_after_first_lookup_and_ttl_expiry():
+    """첫 조회 후 캐시 히트, TTL 경과 시 다시 조회"""
+    user_id = uuid4()
+    service = FakeUserService([user_id])
+    clock = FakeClock()
+    cache = UserInfoCache(service, ttl=60, clock=clock)
+
+    assert await cache.get_user(user_id, "token") == {"id": str(user_id)}
+    assert await cache.get_user(user_id, "token") == {"id": str(user_id)}
+    assert service.calls == 1
+
+    clock.now = 61
+    await cache.get_user(user_id, "token")
+    assert service.calls == 2
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+async def test_negative_caching_and_errors_not_cached():
+    """없는 사용자는 짧게 캐시, User Service 오류는 캐시하지 않음"""
+    missing_id = uuid4()
+    service = FakeUserService()
+    clock = FakeClock()
+    cache = UserInfoCache(service, ttl=60, negative_ttl=5, clock=clock)
+
+    assert await cache.get_user(missing_id, "token") is None
+    assert await cache.get_user(missing_id, "token") is None
+    assert service.calls == 1
+    assert cache.stats()["negative_hits"] == 1
+
+    clock.now = 6
+    service.fail = True
+    assert await cache.get_user(missing_id, "token") is None
+    assert await cache.get_user(missing_id, "token") is None
+    assert service.calls == 3
+    assert cache.stats()["errors"] == 2
+
+async def test_concurrent_misses_are_coalesced():
+    """같은 사용자에 대한 동시 캐시 미스는 User Service 호출 하나를 공유"""
+    user_id = uuid4()
+    service = FakeUserService([user_id], delay=0.01)
+    cache = UserInfoCache(service)
+
+    results = await asyncio.gather(*(cache.get_user(user_id, "token") for _ in range(20)))
+
+    assert all(result == {"id": str(user_id)} for result in results)
+    assert service.calls == 1
+    assert cache.stats()["coalesced"] == 19
+
+async def test_lru_eviction():
+    """최대 크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    user_ids = [uuid4() for _ in range(3)]
+    service = FakeUserService(user_ids)
+    cache = UserInfoCache(service, max_size=2)
+
+    await cache.get_user(user_ids[0], "token")
+    await cache.get_user(user_ids[1], "token")
+    await cache.get_user(user_ids[0], "token")
+    await cache.get_user(user_ids[2], "token")
+
+    assert cache.stats()["evictions"] == 1
+    await cache.get_user(user_ids[0], "token")
+    assert service.calls == 3
+    await cache.get_user(user_ids[1], "token")
+    assert service.calls == 4
+
+async def test_redis_second_tier_shared_between_instances():
+    """Redis 2차 캐시는 다른 Pod(인스턴스)와 공유"""
+    user_id = uuid4()
+    missing_id = uuid4()
+    service = FakeUserService([user_id])
+    redis = fake_aioredis.FakeRedis(decode_responses=True)
+    first = UserInfoCache(service, redis=redis)
+    second = UserInfoCache(service, redis=redis)
+
+    await first.get_user(user_id, "token")
+    await first.get_user(missing_id, "token")
+    assert await second.get_user(user_id, "token") == {"id": str(user_id)}
+    assert await second.get_user(missing_id, "token") is None
+
+    assert service.calls == 2
+    assert second.stats()["redis_hits"] == 2
+    assert await redis.get(user_cache_key(missing_id)) == "null"
+
+async def test_invalidation_message():
+    """무효화 메시지로 특정 사용자 또는 전체 제거"""
+    user_ids = [uuid4(), uuid4()]
+    service = FakeUserService(user_ids)
+    cache = UserInfoCache(service)
+    for user_id in user_ids:
+        await cache.get_user(user_id, "token")
+
+    cache.handle_invalidation(str(user_ids[0]))
+    cache.handle_invalidation("not-a-uuid")
+    assert cache.stats()["size"] == 1
+
+    cache.handle_invalidation("*")
+    assert cache.stats()["size"] == 0
+
+async def test_invalidation_during_lookup_is_not_overwritten():
+    """조회 중 무효화되면 이전 조회 결과를 캐시에 저장하지 않음"""
+    user_id = uuid4()
+    service = FakeUserService([user_id], delay=0.01)
+    cache = UserInfoCache(service)
+
+    lookup = asyncio.ensure_future(cache.get_user(user_id, "token"))
+    await asyncio.sleep(0)
+    cache.invalidate(user_id)
+    await lookup
+
+    assert cache.stats()["size"] == 0